@@ -0,0 +1,98 @@
+#
+# This script measures the throughput of m.x[i,j,k] lookups on a
+# 3-dimensional model, and the memory used by the index tuples of
+# several components indexed by the same product set, with and without
+# index interning.
+#
+
+from pyomo.environ import *
+from pyomo.core.base.indexed_component import (normalize_index,
+                                               set_index_interning)
+
+import gc
+import sys
+import time
+import argparse
+
+NElements = 10000000
+NComponents = 4
+N = 3
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--nelements", help="The number of elements in each component", action="store", type=int, default=None)
+parser.add_argument("--ncomponents", help="The number of components", action="store", type=int, default=None)
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=None)
+args = parser.parse_args()
+
+if args.nelements:
+    NElements = args.nelements
+if args.ncomponents:
+    NComponents = args.ncomponents
+if args.ntrials:
+    N = args.ntrials
+# The size of each of the three index sets
+NSet = max(1, int(round(NElements ** (1.0/3))))
+print("NElements %d   NComponents %d   NTrials %d\n\n"
+      % (NSet**3, NComponents, N))
+
+
+def create_model(intern):
+    set_index_interning(intern)
+    model = ConcreteModel()
+    model.I = RangeSet(NSet)
+    for n in range(NComponents):
+        setattr(model, 'x%d' % n, Var(model.I, model.I, model.I))
+    set_index_interning(False)
+    return model
+
+def index_memory(model):
+    seen = set()
+    total = 0
+    for n in range(NComponents):
+        for idx in getattr(model, 'x%d' % n)._data:
+            if id(idx) not in seen:
+                seen.add(id(idx))
+                total += sys.getsizeof(idx)
+    return total
+
+def measure(f, n=N):
+    data = []
+    for i in range(n):
+        gc.collect()
+        start = time.time()
+        f()
+        data.append(time.time() - start)
+    return sum(data)/len(data)
+
+
+for intern in (False, True):
+    start = time.time()
+    model = create_model(intern)
+    print("interning=%-5s  construction %8.2f s   index memory %8.1f MB"
+          % (intern, time.time() - start, index_memory(model)/1e6))
+    del model
+    gc.collect()
+
+model = create_model(False)
+x = model.x0
+indices = [(i, j, k) for i in range(1, NSet+1)
+           for j in range(1, 11) for k in range(1, 11)]
+nested = [((i, j), k) for i, j, k in indices]
+
+def lookup():
+    for i, j, k in indices:
+        x[i, j, k]
+
+def nested_lookup():
+    for idx in nested:
+        x[idx]
+
+def normalize():
+    for idx in indices:
+        normalize_index(idx)
+
+print("\n%-24s %14s" % ("Operation", "Lookups/s"))
+for name, f in (('x[i,j,k]', lookup),
+                ('x[(i,j),k]', nested_lookup),
+                ('normalize_index', normalize)):
+    print("%-24s %14.0f" % (name, len(indices)/measure(f)))
@@ -0,0 +1,76 @@
+#
+# This script compares the performance of the generic expression value
+# walker (ExpressionValueVisitor.dfs_postorder_stack) with the
+# class-dispatched walker (DispatchValueVisitor) on large nested sums.
+#
+
+from pyomo.environ import *
+from pyomo.core.expr import current as EXPR
+from pyomo.core.expr.expr_pyomo5 import (_EvaluationVisitor,
+                                         _PolynomialDegreeVisitor,
+                                         _IsFixedVisitor)
+
+import gc
+import time
+import argparse
+
+NTerms = 100000
+N = 10
+Depth = 100
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--nterms", help="The number of terms in test expressions", action="store", type=int, default=None)
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=None)
+parser.add_argument("--depth", help="The nesting depth of test expressions", action="store", type=int, default=None)
+args = parser.parse_args()
+
+if args.nterms:
+    NTerms = args.nterms
+if args.ntrials:
+    N = args.ntrials
+if args.depth:
+    Depth = args.depth
+print("NTerms %d   NTrials %d   Depth %d\n\n" % (NTerms, N, Depth))
+
+
+def create_model():
+    model = ConcreteModel()
+    model.A = RangeSet(NTerms)
+    model.x = Var(model.A, initialize=1.5)
+    model.p = Param(model.A, mutable=True, initialize=2)
+    return model
+
+def nested_sum(model):
+    #
+    # A large sum of nonlinear terms, wrapped in a deep chain of
+    # products and sums.
+    #
+    e = sum(model.p[i]*model.x[i]**2 + sin(model.x[i]) for i in model.A)
+    for i in range(1, Depth+1):
+        e = 2*(e + model.x[i])
+    return e
+
+def measure(f, n=N):
+    data = []
+    for i in range(n):
+        gc.collect()
+        start = time.time()
+        f()
+        data.append(time.time() - start)
+    return sum(data)/len(data)
+
+
+model = create_model()
+expr = nested_sum(model)
+
+print("%-24s %12s %12s %8s" % ("Visitor", "Generic", "Dispatch", "Speedup"))
+for name, visitor in (('evaluate', _EvaluationVisitor()),
+                      ('polynomial_degree', _PolynomialDegreeVisitor()),
+                      ('is_fixed', _IsFixedVisitor())):
+    # The ported visitors keep the visit() and visiting_potential_leaf()
+    # methods, so they can also be driven by the generic walker.
+    generic = measure(
+        lambda: EXPR.ExpressionValueVisitor.dfs_postorder_stack(visitor, expr))
+    dispatch = measure(lambda: visitor.dfs_postorder_stack(expr))
+    print("%-24s %12.4f %12.4f %7.2fx" % (name, generic, dispatch,
+                                         generic/dispatch))
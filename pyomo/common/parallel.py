@@ -0,0 +1,88 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import logging
+import multiprocessing
+import os
+
+logger = logging.getLogger('pyomo.common')
+
+# The function evaluated by the worker processes.  This is set before
+# the workers are forked, so it is inherited (and never pickled).
+_worker_fcn = None
+
+
+def _worker(arg):
+    return _worker_fcn(arg)
+
+
+def fork_available():
+    """
+    Returns :const:`True` if worker processes can be created with
+    ``fork()``.
+    """
+    if not hasattr(multiprocessing, 'get_context'):
+        return os.name == 'posix'
+    try:
+        multiprocessing.get_context('fork')
+        return True
+    except ValueError:
+        return False
+
+
+def parallel_map(fcn, args, processes):
+    """
+    A generator that evaluates a function over a sequence of
+    arguments in a pool of worker processes.
+
+    The worker processes are created with ``fork()``, so they inherit
+    the state of the calling process (e.g., a constructed model) and
+    :attr:`fcn` may be a closure.  Only the arguments and the return
+    values are pickled.  If ``fork()`` is not available (or if this is
+    called from a worker process), then the function is evaluated
+    serially.
+
+    Args:
+        fcn: The function that is evaluated.
+        args: A sequence of arguments.
+        processes (int): The number of worker processes.
+
+    Yields:
+        The values of :attr:`fcn`, in the order of :attr:`args`.
+    """
+    global _worker_fcn
+    if processes is None or processes <= 1 or not fork_available():
+        if processes is not None and processes > 1:
+            logger.warning("Worker processes cannot be forked on this "
+                           "platform; evaluating serially.")
+        for arg in args:
+            yield fcn(arg)
+        return
+
+    if _worker_fcn is not None:
+        # This is a nested call from a worker process
+        for arg in args:
+            yield fcn(arg)
+        return
+    if hasattr(multiprocessing, 'get_context'):
+        ctx = multiprocessing.get_context('fork')
+    else:
+        ctx = multiprocessing
+    _worker_fcn = fcn
+    try:
+        pool = ctx.Pool(processes)
+    finally:
+        _worker_fcn = None
+    try:
+        for ans in pool.imap(_worker, args):
+            yield ans
+    finally:
+        pool.terminate()
+        pool.join()
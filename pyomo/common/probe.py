@@ -0,0 +1,151 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import json
+import logging
+import os
+import tempfile
+
+logger = logging.getLogger('pyomo.common')
+
+
+def _default_cache_file():
+    """
+    Return the name of the probe cache file, or None if the cache is
+    disabled (with PYOMO_PROBE_CACHE="").
+    """
+    filename = os.environ.get('PYOMO_PROBE_CACHE', None)
+    if filename is not None:
+        return filename or None
+    cache_dir = os.environ.get('XDG_CACHE_HOME', '') or \
+                os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'pyomo', 'solver_probes.json')
+
+
+def _replace(src, dest):
+    """Atomically replace dest with src"""
+    if hasattr(os, 'replace'):
+        os.replace(src, dest)
+    else:                                   #pragma:nocover
+        if os.name == 'nt' and os.path.exists(dest):
+            os.remove(dest)
+        os.rename(src, dest)
+
+
+class ProbeCache(object):
+    """
+    A cache of the results of probing executables (e.g., running a
+    solver to get its version) that is shared by all processes
+    through a JSON file.
+
+    The results are keyed by the real path of the executable and the
+    name of the probe.  The results for an executable are discarded
+    when its size or modification time changes.  Probes that return
+    None (i.e., failed) are not cached.
+
+    Args:
+        filename (str): The cache file.  The default is the value of
+            the PYOMO_PROBE_CACHE environment variable (an empty value
+            disables the cache) or solver_probes.json in the pyomo
+            directory of the user cache directory.
+    """
+
+    def __init__(self, filename=None):
+        self._filename = filename
+        # The (filename, data) that was last read from the cache file
+        self._data = (None, None)
+
+    @property
+    def filename(self):
+        if self._filename is None:
+            return _default_cache_file()
+        return self._filename
+
+    def __call__(self, executable, probe, fcn):
+        """
+        Return the (cached) value of fcn() for an executable.
+
+        Values that are not JSON-serializable are not cached.  Note that
+        tuples are returned as lists.
+        """
+        filename = self.filename
+        if not filename or not executable:
+            return fcn()
+        try:
+            stat = os.stat(executable)
+        except OSError:
+            return fcn()
+        path = os.path.realpath(executable)
+        signature = [stat.st_mtime, stat.st_size]
+        for reload in (False, True):
+            data = self._load(filename, reload)
+            entry = data.get(path, None)
+            if entry is not None and entry['signature'] == signature \
+               and probe in entry['probes']:
+                return entry['probes'][probe]
+        ans = fcn()
+        if ans is None:
+            return ans
+        try:
+            # Return the value as it is read from the cache file
+            ans = json.loads(json.dumps(ans))
+        except (TypeError, ValueError):
+            return ans
+        self._store(filename, path, signature, probe, ans)
+        return ans
+
+    def clear(self):
+        """Remove the cache file"""
+        filename = self.filename
+        self._data = (None, None)
+        if filename and os.path.exists(filename):
+            os.remove(filename)
+
+    def _load(self, filename, reload=True):
+        """Return the (cached) contents of the cache file"""
+        if not reload and self._data[0] == filename:
+            return self._data[1]
+        try:
+            with open(filename, 'r') as INPUT:
+                data = json.load(INPUT)
+            if type(data) is not dict:
+                data = {}
+        except (IOError, OSError, ValueError):
+            data = {}
+        self._data = (filename, data)
+        return data
+
+    def _store(self, filename, path, signature, probe, value):
+        """Add a value to the cache file"""
+        # Merge with the values stored by other processes
+        data = self._load(filename)
+        entry = data.get(path, None)
+        if entry is None or entry['signature'] != signature:
+            entry = data[path] = {'signature': signature, 'probes': {}}
+        entry['probes'][probe] = value
+        dirname = os.path.dirname(os.path.abspath(filename))
+        tmp = None
+        try:
+            if not os.path.isdir(dirname):
+                os.makedirs(dirname)
+            fd, tmp = tempfile.mkstemp(
+                dir=dirname, prefix='.solver_probes.', suffix='.tmp')
+            with os.fdopen(fd, 'w') as OUTPUT:
+                json.dump(data, OUTPUT, indent=1, sort_keys=True)
+            _replace(tmp, filename)
+        except (IOError, OSError) as e:
+            logger.debug("Unable to update the probe cache '%s': %s"
+                         % (filename, e))
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+
+
+# The probe cache used by the solver plugins
+probe_cache = ProbeCache()
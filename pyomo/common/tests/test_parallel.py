@@ -0,0 +1,48 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+
+import pyutilib.th as unittest
+
+from pyomo.common.parallel import fork_available, parallel_map
+
+class TestParallelMap(unittest.TestCase):
+    def test_serial(self):
+        data = [3, 1, 2]
+        ans = list(parallel_map(lambda i: data[i]*10, range(3), None))
+        self.assertEqual(ans, [30, 10, 20])
+
+    @unittest.skipIf(not fork_available(), "Cannot fork worker processes")
+    def test_parallel(self):
+        # The closure (and the data it references) is inherited by the
+        # workers; only the arguments and results are pickled.
+        data = [object() for i in range(20)]
+        pids = set()
+        ans = []
+        for i, pid in parallel_map(lambda i: (id(data[i]), os.getpid()),
+                                   range(20), 3):
+            ans.append(i)
+            pids.add(pid)
+        self.assertEqual(ans, [id(x) for x in data])
+        self.assertNotIn(os.getpid(), pids)
+
+    @unittest.skipIf(not fork_available(), "Cannot fork worker processes")
+    def test_parallel_error(self):
+        def fcn(i):
+            if i == 2:
+                raise ValueError("bad argument %s" % i)
+            return i
+        with self.assertRaisesRegexp(ValueError, "bad argument 2"):
+            list(parallel_map(fcn, range(5), 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
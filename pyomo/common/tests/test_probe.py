@@ -0,0 +1,115 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+import shutil
+import tempfile
+
+import pyutilib.th as unittest
+
+from pyomo.common.probe import ProbeCache
+
+class TestProbeCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.tmpdir, 'cache', 'probes.json')
+        self.exe = os.path.join(self.tmpdir, 'solver')
+        with open(self.exe, 'w') as FILE:
+            FILE.write('version 1')
+        self.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def probe(self, ans=(1, 2, 3, 0)):
+        def fcn():
+            self.calls.append(ans)
+            return ans
+        return fcn
+
+    def test_cache(self):
+        cache = ProbeCache(self.cache_file)
+        self.assertEqual(cache(self.exe, 'v', self.probe()), [1, 2, 3, 0])
+        self.assertTrue(os.path.exists(self.cache_file))
+        self.assertEqual(cache(self.exe, 'v', self.probe()), [1, 2, 3, 0])
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(cache(self.exe, 'asl', self.probe(True)), True)
+        self.assertEqual(len(self.calls), 2)
+        # Another process (with a new cache) reads the cache file
+        cache = ProbeCache(self.cache_file)
+        self.assertEqual(cache(self.exe, 'v', self.probe()), [1, 2, 3, 0])
+        self.assertEqual(cache(self.exe, 'asl', self.probe()), True)
+        self.assertEqual(len(self.calls), 2)
+        cache.clear()
+        self.assertFalse(os.path.exists(self.cache_file))
+        cache(self.exe, 'v', self.probe())
+        self.assertEqual(len(self.calls), 3)
+
+    def test_changed_executable(self):
+        cache = ProbeCache(self.cache_file)
+        cache(self.exe, 'v', self.probe())
+        with open(self.exe, 'w') as FILE:
+            FILE.write('version 2.0')
+        self.assertEqual(cache(self.exe, 'v', self.probe((2, 0))), [2, 0])
+        self.assertEqual(len(self.calls), 2)
+        stat = os.stat(self.exe)
+        os.utime(self.exe, (stat.st_atime, stat.st_mtime + 10))
+        self.assertEqual(cache(self.exe, 'v', self.probe((2, 1))), [2, 1])
+        self.assertEqual(cache(self.exe, 'v', self.probe()), [2, 1])
+        self.assertEqual(len(self.calls), 3)
+
+    def test_not_cached(self):
+        cache = ProbeCache(self.cache_file)
+        # Failed probes
+        cache(self.exe, 'v', self.probe(None))
+        cache(self.exe, 'v', self.probe(None))
+        self.assertEqual(len(self.calls), 2)
+        # Missing executables
+        missing = os.path.join(self.tmpdir, 'missing')
+        cache(missing, 'v', self.probe())
+        cache(None, 'v', self.probe())
+        self.assertEqual(len(self.calls), 4)
+        # Values that cannot be stored
+        ans = object()
+        self.assertIs(cache(self.exe, 'v', self.probe(ans)), ans)
+        cache(self.exe, 'v', self.probe(ans))
+        self.assertEqual(len(self.calls), 6)
+        self.assertFalse(os.path.exists(self.cache_file))
+        # Disabled cache
+        cache = ProbeCache('')
+        cache(self.exe, 'v', self.probe())
+        cache(self.exe, 'v', self.probe())
+        self.assertEqual(len(self.calls), 8)
+
+    def test_corrupt_file(self):
+        os.makedirs(os.path.dirname(self.cache_file))
+        with open(self.cache_file, 'w') as FILE:
+            FILE.write('{')
+        cache = ProbeCache(self.cache_file)
+        cache(self.exe, 'v', self.probe())
+        cache = ProbeCache(self.cache_file)
+        self.assertEqual(cache(self.exe, 'v', self.probe()), [1, 2, 3, 0])
+        self.assertEqual(len(self.calls), 1)
+
+    def test_environ(self):
+        saved = os.environ.get('PYOMO_PROBE_CACHE', None)
+        try:
+            os.environ['PYOMO_PROBE_CACHE'] = self.cache_file
+            self.assertEqual(ProbeCache().filename, self.cache_file)
+            os.environ['PYOMO_PROBE_CACHE'] = ''
+            self.assertIsNone(ProbeCache().filename)
+        finally:
+            if saved is None:
+                del os.environ['PYOMO_PROBE_CACHE']
+            else:
+                os.environ['PYOMO_PROBE_CACHE'] = saved
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import json
+
+import pyutilib.th as unittest
+
+from six import StringIO
+
+from pyomo.environ import (AbstractModel, Block, Constraint, RangeSet,
+                           TransformationFactory, Var)
+from pyomo.common import timing
+from pyomo.common.timing import ConstructionProfiler
+
+try:
+    import tracemalloc
+    has_tracemalloc = True
+except ImportError:
+    has_tracemalloc = False
+
+
+def _block_rule(b, i):
+    b.y = Var(b.model().I)
+    b.c = Constraint(b.model().I, rule=lambda b, j: b.y[j] <= i)
+
+
+class TestConstructionProfiler(unittest.TestCase):
+
+    def _model(self):
+        m = AbstractModel()
+        m.I = RangeSet(5)
+        m.x = Var(m.I)
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] + 2*m.x[i] >= i)
+        m.b = Block(RangeSet(2), rule=_block_rule)
+        return m
+
+    def test_records(self):
+        m = self._model()
+        with ConstructionProfiler() as prof:
+            inst = m.create_instance()
+            TransformationFactory('core.relax_integrality').apply_to(inst)
+        self.assertIsNone(timing._profiler)
+        stats = dict(((r['type'], r['name']), r) for r in prof.records())
+        self.assertEqual(stats['Model', 'unknown']['count'], 1)
+        self.assertEqual(stats['Constraint', 'c']['rule_calls'], 5)
+        # m.x[i] + 2*m.x[i] >= i
+        self.assertEqual(stats['Constraint', 'c']['nodes'], 5*7)
+        self.assertEqual(stats['Block', 'b']['rule_calls'], 2)
+        self.assertEqual(stats['Constraint', 'b[2].c']['rule_calls'], 5)
+        self.assertIn(('Transformation', 'RelaxIntegrality (in-place)'),
+                      stats)
+        self.assertNotIn('bytes', stats['Constraint', 'c'])
+        model = stats['Model', 'unknown']
+        self.assertGreaterEqual(model['time'], model['self_time'])
+        self.assertGreaterEqual(model['time'],
+                                stats['Block', 'b']['time'])
+
+        data = json.loads(prof.to_json())
+        self.assertEqual(len(data['components']), len(stats))
+
+    def test_folded(self):
+        m = self._model()
+        with ConstructionProfiler() as prof:
+            m.create_instance()
+        out = StringIO()
+        prof.write_folded(out)
+        stacks = dict(line.rsplit(' ', 1)
+                      for line in out.getvalue().splitlines())
+        self.assertIn('Model unknown;Block b;Constraint b[1].c', stacks)
+        self.assertIn('Model unknown;Constraint c', stacks)
+        for val in stacks.values():
+            self.assertGreaterEqual(int(val), 0)
+
+    @unittest.skipIf(not has_tracemalloc, "tracemalloc is not available")
+    def test_memory(self):
+        m = self._model()
+        with ConstructionProfiler(memory=True) as prof:
+            m.create_instance()
+        self.assertFalse(tracemalloc.is_tracing())
+        for r in prof.records():
+            self.assertIn('bytes', r)
+
+    def test_inactive(self):
+        prof = ConstructionProfiler()
+        self._model().create_instance()
+        self.assertEqual(prof.records(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,14 @@
 import sys
+import json
 import logging
+from timeit import default_timer
 from pyutilib.misc.timing import TicTocTimer
 
+try:
+    import tracemalloc
+except ImportError:                             #pragma:nocover
+    tracemalloc = None
+
 _logger = logging.getLogger('pyomo.common.timing')
 _logger.propagate = False
 _logger.setLevel(logging.WARNING)
@@ -20,29 +27,39 @@ def report_timing(stream=True):
         for h in _logger.handlers:
             _logger.removeHandler(h)
 
+def _component_name(obj):
+    try:
+        return obj.name
+    except RuntimeError:
+        try:
+            return obj.local_name
+        except RuntimeError:
+            return '(unknown)'
+
 _construction_logger = logging.getLogger('pyomo.common.timing.construction')
 class ConstructionTimer(object):
     fmt = "%%6.%df seconds to construct %s %s; %d %s total"
     def __init__(self, obj):
         self.obj = obj
         self.timer = TicTocTimer()
+        if _profiler is None:
+            self.frame = None
+        else:
+            self.frame = _profiler._push(
+                obj.type().__name__, _component_name(obj))
 
     def report(self):
         # Record the elapsed time, as some log handlers may not
         # immediately generate the messge string
         self.timer = self.timer.toc(msg="")
+        if self.frame is not None:
+            self.frame.profiler._pop(self.frame, self.obj)
         _construction_logger.info(self)
 
     def __str__(self):
         total_time = self.timer
         idx = len(self.obj.index_set())
-        try:
-            name = self.obj.name
-        except RuntimeError:
-            try:
-                name = self.obj.local_name
-            except RuntimeError:
-                name = '(unknown)'
+        name = _component_name(self.obj)
         try:
             return self.fmt % ( 2 if total_time>=0.005 else 0,
                                 self.obj.type().__name__,
@@ -67,11 +84,14 @@ class TransformationTimer(object):
         else:
             self.mode = " (%s)" % (mode,)
         self.timer = TicTocTimer()
+        self.frame = push_profile_frame(
+            'Transformation', obj.__class__.__name__ + self.mode)
 
     def report(self):
         # Record the elapsed time, as some log handlers may not
         # immediately generate the message string
         self.timer = self.timer.toc(msg="")
+        pop_profile_frame(self.frame)
         _transform_logger.info(self)
 
     def __str__(self):
@@ -86,3 +106,202 @@ class TransformationTimer(object):
             return "TransformationTimer object for %s; %s elapsed seconds" % (
                 name,
                 self.timer.toc("") )
+
+
+#
+# Construction profiling
+#
+
+# The active ConstructionProfiler (or None)
+_profiler = None
+
+def push_profile_frame(kind, name):
+    """Start a profiled region (returns None if no profiler is active)"""
+    if _profiler is None:
+        return None
+    return _profiler._push(kind, name)
+
+def pop_profile_frame(frame, obj=None):
+    """End a profiled region started with push_profile_frame()"""
+    if frame is not None:
+        frame.profiler._pop(frame, obj)
+
+def profile_rule(rule, *args):
+    """Call a construction rule, recording the call in the active profiler"""
+    if _profiler is None:
+        return rule(*args)
+    return _profiler._call_rule(rule, *args)
+
+
+class _ProfileFrame(object):
+    __slots__ = ('profiler', 'kind', 'name', 'start', 'memory',
+                 'child_time', 'rule_calls', 'rule_time')
+
+    def __init__(self, profiler, kind, name):
+        self.profiler = profiler
+        self.kind = kind
+        self.name = name
+        self.child_time = 0
+        self.rule_calls = 0
+        self.rule_time = 0
+        if profiler.memory:
+            self.memory = tracemalloc.get_traced_memory()[0]
+        self.start = default_timer()
+
+
+class ConstructionProfiler(object):
+    """Record where the time (and memory) goes while building models.
+
+    While a profiler is active (between start() and stop(), or within
+    a ``with`` block), it records for every constructed component, call
+    to Model.create_instance(), and applied Transformation:
+
+        count       The number of times it was constructed / applied
+        time        The total (inclusive) time in seconds
+        self_time   The time not spent in nested constructions
+        rule_calls  The number of calls to indexed construction rules
+        rule_time   The time spent in those rules (inclusive)
+        nodes       The number of expression nodes in the component
+                    (for Constraint, Objective and Expression)
+        bytes       The net growth of the memory traced by tracemalloc
+                    (only if memory=True)
+
+    The statistics are aggregated by component type and name, and are
+    returned by records() and to_json().  write_folded() writes the
+    self time of each stack of nested constructions in the "folded
+    stacks" format read by flame graph tools (e.g., flamegraph.pl or
+    speedscope).
+    """
+
+    def __init__(self, memory=False):
+        if memory and tracemalloc is None:
+            raise ValueError("The tracemalloc module is not available. "
+                             "Cannot profile construction memory.")
+        self.memory = memory
+        self.stats = {}
+        self.stacks = {}
+        self._stack = []
+        self._previous = None
+        self._started_tracemalloc = False
+
+    def start(self):
+        """Make this the active construction profiler"""
+        global _profiler
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._previous = _profiler
+        _profiler = self
+        return self
+
+    def stop(self):
+        """Stop recording (and restore the previously active profiler)"""
+        global _profiler
+        if _profiler is self:
+            _profiler = self._previous
+        self._previous = None
+        self._stack = []
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, et, ev, tb):
+        self.stop()
+
+    def _push(self, kind, name):
+        frame = _ProfileFrame(self, kind, name)
+        self._stack.append(frame)
+        return frame
+
+    def _pop(self, frame, obj=None):
+        elapsed = default_timer() - frame.start
+        stack = self._stack
+        if frame not in stack:
+            return
+        # Discard any nested frames that were never closed (e.g.,
+        # because construction raised an exception)
+        while stack.pop() is not frame:
+            pass
+        key = (frame.kind, frame.name)
+        stats = self.stats.get(key, None)
+        if stats is None:
+            stats = self.stats[key] = {
+                'type': frame.kind, 'name': frame.name, 'count': 0,
+                'time': 0.0, 'self_time': 0.0, 'rule_calls': 0,
+                'rule_time': 0.0, 'nodes': 0}
+            if self.memory:
+                stats['bytes'] = 0
+        stats['count'] += 1
+        stats['time'] += elapsed
+        stats['self_time'] += elapsed - frame.child_time
+        stats['rule_calls'] += frame.rule_calls
+        stats['rule_time'] += frame.rule_time
+        if self.memory:
+            stats['bytes'] += tracemalloc.get_traced_memory()[0] \
+                              - frame.memory
+        if obj is not None:
+            start = default_timer()
+            stats['nodes'] += _count_expression_nodes(obj)
+            # Do not charge the time spent counting to the enclosing
+            # frames
+            overhead = default_timer() - start
+            for f in stack:
+                f.start += overhead
+        path = tuple("%s %s" % (f.kind, f.name) for f in stack) \
+               + ("%s %s" % key,)
+        self.stacks[path] = self.stacks.get(path, 0) \
+                            + elapsed - frame.child_time
+        if stack:
+            stack[-1].child_time += elapsed
+
+    def _call_rule(self, rule, *args):
+        if not self._stack:
+            return rule(*args)
+        frame = self._stack[-1]
+        start = default_timer()
+        try:
+            return rule(*args)
+        finally:
+            frame.rule_calls += 1
+            frame.rule_time += default_timer() - start
+
+    def records(self):
+        """Return the statistics, sorted by decreasing total time"""
+        return sorted((dict(stats) for stats in self.stats.values()),
+                      key=lambda x: (-x['time'], x['type'], x['name']))
+
+    def to_json(self, ostream=None, **kwds):
+        """Return (or write to ostream) the statistics as JSON"""
+        data = {'memory': self.memory, 'components': self.records()}
+        if ostream is None:
+            return json.dumps(data, **kwds)
+        json.dump(data, ostream, **kwds)
+
+    def write_folded(self, ostream=None):
+        """Write the self time (in microseconds) of each stack of
+        nested constructions in the "folded stacks" format"""
+        if ostream is None:
+            ostream = sys.stdout
+        for path in sorted(self.stacks):
+            ostream.write("%s %d\n" % (
+                ';'.join(x.replace(';', ',') for x in path),
+                int(round(self.stacks[path]*1e6))))
+
+
+_expression_ctypes = set(['Constraint', 'Objective', 'Expression'])
+
+def _count_expression_nodes(obj):
+    if obj.type().__name__ not in _expression_ctypes:
+        return 0
+    if obj.is_indexed() and obj.is_lazy():
+        return 0
+    from pyomo.core.expr.expr_pyomo5 import _sizeof_expression
+    nodes = 0
+    for data in obj.values():
+        expr = data.expr
+        if expr is not None:
+            nodes += _sizeof_expression(expr)
+    return nodes
@@ -44,7 +44,7 @@ from pyomo.common.deprecation import deprecation_warning
 from pyomo.core.expr import expr_common
 from pyomo.core.expr.symbol_map import SymbolMap
 
-from pyomo.core.base.var import _VarData, Var
+from pyomo.core.base.var import _VarData, Var, load_var_values
 from pyomo.core.base.constraint import Constraint
 from pyomo.core.base.objective import Objective
 from pyomo.core.base.set_types import *
@@ -60,7 +60,11 @@ from pyomo.core.base.plugin import ModelComponentFactory, TransformationFactory
 from pyomo.core.base.label import CNameLabeler, CuidLabeler
 
 import pyomo.opt
-from pyomo.opt.results import SolverResults, Solution, SolutionStatus, UndefinedData
+from pyomo.opt.results import (SolverResults,
+                               CompactSolverResults,
+                               Solution,
+                               SolutionStatus,
+                               UndefinedData)
 
 from six import itervalues, iteritems, StringIO, string_types
 from six.moves import xrange
@@ -125,6 +129,10 @@ class ModelSolution(object):
         #
         for name in ['objective', 'variable', 'constraint', 'problem']:
             self._entry[name] = {}
+        #
+        # arrays[name]: suffix -> (list of objects, values)
+        #
+        self._arrays = None
 
     def __getattr__(self, name):
         if name[0] == '_':
@@ -144,7 +152,8 @@ class ModelSolution(object):
     def __getstate__(self):
         state = {
             '_metadata': self._metadata,
-            '_entry': {}
+            '_entry': {},
+            '_arrays': self._arrays,
         }
         for (name, data) in iteritems(self._entry):
             tmp = state['_entry'][name] = []
@@ -165,6 +174,7 @@ class ModelSolution(object):
 
     def __setstate__(self, state):
         self._metadata = state['_metadata']
+        self._arrays = state.get('_arrays', None)
         self._entry = {}
         for name, data in iteritems(state['_entry']):
             tmp = self._entry[name] = {}
@@ -317,35 +327,67 @@ class ModelSolutions(object):
             sm = SymbolMap()
 
             entry = soln_._entry['objective']
+            arrays = self._array_entries(soln_, 'objective')
             for obj in instance.component_data_objects(Objective, active=True):
-                vals = entry.get(id(obj), None)
+                vals = self._store_entry(obj, entry, arrays)
                 if vals is None:
                     vals = {}
-                else:
-                    vals = vals[1]
                 vals['Value'] = value(obj)
                 soln.objective[ sm.getSymbol(obj, labeler) ] = vals
             entry = soln_._entry['variable']
+            arrays = self._array_entries(soln_, 'variable')
             for obj in instance.component_data_objects(Var, active=True):
                 if obj.stale:
                     continue
-                vals = entry.get(id(obj), None)
+                vals = self._store_entry(obj, entry, arrays)
                 if vals is None:
                     vals = {}
-                else:
-                    vals = vals[1]
                 vals['Value'] = value(obj)
                 soln.variable[ sm.getSymbol(obj, labeler) ] = vals
             entry = soln_._entry['constraint']
+            arrays = self._array_entries(soln_, 'constraint')
             for obj in instance.component_data_objects(Constraint, active=True):
-                vals = entry.get(id(obj), None)
+                vals = self._store_entry(obj, entry, arrays)
                 if vals is None:
                     continue
-                else:
-                    vals = vals[1]
                 soln.constraint[ sm.getSymbol(obj, labeler) ] = vals
             results.solution.insert( soln )
 
+    @staticmethod
+    def _array_entries(soln, name):
+        """
+        Collect the values of a solution that were read as arrays into
+        a dict that maps the id of each object to its entry.
+        """
+        ans = {}
+        if soln._arrays is None:
+            return ans
+        for key, (objs, values) in iteritems(soln._arrays.get(name, {})):
+            for obj, val in ModelSolutions._array_items(objs, values):
+                tmp = ans.get(id(obj), None)
+                if tmp is None:
+                    tmp = ans[id(obj)] = {}
+                tmp[key] = val
+        return ans
+
+    @staticmethod
+    def _store_entry(obj, entry, arrays):
+        """
+        Return the solution entry for an object, merging the values
+        that were read as arrays, or None if there is no entry.
+        """
+        vals = entry.get(id(obj), None)
+        if vals is not None:
+            vals = vals[1]
+        extra = arrays.get(id(obj), None)
+        if extra is not None:
+            if vals is None:
+                vals = extra
+            else:
+                vals = dict(vals)
+                vals.update(extra)
+        return vals
+
     def add_solution(self,
                      solution,
                      smap_id,
@@ -420,6 +462,9 @@ class ModelSolutions(object):
             # Map solution
             #
             smap = self.symbol_map[smap_id]
+            arrays = getattr(solution, '_arrays', None)
+            if arrays is not None:
+                soln._arrays = self._map_arrays(arrays, smap)
             for name in ['problem', 'objective', 'variable', 'constraint']:
                 tmp = soln._entry[name]
                 for symb, val in iteritems(getattr(solution, name)):
@@ -462,6 +507,45 @@ class ModelSolutions(object):
         self.solutions.append(soln)
         return len(self.solutions)-1
 
+    @staticmethod
+    def _map_arrays(arrays, smap):
+        """
+        Map the positional solution values read from an NL solution
+        file to the model components through the symbol map of the
+        NL writer.
+        """
+        ans = {}
+        for name, prefix in (('variable', 'v'),
+                             ('constraint', 'c'),
+                             ('objective', 'o')):
+            data = arrays.get(name, None)
+            if not data:
+                continue
+            n = 0
+            for values in itervalues(data):
+                if type(values) is dict:
+                    if values:
+                        n = max(n, max(values) + 1)
+                else:
+                    n = max(n, len(values))
+            byIndex = getattr(smap, 'byIndex', None)
+            if byIndex is not None:
+                objs = byIndex.get(prefix, [])
+            else:
+                bySymbol = smap.bySymbol
+                objs = []
+                for i in xrange(n):
+                    obj = bySymbol.get(prefix + str(i), None)
+                    objs.append(None if obj is None else obj())
+            if len(objs) < n:
+                raise RuntimeError(
+                    "ERROR: The solution has values for %s %s components, "
+                    "but the symbol map only has %s!"
+                    % (n, name, len(objs)))
+            ans[name] = dict((key, (objs, values))
+                             for key, values in iteritems(data))
+        return ans
+
     def select(self,
                index=0,
                allow_consistent_values_for_fixed_vars=False,
@@ -524,29 +608,21 @@ class ModelSolutions(object):
         #
         # Load variable data (suffixes and values)
         #
+        vars_to_load = []
+        values_to_load = []
         for id_, (vdata, entry) in iteritems(soln._entry['variable']):
             vdata = vdata()
             val = entry['Value']
             if vdata.fixed is True:
                 if ignore_fixed_vars:
                     continue
-                if not allow_consistent_values_for_fixed_vars:
-                    msg = "Variable '%s' in model '%s' is currently fixed - new" \
-                          ' value is not expected in solution'
-                    raise TypeError(msg % (vdata.name, instance.name))
-                if math.fabs(val - vdata.value) > comparison_tolerance_for_fixed_vars:
-                    raise TypeError("Variable '%s' in model '%s' is currently "
-                                    "fixed - a value of '%s' in solution is "
-                                    "not within tolerance=%s of the current "
-                                    "value of '%s'"
-                                    % (vdata.name,
-                                       instance.name,
-                                       str(val),
-                                       str(comparison_tolerance_for_fixed_vars),
-                                       str(vdata.value)))
-
-            vdata.value = val
-            vdata.stale = False
+                self._check_fixed_var(
+                    instance, vdata, val,
+                    allow_consistent_values_for_fixed_vars,
+                    comparison_tolerance_for_fixed_vars)
+
+            vars_to_load.append(vdata)
+            values_to_load.append(val)
 
             for _attr_key, attr_value in iteritems(entry):
                 attr_key = _attr_key[0].lower() + _attr_key[1:]
@@ -554,6 +630,28 @@ class ModelSolutions(object):
                     continue
                 elif attr_key in valid_import_suffixes:
                     valid_import_suffixes[attr_key][vdata] = attr_value
+        arrays = soln._arrays
+        if arrays is not None and 'variable' in arrays:
+            #
+            # Load the variable values that were read as arrays
+            #
+            for key, (objs, values) in iteritems(arrays['variable']):
+                if key == 'Value':
+                    for vdata, val in self._array_items(objs, values):
+                        if vdata.fixed is True:
+                            if ignore_fixed_vars:
+                                continue
+                            self._check_fixed_var(
+                                instance, vdata, val,
+                                allow_consistent_values_for_fixed_vars,
+                                comparison_tolerance_for_fixed_vars)
+                        vars_to_load.append(vdata)
+                        values_to_load.append(val)
+                else:
+                    self._load_array_suffix(
+                        key, objs, values, valid_import_suffixes)
+        # Array-backed variables are loaded in bulk
+        load_var_values(vars_to_load, values_to_load)
         #
         # Load constraint data (suffixes)
         #
@@ -563,6 +661,60 @@ class ModelSolutions(object):
                 attr_key = _attr_key[0].lower() + _attr_key[1:]
                 if attr_key in valid_import_suffixes:
                     valid_import_suffixes[attr_key][cdata] = attr_value
+        #
+        # Load constraint and objective data (suffixes) that were read
+        # as arrays
+        #
+        if arrays is not None:
+            for name in ('constraint', 'objective'):
+                for key, (objs, values) in iteritems(arrays.get(name, {})):
+                    self._load_array_suffix(
+                        key, objs, values, valid_import_suffixes)
+
+    @staticmethod
+    def _check_fixed_var(instance,
+                         vdata,
+                         val,
+                         allow_consistent_values_for_fixed_vars,
+                         comparison_tolerance_for_fixed_vars):
+        if not allow_consistent_values_for_fixed_vars:
+            msg = "Variable '%s' in model '%s' is currently fixed - new" \
+                  ' value is not expected in solution'
+            raise TypeError(msg % (vdata.name, instance.name))
+        if math.fabs(val - vdata.value) > comparison_tolerance_for_fixed_vars:
+            raise TypeError("Variable '%s' in model '%s' is currently "
+                            "fixed - a value of '%s' in solution is "
+                            "not within tolerance=%s of the current "
+                            "value of '%s'"
+                            % (vdata.name,
+                               instance.name,
+                               str(val),
+                               str(comparison_tolerance_for_fixed_vars),
+                               str(vdata.value)))
+
+    @staticmethod
+    def _array_items(objs, values):
+        """
+        Generate the (object, value) pairs for values that are either
+        a list (of values in object order) or a dict that maps object
+        positions to values.
+        """
+        if type(values) is dict:
+            items = ((objs[i], val) for i, val in iteritems(values))
+        else:
+            items = zip(objs, values)
+        for obj, val in items:
+            if obj is not None:
+                yield obj, val
+
+    @staticmethod
+    def _load_array_suffix(key, objs, values, valid_import_suffixes):
+        attr_key = key[0].lower() + key[1:]
+        suffix = valid_import_suffixes.get(attr_key, None)
+        if suffix is None:
+            return
+        for obj, val in ModelSolutions._array_items(objs, values):
+            suffix[obj] = val
 
 
 @ModelComponentFactory.register('Model objects can be used as a component of other models.')
@@ -699,6 +851,7 @@ arguments (which have been ignored):"""
 
         if name is None:
             name = self.name
+        profile_frame = pyomo.common.timing.push_profile_frame('Model', name)
         if filename is not None:
             if data is not None:
                 logger.warning("Model.create_instance() passed both 'filename' "
@@ -772,6 +925,7 @@ arguments (which have been ignored):"""
         # ConcreteModel
         #
         instance.__class__ = ConcreteModel
+        pyomo.common.timing.pop_profile_frame(profile_frame)
         return instance
 
 
@@ -797,7 +951,7 @@ arguments (which have been ignored):"""
             dp = arg
         elif type(arg) is dict:
             dp = DataPortal(data_dict=arg, model=self)
-        elif isinstance(arg, SolverResults):
+        elif isinstance(arg, (SolverResults, CompactSolverResults)):
             if len(arg.solution):
                 logger.warning(
 """DEPRECATION WARNING: the Model.load() method is deprecated for
@@ -46,6 +46,7 @@ import pyomo.core.base._pyomo
 #
 import pyomo.core.base.util
 from pyomo.core.base.rangeset import *
+from pyomo.core.base.serialize import *
 
 from pyomo.core.base.instance2dat import *
 
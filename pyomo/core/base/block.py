@@ -17,21 +17,26 @@ import sys
 import weakref
 import logging
 from inspect import isclass
+from io import BytesIO
 from operator import itemgetter, attrgetter
 from six import iteritems, iterkeys, itervalues, StringIO, string_types, \
     advance_iterator, PY3
+from six.moves import cPickle as pickle
 
 from pyomo.common.timing import ConstructionTimer
+from pyomo.common.parallel import parallel_map
 from pyomo.core.base.plugin import *  # ModelComponentFactory
 from pyomo.core.base.component import Component, ActiveComponentData, \
-    ComponentUID
+    ComponentUID, _ComponentBase
 from pyomo.core.base.sets import Set,  _SetDataBase
 from pyomo.core.base.var import Var
 from pyomo.core.base.misc import apply_indexed_rule
+from pyomo.core.base.clone import structural_copy, UncopyableObjectError
 from pyomo.core.base.suffix import ComponentMap
 from pyomo.core.base.indexed_component import IndexedComponent, \
     ActiveIndexedComponent, UnindexedComponent_set
 import collections
+import multiprocessing
 
 from pyomo.opt.base import ProblemFormat, guess_format
 from pyomo.opt import WriterFactory
@@ -252,6 +257,57 @@ class _BlockConstruction(object):
     data = {}
 
 
+def _data_cache_key(ctype, active, sort):
+    """Return the key used to cache the component data matching the
+    arguments, or None if the query should not be cached."""
+    if SortComponents.sort_names(sort) or SortComponents.sort_indices(sort):
+        return None
+    if ctype is None or isclass(ctype):
+        return (ctype, active)
+    if ctype.__class__ is tuple and all(isclass(x) for x in ctype):
+        return (ctype, active)
+    return None
+
+
+def _data_cache_stamp(comp):
+    """Return the record used to detect changes to the data of a cached
+    component."""
+    if comp.is_indexed():
+        return (comp, comp._data, len(comp._data))
+    return (comp, None, len(comp))
+
+
+def _component_data_items(comp, active, sort_indices):
+    """Return the (index, component data) pairs for a component"""
+    # _NOTE_: Suffix has a dict interface (something other
+    #         derived non-indexed Components may do as well),
+    #         so we don't want to test the existence of
+    #         iteritems as a check for components. Also,
+    #         the case where we test len(comp) after seeing
+    #         that comp.is_indexed is False is a hack for a
+    #         SimpleConstraint whose expression resolved to
+    #         Constraint.skip or Constraint.feasible (in which
+    #         case its data is empty and iteritems would have
+    #         been empty as well)
+    # try:
+    #    _items = comp.iteritems()
+    # except AttributeError:
+    #    _items = [ (None, comp) ]
+    if comp.is_indexed():
+        _items = comp.iteritems()
+    # This is a hack (see _NOTE_ above).
+    elif len(comp) or not hasattr(comp, '_data'):
+        _items = ((None, comp),)
+    else:
+        _items = tuple()
+
+    if sort_indices:
+        _items = sorted(_items, key=itemgetter(0))
+    if active is None or not isinstance(comp, ActiveIndexedComponent):
+        return _items
+    return (x for x in _items if x[1].active == active)
+
+
 class PseudoMap(object):
     """
     This class presents a "mock" dict interface to the internal
@@ -530,6 +586,8 @@ class _BlockData(ActiveComponentData):
         # Note sure why we are deleting these...
         if '_repn' in ans:
             del ans['_repn']
+        # The component data cache is rebuilt on demand
+        ans.pop('_data_cache', None)
         return ans
 
     #
@@ -932,6 +990,7 @@ component, use the block del_component() and add_component() methods.
             idx_info[2] += 1
         else:
             self._ctypes[_type] = [_new_idx, _new_idx, 1]
+        self._invalidate_data_cache()
         #
         # Propagate properties to sub-blocks:
         #   suppressed ctypes
@@ -1048,6 +1107,7 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         ctype_info[2] -= 1
         if ctype_info[2] == 0:
             del self._ctypes[obj.type()]
+        self._invalidate_data_cache()
 
         # Clear the _parent attribute
         obj._parent = None
@@ -1086,6 +1146,7 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             return
 
         idx = self._decl[name]
+        self._invalidate_data_cache()
 
         # Update the ctype linked lists
         ctype_info = self._ctypes[obj.type()]
@@ -1151,14 +1212,25 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         # NonNegativeReals, etc) that are not "owned" by any blocks and
         # should be preserved as singletons.
         #
+        # The structural copier (see pyomo.core.base.clone) copies
+        # components and expressions directly through their slots and
+        # only defers to deepcopy for objects it does not know about.
+        # If one of those objects cannot be deepcopied, we fall back on
+        # a paranoid deepcopy of the entire block.  Other errors are
+        # not caught.
+        #
         save_parent, self._parent = self._parent, None
         try:
-            new_block = copy.deepcopy(
+            new_block = structural_copy(
                 self, {
                     '__block_scope__': {id(self): True, id(None): False},
                     '__paranoid__': False,
                     })
-        except:
+        except UncopyableObjectError:
+            logger.warning(
+                "Block '%s' contains an object that cannot be copied (%s); "
+                "cloning the block with a paranoid deepcopy"
+                % (self.name, sys.exc_info()[1]))
             new_block = copy.deepcopy(
                 self, {
                     '__block_scope__': {id(self): True, id(None): False},
@@ -1246,37 +1318,64 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         _sort_indices = SortComponents.sort_indices(sort)
         _subcomp = PseudoMap(self, ctype, active, sort)
         for name, comp in _subcomp.iteritems():
-            # _NOTE_: Suffix has a dict interface (something other
-            #         derived non-indexed Components may do as well),
-            #         so we don't want to test the existence of
-            #         iteritems as a check for components. Also,
-            #         the case where we test len(comp) after seeing
-            #         that comp.is_indexed is False is a hack for a
-            #         SimpleConstraint whose expression resolved to
-            #         Constraint.skip or Constraint.feasible (in which
-            #         case its data is empty and iteritems would have
-            #         been empty as well)
-            # try:
-            #    _items = comp.iteritems()
-            # except AttributeError:
-            #    _items = [ (None, comp) ]
-            if comp.is_indexed():
-                _items = comp.iteritems()
-            # This is a hack (see _NOTE_ above).
-            elif len(comp) or not hasattr(comp, '_data'):
-                _items = ((None, comp),)
-            else:
-                _items = tuple()
-
-            if _sort_indices:
-                _items = sorted(_items, key=itemgetter(0))
-            if active is None or not isinstance(comp, ActiveIndexedComponent):
-                for idx, compData in _items:
-                    yield (name, idx), compData
+            for idx, compData in _component_data_items(
+                    comp, active, _sort_indices):
+                yield (name, idx), compData
+
+    def _component_data_list_iter(self, ctype=None, active=None, sort=False):
+        """
+        Return an iterator over the component data objects in the
+        block (without descending into sub-blocks).
+
+        The matching component data are cached on the block for each
+        (ctype, active) query.  The cache is discarded when components
+        are added to, deleted from or reclassified on this block, when
+        a component (or component data) on this block is activated or
+        deactivated, or when an indexed component on this block is
+        deleted from.  Data added to an indexed component is detected
+        by comparing the component sizes recorded with the cache.
+        """
+        key = _data_cache_key(ctype, active, sort)
+        if key is None:
+            return (x[1] for x in self._component_data_iter(
+                ctype=ctype, active=active, sort=sort))
+        cache = self.__dict__.get('_data_cache', None)
+        if cache is not None and key in cache:
+            stamps, data = cache[key]
+            for stamp in stamps:
+                if _data_cache_stamp(stamp[0]) != stamp:
+                    break
             else:
-                for idx, compData in _items:
-                    if compData.active == active:
-                        yield (name, idx), compData
+                return iter(data)
+        return self._cache_component_data(key, ctype, active)
+
+    def _cache_component_data(self, key, ctype, active):
+        """
+        Generator that returns the component data objects in the block
+        and then records them in the block's data cache.
+        """
+        # Note: write to the __dict__ directly to bypass the Block
+        # __setattr__
+        cache = self.__dict__.setdefault('_data_cache', {})
+        stamps = []
+        data = []
+        cacheable = True
+        for comp in PseudoMap(self, ctype, active).itervalues():
+            stamps.append(_data_cache_stamp(comp))
+            for idx, compData in _component_data_items(comp, active, False):
+                # Immutable Params return their (replaceable) values
+                cacheable = cacheable and isinstance(compData,
+                                                     _ComponentBase)
+                data.append(compData)
+                yield compData
+        # Only record the data if the block was not modified while the
+        # caller was iterating over it
+        if cacheable and self.__dict__.get('_data_cache', None) is cache:
+            cache[key] = (stamps, data)
+
+    def _invalidate_data_cache(self):
+        """Discard the component data cached on this block"""
+        self.__dict__.pop('_data_cache', None)
 
     def all_components(self, *args, **kwargs):
         logger.warning(
@@ -1337,10 +1436,10 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             block_generator = (self,)
 
         for _block in block_generator:
-            for x in _block._component_data_iter(ctype=ctype,
-                                                 active=active,
-                                                 sort=sort):
-                yield x[1]
+            for x in _block._component_data_list_iter(ctype=ctype,
+                                                      active=active,
+                                                      sort=sort):
+                yield x
 
     def component_data_iterindex(self,
                                  ctype=None,
@@ -1708,6 +1807,19 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                 "writer registered for that format"
                 % str(format))
 
+        # Writers only see the data of lazily constructed components
+        # that has already been constructed
+        lazy = [c.name for c in self.component_objects(
+                    active=True, descend_into=True)
+                if getattr(c, '_lazy_constructed', None) is not None
+                and len(c._lazy_constructed) < len(c.index_set())]
+        if lazy:
+            logger.warning(
+                "Writing model '%s' with lazily constructed components "
+                "that are not fully constructed: %s.  Only the data that "
+                "has been constructed is written; call materialize() to "
+                "construct the remaining data." % (self.name, ', '.join(lazy)))
+
         if solver_capability is None:
             def solver_capability(x): return True
         (filename, smap) = problem_writer(self,
@@ -1737,6 +1849,61 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         return filename, smap_id
 
 
+# The entries of _BlockData.__dict__ that are not user attributes
+_block_data_keys = frozenset(
+    ('_ctypes', '_decl', '_decl_order', '_data_cache', '_repn'))
+
+
+def _reject_components(obj):
+    if isinstance(obj, _ComponentBase):
+        raise pickle.PicklingError("'%s' is a Pyomo component" % (obj,))
+    return None
+
+
+def _dumps_block_attributes(block):
+    """
+    Pickle the attributes of a block (and its subblocks) that are not
+    components.  Returns a list with a dict for each block data in
+    block_data_objects() order.  The dicts map the attribute names to
+    the pickled values, or to None for values that cannot be pickled
+    (including values that refer to components).
+    """
+    ans = []
+    for bd in block.block_data_objects():
+        attributes = {}
+        for name, val in iteritems(bd.__dict__):
+            if name in bd._decl or name in _block_data_keys:
+                continue
+            buf = BytesIO()
+            pickler = pickle.Pickler(buf, pickle.HIGHEST_PROTOCOL)
+            pickler.persistent_id = _reject_components
+            try:
+                pickler.dump(val)
+                attributes[name] = buf.getvalue()
+            except Exception:
+                attributes[name] = None
+        ans.append(attributes)
+    return ans
+
+
+def _loads_block_attributes(data, block):
+    """
+    Restore the attributes pickled by _dumps_block_attributes() that
+    are missing from a block (and its subblocks).
+    """
+    for bd, attributes in zip(block.block_data_objects(), data):
+        for name, val in iteritems(attributes):
+            if name in bd.__dict__:
+                continue
+            if val is None:
+                raise ValueError(
+                    "The attribute '%s' of block '%s' cannot be sent back "
+                    "from the worker process (it cannot be pickled or it "
+                    "refers to a component).  Construct the block "
+                    "serially." % (name, bd.name))
+            super(_BlockData, bd).__setattr__(name, pickle.loads(val))
+
+
 @ModelComponentFactory.register("A component that contains one or more model components.")
 class Block(ActiveIndexedComponent):
     """
@@ -1746,6 +1913,19 @@ class Block(ActiveIndexedComponent):
     that they contain except blocks.  Blocks contained by other
     blocks use their local attribute to determine whether construction
     is deferred.
+
+    If an indexed Block is declared with ``parallel=N`` (or
+    ``parallel=True`` for one process per CPU), the rule is called for
+    the indices in N worker processes, and the components of each
+    finished block are sent back and added to the block in index
+    order.  The rule must only add components to its own block (and
+    may refer to components elsewhere in the model).  The components
+    are copied like :func:`save_model` copies them: the data are the
+    same as after serial construction, but the construction rules and
+    other declaration options are not kept.  Attributes that are not
+    components (e.g., ``b.info = {...}``) are pickled and restored; an
+    attribute that cannot be pickled or that refers to a component
+    raises a ValueError.
     """
 
     _ComponentDataClass = _BlockData
@@ -1763,6 +1943,7 @@ class Block(ActiveIndexedComponent):
         self._suppress_ctypes = set()
         self._rule = kwargs.pop('rule', None)
         self._options = kwargs.pop('options', None)
+        self._parallel = kwargs.pop('parallel', None)
         _concrete = kwargs.pop('concrete', False)
         kwargs.setdefault('ctype', Block)
         ActiveIndexedComponent.__init__(self, *args, **kwargs)
@@ -1824,31 +2005,60 @@ class Block(ActiveIndexedComponent):
         #    (_BlockConstruction.data) that the individual blocks'
         #    add_component() can refer back to to handle component
         #    construction.
-        for idx in self._index:
-            _block = self[idx]
-            if data is not None and idx in data:
-                _BlockConstruction.data[id(_block)] = data[idx]
-            obj = apply_indexed_rule(
-                self, self._rule, _block, idx, self._options)
-            if id(_block) in _BlockConstruction.data:
-                del _BlockConstruction.data[id(_block)]
-
-            if isinstance(obj, _BlockData) and obj is not _block:
-                # If the user returns a block, use their block instead
-                # of the empty one we just created.
-                for c in list(obj.component_objects(descend_into=False)):
-                    obj.del_component(c)
-                    _block.add_component(c.local_name, c)
-                # transfer over any other attributes that are not components
-                for name, val in iteritems(obj.__dict__):
-                    if not hasattr(_block, name) and not hasattr(self, name):
-                        super(_BlockData, _block).__setattr__(name, val)
-
-            # TBD: Should we allow skipping Blocks???
-            # if obj is Block.Skip and idx is not None:
-            #   del self._data[idx]
+        if self._parallel and self.is_indexed():
+            self._construct_parallel(data)
+        else:
+            for idx in self._index:
+                self._construct_index_data(idx, data)
         timer.report()
 
+    def _construct_index_data(self, idx, data):
+        """Fire the rule for one index of the block"""
+        _block = self[idx]
+        if data is not None and idx in data:
+            _BlockConstruction.data[id(_block)] = data[idx]
+        obj = apply_indexed_rule(
+            self, self._rule, _block, idx, self._options)
+        if id(_block) in _BlockConstruction.data:
+            del _BlockConstruction.data[id(_block)]
+
+        if isinstance(obj, _BlockData) and obj is not _block:
+            # If the user returns a block, use their block instead
+            # of the empty one we just created.
+            for c in list(obj.component_objects(descend_into=False)):
+                obj.del_component(c)
+                _block.add_component(c.local_name, c)
+            # transfer over any other attributes that are not components
+            for name, val in iteritems(obj.__dict__):
+                if not hasattr(_block, name) and not hasattr(self, name):
+                    super(_BlockData, _block).__setattr__(name, val)
+
+        # TBD: Should we allow skipping Blocks???
+        # if obj is Block.Skip and idx is not None:
+        #   del self._data[idx]
+        return _block
+
+    def _construct_parallel(self, data):
+        """Fire the rule for all indices in worker processes"""
+        # Deferred import (serialize imports this module)
+        from pyomo.core.base.serialize import _dumps_block, _loads_block
+        processes = self._parallel
+        if processes is True:
+            processes = multiprocessing.cpu_count()
+        context = self.model()
+        def _build(idx):
+            b = self._construct_index_data(idx, data)
+            return _dumps_block(b, context), _dumps_block_attributes(b)
+        index = list(self._index)
+        if processes <= 1 or len(index) <= 1:
+            for idx in index:
+                self._construct_index_data(idx, data)
+            return
+        for idx, (block_data, attributes) in zip(
+                index, parallel_map(_build, index, processes)):
+            _loads_block(block_data, self[idx], context)
+            _loads_block_attributes(attributes, self[idx])
+
     def pprint(self, filename=None, ostream=None, verbose=False, prefix=""):
         """
         Print block information
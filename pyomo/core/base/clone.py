@@ -0,0 +1,379 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# A structural copier used by Block.clone()
+#
+# copy.deepcopy() copies components and expression nodes by calling
+# __getstate__(), deepcopying the resulting state dictionary and then
+# calling __setstate__() on a new instance.  For the (slot-ized) classes
+# that make up a Pyomo model that round trip dominates the cost of
+# Block.clone().  The copier in this module knows the layout of those
+# classes: it first builds a remapping table from every component (and
+# component data) beneath the block being cloned to an empty instance
+# of the same class, and then fills in the new instances by copying the
+# slots and __dict__ entries directly.  Expression trees are rebuilt
+# node-by-node through the same table, so references to variables and
+# parameters inside the block point to the new objects, while
+# references to components outside the block are preserved.  The
+# copy is performed with an explicit work list, so deep expression
+# trees do not hit the recursion limit.
+#
+# Anything the copier does not know how to copy structurally is handed
+# to copy.deepcopy() using the same memo, so the two approaches can be
+# freely mixed.  If deepcopy fails, the copier raises an
+# UncopyableObjectError, so Block.clone() can fall back on a paranoid
+# deepcopy without hiding other errors.
+#
+
+__all__ = ['structural_copy', 'UncopyableObjectError']
+
+import copy
+import sys
+import types
+from pickle import PickleError
+from weakref import ref as weakref_ref
+
+from six import iteritems, itervalues
+
+from pyomo.core.expr.numvalue import NumericValue, native_types
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.core.kernel.component_set import ComponentSet
+from pyomo.core.base.component import (_ComponentBase, Component,
+                                       ComponentData)
+from pyomo.core.base.indexed_component import (IndexedComponent,
+                                               UnindexedComponent_set)
+from pyomo.core.base.suffix import Suffix
+
+
+class UncopyableObjectError(PickleError):
+    """
+    Raised by the structural copier when an object that it hands to
+    copy.deepcopy() cannot be deepcopied.
+    """
+    pass
+
+
+def structural_copy(root, memo):
+    """Copy a block (or component) and everything beneath it.
+
+    This is the engine behind :meth:`Block.clone`.  The memo follows
+    the conventions of :func:`copy.deepcopy` and must define the
+    ``'__block_scope__'`` dictionary used by
+    :meth:`_ComponentBase.__deepcopy__` (mapping ``id(root)`` to True
+    and ``id(None)`` to False).  Components that are not beneath
+    ``root`` are not copied.
+
+    Args:
+        root: The block to copy.
+        memo (dict): The deepcopy memo.
+
+    Returns:
+        The copy of ``root``.
+    """
+    copier = _StructuralCopier(memo)
+    copier.register(root)
+    return copier.run(root)
+
+
+#
+# The ways the copier handles each class of object
+#
+_ATOMIC = 0        # return the object itself
+_DICT = 1
+_LIST = 2
+_TUPLE = 3
+_SET = 4
+_FROZENSET = 5
+_WEAKREF = 6
+_COMPONENT = 7     # structural copy, if the component is in scope
+_STRUCTURAL = 8    # structural copy (expression nodes, ComponentMap)
+_DEEPCOPY = 9      # hand off to copy.deepcopy
+
+_atomic_types = set([
+    type, types.FunctionType, types.BuiltinFunctionType, complex,
+    type(Ellipsis), type(NotImplemented), range, property,
+])
+
+#: class -> how instances of the class are copied
+_class_kind = {
+    dict: _DICT,
+    list: _LIST,
+    tuple: _TUPLE,
+    set: _SET,
+    frozenset: _FROZENSET,
+    weakref_ref: _WEAKREF,
+}
+
+_NotFound = object()
+
+#: class -> (slot descriptors, has __dict__, skipped __dict__ keys, fixup)
+_class_layout = {}
+
+#: __setstate__ implementations that only assign the state to the
+#: object (after converting hard references back to weakrefs).  Classes
+#: whose __setstate__ does anything else are copied with deepcopy.
+_safe_setstate = None
+
+
+def _get_safe_setstate():
+    global _safe_setstate
+    if _safe_setstate is None:
+        # Imported here to avoid circular imports
+        from pyomo.core.base.alias import Alias
+        from pyomo.core.base.expression import _GeneralExpressionDataImpl
+        _safe_setstate = set(
+            cls.__dict__['__setstate__'] for cls in (
+                Component, ComponentData, IndexedComponent, NumericValue,
+                _GeneralExpressionDataImpl, Alias, Suffix, ComponentMap,
+                ComponentSet))
+    return _safe_setstate
+
+
+def _classify(cls):
+    """Determine (and cache) how instances of a class are copied"""
+    if cls in native_types or cls in _atomic_types:
+        kind = _ATOMIC
+    elif issubclass(cls, (_ComponentBase, NumericValue, ComponentMap,
+                          ComponentSet)) and _is_structural(cls):
+        _class_layout[cls] = _layout(cls)
+        if issubclass(cls, _ComponentBase):
+            kind = _COMPONENT
+        else:
+            kind = _STRUCTURAL
+    else:
+        kind = _DEEPCOPY
+    _class_kind[cls] = kind
+    return kind
+
+
+def _is_structural(cls):
+    """Return True if the pickle protocol of a class only moves the
+    attributes of the instance (and can therefore be bypassed)"""
+    if getattr(cls, '__deepcopy__', _ComponentBase.__deepcopy__) \
+       is not _ComponentBase.__deepcopy__:
+        return False
+    if cls.__reduce_ex__ is not object.__reduce_ex__ \
+       or cls.__reduce__ is not object.__reduce__:
+        return False
+    safe = _get_safe_setstate()
+    for base in cls.__mro__:
+        if '__setstate__' in base.__dict__ \
+           and base.__dict__['__setstate__'] not in safe:
+            return False
+    return True
+
+
+def _layout(cls):
+    # Imported here to avoid circular imports
+    from pyomo.core.base.block import _BlockData
+
+    slots = []
+    for base in reversed(cls.__mro__):
+        names = base.__dict__.get('__slots__', ())
+        if names.__class__ in native_types:
+            names = (names,)
+        for name in names:
+            if name in ('__weakref__', '__dict__'):
+                continue
+            if name.startswith('__') and not name.endswith('__'):
+                name = '_%s%s' % (base.__name__.lstrip('_'), name)
+            slots.append(base.__dict__[name])
+    has_dict = '__dict__' in dir(cls)
+    if issubclass(cls, _BlockData):
+        # The block __getstate__ never copies the cached
+        # representations generated by the writers or the cached
+        # component data
+        skip = frozenset(('_repn', '_data_cache'))
+    else:
+        skip = frozenset()
+    if issubclass(cls, ComponentMap):
+        fixup = _rebuild_component_map
+    elif issubclass(cls, ComponentSet):
+        fixup = _rebuild_component_set
+    else:
+        fixup = None
+    return tuple(slots), has_dict, skip, fixup
+
+
+def _rebuild_component_map(obj):
+    # ComponentMap is keyed by id(), so the keys must be regenerated
+    obj._dict = dict((id(key), (key, val))
+                     for key, val in itervalues(obj._dict))
+
+
+def _rebuild_component_set(obj):
+    # ComponentSet is keyed by id(), so the keys must be regenerated
+    obj._data = dict((id(val), val) for val in itervalues(obj._data))
+
+
+class _StructuralCopier(object):
+    """Copy a block hierarchy through a remapping table.
+
+    The memo maps id(original) -> copy for every object that has
+    already been copied (or for which an empty instance has been
+    created).  Empty instances are queued on the pending list and
+    filled in by :meth:`run`.
+    """
+
+    __slots__ = ('memo', 'scope', 'pending')
+
+    def __init__(self, memo):
+        self.memo = memo
+        self.scope = memo['__block_scope__']
+        self.pending = []
+
+    def register(self, root):
+        """Build the remapping table for all components beneath root"""
+        # Imported here to avoid circular imports
+        from pyomo.core.base.block import _BlockData
+
+        memo = self.memo
+        scope = self.scope
+        blocks = [root]
+        self._new_instance(root)
+        while blocks:
+            block = blocks.pop()
+            scope[id(block)] = True
+            for comp in block.component_objects(descend_into=False):
+                if id(comp) not in memo:
+                    self._new_instance(comp)
+                if not isinstance(comp, IndexedComponent):
+                    continue
+                for data in itervalues(comp._data):
+                    if id(data) not in memo:
+                        self._new_instance(data)
+                    if isinstance(data, _BlockData):
+                        blocks.append(data)
+
+    def run(self, root):
+        """Fill in all pending instances and return the copy of root"""
+        pending = self.pending
+        fill = self._fill
+        while pending:
+            fill(*pending.pop())
+        return self.memo[id(root)]
+
+    def _new_instance(self, obj):
+        cls = obj.__class__
+        if cls not in _class_layout and _classify(cls) == _DEEPCOPY:
+            return self._deepcopy(obj)
+        ans = self.memo[id(obj)] = cls.__new__(cls)
+        self.pending.append((obj, ans))
+        return ans
+
+    def _fill(self, obj, ans):
+        cls = obj.__class__
+        slots, has_dict, skip, fixup = _class_layout[cls]
+        _copy = self.copy
+        for slot in slots:
+            try:
+                val = slot.__get__(obj, cls)
+            except AttributeError:
+                # unassigned slot
+                continue
+            slot.__set__(ans, _copy(val))
+        if has_dict:
+            # Note: write to the __dict__ directly to bypass
+            # overloaded __setattr__ methods (e.g., on blocks)
+            state = ans.__dict__
+            for key, val in iteritems(obj.__dict__):
+                if key in skip:
+                    continue
+                state[key] = _copy(val)
+        if fixup is not None:
+            fixup(ans)
+
+    def _in_scope(self, obj):
+        scope = self.scope
+        _id = id(obj)
+        if _id in scope:
+            return scope[_id]
+        # This mirrors the scope test in _ComponentBase.__deepcopy__
+        _new = []
+        tmp = obj.parent_block()
+        tmpId = id(tmp)
+        while tmpId not in scope:
+            _new.append(tmpId)
+            tmp = tmp.parent_block()
+            tmpId = id(tmp)
+        for _id in _new:
+            scope[_id] = scope[tmpId]
+        return scope[tmpId]
+
+    def copy(self, obj):
+        """Return the copy of an arbitrary object"""
+        cls = obj.__class__
+        kind = _class_kind.get(cls, None)
+        if kind is None:
+            kind = _classify(cls)
+        if kind == _ATOMIC:
+            return obj
+        memo = self.memo
+        ans = memo.get(id(obj), _NotFound)
+        if ans is not _NotFound:
+            return ans
+
+        if kind == _COMPONENT:
+            if not self._in_scope(obj):
+                memo[id(obj)] = obj
+                return obj
+            return self._new_instance(obj)
+        elif kind == _STRUCTURAL:
+            return self._new_instance(obj)
+        elif kind == _LIST:
+            ans = memo[id(obj)] = []
+            ans.extend(self.copy(x) for x in obj)
+            return ans
+        elif kind == _DICT:
+            ans = memo[id(obj)] = {}
+            for key, val in iteritems(obj):
+                ans[self.copy(key)] = self.copy(val)
+            return ans
+        elif kind == _TUPLE:
+            _copy = self.copy
+            ans = tuple([_copy(x) for x in obj])
+            if all(x is y for x, y in zip(ans, obj)):
+                ans = obj
+            memo[id(obj)] = ans
+            return ans
+        elif kind == _SET:
+            if obj is UnindexedComponent_set:
+                # The global index set for scalar components
+                return obj
+            ans = memo[id(obj)] = set(self.copy(x) for x in obj)
+            return ans
+        elif kind == _FROZENSET:
+            ans = frozenset(self.copy(x) for x in obj)
+            if len(ans) == len(obj) and all(x in obj for x in ans):
+                ans = obj
+            memo[id(obj)] = ans
+            return ans
+        elif kind == _WEAKREF:
+            ref = obj()
+            if ref is None:
+                return obj
+            ans = self.copy(ref)
+            if ans is ref:
+                return obj
+            return weakref_ref(ans)
+        else:
+            return self._deepcopy(obj)
+
+    def _deepcopy(self, obj):
+        """Copy an object that the copier does not know about"""
+        try:
+            return copy.deepcopy(obj, self.memo)
+        except UncopyableObjectError:
+            raise
+        except Exception:
+            e = sys.exc_info()[1]
+            raise UncopyableObjectError(
+                "Unable to deepcopy object of type %s: %s"
+                % (type(obj).__name__, e))
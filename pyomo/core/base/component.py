@@ -66,6 +66,13 @@ def cname(*args, **kwds):
     return name(*args, **kwds)
 
 
+def _invalidate_data_cache(obj):
+    """Discard the component data cached on the block that owns obj"""
+    block = obj.parent_block()
+    if block is not None:
+        block._invalidate_data_cache()
+
+
 class _ComponentBase(object):
     """An abstract base class for Component and ComponentData
 
@@ -364,6 +371,7 @@ class Component(_ComponentBase):
     def reconstruct(self, data=None):
         """Re-construct model expressions"""
         self._constructed = False
+        _invalidate_data_cache(self)
         self.construct(data=data)
 
     def valid_model_component(self):
@@ -550,10 +558,12 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active=True
+        _invalidate_data_cache(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active=False
+        _invalidate_data_cache(self)
 
 
 class ComponentData(_ComponentBase):
@@ -873,10 +883,12 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        _invalidate_data_cache(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        _invalidate_data_cache(self)
 
 
 class ComponentUID(object):
@@ -570,6 +570,13 @@ class _GeneralConstraintData(_ConstraintData):
                 self._body  = expr.arg(1)
                 self._upper = as_numeric(expr.arg(2))
 
+        #
+        # The body is finalized, so sums can store their arguments
+        # compactly
+        #
+        if self._body.__class__ is EXPR.SumExpression:
+            self._body._compact()
+
         #
         # Reset the values to 'None' if they are 'infinite'
         #
@@ -636,6 +643,10 @@ class Constraint(ActiveIndexedComponent):
             A Pyomo expression for this constraint
         rule 
             A function that is used to construct constraint expressions
+        lazy
+            If True, the rule is only evaluated for an index when
+            that index is first accessed (see
+            IndexedComponent.materialize)
         doc 
             A text string describing this component
         name 
@@ -688,6 +699,7 @@ class Constraint(ActiveIndexedComponent):
     def __init__(self, *args, **kwargs):
         self.rule = kwargs.pop('rule', None)
         self._init_expr = kwargs.pop('expr', None)
+        self._lazy = kwargs.pop('lazy', False)
         #if self.rule is None and self._init_expr is None:
         #    raise ValueError("A simple Constraint component requires a 'rule' or 'expr' option")
         kwargs.setdefault('ctype', Constraint)
@@ -771,25 +783,33 @@ class Constraint(ActiveIndexedComponent):
                     "of a constraint with a single expression" %
                     (self.name,) )
 
-            for ndx in self._index:
-                try:
-                    tmp = apply_indexed_rule(self,
-                                             _init_rule,
-                                             _self_parent,
-                                             ndx)
-                except Exception:
-                    err = sys.exc_info()[1]
-                    logger.error(
-                        "Rule failed when generating expression for "
-                        "constraint %s with index %s:\n%s: %s"
-                        % (self.name,
-                           str(ndx),
-                           type(err).__name__,
-                           err))
-                    raise
-                self._setitem_when_not_present(ndx, tmp)
+            if self._lazy:
+                # The rule is evaluated by _construct_index() as
+                # indices are accessed
+                self._lazy_constructed = set()
+            else:
+                for ndx in self._index:
+                    self._construct_index(ndx)
         timer.report()
 
+    def _construct_index(self, index):
+        try:
+            tmp = apply_indexed_rule(self,
+                                     self.rule,
+                                     self._parent(),
+                                     index)
+        except Exception:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed when generating expression for "
+                "constraint %s with index %s:\n%s: %s"
+                % (self.name,
+                   str(index),
+                   type(err).__name__,
+                   err))
+            raise
+        self._setitem_when_not_present(index, tmp)
+
     def _pprint(self):
         """
         Return data that will be printed for this component.
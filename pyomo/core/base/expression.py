@@ -254,6 +254,9 @@ class Expression(IndexedComponent):
                         used to initialize this object.
         expr        A synonym for initialize.
         rule        A rule function used to initialize this object.
+        lazy        If True, the rule is only evaluated for an index
+                        when that index is first accessed (see
+                        IndexedComponent.materialize).
     """
 
     _ComponentDataClass = _GeneralExpressionData
@@ -272,6 +275,7 @@ class Expression(IndexedComponent):
         self._init_rule = kwds.pop('rule', None)
         self._init_expr = kwds.pop('initialize', None)
         self._init_expr = kwds.pop('expr', self._init_expr)
+        self._lazy = kwds.pop('lazy', False)
         if is_functor(self._init_expr) and \
            (not isinstance(self._init_expr, NumericValue)):
             raise TypeError(
@@ -384,13 +388,11 @@ class Expression(IndexedComponent):
         if _init_rule is not None:
             # construct and initialize with a rule
             if self.is_indexed():
-                for key in self._index:
-                    self.add(key,
-                             apply_indexed_rule(
-                                 self,
-                                 _init_rule,
-                                 self._parent(),
-                                 key))
+                if self._lazy:
+                    self._lazy_constructed = set()
+                else:
+                    for key in self._index:
+                        self._construct_index(key)
             else:
                 self.add(None, _init_rule(self._parent()))
         else:
@@ -405,6 +407,14 @@ class Expression(IndexedComponent):
                     self.add(key, _init_expr)
         timer.report()
 
+    def _construct_index(self, index):
+        self.add(index,
+                 apply_indexed_rule(
+                     self,
+                     self._init_rule,
+                     self._parent(),
+                     index))
+
 class SimpleExpression(_GeneralExpressionData, Expression):
 
     def __init__(self, *args, **kwds):
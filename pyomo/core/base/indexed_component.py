@@ -13,8 +13,10 @@ __all__ = ['IndexedComponent', 'ActiveIndexedComponent']
 import pyutilib.misc
 
 from pyomo.core.expr.expr_errors import TemplateExpressionError
+from pyomo.core.expr.numvalue import native_types
 from pyomo.core.base.indexed_component_slice import _IndexedComponent_slice
-from pyomo.core.base.component import Component, ActiveComponent
+from pyomo.core.base.component import Component, ActiveComponent, \
+    _invalidate_data_cache
 from pyomo.core.base.config import PyomoOptions
 from pyomo.common import DeveloperError
 
@@ -28,6 +30,30 @@ def normalize_index(index):
     return just the element.  If it has length > 1, then
     return a tuple.
     """
+    # Fast path: native scalars and flat tuples of native scalars (by
+    # far the most common indices) do not need to be flattened.  Note
+    # that native_types is the live set, so types registered later are
+    # also recognized.
+    if index.__class__ in native_types:
+        return index
+    if index.__class__ is tuple:
+        idx = index
+        for i in idx:
+            if i.__class__ not in native_types:
+                if i.__class__ is not tuple:
+                    break
+                # Nested tuples (e.g., x[(i,j),k]) can be flattened
+                # without the generic iterable handling
+                idx = pyutilib.misc.flatten_tuple(index)
+                if any(i.__class__ not in native_types for i in idx):
+                    break
+                if len(idx) == 1:
+                    return idx[0]
+                return idx
+        else:
+            if len(idx) == 1:
+                return idx[0]
+            return idx
     idx = pyutilib.misc.flatten(index)
     if type(idx) is list:
         if len(idx) == 1:
@@ -37,6 +63,36 @@ def normalize_index(index):
     return idx
 normalize_index.flatten = True
 
+
+def intern_index(index):
+    """
+    Return the shared copy of an index tuple.
+
+    When index interning is enabled (see :func:`set_index_interning`),
+    equal index tuples are replaced by a single shared tuple, so that
+    components indexed by the same (virtual) product set do not each
+    hold their own copies of the index tuples.  When interning is
+    disabled, the index is returned unchanged.
+    """
+    table = intern_index.table
+    if table is None:
+        return index
+    return table.setdefault(index, index)
+intern_index.table = None
+
+
+def set_index_interning(enabled=True):
+    """
+    Enable (or disable) the global index interning table.
+
+    Disabling interning releases the table; indices that have already
+    been stored by components remain shared.
+    """
+    if not enabled:
+        intern_index.table = None
+    elif intern_index.table is None:
+        intern_index.table = {}
+
 class _NotFound(object):
     pass
 
@@ -115,6 +171,9 @@ class IndexedComponent(Component):
         _index              The set of valid indices
         _implicit_subsets   A temporary data element that stores
                                 sets that are transfered to the model
+        _lazy_constructed   For lazily constructed components, the
+                                set of indices whose data has been
+                                constructed (None otherwise)
     """
 
     #
@@ -126,6 +185,8 @@ class IndexedComponent(Component):
     #
     _DEFAULT_INDEX_CHECKING_ENABLED = True
 
+    _lazy_constructed = None
+
     def __init__(self, *args, **kwds):
         from pyomo.core.base.sets import process_setarg
         #
@@ -182,6 +243,66 @@ class IndexedComponent(Component):
             state['_index'] = UnindexedComponent_set
         super(IndexedComponent, self).__setstate__(state)
 
+    def materialize(self, indices=None):
+        """Construct the data for indices of a lazily constructed component.
+
+        Components declared with ``lazy=True`` do not evaluate their
+        rule for every index when they are constructed.  Instead, the
+        component data for an index is constructed when the index is
+        first accessed (e.g., through ``__getitem__``).  Iterating over
+        a lazy component (and writing the model) only visits the data
+        that has already been constructed, while ``in`` checks the
+        index set for indices that have not been constructed.
+
+        Args:
+            indices: The indices to construct.  If None, the data for
+                all remaining indices in the index set is constructed.
+        """
+        if self._constructed is False:
+            raise ValueError(
+                "Cannot materialize component '%s': the component has "
+                "not been constructed." % (self.name,))
+        constructed = self._lazy_constructed
+        if constructed is None:
+            return
+        _data = self._data
+        if indices is None:
+            for index in self._index:
+                if index not in constructed and index not in _data:
+                    self._materialize_index(index)
+            # Everything is constructed, so this is now a regular
+            # (eagerly constructed) component
+            self._lazy_constructed = None
+            return
+        for index in indices:
+            if index in constructed or index in _data:
+                continue
+            index = self._validate_index(index)
+            if index not in constructed and index not in _data:
+                self._materialize_index(index)
+
+    def is_lazy(self):
+        """Return True if the data of this component is constructed
+        on demand"""
+        return self._lazy_constructed is not None
+
+    def _materialize_index(self, index):
+        # Record the index first: the rule may return Skip, in which
+        # case there is no data to find the next time
+        self._lazy_constructed.add(index)
+        self._construct_index(index)
+        return self._data.get(index, _NotFound)
+
+    def _construct_index(self, index):
+        """Construct the data for a single index (from the rule).
+
+        This method must be defined on subclasses of IndexedComponent
+        that support lazy construction.
+        """
+        raise DeveloperError(
+            "Derived component %s failed to define _construct_index()."
+            % (self.__class__.__name__,))
+
     def to_dense_data(self):
         """TODO"""
         for idx in self._index:
@@ -220,7 +341,14 @@ class IndexedComponent(Component):
 
     def __contains__(self, idx):
         """Return true if the index is in the dictionary"""
-        return idx in self._data
+        if idx in self._data:
+            return True
+        # The data of a lazily constructed component may not have been
+        # constructed yet
+        if self._lazy_constructed is not None \
+           and idx not in self._lazy_constructed:
+            return idx in self._index
+        return False
 
     def __iter__(self):
         """Iterate over the keys in the dictionary"""
@@ -341,6 +469,12 @@ You can silence this warning by one of three ways:
                     return index
                 obj = self._data.get(index, _NotFound)
             #
+            # Construct the data of lazily constructed components
+            #
+            if obj is _NotFound and self._lazy_constructed is not None \
+               and index not in self._lazy_constructed:
+                obj = self._materialize_index(index)
+            #
             # Call the _getitem_when_not_present helper to retrieve/return
             # the default value
             #
@@ -433,6 +567,7 @@ You can silence this warning by one of three ways:
                 # Remove reference to this object
                 self._data[index]._component = None
             del self._data[index]
+            _invalidate_data_cache(self)
 
     def _not_constructed_error(self, idx):
         # Generate an error because the component is not constructed
@@ -454,6 +589,14 @@ You can silence this warning by one of three ways:
 
         # This is only called through __{get,set,del}item__, which has
         # already trapped unhashable objects.
+        if normalize_index.flatten and idx.__class__ is tuple:
+            # Testing for membership in the index set is potentially
+            # expensive, so first check if the normalized index is a
+            # known entry (e.g., for x[(i,j),k]).
+            normalized_idx = normalize_index(idx)
+            if normalized_idx is not idx and normalized_idx in self._data:
+                return normalized_idx
+
         if idx in self._index:
             # If the index is in the underlying index set, then return it
             #  Note: This check is potentially expensive (e.g., when the
@@ -16,6 +16,8 @@ import types
 
 from six import itervalues
 
+from pyomo.common import timing
+
 logger = logging.getLogger('pyomo.core')
 
 
@@ -50,7 +52,12 @@ def create_name(name, ndx):
     return name+"["+str(ndx)+"]"
 
 
-def apply_indexed_rule(obj, rule, model, index, options=None):
+def apply_indexed_rule(obj, rule, model, index, options=None,
+                       _profile=True):
+    if _profile and timing._profiler is not None:
+        # Record the rule call in the active ConstructionProfiler
+        return timing.profile_rule(
+            apply_indexed_rule, obj, rule, model, index, options, False)
     try:
         if options is None:
             if index.__class__ is tuple:
@@ -21,11 +21,18 @@ from pyomo.core.base.component import ComponentData
 from pyomo.core.base.indexed_component import IndexedComponent, \
     UnindexedComponent_set
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
-from pyomo.core.base.numvalue import NumericValue, native_types, value
+from pyomo.core.base.numvalue import NumericValue, native_types, \
+    native_numeric_types, value
 from pyomo.core.base.set_types import Any
 
 from six import iteritems, iterkeys, next, itervalues
 
+try:
+    import numpy
+    has_numpy = True
+except:                                         #pragma:nocover
+    has_numpy = False
+
 logger = logging.getLogger('pyomo.core')
 
 def _raise_modifying_immutable_error(obj, index):
@@ -177,6 +184,43 @@ class _ParamData(ComponentData, NumericValue):
     __bool__ = __nonzero__
 
 
+_nan = float('nan')
+
+class _ArrayParamData(_ParamData):
+    """
+    This class defines the data for a mutable parameter of an
+    array-backed indexed parameter (see :class:`ArrayIndexedParam`).
+
+    Constructor Arguments:
+        component   The ArrayIndexedParam object that owns this data.
+        pos         The position of the index in the index set.
+
+    The value of the parameter is stored in a NumPy array on the
+    owning component, at the position given by the '_pos' attribute.
+    """
+
+    __slots__ = ('_pos',)
+
+    def __init__(self, component, pos):
+        self._component = weakref_ref(component)
+        self._pos = pos
+
+    def __getstate__(self):
+        # The value is stored on the component, so we skip the
+        # _ParamData slots
+        state = super(_ParamData, self).__getstate__()
+        for i in _ArrayParamData.__slots__:
+            state[i] = getattr(self, i)
+        return state
+
+    @property
+    def _value(self):
+        return self._component()._get_value(self._pos)
+    @_value.setter
+    def _value(self, val):
+        self._component()._set_value(self._pos, val)
+
+
 @ModelComponentFactory.register("Parameter data that is used to define a model instance.")
 class Param(IndexedComponent):
     """
@@ -198,9 +242,14 @@ class Param(IndexedComponent):
         default     
             A scalar, rule, or dictionary that defines default values for 
             this parameter
-        initialize  
-            A dictionary or rule for setting up this parameter with existing 
-            model data
+        initialize
+            A dictionary or rule for setting up this parameter with existing
+            model data, or (for array-backed parameters) a NumPy array or
+            pandas Series
+        array_backed
+            If True, store the values of an indexed parameter in a NumPy
+            array ordered like the (ordered) index set (see
+            ArrayIndexedParam).  Defaults to False.
     """
 
     DefaultMutable = False
@@ -210,6 +259,8 @@ class Param(IndexedComponent):
             return super(Param, cls).__new__(cls)
         if not args or (args[0] is UnindexedComponent_set and len(args)==1):
             return SimpleParam.__new__(SimpleParam)
+        elif kwds.get('array_backed', False):
+            return ArrayIndexedParam.__new__(ArrayIndexedParam)
         else:
             return IndexedParam.__new__(IndexedParam)
 
@@ -222,6 +273,8 @@ class Param(IndexedComponent):
         self._mutable       = kwd.pop('mutable', Param.DefaultMutable )
         self._default_val   = kwd.pop('default', _NotValid )
         self._dense_initialize = kwd.pop('initialize_as_dense', False)
+        # The storage mode was selected by Param.__new__
+        kwd.pop('array_backed', None)
         #
         if 'repn' in kwd:
             logger.error(
@@ -294,7 +347,7 @@ class Param(IndexedComponent):
         """Return an iterator of (index,data) tuples for defined parameters"""
         return iteritems(self._data)
 
-    def extract_values(self):
+    def extract_values(self, as_array=False):
         """
         A utility to extract all index-value pairs defined for this
         parameter, returned as a dictionary.
@@ -302,7 +355,16 @@ class Param(IndexedComponent):
         This method is useful in contexts where key iteration and
         repeated __getitem__ calls are too expensive to extract
         the contents of a parameter.
+
+        If 'as_array' is True, a NumPy array of floats with the values
+        in the iteration order of this component is returned instead.
         """
+        if as_array:
+            if not has_numpy:
+                raise ValueError("The numpy module is not available.")
+            return numpy.fromiter(
+                (value(param_value) for param_value in self.itervalues()),
+                dtype=float, count=len(self))
         if self._mutable:
             #
             # The parameter is mutable, parameter data are ParamData types.
@@ -1007,3 +1069,309 @@ class IndexedParam(Param):
             raise TypeError('Cannot compute the value of an indexed Param (%s)'
                             % (self.name,) )
 
+
+
+def _is_array_like(obj):
+    """Return True for NumPy arrays and (duck-typed) pandas Series"""
+    if has_numpy and isinstance(obj, numpy.ndarray):
+        return True
+    return hasattr(obj, 'dtype') and hasattr(obj, 'index') \
+        and hasattr(obj, 'values') and not isinstance(obj, IndexedComponent)
+
+
+class ArrayIndexedParam(IndexedParam):
+    """An indexed parameter that stores its values in a NumPy array.
+
+    The values are stored in a float array with one entry for each
+    member of the (ordered) index set, in the order of the index set,
+    and a boolean array flags the entries that are defined.  Values are
+    looked up through the position of the index in the index set
+    (see :meth:`Set.ord`), and the whole array can be retrieved with
+    ``extract_values(as_array=True)``.  Immutable values are returned
+    as floats, and mutable parameters create :class:`_ArrayParamData`
+    objects that refer to the array on first access.
+
+    In addition to the usual initializers, the parameter may be
+    initialized from a NumPy array with one value per index (or with
+    one axis per set of a product index set), or from a pandas Series
+    whose labels are members of the index set.  NaN values (and
+    members of the index set that do not appear in a Series) are left
+    undefined, so the parameter may be sparse.
+
+    This class is used when a Param is declared with
+    ``array_backed=True``.  The index set may not change size after
+    the parameter is constructed.
+    """
+
+    def __init__(self, *args, **kwds):
+        if not has_numpy:
+            raise ValueError("The numpy module is not available. "
+                             "Cannot declare an array-backed Param.")
+        self._values = None
+        self._present = None
+        IndexedParam.__init__(self, *args, **kwds)
+
+    def construct(self, data=None):
+        """Construct this component."""
+        if self._constructed:
+            return
+        if not self._index.ordered:
+            raise ValueError(
+                "Cannot construct array-backed Param %s: the index set %s "
+                "is not ordered" % (self.name, self._index.name))
+        n = len(self._index)
+        self._values = numpy.full(n, _nan)
+        self._present = numpy.zeros(n, dtype=bool)
+        IndexedParam.construct(self, data)
+
+    def _position(self, index):
+        """Return the position of an index in the index set."""
+        if len(self._index) != len(self._values):
+            raise RuntimeError(
+                "The index set of array-backed Param %s has changed size "
+                "since the Param was constructed" % (self.name,))
+        try:
+            return self._index.ord(index) - 1
+        except (IndexError, KeyError, TypeError, ValueError):
+            raise KeyError("Index '%s' is not valid for array-backed Param %s"
+                           % (index, self.name))
+
+    def _get_value(self, pos):
+        if self._present.item(pos):
+            return self._values.item(pos)
+        return _NotValid
+
+    def _set_value(self, pos, val):
+        if val is _NotValid:
+            self._present[pos] = False
+            return
+        if val.__class__ not in native_numeric_types:
+            raise ValueError(
+                "Invalid parameter value: %s[%s] = '%s', value type=%s.\n"
+                "\tArray-backed Params can only hold numeric values"
+                % (self.name, self._index[pos+1], val, type(val)))
+        self._values[pos] = val
+        self._present[pos] = True
+
+    def __len__(self):
+        if self._default_val is _NotValid:
+            return int(self._present.sum())
+        return len(self._index)
+
+    def __contains__(self, idx):
+        if self._default_val is _NotValid:
+            try:
+                return self._present.item(self._position(idx))
+            except KeyError:
+                return False
+        return idx in self._index
+
+    def __iter__(self):
+        if self._default_val is _NotValid:
+            return self.sparse_iterkeys()
+        return self._index.__iter__()
+
+    def __getitem__(self, index):
+        #
+        # Fast path: the values of constructed immutable parameters are
+        # read directly from the array
+        #
+        if self._constructed and not self._mutable:
+            try:
+                pos = self._index.ord(index) - 1
+                if self._present.item(pos) \
+                        and len(self._values) == len(self._index):
+                    return self._values.item(pos)
+            except (IndexError, KeyError, TypeError, ValueError):
+                pass
+        return IndexedParam.__getitem__(self, index)
+
+    def __delitem__(self, index):
+        if self._constructed is False:
+            self._not_constructed_error(index)
+        index = self._validate_index(index)
+        obj = self._data.pop(index, None)
+        if obj is not None and obj.__class__ is _ArrayParamData:
+            obj._component = None
+        self._present[self._position(index)] = False
+
+    def _getitem_when_not_present(self, index):
+        pos = self._position(index)
+        if self._present.item(pos):
+            if not self._mutable:
+                return self._values.item(pos)
+        elif not self._mutable or self._default_val is not _NotValid:
+            return IndexedParam._getitem_when_not_present(self, index)
+        obj = self._data[index] = _ArrayParamData(self, pos)
+        return obj
+
+    def _setitem_when_not_present(self, index, value, _check_domain=True):
+        if self._constructed and not self._mutable:
+            _raise_modifying_immutable_error(self, index)
+        if value.__class__ not in native_types:
+            if isinstance(value, NumericValue):
+                value = value()
+        pos = self._position(index)
+        if self._mutable:
+            obj = self._data.get(index, None)
+            if obj is None:
+                obj = self._data[index] = _ArrayParamData(self, pos)
+            obj.set_value(value, index)
+            return obj
+        self._set_value(pos, value)
+        try:
+            self._validate_value(index, value, _check_domain)
+        except:
+            self._present[pos] = False
+            raise
+        return self._values.item(pos)
+
+    def _load_array(self, data):
+        """
+        Return a float array aligned with the index set from a NumPy
+        array or a pandas Series.
+        """
+        n = len(self._index)
+        if not isinstance(data, numpy.ndarray):
+            #
+            # A pandas Series: place the values using the positions of
+            # the labels in the index set
+            #
+            src = numpy.asarray(data.values, dtype=float)
+            values = numpy.full(n, _nan)
+            values[numpy.fromiter(
+                (self._position(key) for key in data.index),
+                dtype=int, count=len(src))] = src
+            return values
+        shape = (n,)
+        if data.ndim > 1:
+            shape = tuple(len(s) for s in getattr(
+                self._index, 'set_tuple', (self._index,)))
+        if data.shape != shape:
+            raise ValueError(
+                "Cannot initialize array-backed Param %s from an array "
+                "with shape %s (expected shape %s)"
+                % (self.name, data.shape, shape))
+        # Note: C-order matches the iteration order of product sets
+        return numpy.array(data, dtype=float).reshape(n)
+
+    def _initialize_from(self, _init):
+        if not _is_array_like(_init):
+            return IndexedParam._initialize_from(self, _init)
+        values = self._load_array(_init)
+        self._validate_array(_init)
+        self._values = values
+        self._present = values == values
+
+    def _validate_array(self, data):
+        """
+        Validate the values of a NumPy array or pandas Series (that was
+        accepted by _load_array).  The values are validated in their
+        original type, before they are converted to floats, so that
+        integer and boolean domains accept integer and boolean arrays.
+        """
+        if self.domain is Any and not self._validate:
+            return
+        if isinstance(data, numpy.ndarray):
+            items = zip(self._index, data.reshape(len(self._index)).tolist())
+        else:
+            items = zip(data.index, data.values.tolist())
+        for index, val in items:
+            if val == val:
+                self._validate_value(index, val)
+
+    def sparse_keys(self):
+        """Return a list of keys in the defined parameters"""
+        return list(self.sparse_iterkeys())
+
+    def sparse_values(self):
+        """Return a list of the defined param data objects"""
+        return list(self.sparse_itervalues())
+
+    def sparse_items(self):
+        """Return a list (index,data) tuples for defined parameters"""
+        return list(self.sparse_iteritems())
+
+    def sparse_iterkeys(self):
+        """Return an iterator for the keys in the defined parameters"""
+        if self._present.all():
+            return self._index.__iter__()
+        return (index for index, present in zip(
+            self._index, self._present.tolist()) if present)
+
+    def sparse_itervalues(self):
+        """Return an iterator for the defined param data objects"""
+        for index in self.sparse_iterkeys():
+            yield self[index]
+
+    def sparse_iteritems(self):
+        """Return an iterator of (index,data) tuples for defined parameters"""
+        for index in self.sparse_iterkeys():
+            yield index, self[index]
+
+    def extract_values(self, as_array=False):
+        """
+        A utility to extract all index-value pairs defined for this
+        parameter, returned as a dictionary.
+
+        If 'as_array' is True, a NumPy array of floats with the values
+        in the iteration order of this component is returned instead.
+        """
+        default = self._default_val
+        if self._present.all():
+            if as_array:
+                return self._values.copy()
+            return dict(zip(self._index, self._values.tolist()))
+        if default is _NotValid:
+            if as_array:
+                return self._values[self._present]
+            return self.extract_values_sparse()
+        if as_array and default.__class__ in native_numeric_types:
+            return numpy.where(self._present, self._values, default)
+        return IndexedParam.extract_values(self, as_array)
+
+    def extract_values_sparse(self):
+        """
+        A utility to extract all index-value pairs defined with non-default
+        values, returned as a dictionary.
+        """
+        return dict((index, val) for index, val, present in zip(
+            self._index, self._values.tolist(), self._present.tolist())
+                    if present)
+
+    def store_values(self, new_values, check=True):
+        """
+        A utility to update a Param with a dictionary or scalar.
+
+        The new values may also be a NumPy array or pandas Series (see
+        :class:`ArrayIndexedParam`), which replaces all values of the
+        parameter.  If check=True, the new values are validated.
+        """
+        if not _is_array_like(new_values):
+            if check:
+                return IndexedParam.store_values(self, new_values, check)
+            if not self._mutable:
+                _raise_modifying_immutable_error(self, '*')
+            #
+            # The argument check is False, so we write the values
+            # directly into the array.  Note that the IndexedParam
+            # implementation cannot be used, as it would create
+            # _ParamData objects that hold their own values.
+            #
+            _srcType = type(new_values)
+            if _srcType is dict or ( \
+                    hasattr(_srcType, '__getitem__')
+                    and not isinstance(new_values, NumericValue) ):
+                for index, new_value in iteritems(new_values):
+                    self._set_value(self._position(index), new_value)
+            else:
+                for pos in range(len(self._values)):
+                    self._set_value(pos, new_values)
+            return
+        if not self._mutable:
+            _raise_modifying_immutable_error(self, '*')
+        values = self._load_array(new_values)
+        if check:
+            self._validate_array(new_values)
+        self._values[:] = values
+        self._present[:] = values == values
@@ -186,6 +186,17 @@ class RangeSet(OrderedSimpleSet):
         else:
             raise IndexError("Valid index values for sets are 1 .. len(set) or -1 .. -len(set)")
 
+    def ord(self, match_element):
+        """
+        Return the position index of the input value.  The
+        position indices start at 1.
+        """
+        if not self._set_contains(match_element):
+            raise KeyError("Unknown input element="+str(match_element)+" provided as input to ord() method for set="+self.name)
+        # Note: consistent with __getitem__, this ignores any filter
+        return int(round((match_element - self._start_val) /
+                         float(self._step_val))) + 1
+
     def _set_contains(self, element):
         """
         Test if the specified element in this set.
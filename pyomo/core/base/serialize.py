@@ -0,0 +1,1373 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# A binary file format for constructed models
+#
+# Pickling a model calls __getstate__() and __setstate__() on every
+# component, component data and expression node.  The format in this
+# module instead stores the data of a constructed model in flat, typed
+# arrays: the values, bounds and flags of the variables, the values of
+# the parameters, and the expressions of the constraints, objectives
+# and named expressions as a single node table.  The node table holds
+# an operator code, an integer datum and a list of argument positions
+# for every node, in topological order (the arguments of a node always
+# precede it), so shared subexpressions are stored (and restored) once.
+# The structure of the model (the block hierarchy, the component
+# names, the set values and the index keys) is kept in a pickled
+# directory at the end of the file.
+#
+# The arrays are 8-byte aligned so they can be used in place from a
+# memory-mapped file.  Array-backed variables (see ArrayIndexedVar) can
+# use the mapped arrays directly, and indexed constraints can be
+# rebuilt from the node table when they are first accessed (see
+# IndexedComponent.materialize), so a process can attach to a large
+# prebuilt model without creating every Python object up front.
+#
+# File layout:
+#
+#   header      magic string, format version, directory offset and size
+#   arrays      typed arrays, each starting on an 8-byte boundary
+#   directory   pickled dictionary describing the model and the arrays
+#
+
+__all__ = ['save_model', 'load_model']
+
+import array
+import importlib
+from io import BytesIO
+import mmap as mmap_module
+import struct
+import sys
+from weakref import ref as weakref_ref
+
+from pyutilib.misc import PauseGC
+from six import iteritems, itervalues
+from six.moves import xrange, cPickle as pickle
+
+from pyomo.core.expr import expr_pyomo5 as EXPR
+from pyomo.core.expr.numvalue import (NumericConstant, as_numeric,
+                                      native_types)
+from pyomo.core.base.component import (Component, ComponentData,
+                                       ComponentUID)
+from pyomo.core.base.sets import Set, SimpleSet, OrderedSimpleSet, _SetProduct
+from pyomo.core.base.rangeset import RangeSet
+from pyomo.core.base.param import Param, SimpleParam, IndexedParam, _ParamData
+from pyomo.core.base.var import (Var, SimpleVar, IndexedVar, ArrayIndexedVar,
+                                 VarList, _VarData, _GeneralVarData,
+                                 _ArrayVarData)
+from pyomo.core.base.constraint import (Constraint, SimpleConstraint,
+                                        IndexedConstraint, ConstraintList,
+                                        _GeneralConstraintData)
+from pyomo.core.base.objective import (Objective, SimpleObjective,
+                                       IndexedObjective, ObjectiveList,
+                                       _GeneralObjectiveData)
+from pyomo.core.base.expression import (Expression, SimpleExpression,
+                                        IndexedExpression,
+                                        _GeneralExpressionData)
+from pyomo.core.base.suffix import Suffix
+from pyomo.core.base.block import Block, SimpleBlock, IndexedBlock
+from pyomo.core.base.PyomoModel import ConcreteModel
+import pyomo.core.base.set_types as set_types
+
+try:
+    import numpy
+    has_numpy = True
+except:                                         #pragma:nocover
+    has_numpy = False
+
+
+_MAGIC = b'PYOMOMDL'
+_VERSION = 1
+# magic, version, directory offset, directory size
+_header = struct.Struct('<8sIQQ')
+_HEADER_SIZE = 32
+
+_numpy_dtypes = {'d': 'f8', 'q': 'i8', 'i': 'i4', 'b': 'i1', 'B': 'u1'}
+
+#
+# Operator codes for the leaves of the node table.  Expression nodes
+# use non-negative codes (positions in the class table).
+#
+_VAR = -1               # datum: variable number
+_PARAM = -2             # datum: (mutable) parameter number
+_NAMED_EXPR = -3        # datum: named expression number
+_INT = -4               # datum: the value
+_FLOAT = -5             # datum: position in the float table
+_NUMERIC_CONSTANT = -6  # datum: position of the value in the object table
+_OBJECT = -7            # datum: position in the object table
+_EXTERNAL = -8          # datum: position of the reference to a component
+                        # outside of the saved block in the object table
+
+#
+# The ways expression nodes are stored.  The slots of each class must
+# match exactly, so subclasses that add data are rejected.
+#
+_GENERIC = 0            # args
+_SUM = 1                # the first nargs args
+_UNARY = 2              # args; datum: position in the function table
+_INEQUALITY = 3         # args; datum: strict
+_RANGED = 4             # args; datum: strict flags (bit 0 and bit 1)
+_LINEAR = 5             # constant, coefs and vars; datum: number of vars
+_ARRAY_LINEAR = 6       # constant and var_list; datum: position of the
+                        # (coef_array, index_array) pair in the object table
+
+_node_kind_slots = (
+    (EXPR.ArrayLinearExpression, _ARRAY_LINEAR,
+     ('_args_', 'constant', 'linear_coefs', 'linear_vars', 'coef_array',
+      'index_array', 'var_list')),
+    (EXPR.LinearExpression, _LINEAR,
+     ('_args_', 'constant', 'linear_coefs', 'linear_vars')),
+    (EXPR.SumExpression, _SUM, ('_args_', '_nargs', '_shared_args')),
+    (EXPR.UnaryFunctionExpression, _UNARY, ('_args_', '_fcn', '_name')),
+    (EXPR.InequalityExpression, _INEQUALITY, ('_args_', '_strict')),
+    (EXPR.RangedExpression, _RANGED, ('_args_', '_strict')),
+    (EXPR.ExpressionBase, _GENERIC, ('_args_',)),
+)
+
+#: class -> node kind
+_node_kinds = {}
+
+_list_classes = (VarList, ConstraintList, ObjectiveList)
+
+_INT64_MIN = -2**63
+_INT64_MAX = 2**63 - 1
+
+_nan = float('nan')
+
+
+def _slot_names(cls):
+    names = set()
+    for base in cls.__mro__:
+        slots = base.__dict__.get('__slots__', ())
+        if slots.__class__ in native_types:
+            slots = (slots,)
+        names.update(slots)
+    return names
+
+
+def _node_kind(cls):
+    """Return (and cache) the way nodes of an expression class are stored"""
+    kind = _node_kinds.get(cls, None)
+    if kind is not None:
+        return kind
+    if '__dict__' not in dir(cls):
+        slots = _slot_names(cls)
+        for base, kind, base_slots in _node_kind_slots:
+            if issubclass(cls, base):
+                if slots == set(base_slots):
+                    _node_kinds[cls] = kind
+                    return kind
+                break
+    raise TypeError(
+        "Cannot save expressions containing nodes of type %s"
+        % (cls.__name__,))
+
+
+def _encode_ordered(ordered):
+    if ordered is Set.InsertionOrder:
+        return 'insertion'
+    elif ordered is Set.SortedOrder:
+        return 'sorted'
+    return ordered
+
+
+def _decode_ordered(ordered):
+    if ordered == 'insertion':
+        return Set.InsertionOrder
+    elif ordered == 'sorted':
+        return Set.SortedOrder
+    return ordered
+
+
+def save_model(model, filename):
+    """Save a constructed model to a binary model file.
+
+    The file stores the block hierarchy, the sets, and the data of
+    the parameters, variables, constraints, objectives, named
+    expressions and suffixes of the model.  The numeric data and the
+    expression trees are stored in typed arrays that can be
+    memory-mapped by :func:`load_model`.  Construction rules and
+    other declaration options are not saved: the loaded model is a
+    snapshot of the constructed model.
+
+    Args:
+        model: The (constructed) block to save.
+        filename (str): The name of the file to write.
+
+    Raises:
+        TypeError: If the model contains components or expression
+            nodes that are not supported by the file format.
+        ValueError: If the model references components that are not
+            part of the model.
+    """
+    with PauseGC():
+        _ModelWriter(model).write(filename)
+
+
+def load_model(filename, mmap=True, array_backed=None, lazy=False):
+    """Load a model saved with :func:`save_model`.
+
+    Args:
+        filename (str): The name of the model file.
+        mmap (bool): Map the file into memory instead of reading it.
+            The arrays in the file are then used in place (and copied
+            on write), so array-backed variables and lazily loaded
+            constraints do not hold a private copy of the data.
+            Defaults to True.
+        array_backed (bool, optional): Load indexed variables as
+            array-backed variables (True) or as standard variables
+            (False).  By default each variable is loaded the way it
+            was saved.  Array-backed variables require NumPy.
+        lazy (bool): Rebuild the constraints of indexed Constraint
+            components from the file when they are first accessed
+            (see :meth:`IndexedComponent.materialize`).  Defaults to
+            False.
+
+    Returns:
+        A :class:`ConcreteModel`.
+    """
+    with PauseGC():
+        return _ModelReader(filename, mmap).load(array_backed, lazy)
+
+
+def _dumps_block(block, context):
+    """Return the binary model representation of a constructed block.
+
+    Unlike :func:`save_model`, the components of the block may refer to
+    components elsewhere in the context block; these references are
+    stored by name and resolved by :func:`_loads_block`.
+    """
+    OUTPUT = BytesIO()
+    with PauseGC():
+        _ModelWriter(block, context)._write(OUTPUT)
+    return OUTPUT.getvalue()
+
+
+def _loads_block(data, block, context):
+    """Add the components saved by :func:`_dumps_block` to an (empty)
+    block that is part of the context block"""
+    with PauseGC():
+        _ModelReader('<buffer>', False, bytearray(data)).load(
+            None, False, block, context)
+
+
+class _ModelWriter(object):
+    """Flatten a model into a directory and a set of typed arrays.
+
+    The data objects of the variables, parameters, named expressions,
+    constraints and objectives are numbered in the order they are
+    visited.  The expressions are then encoded in a second pass, once
+    every leaf of every expression has a number.
+    """
+
+    def __init__(self, root, context=None):
+        self.root = root
+        # References to components outside of the root block are
+        # allowed (and saved relative to the context block) if a
+        # context is given
+        self.context = context
+        self.context_names = {}
+        self.context_indices = {}
+        self.arrays = {}
+        self.var_ids = {}
+        self.param_ids = {}
+        self.expr_ids = {}
+        self.con_ids = {}
+        self.obj_ids = {}
+        self.variables = []
+        self.expressions = []
+        self.constraints = []
+        self.objectives = []
+        self.suffixes = []
+        self.domains = []
+        self.domain_ids = {}
+        self.skip = set()
+        self.nparams = 0
+
+        self.node_ids = {}
+        self.node_op = array.array('i')
+        self.node_data = array.array('q')
+        self.node_arg_start = array.array('q', [0])
+        self.node_args = array.array('q')
+        self.floats = array.array('d')
+        self.objects = []
+        self.classes = []
+        self.class_ids = {}
+        self.functions = []
+        self.function_ids = {}
+
+    def write(self, filename):
+        with open(filename, 'wb') as OUTPUT:
+            self._write(OUTPUT)
+
+    def _write(self, OUTPUT):
+        root = self.root
+        directory = {
+            'name': root.name,
+            'byteorder': sys.byteorder,
+            'root': self._block_record(root),
+        }
+        self._encode_model(directory)
+        directory['domains'] = self.domains
+        directory['objects'] = self.objects
+        directory['classes'] = self.classes
+        directory['functions'] = self.functions
+
+        index = directory['arrays'] = {}
+        OUTPUT.write(b'\0' * _HEADER_SIZE)
+        for name, data in sorted(iteritems(self.arrays)):
+            offset = OUTPUT.tell()
+            OUTPUT.write(data.tobytes())
+            OUTPUT.write(b'\0' * (-OUTPUT.tell() % 8))
+            index[name] = (data.typecode, offset, len(data))
+        dir_offset = OUTPUT.tell()
+        pickle.dump(directory, OUTPUT, protocol=pickle.HIGHEST_PROTOCOL)
+        dir_size = OUTPUT.tell() - dir_offset
+        OUTPUT.seek(0)
+        OUTPUT.write(_header.pack(_MAGIC, _VERSION, dir_offset, dir_size))
+
+    def _add_array(self, name, typecode, data):
+        self.arrays[name] = array.array(typecode, data)
+        return name
+
+    #
+    # Pass 1: the model structure
+    #
+
+    def _block_record(self, block):
+        components = []
+        for comp in block.component_objects(descend_into=False):
+            if comp.__class__ in _list_classes:
+                # The index sets of the list components are
+                # recreated by the components
+                self.skip.add(id(comp._index))
+        for comp in block.component_objects(descend_into=False):
+            if id(comp) in self.skip:
+                continue
+            saver = _savers.get(comp.__class__, None)
+            if saver is None:
+                raise TypeError(
+                    "Cannot save component '%s': components of type %s "
+                    "are not supported" % (comp.name, comp.__class__.__name__))
+            record = {'name': comp.local_name, 'doc': comp.doc}
+            if comp.__class__ in _list_classes:
+                record['index'] = None
+                record['list'] = True
+                record['keys'] = list(comp._data)
+            elif comp.__class__ is Suffix:
+                record['index'] = None
+                record['list'] = False
+                record['keys'] = None
+            else:
+                record['index'] = self._ref(comp._index) \
+                                  if comp.is_indexed() else None
+                record['list'] = False
+                record['keys'] = self._keys(comp)
+            saver(self, comp, record)
+            components.append(record)
+        return {'components': components, 'active': block.active}
+
+    def _keys(self, comp):
+        # None means "the keys of the index set, in order"
+        index = comp.index_set()
+        keys = list(comp._data)
+        if len(keys) == len(index) \
+           and all(a == b for a, b in zip(keys, index)):
+            return None
+        return keys
+
+    def _in_model(self, obj):
+        block = obj.parent_block()
+        while block is not None:
+            if block is self.root:
+                return True
+            block = block.parent_block()
+        return False
+
+    def _ref(self, obj):
+        if not self._in_model(obj):
+            if self.context is not None:
+                return self._context_ref(obj)
+            raise ValueError(
+                "Cannot save model '%s': it references the component '%s', "
+                "which is not part of the model"
+                % (self.root.name, obj.name))
+        return str(ComponentUID(obj, context=self.root))
+
+    def _context_ref(self, obj):
+        """Return a reference to a component (or component data)
+        outside of the root block, relative to the context block"""
+        comp = obj.parent_component()
+        name = self.context_names.get(id(comp), None)
+        if name is None:
+            name = self.context_names[id(comp)] = str(
+                ComponentUID(comp, context=self.context))
+        if obj is comp:
+            return ('context', name)
+        # Note: we map the data to their indices once per component
+        # (ComponentUID would search the component for every index)
+        indices = self.context_indices.get(id(comp), None)
+        if indices is None:
+            indices = self.context_indices[id(comp)] = dict(
+                (id(v), k) for k, v in iteritems(comp._data))
+        return ('context', name, indices[id(obj)])
+
+    def _domain(self, domain):
+        ans = self.domain_ids.get(id(domain), None)
+        if ans is not None:
+            return ans
+        if getattr(set_types, str(getattr(domain, 'name', '')), None) \
+           is domain:
+            entry = ('global', domain.name)
+        elif isinstance(domain, Component):
+            entry = ('component', self._ref(domain))
+        else:
+            entry = ('object', domain)
+        ans = self.domain_ids[id(domain)] = len(self.domains)
+        self.domains.append(entry)
+        return ans
+
+    def _save_set(self, comp, record):
+        cls = comp.__class__
+        if cls is RangeSet:
+            record['type'] = 'rangeset'
+            record['args'] = (comp._start_val, comp._end_val, comp._step_val)
+        elif cls is _SetProduct:
+            record['type'] = 'setproduct'
+            record['sets'] = [self._ref(s) for s in comp.set_tuple]
+        else:
+            record['type'] = 'set'
+            record['values'] = list(comp)
+            record['ordered'] = _encode_ordered(comp.ordered)
+            record['dimen'] = comp.dimen
+
+    def _save_param(self, comp, record):
+        record['type'] = 'param'
+        record['mutable'] = comp._mutable
+        record['default'] = comp._default_val
+        record['domain'] = self._domain(comp.domain)
+        values = []
+        for val in itervalues(comp._data):
+            if isinstance(val, _ParamData):
+                self.param_ids[id(val)] = self.nparams
+                self.nparams += 1
+                val = val._value
+            values.append(val)
+        name = 'param%d' % (len(self.arrays),)
+        if all(val.__class__ is float for val in values):
+            record['values'] = self._add_array(name, 'd', values)
+        elif all(val.__class__ is int and _INT64_MIN <= val <= _INT64_MAX
+                 for val in values):
+            record['values'] = self._add_array(name, 'q', values)
+        else:
+            record['values'] = values
+
+    def _save_var(self, comp, record):
+        record['type'] = 'var'
+        record['start'] = len(self.variables)
+        record['array_backed'] = comp.__class__ is ArrayIndexedVar
+        var_ids = self.var_ids
+        for vardata in itervalues(comp._data):
+            var_ids[id(vardata)] = len(self.variables)
+            self.variables.append(vardata)
+        record['count'] = len(self.variables) - record['start']
+
+    def _save_constraint(self, comp, record):
+        record['type'] = 'constraint'
+        record['active'] = comp.active
+        record['start'] = len(self.constraints)
+        for condata in itervalues(comp._data):
+            self.con_ids[id(condata)] = len(self.constraints)
+            self.constraints.append(condata)
+
+    def _save_objective(self, comp, record):
+        record['type'] = 'objective'
+        record['active'] = comp.active
+        record['start'] = len(self.objectives)
+        for objdata in itervalues(comp._data):
+            self.obj_ids[id(objdata)] = len(self.objectives)
+            self.objectives.append(objdata)
+
+    def _save_expression(self, comp, record):
+        record['type'] = 'expression'
+        record['start'] = len(self.expressions)
+        for exprdata in itervalues(comp._data):
+            self.expr_ids[id(exprdata)] = len(self.expressions)
+            self.expressions.append(exprdata)
+
+    def _save_suffix(self, comp, record):
+        record['type'] = 'suffix'
+        record['active'] = comp.active
+        record['direction'] = comp.get_direction()
+        record['datatype'] = comp.get_datatype()
+        # The entries may reference components that have not been
+        # numbered yet
+        self.suffixes.append((comp, record))
+
+    def _save_block(self, comp, record):
+        record['type'] = 'block'
+        record['active'] = comp.active
+        record['blocks'] = [self._block_record(b)
+                            for b in itervalues(comp._data)]
+
+    #
+    # Pass 2: the data and the expressions
+    #
+
+    def _encode_model(self, directory):
+        encode = self._encode
+
+        values = []
+        lbs = []
+        ubs = []
+        # Integer values and bounds (bits 0, 1 and 2) are restored as
+        # integers by standard variables
+        ints = []
+        bound_exprs = directory['bound_exprs'] = []
+        for n, vardata in enumerate(self.variables):
+            val = vardata.value
+            values.append(_nan if val is None else val)
+            flags = val.__class__ is int
+            for which, bound, bounds in ((0, vardata._lb, lbs),
+                                         (1, vardata._ub, ubs)):
+                if bound is None:
+                    bounds.append(_nan)
+                elif bound.__class__ in native_types:
+                    bounds.append(bound)
+                    if bound.__class__ is int:
+                        flags |= 2 << which
+                else:
+                    bounds.append(_nan)
+                    bound_exprs.append((n, which, encode(bound)))
+            ints.append(flags)
+        self._add_array('var_value', 'd', values)
+        self._add_array('var_lb', 'd', lbs)
+        self._add_array('var_ub', 'd', ubs)
+        self._add_array('var_int', 'B', ints)
+        self._add_array('var_fixed', 'B',
+                        [bool(v.fixed) for v in self.variables])
+        self._add_array('var_stale', 'B',
+                        [bool(v.stale) for v in self.variables])
+        self._add_array('var_domain', 'i',
+                        [self._domain(v._domain) for v in self.variables])
+
+        constraints = self.constraints
+        self._add_array('con_lower', 'q',
+                        [encode(c._lower) for c in constraints])
+        self._add_array('con_body', 'q',
+                        [encode(c._body) for c in constraints])
+        self._add_array('con_upper', 'q',
+                        [encode(c._upper) for c in constraints])
+        self._add_array('con_flags', 'B',
+                        [c._active | (c._equality << 1) for c in constraints])
+
+        objectives = self.objectives
+        self._add_array('obj_expr', 'q', [encode(o._expr) for o in objectives])
+        self._add_array('obj_sense', 'b', [o._sense for o in objectives])
+        self._add_array('obj_active', 'B', [o._active for o in objectives])
+
+        self._add_array('expr_expr', 'q',
+                        [encode(e._expr) for e in self.expressions])
+
+        for comp, record in self.suffixes:
+            record['entries'] = [(self._suffix_key(key), val)
+                                 for key, val in iteritems(comp)]
+
+        self.arrays['node_op'] = self.node_op
+        self.arrays['node_data'] = self.node_data
+        self.arrays['node_arg_start'] = self.node_arg_start
+        self.arrays['node_args'] = self.node_args
+        self.arrays['const_float'] = self.floats
+
+    def _suffix_key(self, obj):
+        for kind, ids in (('var', self.var_ids), ('con', self.con_ids),
+                          ('obj', self.obj_ids), ('param', self.param_ids),
+                          ('expr', self.expr_ids)):
+            n = ids.get(id(obj), None)
+            if n is not None:
+                return kind, n
+        if obj is self.root:
+            return 'root', None
+        if isinstance(obj, (Component, ComponentData)):
+            return 'component', self._ref(obj)
+        raise TypeError("Cannot save the value of suffix entry %s" % (obj,))
+
+    def _add_node(self, obj, op, data, args=()):
+        n = self.node_ids[id(obj)] = len(self.node_op)
+        self.node_op.append(op)
+        self.node_data.append(data)
+        self.node_args.extend(args)
+        self.node_arg_start.append(len(self.node_args))
+        return n
+
+    def _add_object(self, obj):
+        self.objects.append(obj)
+        return len(self.objects) - 1
+
+    def _encode_leaf(self, obj):
+        """Add the node for a leaf and return its number, or return
+        None if the object is an expression node"""
+        cls = obj.__class__
+        if cls in native_types:
+            if cls is int and _INT64_MIN <= obj <= _INT64_MAX:
+                return self._add_node(obj, _INT, obj)
+            elif cls is float:
+                self.floats.append(obj)
+                return self._add_node(obj, _FLOAT, len(self.floats) - 1)
+            return self._add_node(obj, _OBJECT, self._add_object(obj))
+        if cls is NumericConstant:
+            return self._add_node(obj, _NUMERIC_CONSTANT,
+                                  self._add_object(obj.value))
+        if obj.is_expression_type():
+            if not isinstance(obj, _GeneralExpressionData):
+                return None
+            ids, op, kind = self.expr_ids, _NAMED_EXPR, 'named expression'
+        elif isinstance(obj, _VarData):
+            ids, op, kind = self.var_ids, _VAR, 'variable'
+        elif isinstance(obj, _ParamData):
+            ids, op, kind = self.param_ids, _PARAM, 'parameter'
+        else:
+            raise TypeError(
+                "Cannot save expressions containing %s" % (type(obj),))
+        n = ids.get(id(obj), None)
+        if n is None:
+            if self.context is not None:
+                return self._add_node(obj, _EXTERNAL,
+                                      self._add_object(self._ref(obj)))
+            raise ValueError(
+                "Cannot save model '%s': an expression references the "
+                "%s '%s', which is not part of the model"
+                % (self.root.name, kind, obj.name))
+        return self._add_node(obj, op, n)
+
+    def _node_info(self, obj):
+        """Return the node kind, the datum and the arguments of an
+        expression node"""
+        cls = obj.__class__
+        kind = _node_kind(cls)
+        if kind == _GENERIC:
+            return kind, 0, obj._args_
+        elif kind == _SUM:
+            return kind, 0, obj._args_[:obj._nargs]
+        elif kind == _UNARY:
+            return kind, self._function(obj._name, obj._fcn), obj._args_
+        elif kind == _INEQUALITY:
+            return kind, int(obj._strict), obj._args_
+        elif kind == _RANGED:
+            return (kind, int(obj._strict[0]) | (int(obj._strict[1]) << 1),
+                    obj._args_)
+        elif kind == _LINEAR:
+            args = [obj.constant]
+            args.extend(obj.linear_coefs)
+            args.extend(obj.linear_vars)
+            return kind, len(obj.linear_vars), args
+        else: # kind == _ARRAY_LINEAR
+            args = [obj.constant]
+            args.extend(obj.var_list)
+            return (kind, self._add_object((obj.coef_array, obj.index_array)),
+                    args)
+
+    def _function(self, name, fcn):
+        key = (name, fcn)
+        ans = self.function_ids.get(key, None)
+        if ans is not None:
+            return ans
+        module = getattr(fcn, '__module__', None) or 'builtins'
+        fcn_name = getattr(fcn, '__name__', None)
+        try:
+            found = getattr(importlib.import_module(module), fcn_name)
+        except (ImportError, AttributeError, TypeError):
+            found = None
+        if found is not fcn:
+            raise TypeError(
+                "Cannot save the function '%s' of an intrinsic function "
+                "expression" % (name,))
+        ans = self.function_ids[key] = len(self.functions)
+        self.functions.append((name, module, fcn_name))
+        return ans
+
+    def _class(self, cls):
+        ans = self.class_ids.get(cls, None)
+        if ans is None:
+            ans = self.class_ids[cls] = len(self.classes)
+            self.classes.append((cls.__module__, cls.__name__))
+        return ans
+
+    def _encode(self, root):
+        """Add an expression to the node table and return the number
+        of its root node (-1 for None)"""
+        if root is None:
+            return -1
+        node_ids = self.node_ids
+        ans = node_ids.get(id(root), None)
+        if ans is not None:
+            return ans
+        if self._encode_leaf(root) is not None:
+            return node_ids[id(root)]
+        #
+        # Post-order traversal with an explicit stack, so the
+        # arguments of a node are numbered before the node
+        #
+        stack = [(root, self._node_info(root))]
+        while stack:
+            obj, info = stack[-1]
+            for arg in info[2]:
+                if id(arg) not in node_ids \
+                   and self._encode_leaf(arg) is None:
+                    stack.append((arg, self._node_info(arg)))
+                    break
+            else:
+                stack.pop()
+                if id(obj) in node_ids:
+                    continue
+                kind, data, args = info
+                self._add_node(obj, self._class(obj.__class__), data,
+                               [node_ids[id(arg)] for arg in args])
+        return node_ids[id(root)]
+
+
+_savers = {
+    SimpleSet: _ModelWriter._save_set,
+    OrderedSimpleSet: _ModelWriter._save_set,
+    RangeSet: _ModelWriter._save_set,
+    _SetProduct: _ModelWriter._save_set,
+    SimpleParam: _ModelWriter._save_param,
+    IndexedParam: _ModelWriter._save_param,
+    SimpleVar: _ModelWriter._save_var,
+    IndexedVar: _ModelWriter._save_var,
+    ArrayIndexedVar: _ModelWriter._save_var,
+    VarList: _ModelWriter._save_var,
+    SimpleConstraint: _ModelWriter._save_constraint,
+    IndexedConstraint: _ModelWriter._save_constraint,
+    ConstraintList: _ModelWriter._save_constraint,
+    SimpleObjective: _ModelWriter._save_objective,
+    IndexedObjective: _ModelWriter._save_objective,
+    ObjectiveList: _ModelWriter._save_objective,
+    SimpleExpression: _ModelWriter._save_expression,
+    IndexedExpression: _ModelWriter._save_expression,
+    Suffix: _ModelWriter._save_suffix,
+    SimpleBlock: _ModelWriter._save_block,
+    IndexedBlock: _ModelWriter._save_block,
+}
+
+
+class _ModelReader(object):
+    """Rebuild a model from a model file.
+
+    The components are created first, in declaration order, and the
+    data objects of the variables, parameters, named expressions,
+    constraints and objectives are collected in the order they were
+    numbered by the writer.  The expressions are decoded from the node
+    table once all of the leaves exist.
+    """
+
+    def __init__(self, filename, use_mmap, buffer=None):
+        if buffer is not None:
+            self.buffer = buffer
+            header = bytes(buffer[:_header.size])
+        else:
+            with open(filename, 'rb') as INPUT:
+                header = INPUT.read(_header.size)
+                if use_mmap and len(header) == _header.size:
+                    self.buffer = mmap_module.mmap(
+                        INPUT.fileno(), 0, access=mmap_module.ACCESS_COPY)
+                else:
+                    INPUT.seek(0)
+                    self.buffer = bytearray(INPUT.read())
+        if len(header) < _header.size or header[:8] != _MAGIC:
+            raise ValueError(
+                "File '%s' is not a Pyomo model file" % (filename,))
+        magic, version, dir_offset, dir_size = _header.unpack(header)
+        if version != _VERSION:
+            raise ValueError(
+                "Pyomo model file '%s' uses an unsupported version (%s) "
+                "of the file format" % (filename, version))
+        self.directory = pickle.loads(
+            bytes(self.buffer[dir_offset:dir_offset + dir_size]))
+        if self.directory['byteorder'] != sys.byteorder:
+            raise ValueError(
+                "Pyomo model file '%s' was written on a platform with a "
+                "different byte order" % (filename,))
+        self.views = {}
+        self.lists = {}
+        self.variables = []
+        self.params = []
+        self.expressions = []
+        self.constraints = []
+        self.objectives = []
+        self.suffixes = []
+        self.lazy_components = []
+        self.lazy_keys = None
+        self.domains = [None] * len(self.directory['domains'])
+
+    def _view(self, name):
+        """Return an array of the file as a memoryview"""
+        ans = self.views.get(name, None)
+        if ans is None:
+            typecode, offset, count = self.directory['arrays'][name]
+            size = array.array(typecode).itemsize
+            ans = self.views[name] = memoryview(self.buffer)[
+                offset:offset + count*size].cast(typecode)
+        return ans
+
+    def _list(self, name):
+        """Return an array of the file as a list"""
+        ans = self.lists.get(name, None)
+        if ans is None:
+            ans = self.lists[name] = self._view(name).tolist()
+        return ans
+
+    def _numpy(self, name, start, count):
+        """Return a slice of an array of the file as a NumPy array
+        (which shares the memory of the file)"""
+        typecode, offset, _ = self.directory['arrays'][name]
+        dtype = numpy.dtype(_numpy_dtypes[typecode])
+        return numpy.frombuffer(self.buffer, dtype=dtype, count=count,
+                                offset=offset + start*dtype.itemsize)
+
+    def _find(self, ref):
+        if ref.__class__ is tuple:
+            # A component (or component data) outside of the saved block
+            ans = self.external.get(ref[1], None)
+            if ans is None:
+                ans = self.external[ref[1]] = ComponentUID(
+                    ref[1]).find_component_on(self.context)
+            if ans is not None and len(ref) == 3:
+                ans = ans[ref[2]]
+        else:
+            ans = ComponentUID(ref).find_component_on(self.model)
+        if ans is None:
+            raise ValueError(
+                "Error loading a Pyomo model file: component '%s' not found"
+                % (ref,))
+        return ans
+
+    def _domain(self, n):
+        ans = self.domains[n]
+        if ans is None:
+            kind, data = self.directory['domains'][n]
+            if kind == 'global':
+                ans = getattr(set_types, data)
+            elif kind == 'component':
+                ans = self._find(data)
+            else:
+                ans = data
+            self.domains[n] = ans
+        return ans
+
+    def _index_args(self, record):
+        if record['index'] is None:
+            return ()
+        return (self._find(record['index']),)
+
+    def _keys(self, comp, record):
+        keys = record['keys']
+        if record['list']:
+            for key in keys:
+                comp._index.add(key)
+        elif keys is None:
+            keys = list(comp.index_set())
+        return keys
+
+    def load(self, array_backed, lazy, block=None, context=None):
+        directory = self.directory
+        self.array_backed = array_backed
+        self.lazy = lazy
+        self.context = context
+        self.external = {}
+        if block is None:
+            self.model = ConcreteModel(name=directory['name'])
+        else:
+            self.model = block
+        self._load_block(self.model, directory['root'])
+
+        decoder = self.decoder = _NodeDecoder(self)
+        if lazy:
+            node = decoder.decode
+        else:
+            node = decoder.decode_all().__getitem__
+
+        lower = self._list('con_lower')
+        body = self._list('con_body')
+        upper = self._list('con_upper')
+        flags = self._list('con_flags')
+        for n, condata in enumerate(self.constraints):
+            if condata is None:
+                # lazily loaded
+                continue
+            condata._lower = node(lower[n])
+            condata._body = node(body[n])
+            condata._upper = node(upper[n])
+            condata._equality = bool(flags[n] & 2)
+            condata._active = bool(flags[n] & 1)
+
+        for objdata, expr, sense, active in zip(
+                self.objectives, self._list('obj_expr'),
+                self._list('obj_sense'), self._list('obj_active')):
+            objdata._expr = node(expr)
+            objdata._sense = sense
+            objdata._active = bool(active)
+
+        for exprdata, expr in zip(self.expressions,
+                                  self._list('expr_expr')):
+            exprdata._expr = node(expr)
+
+        for n, which, expr in directory['bound_exprs']:
+            vardata = self.variables[n]
+            if vardata.__class__ is _ArrayVarData:
+                vardata._component()._set_bound(vardata._pos, which,
+                                                node(expr))
+            elif which:
+                vardata._ub = node(expr)
+            else:
+                vardata._lb = node(expr)
+
+        for comp, entries in self.suffixes:
+            for key, val in entries:
+                comp[self._suffix_key(key)] = val
+
+        # Deactivate the lazily loaded constraints that were saved
+        # as inactive (this constructs them)
+        for comp, positions in self.lazy_components:
+            for key, n in iteritems(positions):
+                if not flags[n] & 1:
+                    comp[key].deactivate()
+
+        if not lazy:
+            # Release the references to the file buffer
+            self.views = None
+            self.lists = None
+            self.decoder = None
+        return self.model
+
+    def _suffix_key(self, key):
+        kind, n = key
+        if kind == 'var':
+            return self.variables[n]
+        elif kind == 'con':
+            return self._constraint(n)
+        elif kind == 'obj':
+            return self.objectives[n]
+        elif kind == 'param':
+            return self.params[n]
+        elif kind == 'expr':
+            return self.expressions[n]
+        elif kind == 'root':
+            return self.model
+        return self._find(n)
+
+    def _constraint(self, n):
+        condata = self.constraints[n]
+        if condata is None:
+            # A lazily loaded constraint: construct it
+            if self.lazy_keys is None:
+                self.lazy_keys = {}
+                for comp, positions in self.lazy_components:
+                    for key, i in iteritems(positions):
+                        self.lazy_keys[i] = (comp, key)
+            comp, key = self.lazy_keys[n]
+            condata = comp[key]
+        return condata
+
+    def _lazy_expr(self, n):
+        """Return the (lower, body, upper) expressions of a lazily
+        loaded constraint, in the form accepted by set_value()"""
+        decode = self.decoder.decode
+        flags = self._view('con_flags')[n]
+        lower = decode(self._view('con_lower')[n])
+        body = decode(self._view('con_body')[n])
+        if flags & 2:
+            return (body, lower)
+        return (lower, body, decode(self._view('con_upper')[n]))
+
+    #
+    # Component loaders
+    #
+
+    def _load_block(self, block, record):
+        block._active = record['active']
+        for comp_record in record['components']:
+            _loaders[comp_record['type']](self, block, comp_record)
+
+    def _load_set(self, block, record):
+        comp = Set(initialize=record['values'],
+                   ordered=_decode_ordered(record['ordered']),
+                   dimen=record['dimen'],
+                   doc=record['doc'])
+        block.add_component(record['name'], comp)
+
+    def _load_rangeset(self, block, record):
+        block.add_component(record['name'],
+                            RangeSet(*record['args'], doc=record['doc']))
+
+    def _load_setproduct(self, block, record):
+        sets = [self._find(ref) for ref in record['sets']]
+        comp = sets[0].cross(*sets[1:])
+        comp.doc = record['doc']
+        block.add_component(record['name'], comp)
+
+    def _load_param(self, block, record):
+        comp = Param(*self._index_args(record),
+                     mutable=record['mutable'],
+                     default=record['default'],
+                     within=self._domain(record['domain']),
+                     doc=record['doc'])
+        block.add_component(record['name'], comp)
+        keys = self._keys(comp, record)
+        values = record['values']
+        if values.__class__ is not list:
+            values = self._view(values).tolist()
+        if not comp.is_indexed():
+            if keys:
+                comp._data[None] = comp
+                comp._value = values[0]
+                self.params.append(comp)
+        elif comp._mutable:
+            data = comp._data
+            params = self.params
+            for key, val in zip(keys, values):
+                paramdata = data[key] = _ParamData(comp)
+                paramdata._value = val
+                params.append(paramdata)
+        else:
+            comp._data.update(zip(keys, values))
+
+    def _load_var(self, block, record):
+        if self.array_backed is not None:
+            array_backed = self.array_backed
+        else:
+            # Fall back on standard variables if NumPy is missing
+            array_backed = record['array_backed'] and has_numpy
+        if record['list']:
+            comp = VarList(doc=record['doc'])
+            array_backed = False
+        elif record['index'] is None:
+            comp = Var(doc=record['doc'])
+            array_backed = False
+        else:
+            comp = Var(*self._index_args(record), dense=False,
+                       array_backed=array_backed, doc=record['doc'])
+        block.add_component(record['name'], comp)
+        keys = self._keys(comp, record)
+        start = record['start']
+        stop = start + record['count']
+        domains = [self._domain(n) for n in self._list('var_domain')[start:stop]]
+        data = comp._data
+        variables = self.variables
+        if array_backed:
+            _numpy = self._numpy
+            count = stop - start
+            comp._values = _numpy('var_value', start, count)
+            comp._lbs = _numpy('var_lb', start, count)
+            comp._ubs = _numpy('var_ub', start, count)
+            comp._fixed = _numpy('var_fixed', start, count).view(bool)
+            comp._stale = _numpy('var_stale', start, count).view(bool)
+            comp._npos = count
+            comp_ref = weakref_ref(comp)
+            for pos, (key, domain) in enumerate(zip(keys, domains)):
+                # Bypass _ArrayVarData.__init__(), which allocates a
+                # new position in the arrays
+                vardata = _ArrayVarData.__new__(_ArrayVarData)
+                vardata._component = comp_ref
+                vardata._pos = pos
+                vardata._domain = domain
+                data[key] = vardata
+                variables.append(vardata)
+            return
+        values = self._list('var_value')
+        lbs = self._list('var_lb')
+        ubs = self._list('var_ub')
+        fixed = self._list('var_fixed')
+        stale = self._list('var_stale')
+        ints = self._list('var_int')
+        scalar = not comp.is_indexed()
+        for n, key, domain in zip(xrange(start, stop), keys, domains):
+            if scalar:
+                vardata = comp
+            else:
+                vardata = data[key] = _GeneralVarData(domain, component=comp)
+            flags = ints[n]
+            val = values[n]
+            vardata._value = None if val != val else \
+                             int(val) if flags & 1 else val
+            val = lbs[n]
+            vardata._lb = None if val != val else \
+                          int(val) if flags & 2 else val
+            val = ubs[n]
+            vardata._ub = None if val != val else \
+                          int(val) if flags & 4 else val
+            vardata._domain = domain
+            vardata.fixed = bool(fixed[n])
+            vardata.stale = bool(stale[n])
+            variables.append(vardata)
+
+    def _load_constraint(self, block, record):
+        if record['list']:
+            comp = ConstraintList(doc=record['doc'])
+        elif record['index'] is not None and self.lazy:
+            rule = _LazyConstraintRule(self)
+            comp = Constraint(*self._index_args(record), rule=rule,
+                              lazy=True, doc=record['doc'])
+            block.add_component(record['name'], comp)
+            keys = self._keys(comp, record)
+            start = len(self.constraints)
+            rule.positions = dict(zip(keys, xrange(start,
+                                                   start + len(keys))))
+            self.constraints.extend([None] * len(keys))
+            self.lazy_components.append((comp, rule.positions))
+            comp._active = record['active']
+            return
+        else:
+            comp = Constraint(*self._index_args(record), doc=record['doc'])
+        block.add_component(record['name'], comp)
+        keys = self._keys(comp, record)
+        data = comp._data
+        constraints = self.constraints
+        if not comp.is_indexed():
+            if keys:
+                data[None] = comp
+                constraints.append(comp)
+        else:
+            for key in keys:
+                condata = data[key] = _GeneralConstraintData(component=comp)
+                constraints.append(condata)
+        comp._active = record['active']
+
+    def _load_objective(self, block, record):
+        if record['list']:
+            comp = ObjectiveList(doc=record['doc'])
+        else:
+            comp = Objective(*self._index_args(record), doc=record['doc'])
+        block.add_component(record['name'], comp)
+        keys = self._keys(comp, record)
+        data = comp._data
+        objectives = self.objectives
+        if not comp.is_indexed():
+            if keys:
+                data[None] = comp
+                objectives.append(comp)
+        else:
+            for key in keys:
+                objdata = data[key] = _GeneralObjectiveData(component=comp)
+                objectives.append(objdata)
+        comp._active = record['active']
+
+    def _load_expression(self, block, record):
+        comp = Expression(*self._index_args(record), doc=record['doc'])
+        block.add_component(record['name'], comp)
+        keys = self._keys(comp, record)
+        data = comp._data
+        expressions = self.expressions
+        if not comp.is_indexed():
+            if keys:
+                expressions.append(comp)
+            else:
+                data.clear()
+        else:
+            # Indexed expressions are constructed with every index
+            data.clear()
+            for key in keys:
+                exprdata = data[key] = _GeneralExpressionData(component=comp)
+                expressions.append(exprdata)
+
+    def _load_suffix(self, block, record):
+        comp = Suffix(direction=record['direction'],
+                      datatype=record['datatype'],
+                      doc=record['doc'])
+        block.add_component(record['name'], comp)
+        comp._active = record['active']
+        self.suffixes.append((comp, record['entries']))
+
+    def _load_block_component(self, block, record):
+        comp = Block(*self._index_args(record), doc=record['doc'])
+        block.add_component(record['name'], comp)
+        keys = self._keys(comp, record)
+        for key, block_record in zip(keys, record['blocks']):
+            self._load_block(comp[key], block_record)
+        comp._active = record['active']
+
+
+_loaders = {
+    'set': _ModelReader._load_set,
+    'rangeset': _ModelReader._load_rangeset,
+    'setproduct': _ModelReader._load_setproduct,
+    'param': _ModelReader._load_param,
+    'var': _ModelReader._load_var,
+    'constraint': _ModelReader._load_constraint,
+    'objective': _ModelReader._load_objective,
+    'expression': _ModelReader._load_expression,
+    'suffix': _ModelReader._load_suffix,
+    'block': _ModelReader._load_block_component,
+}
+
+
+class _NodeDecoder(object):
+    """Rebuild expression nodes from the node table.
+
+    :meth:`decode_all` rebuilds the whole table in one pass (the
+    arguments of a node always precede it).  :meth:`decode` rebuilds a
+    single expression (and the nodes it needs) on demand, reading the
+    table in place.
+    """
+
+    def __init__(self, reader):
+        directory = reader.directory
+        self.reader = reader
+        self.op = reader._view('node_op')
+        self.data = reader._view('node_data')
+        self.arg_start = reader._view('node_arg_start')
+        self.args = reader._view('node_args')
+        self.floats = reader._view('const_float')
+        self.objects = directory['objects']
+        self.variables = reader.variables
+        self.params = reader.params
+        self.expressions = reader.expressions
+        self.nodes = {}
+
+        self.classes = []
+        for module, name in directory['classes']:
+            cls = getattr(importlib.import_module(module), name, None)
+            if cls is None or not issubclass(cls, EXPR.ExpressionBase):
+                raise ValueError(
+                    "Error loading a Pyomo model file: unknown expression "
+                    "class %s.%s" % (module, name))
+            self.classes.append((cls, _node_kind(cls)))
+        self.functions = [
+            (name, getattr(importlib.import_module(module), fcn_name))
+            for name, module, fcn_name in directory['functions']]
+
+    def _make(self, op, datum, args):
+        if op < 0:
+            if op == _VAR:
+                return self.variables[datum]
+            elif op == _PARAM:
+                return self.params[datum]
+            elif op == _NAMED_EXPR:
+                return self.expressions[datum]
+            elif op == _INT:
+                return datum
+            elif op == _FLOAT:
+                return self.floats[datum]
+            elif op == _NUMERIC_CONSTANT:
+                return as_numeric(self.objects[datum])
+            elif op == _EXTERNAL:
+                return self.reader._find(self.objects[datum])
+            return self.objects[datum]
+
+        # Bypass the constructors (as unpickling does)
+        cls, kind = self.classes[op]
+        node = cls.__new__(cls)
+        if kind == _GENERIC:
+            node._args_ = tuple(args)
+        elif kind == _SUM:
+            node._args_ = args
+            node._nargs = len(args)
+            node._shared_args = False
+        elif kind == _UNARY:
+            node._args_ = tuple(args)
+            node._name, node._fcn = self.functions[datum]
+        elif kind == _INEQUALITY:
+            node._args_ = tuple(args)
+            node._strict = bool(datum)
+        elif kind == _RANGED:
+            node._args_ = tuple(args)
+            node._strict = (bool(datum & 1), bool(datum & 2))
+        elif kind == _LINEAR:
+            nvars = len(args) - datum
+            node._args_ = ()
+            node.constant = args[0]
+            node.linear_coefs = args[1:nvars]
+            node.linear_vars = args[nvars:]
+        else: # kind == _ARRAY_LINEAR
+            node._args_ = ()
+            node.constant = args[0]
+            node.var_list = args[1:]
+            node.coef_array, node.index_array = self.objects[datum]
+        return node
+
+    def decode_all(self):
+        """Rebuild every node and return the list of nodes.
+
+        The list has an additional None entry at the end, so it can be
+        indexed with -1 (the node number stored for None).
+        """
+        op = self.op.tolist()
+        data = self.data.tolist()
+        arg_start = self.arg_start.tolist()
+        args = self.args.tolist()
+        floats = self.floats.tolist()
+        variables = self.variables
+        make = self._make
+        nodes = []
+        append = nodes.append
+        for i in xrange(len(op)):
+            code = op[i]
+            # Inline the most common leaves
+            if code == _VAR:
+                append(variables[data[i]])
+            elif code == _INT:
+                append(data[i])
+            elif code == _FLOAT:
+                append(floats[data[i]])
+            else:
+                append(make(code, data[i],
+                            [nodes[j] for j in
+                             args[arg_start[i]:arg_start[i+1]]]))
+        append(None)
+        return nodes
+
+    def decode(self, n):
+        """Rebuild the node n (and its arguments), reusing the nodes
+        that were already rebuilt"""
+        if n < 0:
+            return None
+        nodes = self.nodes
+        ans = nodes.get(n, None)
+        if ans is not None:
+            return ans
+        op = self.op
+        data = self.data
+        arg_start = self.arg_start
+        all_args = self.args
+        stack = [n]
+        while stack:
+            i = stack[-1]
+            if i in nodes:
+                stack.pop()
+                continue
+            args = all_args[arg_start[i]:arg_start[i+1]].tolist()
+            missing = [j for j in args if j not in nodes]
+            if missing:
+                stack.extend(missing)
+                continue
+            stack.pop()
+            nodes[i] = self._make(op[i], data[i], [nodes[j] for j in args])
+        return nodes[n]
+
+
+class _LazyConstraintRule(object):
+    """The rule of a lazily loaded Constraint component.
+
+    The rule returns the expressions of a constraint rebuilt from the
+    node table, or Constraint.Skip for indices that were not saved.
+    """
+
+    def __init__(self, reader):
+        self.reader = reader
+        # index -> constraint number
+        self.positions = None
+
+    def __call__(self, block, *index):
+        if len(index) == 1:
+            index = index[0]
+        n = self.positions.get(index, None)
+        if n is None:
+            return Constraint.Skip
+        return self.reader._lazy_expr(n)
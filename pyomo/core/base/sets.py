@@ -19,6 +19,7 @@ import sys
 import types
 import copy
 import itertools
+from bisect import bisect_left, bisect_right
 from weakref import ref as weakref_ref
 
 from pyutilib.misc import flatten_tuple as pyutilib_misc_flatten_tuple
@@ -29,11 +30,11 @@ from pyomo.core.base.misc import apply_indexed_rule, \
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.component import Component, ComponentData
 from pyomo.core.base.indexed_component import IndexedComponent, \
-    UnindexedComponent_set
+    UnindexedComponent_set, intern_index
 from pyomo.core.base.numvalue import native_numeric_types
 
 from six import itervalues, iteritems, string_types
-from six.moves import xrange
+from six.moves import xrange, map
 
 logger = logging.getLogger('pyomo.core')
 
@@ -265,8 +266,12 @@ class _OrderedSetData(_SetDataBase):
     Public Class Attributes:
         value       The set values
         _bounds     The tuple of bound values
-        order_dict  A dictionary that maps from element value to element id.
-                        Indices in this dictionary start with 1 (not 0).
+        order_dict  A dictionary that maps from element value to element id
+                        (InsertionOrder) or to the element sort key
+                        (SortedOrder).
+        _keys       The sort keys of the set values (only used when the
+                        owning component defines a custom sort order)
+        _sort_key   The custom sort key function, or None
 
     The ordering supported in this class depends on the 'ordered' attribute
     of the owning component:
@@ -277,9 +282,16 @@ class _OrderedSetData(_SetDataBase):
                                 the Python ordering of the set types is used.
                                 Note that a _stable_ sort method is required
                                 if the discard method is used.
+
+    Sorted sets keep the value list in sorted order, so ord(), next()
+    and prev() are binary searches, and elements are inserted in place.
+    Elements added to a set that has not been accessed by position yet
+    (e.g., during construction) are appended and sorted in bulk on the
+    first ordered access.
     """
 
-    __slots__ = ('value', 'order_dict', '_bounds', '_is_sorted')
+    __slots__ = ('value', 'order_dict', '_bounds', '_is_sorted', '_keys',
+                 '_sort_key')
 
     def __init__(self, owner, bounds):
         #
@@ -289,10 +301,14 @@ class _OrderedSetData(_SetDataBase):
         self._component = weakref_ref(owner)
         #
         self._bounds = bounds
-        if self.parent_component().ordered is Set.InsertionOrder:
+        _ordered = self.parent_component().ordered
+        self._sort_key = None
+        if _ordered is Set.InsertionOrder:
             self._is_sorted = 0
         else:
             self._is_sorted = 1
+            if _ordered is not Set.SortedOrder:
+                self._sort_key = _ordered
         self._clear()
 
     def __getstate__(self):
@@ -328,22 +344,42 @@ class _OrderedSetData(_SetDataBase):
     def _sort(self):
         """
         Sort the set using the 'ordered' attribute of the owning
-        component.  This recreates the order_dict dictionary, which indicates
-        that the set is sorted.
+        component.  After sorting, new elements are inserted in sorted
+        order.
         """
-        _sorter = self.parent_component().ordered
-        self.value = sorted(self.value, key=None if _sorter is Set.SortedOrder else _sorter)
-        self.order_dict = dict((j,i) for i,j in enumerate(self.value))
+        if not self._is_sorted:
+            return
+        if self._sort_key is None:
+            self.value = sorted(self.value)
+        else:
+            _key = self.order_dict.__getitem__
+            self.value = sorted(self.value, key=_key)
+            self._keys = [_key(val) for val in self.value]
         self._is_sorted = 1
 
+    def _position(self, val):
+        """
+        Return the 0-based position of an element of a sorted set.
+        """
+        key = self.order_dict[val]
+        if self._sort_key is None:
+            return bisect_left(self.value, key)
+        # Distinct elements may share the same sort key
+        _id = bisect_left(self._keys, key)
+        value = self.value
+        while value[_id] != val:
+            _id += 1
+        return _id
+
     def _clear(self):
         """
         Reset the set data
         """
         self.value = []
         self.order_dict = {}
+        self._keys = None
         if self._is_sorted:
-            self._is_sorted = 1
+            self._is_sorted = 2
 
     def _add(self, val, verify=True):
         """
@@ -353,19 +389,38 @@ class _OrderedSetData(_SetDataBase):
         """
         if verify:
             self._component()._verify(val)
-        self.order_dict[val] = len(self.value)
-        self.value.append(val)
-        if self._is_sorted:
-            self._is_sorted = 2
+        if not self._is_sorted:
+            self.order_dict[val] = len(self.value)
+            self.value.append(val)
+            return
+        key = val if self._sort_key is None else self._sort_key(val)
+        self.order_dict[val] = key
+        if self._is_sorted == 2:
+            self.value.append(val)
+        elif self._sort_key is None:
+            self.value.insert(bisect_right(self.value, key), val)
+        else:
+            _id = bisect_right(self._keys, key)
+            self._keys.insert(_id, key)
+            self.value.insert(_id, val)
 
     def _discard(self, val):
         """
         Discard an element of this set.  This does not return an error
         if the element does not already exist.
         """
-        try:
-            _id = self.order_dict.pop(val)
-        except KeyError:
+        if val not in self.order_dict:
+            return
+        if self._is_sorted == 1:
+            _id = self._position(val)
+            del self.order_dict[val]
+            del self.value[_id]
+            if self._keys is not None:
+                del self._keys[_id]
+            return
+        _id = self.order_dict.pop(val)
+        if self._is_sorted:
+            self.value.remove(val)
             return
         del self.value[_id]
         #
@@ -440,6 +495,8 @@ class _OrderedSetData(_SetDataBase):
         if self._is_sorted == 2:
             self._sort()
         try:
+            if self._is_sorted:
+                return self._position(match_element) + 1
             return self.order_dict[match_element] + 1
         except IndexError:
             raise IndexError("Unknown input element="+str(match_element)+" provided as input to ord() method for set="+self.name)
@@ -480,7 +537,7 @@ class _OrderedSetData(_SetDataBase):
         except KeyError:
             raise KeyError("Cannot obtain nextw() member of set="+self.name+"; input element="+str(match_element)+" is not a member of the set!")
         #
-        return self[(element_position+k-1) % len(self.value) + 1]
+        return self[(element_position+k-1) % len(self) + 1]
 
     def prev(self, match_element, k=1):
         """
@@ -557,6 +614,8 @@ class _IndexedOrderedSetData(_OrderedSetData):
         """
         Return the underlying set data.
         """
+        if self._is_sorted == 2:
+            self._sort()
         return self.value
 
     def clear(self):
@@ -871,7 +930,7 @@ class SimpleSetBase(Set):
             None, #("Members",),
             lambda k, v: [
                 "Virtual" if not self.concrete or v.virtual \
-                    else v.value if v.ordered \
+                    else list(v) if v.ordered \
                     else sorted(v), ] )
 
     def _set_repn(self, other):
@@ -1306,6 +1365,14 @@ class OrderedSimpleSet(SimpleSetBase,_OrderedSetData):
         """
         return _OrderedSetData.__getitem__(self, key)
 
+    def __iter__(self):
+        """
+        Return an iterator for the underlying set
+        """
+        if self._is_sorted == 2:
+            self._sort()
+        return SimpleSetBase.__iter__(self)
+
     def _set_contains(self, element):
         """
         A wrapper function that tests if the element is in
@@ -1549,12 +1616,16 @@ class _SetProduct(_SetOperator):
         self._compute_dimen()
 
     def __iter__(self):
-        if self.is_flat_product():
-            for i in itertools.product(*self.set_tuple):
-                yield i
-        else:
-            for i in itertools.product(*self.set_tuple):
-                yield pyutilib_misc_flatten_tuple(i)
+        # Note: return iterators (instead of yielding from a generator)
+        # to avoid the generator overhead for every element
+        ans = itertools.product(*self.set_tuple)
+        if not self.is_flat_product():
+            ans = map(pyutilib_misc_flatten_tuple, ans)
+        table = intern_index.table
+        if table is not None:
+            _intern = table.setdefault
+            ans = (_intern(i, i) for i in ans)
+        return ans
 
     def _set_contains(self, element):
         # Do we really need to check if element is a tuple???
@@ -1593,6 +1664,116 @@ class _SetProduct(_SetOperator):
             ans *= len(_set)
         return ans
 
+    #
+    # Positional access for ordered products.  These methods compute
+    # positions from the positions in the component sets, so the
+    # product is never enumerated.
+    #
+
+    def _split(self, element):
+        """
+        Return the list of component set members that make up an
+        element of the product.
+        """
+        ans = []
+        ctr = 0
+        for subset in self.set_tuple:
+            d = subset.dimen
+            if d is None:
+                for dlen in range(len(element), ctr, -1):
+                    if subset._set_contains(element[ctr:dlen]):
+                        d = dlen - ctr
+                        break
+                else:
+                    d = 1
+            if d == 1:
+                ans.append(element[ctr])
+            else:
+                ans.append(element[ctr:ctr+d])
+            ctr += d
+        if ctr != len(element):
+            raise KeyError("Unknown input element="+str(element)+" provided as input to ord() method for set="+self.name)
+        return ans
+
+    def __getitem__(self, idx):
+        """
+        Return the specified member of an ordered product.
+        """
+        if not self.ordered:
+            raise ValueError("Cannot index an unordered set '%s'" % self.name)
+        n = len(self)
+        if idx >= 1:
+            if idx > n:
+                raise IndexError("Cannot index a set past the last element")
+            pos = idx - 1
+        elif idx < 0:
+            if n+idx < 0:
+                raise IndexError("Cannot index a set past the first element")
+            pos = n + idx
+        else:
+            raise IndexError("Valid index values for sets are 1 .. len(set) or -1 .. -len(set)")
+        ans = []
+        for subset in reversed(self.set_tuple):
+            pos, _id = divmod(pos, len(subset))
+            ans.append(subset[_id+1])
+        ans.reverse()
+        if self.is_flat_product():
+            return tuple(ans)
+        return pyutilib_misc_flatten_tuple(tuple(ans))
+
+    def ord(self, match_element):
+        """
+        Return the position index of a member of an ordered product.
+        The position indices start at 1.
+        """
+        if not self.ordered:
+            raise ValueError("Cannot compute the position of an element of the unordered set '%s'" % self.name)
+        if match_element.__class__ is not tuple:
+            match_element = (match_element,)
+        pos = 0
+        for subset, val in zip(self.set_tuple,
+                               self._split(match_element)):
+            pos = pos*len(subset) + subset.ord(val) - 1
+        return pos + 1
+
+    def first(self):
+        """
+        Return the first element of an ordered product.
+        """
+        return self[1]
+
+    def last(self):
+        """
+        Return the last element of an ordered product.
+        """
+        return self[-1]
+
+    def next(self, match_element, k=1):
+        """
+        Return the element k positions after match_element.
+        """
+        return self[self.ord(match_element)+k]
+
+    def nextw(self, match_element, k=1):
+        """
+        Return the element k positions after match_element, wrapping
+        around to the beginning of the set.
+        """
+        return self[(self.ord(match_element)+k-1) % len(self) + 1]
+
+    def prev(self, match_element, k=1):
+        """
+        Return the element k positions before match_element.
+        """
+        return self.next(match_element, k=-k)
+
+    def prevw(self, match_element, k=1):
+        """
+        Return the element k positions before match_element, wrapping
+        around to the end of the set.
+        """
+        return self.nextw(match_element, k=-k)
+
     def _compute_dimen(self):
         ans=0
         for _set in self.set_tuple:
@@ -8,13 +8,15 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-__all__ = ['Var', '_VarData', '_GeneralVarData', 'VarList', 'SimpleVar']
+__all__ = ['Var', '_VarData', '_GeneralVarData', '_ArrayVarData', 'VarList',
+           'SimpleVar']
 
 import logging
 from weakref import ref as weakref_ref
 
 from pyomo.common.timing import ConstructionTimer
-from pyomo.core.base.numvalue import NumericValue, value, is_fixed
+from pyomo.core.base.numvalue import (NumericValue, value, is_fixed,
+                                      native_numeric_types)
 from pyomo.core.base.set_types import BooleanSet, IntegerSet, RealSet, Reals
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.component import ComponentData
@@ -26,6 +28,12 @@ from pyomo.core.base.util import is_functor
 from six import iteritems, itervalues
 from six.moves import xrange
 
+try:
+    import numpy
+    has_numpy = True
+except:                                         #pragma:nocover
+    has_numpy = False
+
 logger = logging.getLogger('pyomo.core')
 
 class _VarData(ComponentData, NumericValue):
@@ -458,6 +466,146 @@ class _GeneralVarData(_VarData):
     free = unfix
 
 
+_nan = float('nan')
+
+class _ArrayVarData(_VarData):
+    """
+    This class defines the data for a single variable of an
+    array-backed indexed variable (see :class:`ArrayIndexedVar`).
+
+    Constructor Arguments:
+        domain      The domain of this variable.
+        component   The ArrayIndexedVar object that owns this data.
+
+    The value, bounds, fixed flag and stale flag of the variable are
+    stored in NumPy arrays on the owning component, at the position
+    given by the '_pos' attribute.  A value of None, or a bound of
+    None, is stored as NaN.  Bounds that are not numeric constants
+    (e.g., mutable parameters) are stored in a dictionary on the
+    component.
+    """
+
+    __slots__ = ('_pos', '_domain')
+
+    def __init__(self, domain=Reals, component=None):
+        #
+        # These lines represent in-lining of the
+        # following constructors:
+        #   - _VarData
+        #   - ComponentData
+        #   - NumericValue
+        self._component = weakref_ref(component)
+        self._pos = component._allocate_position()
+        if hasattr(domain, 'bounds'):
+            self._domain = domain
+        else:
+            self._domain = None
+            raise ValueError(
+                "%s is not a valid domain. Variable domains must be an "
+                "instance of one of %s, or an object that declares a method "
+                "for bounds (like a Pyomo Set). Examples: NonNegativeReals, "
+                "Integers, Binary" % (domain, (RealSet, IntegerSet, BooleanSet)))
+
+    def __getstate__(self):
+        state = super(_ArrayVarData, self).__getstate__()
+        for i in _ArrayVarData.__slots__:
+            state[i] = getattr(self, i)
+        return state
+
+    #
+    # Abstract Interface
+    #
+
+    @property
+    def value(self):
+        """Return the value for this variable."""
+        val = self._component()._values.item(self._pos)
+        if val != val:
+            return None
+        return val
+    @value.setter
+    def value(self, val):
+        """Set the value for this variable."""
+        self._component()._values[self._pos] = _nan if val is None else val
+
+    domain = _GeneralVarData.domain
+
+    @property
+    def _lb(self):
+        return self._component()._get_bound(self._pos, 0)
+
+    @property
+    def _ub(self):
+        return self._component()._get_bound(self._pos, 1)
+
+    lb = _GeneralVarData.lb
+    ub = _GeneralVarData.ub
+
+    @property
+    def fixed(self):
+        """Return the fixed indicator for this variable."""
+        return self._component()._fixed.item(self._pos)
+    @fixed.setter
+    def fixed(self, val):
+        """Set the fixed indicator for this variable."""
+        self._component()._fixed[self._pos] = val
+
+    @property
+    def stale(self):
+        """Return the stale indicator for this variable."""
+        return self._component()._stale.item(self._pos)
+    @stale.setter
+    def stale(self, val):
+        """Set the stale indicator for this variable."""
+        self._component()._stale[self._pos] = val
+
+    def setlb(self, val):
+        """
+        Set the lower bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        # Note: is_fixed(None) returns True
+        if is_fixed(val):
+            self._component()._set_bound(self._pos, 0, val)
+        else:
+            raise ValueError(
+                "Non-fixed input of type '%s' supplied as variable lower "
+                "bound - legal types must be fixed expressions or variables."
+                % (type(val),))
+
+    def setub(self, val):
+        """
+        Set the upper bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        # Note: is_fixed(None) returns True
+        if is_fixed(val):
+            self._component()._set_bound(self._pos, 1, val)
+        else:
+            raise ValueError(
+                "Non-fixed input of type '%s' supplied as variable upper "
+                "bound - legal types are fixed expressions or variables."
+                "parameters"
+                % (type(val),))
+
+    def fix(self, *val):
+        """
+        Set the fixed indicator to True. Value argument is optional,
+        indicating the variable should be fixed at its current value.
+        """
+        self.fixed = True
+        if len(val) == 1:
+            self.value = val[0]
+        elif len(val) > 1:
+            raise TypeError("fix expected at most 1 arguments, got %d" % (len(val)))
+
+    def unfix(self):
+        """Sets the fixed indicator to False."""
+        self.fixed = False
+
+    free = unfix
+
+
 @ModelComponentFactory.register("Decision variables.")
 class Var(IndexedComponent):
     """A numeric variable, which may be defined over an index.
@@ -477,6 +625,13 @@ class Var(IndexedComponent):
             `index_set()` when constructing the Var (True) or just the
             variables returned by `initialize`/`rule` (False).  Defaults
             to True.
+        lazy (bool, optional): Construct the elements of an indexed
+            Var the first time they are accessed instead of when the
+            Var is constructed (see
+            :meth:`IndexedComponent.materialize`).  Defaults to False.
+        array_backed (bool, optional): Store the values, bounds, and
+            fixed and stale flags of an indexed Var in NumPy arrays
+            (see :class:`ArrayIndexedVar`).  Defaults to False.
     """
 
     _ComponentDataClass = _GeneralVarData
@@ -486,6 +641,8 @@ class Var(IndexedComponent):
             return super(Var, cls).__new__(cls)
         if not args or (args[0] is UnindexedComponent_set and len(args)==1):
             return SimpleVar.__new__(SimpleVar)
+        elif kwds.get('array_backed', False):
+            return ArrayIndexedVar.__new__(ArrayIndexedVar)
         else:
             return IndexedVar.__new__(IndexedVar)
 
@@ -499,6 +656,9 @@ class Var(IndexedComponent):
         domain = kwd.pop('domain', domain)
         bounds = kwd.pop('bounds', None)
         self._dense = kwd.pop('dense', True)
+        self._lazy = kwd.pop('lazy', False)
+        # The storage mode was selected by Var.__new__
+        kwd.pop('array_backed', None)
 
         #
         # Initialize the base class
@@ -547,10 +707,23 @@ class Var(IndexedComponent):
         for var_data in itervalues(self._data):
             var_data.stale = True
 
-    def get_values(self, include_fixed_values=True):
+    def get_values(self, include_fixed_values=True, as_array=False):
         """
         Return a dictionary of index-value pairs.
+
+        If 'as_array' is True, a NumPy array with the values in the
+        iteration order of this component is returned instead.  Values
+        that are None (and, when 'include_fixed_values' is False, the
+        values of fixed variables) are NaN in the array.
         """
+        if as_array:
+            if not has_numpy:
+                raise ValueError("The numpy module is not available.")
+            return numpy.fromiter(
+                (_nan if (vardata.value is None or
+                          (vardata.fixed and not include_fixed_values))
+                 else vardata.value for vardata in itervalues(self)),
+                dtype=float, count=len(self))
         if include_fixed_values:
             return dict((idx, vardata.value)
                             for idx, vardata in iteritems(self._data))
@@ -564,11 +737,26 @@ class Var(IndexedComponent):
         """
         Set the values of a dictionary.
 
+        The values may also be a sequence (e.g., a NumPy array) with
+        one value for each variable, in the iteration order of this
+        component.  NaN entries in a sequence are stored as None.
+
         The default behavior is to validate the values in the
         dictionary.
         """
-        for index, new_value in iteritems(new_values):
-            self[index].set_value(new_value, valid)
+        if hasattr(new_values, 'items'):
+            for index, new_value in iteritems(new_values):
+                self[index].set_value(new_value, valid)
+            return
+        if len(new_values) != len(self):
+            raise ValueError(
+                "Cannot set the values of Var '%s' from a sequence of "
+                "length %s (expected %s values)"
+                % (self.name, len(new_values), len(self)))
+        for vardata, new_value in zip(itervalues(self), new_values):
+            if new_value != new_value:
+                new_value = None
+            vardata.set_value(new_value, valid)
 
     def construct(self, data=None):
         """Construct this component."""
@@ -595,6 +783,8 @@ class Var(IndexedComponent):
         if not self.is_indexed():
             self._data[None] = self
             self._initialize_members((None,))
+        elif self._lazy:
+            self._lazy_constructed = set()
         elif self._dense:
             # This loop is optimized for speed with pypy.
             # Calling dict.update((...) for ...) is roughly
@@ -627,6 +817,9 @@ class Var(IndexedComponent):
         self._initialize_members((index,))
         return obj
 
+    def _construct_index(self, index):
+        self._getitem_when_not_present(index)
+
     def _setitem_when_not_present(self, index, value):
         """Perform the fundamental component item creation and storage.
 
@@ -947,6 +1140,218 @@ class IndexedVar(Var):
     free=unfix
 
 
+class ArrayIndexedVar(IndexedVar):
+    """An array of variables that stores its data in NumPy arrays.
+
+    The values, numeric bounds, and fixed and stale flags of the
+    variables are stored in contiguous NumPy arrays on this component,
+    and each :class:`_ArrayVarData` only records its position in those
+    arrays.  This makes the bulk :meth:`get_values` and
+    :meth:`set_values` methods (and :func:`load_var_values`) operate on
+    whole arrays instead of individual objects.
+
+    This class is used when a Var is declared with
+    ``array_backed=True``.
+    """
+
+    _ComponentDataClass = _ArrayVarData
+
+    def __init__(self, *args, **kwds):
+        if not has_numpy:
+            raise ValueError("The numpy module is not available. "
+                             "Cannot declare an array-backed Var.")
+        self._npos = 0
+        self._values = numpy.empty(0)
+        self._lbs = numpy.empty(0)
+        self._ubs = numpy.empty(0)
+        self._fixed = numpy.empty(0, dtype=bool)
+        self._stale = numpy.empty(0, dtype=bool)
+        # Bounds that are not numeric constants, keyed by
+        # (position, 0) for lower and (position, 1) for upper bounds
+        self._bound_exprs = {}
+        self._position_cache = None
+        IndexedVar.__init__(self, *args, **kwds)
+
+    def construct(self, data=None):
+        """Construct this component."""
+        if self._constructed:
+            return
+        timer = ConstructionTimer(self)
+        self._constructed=True
+
+        if self._lazy:
+            self._lazy_constructed = set()
+        elif self._dense:
+            self._reserve(len(self._index))
+            domain = self._domain_init_value
+            for ndx in self._index:
+                self._data[ndx] = _ArrayVarData(domain, component=self)
+            self._initialize_members(self._index)
+        timer.report()
+
+    def _reserve(self, size):
+        """Grow the storage arrays to hold at least 'size' variables."""
+        n = len(self._values)
+        if size <= n:
+            return
+        def _grow(old, fill):
+            new = numpy.empty(size, dtype=old.dtype)
+            new[:n] = old
+            new[n:] = fill
+            return new
+        self._values = _grow(self._values, _nan)
+        self._lbs = _grow(self._lbs, _nan)
+        self._ubs = _grow(self._ubs, _nan)
+        self._fixed = _grow(self._fixed, False)
+        self._stale = _grow(self._stale, True)
+
+    def _allocate_position(self):
+        pos = self._npos
+        if pos == len(self._values):
+            self._reserve(max(16, 2*pos))
+        self._npos = pos + 1
+        return pos
+
+    def _get_bound(self, pos, which):
+        val = (self._ubs if which else self._lbs).item(pos)
+        if val != val:
+            return self._bound_exprs.get((pos, which), None)
+        return val
+
+    def _set_bound(self, pos, which, val):
+        bounds = self._ubs if which else self._lbs
+        if val is None or val.__class__ in native_numeric_types:
+            bounds[pos] = _nan if val is None else val
+            self._bound_exprs.pop((pos, which), None)
+        else:
+            bounds[pos] = _nan
+            self._bound_exprs[pos, which] = val
+
+    def _positions(self):
+        """Return the positions of the variables in iteration order.
+
+        This is a slice when the positions are contiguous (e.g., for
+        dense variables), and an integer array otherwise.
+        """
+        key = (len(self._data), self._npos)
+        if self._position_cache is None or self._position_cache[0] != key:
+            positions = numpy.fromiter(
+                (vardata._pos for vardata in itervalues(self)),
+                dtype=int, count=len(self._data))
+            if len(positions) == self._npos and \
+               (positions == numpy.arange(self._npos)).all():
+                positions = slice(0, self._npos)
+            self._position_cache = (key, positions)
+        return self._position_cache[1]
+
+    def flag_as_stale(self):
+        """
+        Set the 'stale' attribute of every variable data object to True.
+        """
+        self._stale[:self._npos] = True
+
+    def fix(self, *val):
+        """
+        Set the fixed indicator to True. Value argument is optional,
+        indicating the variable should be fixed at its current value.
+        """
+        if val:
+            return IndexedVar.fix(self, *val)
+        self._fixed[self._positions()] = True
+
+    def unfix(self):
+        """Sets the fixed indicator to False."""
+        self._fixed[self._positions()] = False
+
+    free=unfix
+
+    def get_values(self, include_fixed_values=True, as_array=False):
+        """
+        Return a dictionary of index-value pairs.
+
+        If 'as_array' is True, a NumPy array with the values in the
+        iteration order of this component is returned instead.  Values
+        that are None (and, when 'include_fixed_values' is False, the
+        values of fixed variables) are NaN in the array.
+        """
+        positions = self._positions()
+        if as_array:
+            # Indexing with a slice returns a view, not a copy
+            values = numpy.array(self._values[positions])
+            if not include_fixed_values:
+                values[self._fixed[positions]] = _nan
+            return values
+        values = [None if v != v else v
+                  for v in self._values[positions].tolist()]
+        if include_fixed_values:
+            return dict(zip(self.keys(), values))
+        return dict((idx, val) for idx, val, fixed in
+                    zip(self.keys(), values, self._fixed[positions].tolist())
+                    if not fixed)
+
+    extract_values = get_values
+
+    def set_values(self, new_values, valid=False):
+        """
+        Set the values of a dictionary.
+
+        The values may also be a sequence (e.g., a NumPy array) with
+        one value for each variable, in the iteration order of this
+        component.  NaN entries in a sequence are stored as None.
+        Sequences are stored with a single array assignment, so
+        passing valid=True (which skips the validation of each value
+        against the variable domains) is significantly faster.
+
+        The default behavior is to validate the values in the
+        dictionary.
+        """
+        if hasattr(new_values, 'items'):
+            return IndexedVar.set_values(self, new_values, valid)
+        new_values = numpy.asarray(new_values, dtype=float)
+        if new_values.shape != (len(self),):
+            raise ValueError(
+                "Cannot set the values of Var '%s' from a sequence of "
+                "shape %s (expected %s values)"
+                % (self.name, new_values.shape, len(self)))
+        if not valid:
+            for vardata, val in zip(itervalues(self), new_values.tolist()):
+                if val == val:
+                    vardata._valid_value(val)
+        positions = self._positions()
+        self._values[positions] = new_values
+        self._stale[positions] = False
+
+    def _set_values_at(self, positions, values):
+        """Set the values of the variables at the given positions and
+        flag them as not stale.  The values are not validated."""
+        self._values[positions] = values
+        self._stale[positions] = False
+
+
+def load_var_values(variables, values):
+    """Load values into a sequence of variable data objects.
+
+    The variables are flagged as not stale.  The values are not
+    validated against the variable domains.  The values of variables
+    that belong to array-backed Var components are stored with a
+    single array assignment per component.
+    """
+    by_component = {}
+    for vardata, val in zip(variables, values):
+        if vardata.__class__ is _ArrayVarData:
+            comp = vardata._component()
+            data = by_component.get(id(comp), None)
+            if data is None:
+                data = by_component[id(comp)] = (comp, [], [])
+            data[1].append(vardata._pos)
+            data[2].append(_nan if val is None else val)
+        else:
+            vardata.value = val
+            vardata.stale = False
+    for comp, positions, comp_values in itervalues(by_component):
+        comp._set_values_at(positions, comp_values)
+
+
 @ModelComponentFactory.register("List of decision variables.")
 class VarList(IndexedVar):
     """
@@ -25,6 +25,7 @@ __all__ = (
 'inequality',
 'decompose_term',
 'clone_counter',
+'clear_float_pool',
 'clone_expression',
 'FixedExpressionError',
 'NonConstantExpressionError',
@@ -44,6 +45,8 @@ __all__ = (
 'GetItemExpression',
 'Expr_ifExpression',
 'LinearExpression',
+'ArrayLinearExpression',
+'array_linear_expression',
 'ReciprocalExpression',
 'NegationExpression',
 'SumExpression',
@@ -60,6 +63,7 @@ __all__ = (
 'StreamBasedExpressionVisitor',
 'SimpleExpressionVisitor',
 'ExpressionValueVisitor',
+'DispatchValueVisitor',
 'replace_expressions',
 'ExpressionReplacementVisitor',
 'LinearDecompositionError',
@@ -87,6 +91,12 @@ from six import next, string_types, itervalues
 from six.moves import xrange, builtins
 from weakref import ref
 
+try:
+    import numpy
+    has_numpy = True
+except:     #pragma:nocover
+    has_numpy = False
+
 logger = logging.getLogger('pyomo.core')
 
 from pyutilib.misc.visitor import SimpleVisitor, ValueVisitor
@@ -191,6 +201,7 @@ class nonlinear_expression(object):
     def __exit__(self, *args):
         if self.e.__class__ == _MutableSumExpression:
             self.e.__class__ = SumExpression
+            self.e._compact()
 
 
 class linear_expression(object):
@@ -727,6 +738,208 @@ class ExpressionValueVisitor(object):
             else:
                 return self.finalize(ans)
 
+class _ExpandNode(object):
+    """The sentinel returned by leaf handlers for nodes to expand."""
+
+    def __repr__(self):
+        return 'EXPAND'
+
+
+class DispatchValueVisitor(ExpressionValueVisitor):
+    """
+    A non-recursive postorder value visitor that dispatches on the
+    class of each node.
+
+    This visitor computes the same values as
+    :class:`ExpressionValueVisitor`, but it replaces the calls to
+    :func:`visiting_potential_leaf` and :func:`visit` with two
+    dispatch tables that are keyed on ``node.__class__``:
+
+    * The *leaf table* maps a class to :const:`None` if nodes of
+      that class are always expanded, or to a handler
+      ``handler(visitor, node)`` that returns the value of a leaf.
+      A handler may return :attr:`EXPAND` if the decision to expand
+      a node depends on the instance.
+    * The *node table* maps a class to a handler
+      ``handler(visitor, node, values)`` that computes the value of
+      an expanded node from the values of its arguments.
+
+    The tables are shared by all instances of a visitor class.  The
+    entry for a class that was not registered is created the first
+    time that a node of that class is visited, using
+    :func:`leaf_handler` and :func:`node_handler`.  By default these
+    wrap :func:`visiting_potential_leaf` and :func:`visit`, so any
+    :class:`ExpressionValueVisitor` can be converted to this class
+    before it defines specialized handlers.
+
+    The frames of the search stack are preallocated lists that are
+    reused for every node at the same depth (and across searches
+    with the same visitor).
+    """
+
+    EXPAND = _ExpandNode()
+
+    def __init__(self):
+        self._frames = []
+
+    @classmethod
+    def _dispatch_tables(cls):
+        tables = cls.__dict__.get('_tables', None)
+        if tables is None:
+            tables = ({}, {})
+            cls._tables = tables
+        return tables
+
+    @classmethod
+    def register_leaf_handler(cls, node_class, handler):
+        """
+        Register the leaf handler for a class of nodes.
+
+        Args:
+            node_class: The class of the node.
+            handler: A function ``handler(visitor, node)`` that
+                returns the value of the node (or :attr:`EXPAND`),
+                or :const:`None` if nodes of this class are always
+                expanded.
+        """
+        cls._dispatch_tables()[0][node_class] = handler
+
+    @classmethod
+    def register_node_handler(cls, node_class, handler):
+        """
+        Register the handler that computes the value of an expanded
+        node.
+
+        Args:
+            node_class: The class of the node.
+            handler: A function ``handler(visitor, node, values)``.
+        """
+        cls._dispatch_tables()[1][node_class] = handler
+
+    def leaf_handler(self, node):
+        """
+        Return the leaf-table entry for the class of a node.  This is
+        called once for each class that was not registered.
+        """
+        return _generic_leaf_handler
+
+    def node_handler(self, node):
+        """
+        Return the node-table entry for the class of a node.  This is
+        called once for each class that was not registered.
+        """
+        return self.__class__.visit
+
+    def dfs_postorder_stack(self, node):
+        """
+        Perform a depth-first search in postorder using a stack
+        implementation.
+
+        Args:
+            node: The root node of the expression tree
+                that is searched.
+
+        Returns:
+            The return value is determined by the :func:`finalize` function,
+            which may be defined by the user.
+        """
+        leaf_table, node_table = self._dispatch_tables()
+        EXPAND = self.EXPAND
+
+        try:
+            handler = leaf_table[node.__class__]
+        except KeyError:
+            handler = leaf_table[node.__class__] = self.leaf_handler(node)
+        if handler is not None:
+            ans = handler(self, node)
+            if ans is not EXPAND:
+                return ans
+
+        # Take ownership of the frames, so that a handler can start
+        # another search with this visitor
+        frames = self._frames
+        self._frames = []
+        nframes = len(frames)
+        depth = 0
+
+        _obj = node
+        _argList = node._args_
+        _idx = 0
+        _len = node.nargs()
+        _result = []
+        while 1:
+            while _idx < _len:
+                _sub = _argList[_idx]
+                _idx += 1
+                try:
+                    handler = leaf_table[_sub.__class__]
+                except KeyError:
+                    handler = leaf_table[_sub.__class__] = \
+                              self.leaf_handler(_sub)
+                if handler is not None:
+                    ans = handler(self, _sub)
+                    if ans is not EXPAND:
+                        _result.append(ans)
+                        continue
+                #
+                # Push the current node and descend into the argument
+                #
+                if depth == nframes:
+                    frames.append([_obj, _argList, _idx, _len, _result])
+                    nframes += 1
+                else:
+                    frame = frames[depth]
+                    frame[0] = _obj
+                    frame[1] = _argList
+                    frame[2] = _idx
+                    frame[3] = _len
+                    frame[4] = _result
+                depth += 1
+                _obj = _sub
+                _argList = _sub._args_
+                _idx = 0
+                _len = _sub.nargs()
+                _result = []
+            #
+            # Process the current node
+            #
+            try:
+                handler = node_table[_obj.__class__]
+            except KeyError:
+                handler = node_table[_obj.__class__] = self.node_handler(_obj)
+            ans = handler(self, _obj, _result)
+            if not depth:
+                break
+            depth -= 1
+            _obj, _argList, _idx, _len, _result = frames[depth]
+            _result.append(ans)
+
+        # Release the references held by the frames
+        for frame in frames:
+            frame[0] = frame[1] = frame[4] = None
+        self._frames = frames
+        return self.finalize(ans)
+
+
+def _generic_leaf_handler(visitor, node):
+    flag, value = visitor.visiting_potential_leaf(node)
+    if flag:
+        return value
+    return DispatchValueVisitor.EXPAND
+
+
+def _return_node(visitor, node):
+    return node
+
+
+def _return_value(visitor, node):
+    return value(node)
+
+
+def _apply_operation(visitor, node, values):
+    return node._apply_operation(values)
+
+
 def replace_expressions(expr,
                         substitution_map,
                         descend_into_named_expressions=True,
@@ -885,7 +1098,7 @@ class ExpressionReplacementVisitor(object):
             The return value is determined by the :func:`finalize` function,
             which may be defined by the user.
         """
-        if node.__class__ is LinearExpression:
+        if node.__class__ in _linear_expression_types:
             _argList = [node.constant] + node.linear_coefs + node.linear_vars
             _len = len(_argList)
             _stack = [ (node, _argList, 0, _len, [False])]
@@ -928,7 +1141,7 @@ class ExpressionReplacementVisitor(object):
                     _obj = _sub
                     _idx = 0
                     _result = [False]
-                    if _sub.__class__ is LinearExpression:
+                    if _sub.__class__ in _linear_expression_types:
                         _argList = [_sub.constant] + _sub.linear_coefs \
                                    + _sub.linear_vars
                         _len = len(_argList)
@@ -953,7 +1166,7 @@ class ExpressionReplacementVisitor(object):
                     assert(len(_result) == 2)
                     ans.expr = _result[1]
             elif _result[0]:
-                if ans.__class__ is LinearExpression:
+                if ans.__class__ in _linear_expression_types:
                     ans = _result[1]
                     nterms = (len(_result)-2)//2
                     for i in range(nterms):
@@ -1060,7 +1273,17 @@ def _sizeof_expression(expr):
 #  evaluate_expression
 # =====================================================
 
-class _EvaluationVisitor(ExpressionValueVisitor):
+class _EvaluationVisitor(DispatchValueVisitor):
+
+    def leaf_handler(self, node):
+        if node.__class__ in nonpyomo_leaf_types:
+            return _return_node
+        if node.is_expression_type():
+            return None
+        return _return_value
+
+    def node_handler(self, node):
+        return _apply_operation
 
     def visit(self, node, values):
         """ Visit nodes that have been expanded """
@@ -1096,7 +1319,34 @@ class NonConstantExpressionError(Exception):
         super(NonConstantExpressionError, self).__init__(*args, **kwds)
 
 
-class _EvaluateConstantExpressionVisitor(ExpressionValueVisitor):
+def _constant_param_value(visitor, node):
+    if node._component()._mutable:
+        raise FixedExpressionError()
+    return value(node)
+
+
+def _nonconstant_variable(visitor, node):
+    if node.fixed:
+        raise FixedExpressionError()
+    else:
+        raise NonConstantExpressionError()
+
+
+class _EvaluateConstantExpressionVisitor(DispatchValueVisitor):
+
+    def leaf_handler(self, node):
+        if node.__class__ in nonpyomo_leaf_types:
+            return _return_node
+        if node.is_parameter_type():
+            return _constant_param_value
+        if node.is_variable_type():
+            return _nonconstant_variable
+        if node.is_expression_type():
+            return None
+        return _return_value
+
+    def node_handler(self, node):
+        return _apply_operation
 
     def visit(self, node, values):
         """ Visit nodes that have been expanded """
@@ -1315,7 +1565,46 @@ def identify_mutable_parameters(expr):
 #  _polynomial_degree
 # =====================================================
 
-class _PolynomialDegreeVisitor(ExpressionValueVisitor):
+def _always_potentially_variable(node):
+    # True if the class of the node does not override
+    # ExpressionBase.is_potentially_variable()
+    return node.__class__.is_potentially_variable == \
+        ExpressionBase.is_potentially_variable
+
+
+def _degree_of_expression(visitor, node):
+    if node.is_potentially_variable():
+        return DispatchValueVisitor.EXPAND
+    return 0
+
+
+def _degree_of_leaf(visitor, node):
+    return 0 if node.is_fixed() else 1
+
+
+def _return_zero(visitor, node):
+    return 0
+
+
+def _compute_polynomial_degree(visitor, node, values):
+    return node._compute_polynomial_degree(values)
+
+
+class _PolynomialDegreeVisitor(DispatchValueVisitor):
+
+    def leaf_handler(self, node):
+        if node.__class__ in nonpyomo_leaf_types:
+            return _return_zero
+        if node.is_expression_type():
+            if _always_potentially_variable(node):
+                return None
+            return _degree_of_expression
+        if not node.is_potentially_variable():
+            return _return_zero
+        return _degree_of_leaf
+
+    def node_handler(self, node):
+        return _compute_polynomial_degree
 
     def visit(self, node, values):
         """ Visit nodes that have been expanded """
@@ -1355,13 +1644,45 @@ def _polynomial_degree(node):
 #  _expression_is_fixed
 # =====================================================
 
-class _IsFixedVisitor(ExpressionValueVisitor):
+def _expression_fixed(visitor, node):
+    if node.is_potentially_variable():
+        return DispatchValueVisitor.EXPAND
+    return True
+
+
+def _leaf_fixed(visitor, node):
+    return node.is_fixed()
+
+
+def _return_true(visitor, node):
+    return True
+
+
+def _is_fixed(visitor, node, values):
+    return node._is_fixed(values)
+
+
+class _IsFixedVisitor(DispatchValueVisitor):
     """
     NOTE: This doesn't check if combiner logic is
     all or any and short-circuit the test.  It's
     not clear that that is an important optimization.
     """
 
+    def leaf_handler(self, node):
+        if node.__class__ in nonpyomo_leaf_types:
+            return _return_true
+        if node.is_expression_type():
+            if _always_potentially_variable(node):
+                return None
+            return _expression_fixed
+        if not node.is_potentially_variable():
+            return _return_true
+        return _leaf_fixed
+
+    def node_handler(self, node):
+        return _is_fixed
+
     def visit(self, node, values):
         """ Visit nodes that have been expanded """
         return node._is_fixed(values)
@@ -1400,7 +1721,28 @@ def _expression_is_fixed(node):
 #  expression_to_string
 # =====================================================
 
-class _ToStringVisitor(ExpressionValueVisitor):
+def _return_none(visitor, node):
+    return None
+
+
+def _leaf_str(visitor, node):
+    return str(node)
+
+
+def _variable_to_string(visitor, node):
+    if not node.fixed:
+        return node.to_string(verbose=visitor.verbose, smap=visitor.smap,
+                              compute_values=False)
+    return node.to_string(verbose=visitor.verbose, smap=visitor.smap,
+                          compute_values=visitor.compute_values)
+
+
+def _leaf_to_string(visitor, node):
+    return node.to_string(verbose=visitor.verbose, smap=visitor.smap,
+                          compute_values=visitor.compute_values)
+
+
+class _ToStringVisitor(DispatchValueVisitor):
 
     def __init__(self, verbose, smap, compute_values):
         super(_ToStringVisitor, self).__init__()
@@ -1408,6 +1750,17 @@ class _ToStringVisitor(ExpressionValueVisitor):
         self.smap = smap
         self.compute_values = compute_values
 
+    def leaf_handler(self, node):
+        if node is None:
+            return _return_none
+        if node.__class__ in nonpyomo_leaf_types:
+            return _leaf_str
+        if node.is_variable_type():
+            return _variable_to_string
+        if node.is_expression_type():
+            return None
+        return _leaf_to_string
+
     def visit(self, node, values):
         """ Visit nodes that have been expanded """
         tmp = []
@@ -2486,7 +2839,9 @@ class SumExpression(SumExpressionBase):
         x + y
 
     Args:
-        args (list): Children nodes
+        args (list or tuple): Children nodes.  Sums that are built
+            incrementally share a list of arguments; finalized sums
+            store their arguments in a tuple.
     """
     __slots__ = ('_nargs','_shared_args')
     PRECEDENCE = 6
@@ -2500,8 +2855,11 @@ class SumExpression(SumExpressionBase):
         if new_arg.__class__ in native_numeric_types and new_arg == 0:
             return self
         # Clone 'self', because SumExpression are immutable
-        self._shared_args = True
-        self = self.__class__(self._args_)
+        if self._args_.__class__ is tuple:
+            self = self.__class__(list(self._args_))
+        else:
+            self._shared_args = True
+            self = self.__class__(self._args_)
         #
         if new_arg.__class__ is SumExpression or new_arg.__class__ is _MutableSumExpression:
             self._args_.extend( islice(new_arg._args_, new_arg._nargs) )
@@ -2513,6 +2871,18 @@ class SumExpression(SumExpressionBase):
     def nargs(self):
         return self._nargs
 
+    def _compact(self):
+        """
+        Store the arguments of a finalized sum in a tuple.
+
+        The arguments of a sum that was built incrementally are
+        stored in an over-allocated list, which may be shared with
+        the sums that it was built from.  This sum keeps its list if
+        another sum was created from it.
+        """
+        if not self._shared_args and self._args_.__class__ is list:
+            self._args_ = tuple(islice(self._args_, self._nargs))
+
     def _precedence(self):
         return SumExpression.PRECEDENCE
 
@@ -2684,7 +3054,7 @@ class Expr_ifExpression(ExpressionBase):
         THEN_ (expression): An expression that is used if :attr:`IF_` is true.
         ELSE_ (expression): An expression that is used if :attr:`IF_` is false.
     """
-    __slots__ = ('_if','_then','_else')
+    __slots__ = ()
 
     # **NOTE**: This class evaluates the branching "_if" expression
     #           on a number of occasions. It is important that
@@ -2694,21 +3064,26 @@ class Expr_ifExpression(ExpressionBase):
         if type(IF_) is tuple and THEN_==None and ELSE_==None:
             IF_, THEN_, ELSE_ = IF_
         self._args_ = (IF_, THEN_, ELSE_)
-        self._if = IF_
-        self._then = THEN_
-        self._else = ELSE_
-        if self._if.__class__ in native_numeric_types:
-            self._if = as_numeric(self._if)
+
+    # The branches are stored only in _args_
+    @property
+    def _if(self):
+        _if = self._args_[0]
+        if _if.__class__ in native_numeric_types:
+            return as_numeric(_if)
+        return _if
+
+    @property
+    def _then(self):
+        return self._args_[1]
+
+    @property
+    def _else(self):
+        return self._args_[2]
 
     def nargs(self):
         return 3
 
-    def __getstate__(self):
-        state = super(Expr_ifExpression, self).__getstate__()
-        for i in Expr_ifExpression.__slots__:
-            state[i] = getattr(self, i)
-        return state
-
     def getname(self, *args, **kwds):
         return "Expr_if"
 
@@ -3000,6 +3375,8 @@ class LinearExpression(ExpressionBase):
                     if v is None:
                         self.constant += c
                     else:
+                        if c.__class__ is float:
+                            c = _intern_float(c)
                         self.linear_coefs.append(c)
                         self.linear_vars.append(v)
 
@@ -3065,6 +3442,139 @@ class _MutableLinearExpression(LinearExpression):
     __slots__ = ()
 
 
+class ArrayLinearExpression(LinearExpression):
+    """
+    A linear expression whose terms are stored in NumPy arrays.
+
+    The terms are defined by an array of numeric coefficients and an
+    array of integer positions into a (possibly shared) list of
+    variables.  The per-term coefficient and variable objects are
+    never stored, so very large linear expressions can be created
+    with a single call to :func:`array_linear_expression`.
+
+    The :attr:`linear_coefs` and :attr:`linear_vars` attributes are
+    generated on demand, so this class can be used wherever a
+    :class:`LinearExpression` is expected.  Code that is aware of this
+    class should use :attr:`coef_array`, :attr:`index_array` and
+    :attr:`var_list` directly.
+
+    Args:
+        args (tuple): The constant, the coefficient array, the index
+            array and the list of variables
+    """
+    __slots__ = ('coef_array',        # Linear coefficients (float array)
+                 'index_array',       # Positions in var_list (int array)
+                 'var_list')          # Variables referenced by index_array
+
+    def __init__(self, args):
+        self.constant, self.coef_array, self.index_array, self.var_list = args
+        self._args_ = tuple()
+
+    @property
+    def linear_coefs(self):
+        return self.coef_array.tolist()
+
+    @property
+    def linear_vars(self):
+        var_list = self.var_list
+        return [var_list[i] for i in self.index_array.tolist()]
+
+    def nterms(self):
+        """
+        Returns the number of linear terms in this expression.
+        """
+        return len(self.index_array)
+
+    def __getstate__(self):
+        state = super(LinearExpression, self).__getstate__()
+        state['constant'] = self.constant
+        for i in ArrayLinearExpression.__slots__:
+           state[i] = getattr(self,i)
+        return state
+
+    def create_node_with_local_data(self, args):
+        return self.__class__((self.constant, self.coef_array,
+                               self.index_array, self.var_list))
+
+    def _compute_polynomial_degree(self, result):
+        return 1 if len(self.index_array) > 0 else 0
+
+    def is_constant(self):
+        return len(self.index_array) == 0
+
+    def is_fixed(self):
+        var_list = self.var_list
+        for i in numpy.unique(self.index_array).tolist():
+            if not var_list[i].fixed:
+                return False
+        return True
+
+    def is_potentially_variable(self):
+        return len(self.index_array) > 0
+
+    def _apply_operation(self, result):
+        var_list = self.var_list
+        values = numpy.array([var_list[i].value
+                              for i in self.index_array.tolist()],
+                             dtype=float)
+        return value(self.constant) + float(numpy.dot(self.coef_array, values))
+
+    def aggregate_terms(self):
+        """
+        Combine the terms that reference the same variable.
+
+        Returns:
+            A tuple ``(positions, coefs)`` of NumPy arrays, where
+            :attr:`positions` lists each distinct entry of
+            :attr:`index_array` (in the order of first appearance) and
+            :attr:`coefs` is the sum of the coefficients of the terms
+            that reference it.
+        """
+        positions, first, inverse = numpy.unique(
+            self.index_array, return_index=True, return_inverse=True)
+        coefs = numpy.bincount(inverse.ravel(), weights=self.coef_array,
+                               minlength=len(positions))
+        order = numpy.argsort(first, kind='mergesort')
+        return positions[order], coefs[order]
+
+
+def array_linear_expression(coefs, variables, index=None, constant=0):
+    """
+    Create an :class:`ArrayLinearExpression` from array data.
+
+    Args:
+        coefs: A sequence or NumPy array of numeric coefficients.
+        variables: A list of variables.  Since this list may be
+            shared by many expressions, it is not copied.
+        index: A sequence or NumPy array of integers that specifies
+            the position in :attr:`variables` of the variable in each
+            term.  If this is :const:`None`, then the i-th coefficient
+            multiplies the i-th variable.
+        constant: The constant term.  Defaults to zero.
+
+    Returns:
+        An :class:`ArrayLinearExpression` object.
+    """
+    if not has_numpy:
+        raise RuntimeError(
+            "array_linear_expression() requires the numpy package")
+    coefs = numpy.ascontiguousarray(coefs, dtype=float).ravel()
+    if index is None:
+        index = numpy.arange(len(coefs), dtype=numpy.intp)
+    else:
+        index = numpy.ascontiguousarray(index, dtype=numpy.intp).ravel()
+    if len(coefs) != len(index):
+        raise ValueError(
+            "The coefficient array (length %d) and the index array "
+            "(length %d) must have the same length"
+            % (len(coefs), len(index)))
+    if len(index) and (index.min() < 0 or index.max() >= len(variables)):
+        raise IndexError(
+            "The index array references variables that are not in the "
+            "list of %d variables" % (len(variables),))
+    return ArrayLinearExpression((constant, coefs, index, variables))
+
+
 #-------------------------------------------------------
 #
 # Functions used to generate expressions
@@ -3151,7 +3661,7 @@ def _decompose_linear_terms(expr, multiplier=1):
     elif expr.__class__ is NegationExpression:
         for term in  _decompose_linear_terms(expr._args_[0], -multiplier):
             yield term
-    elif expr.__class__ is LinearExpression or expr.__class__ is _MutableLinearExpression:
+    elif expr.__class__ in _linear_expression_types or expr.__class__ is _MutableLinearExpression:
         if not (expr.constant.__class__ in native_numeric_types and expr.constant == 0):
             yield (multiplier*expr.constant,None)
         if len(expr.linear_coefs) > 0:
@@ -3161,11 +3671,47 @@ def _decompose_linear_terms(expr, multiplier=1):
         raise LinearDecompositionError("Unexpected nonlinear term")   #pragma: no cover
 
 
+#
+# Repeated numeric constants (e.g., the values of immutable parameters
+# or coefficients read from data) are stored in expressions as a single
+# float object.  Zeros and NaN are never interned, so the sign of zero
+# is preserved.
+#
+# The pool is shared by all models in the process and is not cleared
+# when a model is deleted.  It holds at most _MAX_INTERNED_FLOATS
+# values; once it is full, new values are no longer interned.  Call
+# clear_float_pool() to release the pooled values (e.g., between
+# models in a long-running process).
+#
+_float_pool = {}
+_MAX_INTERNED_FLOATS = 1 << 20
+
+def _intern_float(val):
+    try:
+        return _float_pool[val]
+    except KeyError:
+        if val and val == val and len(_float_pool) < _MAX_INTERNED_FLOATS:
+            _float_pool[val] = val
+        return val
+
+def clear_float_pool():
+    """
+    Clear the pool of interned float constants.
+
+    Expressions that were already created keep their constants, but
+    constants in new expressions are no longer shared with them.
+    """
+    _float_pool.clear()
+
+
 def _process_arg(obj):
     try:
         if obj.is_parameter_type() and not obj._component()._mutable and obj._constructed:
             # Return the value of an immutable SimpleParam or ParamData object
-            return obj()
+            obj = obj()
+            if obj.__class__ is float:
+                return _intern_float(obj)
+            return obj
 
         elif obj.__class__ is NumericConstant:
             return obj.value
@@ -3211,6 +3757,8 @@ def _generate_sum_expression(etype, _self, _other):
     #
     if not (_self.__class__ in native_types or _self.is_expression_type()):
         _self = _process_arg(_self)
+    elif _self.__class__ is float:
+        _self = _intern_float(_self)
 
     if etype == _neg:
         if _self.__class__ in native_numeric_types:
@@ -3232,6 +3780,8 @@ def _generate_sum_expression(etype, _self, _other):
 
     if not (_other.__class__ in native_types or _other.is_expression_type()):
         _other = _process_arg(_other)
+    elif _other.__class__ is float:
+        _other = _intern_float(_other)
 
     if etype < 0:
         #
@@ -3353,9 +3903,13 @@ def _generate_mul_expression(etype, _self, _other):
     #
     if not (_self.__class__ in native_types or _self.is_expression_type()):
         _self = _process_arg(_self)
+    elif _self.__class__ is float:
+        _self = _intern_float(_self)
 
     if not (_other.__class__ in native_types or _other.is_expression_type()):
         _other = _process_arg(_other)
+    elif _other.__class__ is float:
+        _other = _intern_float(_other)
 
     if etype < 0:
         #
@@ -3723,3 +4277,33 @@ NPV_expression_types = set(
     NPV_UnaryFunctionExpression,
     NPV_AbsExpression])
 
+_linear_expression_types = set(
+   [LinearExpression,
+    ArrayLinearExpression])
+
+#
+# Register specialized visitor handlers for the most common
+# expression classes
+#
+
+def _evaluate_sum(visitor, node, values):
+    return sum(values)
+
+
+def _evaluate_product(visitor, node, values):
+    return values[0] * values[1]
+
+
+for _visitor in (_EvaluationVisitor, _EvaluateConstantExpressionVisitor):
+    for _cls in (SumExpression, _MutableSumExpression):
+        _visitor.register_node_handler(_cls, _evaluate_sum)
+    for _cls in (ProductExpression, NPV_ProductExpression,
+                 MonomialTermExpression):
+        _visitor.register_node_handler(_cls, _evaluate_product)
+
+for _cls in NPV_expression_types:
+    _PolynomialDegreeVisitor.register_leaf_handler(_cls, _return_zero)
+    _IsFixedVisitor.register_leaf_handler(_cls, _return_true)
+
+del _visitor
+del _cls
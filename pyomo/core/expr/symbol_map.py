@@ -179,3 +179,176 @@ class SymbolMap(object):
     def removeSymbol(self, obj):
         symb = self.byObject.pop(id(obj))
         self.bySymbol.pop(symb)
+
+
+class _IndexSymbols(object):
+    """
+    A read-only mapping from ``<prefix><index>`` labels to object
+    weakrefs that is computed from the object lists of an
+    :class:`IndexSymbolMap`.
+    """
+
+    __slots__ = ('_smap',)
+
+    def __init__(self, smap):
+        self._smap = smap
+
+    def _lookup(self, symbol):
+        try:
+            objs = self._smap.byIndex[symbol[0]]
+            i = int(symbol[1:])
+        except (KeyError, ValueError, IndexError, TypeError):
+            return None
+        if i < 0 or i >= len(objs) or symbol[1:] != str(i):
+            return None
+        return objs[i]
+
+    def __contains__(self, symbol):
+        return self._lookup(symbol) is not None
+
+    def __getitem__(self, symbol):
+        obj = self._lookup(symbol)
+        if obj is None:
+            raise KeyError(symbol)
+        return weakref_ref(obj)
+
+    def get(self, symbol, default=None):
+        obj = self._lookup(symbol)
+        if obj is None:
+            return default
+        return weakref_ref(obj)
+
+    def __len__(self):
+        return sum(len(objs) for objs in self._smap.byIndex.values())
+
+    def __iter__(self):
+        for prefix, objs in iteritems(self._smap.byIndex):
+            for i in range(len(objs)):
+                yield prefix + str(i)
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(symbol, self[symbol]) for symbol in self]
+
+    iterkeys = __iter__
+
+    def iteritems(self):
+        for symbol in self:
+            yield symbol, self[symbol]
+
+
+class _IndexObjects(object):
+    """
+    A read-only mapping from object ids to ``<prefix><index>`` labels
+    that is computed from the object lists of an
+    :class:`IndexSymbolMap`.  The reverse index is built on first use.
+    """
+
+    __slots__ = ('_smap', '_index')
+
+    def __init__(self, smap):
+        self._smap = smap
+        self._index = None
+
+    def _get_index(self):
+        if self._index is None:
+            self._index = {}
+            for prefix, objs in iteritems(self._smap.byIndex):
+                self._index.update((id(obj), (prefix, i))
+                                   for i, obj in enumerate(objs))
+        return self._index
+
+    def __contains__(self, obj_id):
+        return obj_id in self._get_index()
+
+    def __getitem__(self, obj_id):
+        prefix, i = self._get_index()[obj_id]
+        return prefix + str(i)
+
+    def get(self, obj_id, default=None):
+        if obj_id in self._get_index():
+            return self[obj_id]
+        return default
+
+    def __len__(self):
+        return len(self._get_index())
+
+    def __iter__(self):
+        return iter(self._get_index())
+
+
+class IndexSymbolMap(SymbolMap):
+    """
+    A symbol map for labels of the form ``<prefix><index>``.
+
+    Objects are stored in one list per (single character) prefix, so
+    the label of an object is the prefix followed by its position in
+    the list.  Labels are only generated when they are requested
+    (e.g., when a solution is loaded), which avoids creating a string
+    for every object when a problem file is written.
+
+    The :attr:`bySymbol` and :attr:`byObject` attributes provide the
+    same (read-only) interface as the dictionaries of a
+    :class:`SymbolMap`.  Note that the object lists hold strong
+    references to the objects.
+
+    Attributes:
+        byIndex (dict):  maps (prefix) to (list of objects)
+    """
+
+    def __init__(self, labeler=None):
+        super(IndexSymbolMap, self).__init__(labeler)
+        self.byIndex = {}
+        self.bySymbol = _IndexSymbols(self)
+        self.byObject = _IndexObjects(self)
+
+    def __getstate__(self):
+        return {
+            'byIndex': self.byIndex,
+            'aliases': tuple(
+                (key, obj()) for key, obj in iteritems(self.aliases) ),
+        }
+
+    def __setstate__(self, state):
+        self.byIndex = state['byIndex']
+        self.bySymbol = _IndexSymbols(self)
+        self.byObject = _IndexObjects(self)
+        self.aliases = dict(
+            (key, weakref_ref(obj)) for key, obj in state['aliases'] )
+        self.default_labeler = None
+
+    def addObjects(self, prefix, objs):
+        """
+        Append objects to the list for a prefix.  The label of each
+        object is the prefix followed by its position in that list.
+        """
+        self.byIndex.setdefault(prefix, []).extend(objs)
+        self.byObject._index = None
+
+    def getIndex(self, obj):
+        """
+        Return the ``(prefix, index)`` tuple for an object.
+        """
+        return self.byObject._get_index()[id(obj)]
+
+    def addSymbol(self, obj, symb):
+        raise TypeError("IndexSymbolMap does not support adding "
+                        "arbitrary symbols; use addObjects()")
+
+    def addSymbols(self, obj_symbol_tuples):
+        raise TypeError("IndexSymbolMap does not support adding "
+                        "arbitrary symbols; use addObjects()")
+
+    def createSymbol(self, obj, labeler=None, *args):
+        raise TypeError("IndexSymbolMap does not support adding "
+                        "arbitrary symbols; use addObjects()")
+
+    createSymbols = createSymbol
+
+    def getSymbol(self, obj, labeler=None, *args):
+        return self.byObject[id(obj)]
+
+    def removeSymbol(self, obj):
+        raise TypeError("IndexSymbolMap does not support removing symbols")
@@ -27,11 +27,14 @@ import pyutilib.services
 
 from pyomo.environ import *
 from pyomo.common.log import LoggingIntercept
+from pyomo.common.parallel import fork_available
 from pyomo.core.base.block import SimpleBlock, SubclassOf
 from pyomo.core.expr import current as EXPR
 from pyomo.opt import *
 
 from pyomo.gdp import Disjunct
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.core.kernel.component_set import ComponentSet
 
 solvers = check_available_solvers('glpk')
 
@@ -1698,6 +1701,59 @@ class TestBlock(unittest.TestCase):
             Var, descend_into=(Block,Disjunct) ))
         self.assertEqual(test, ref)
 
+    def test_component_data_cache(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3])
+        m.c = ConstraintList()
+        m.c.add(m.x[1] >= 0)
+        m.c.add(m.x[2] >= 0)
+        m.b = Block([1,2])
+        m.b[1].c = Constraint(expr=m.x[3] <= 1)
+        m.b[2].c = Constraint(expr=m.x[3] <= 2)
+
+        def active_names():
+            return [c.name for c in m.component_data_objects(
+                Constraint, active=True)]
+
+        ref = ['c[1]', 'c[2]', 'b[1].c', 'b[2].c']
+        self.assertEqual(active_names(), ref)
+        self.assertIn((Constraint, True), m._data_cache)
+        # The cached data is returned until the block changes
+        self.assertEqual(active_names(), ref)
+
+        m.c[1].deactivate()
+        self.assertEqual(active_names(), ['c[2]', 'b[1].c', 'b[2].c'])
+        m.c[1].activate()
+        m.b[1].deactivate()
+        self.assertEqual(active_names(), ['c[1]', 'c[2]', 'b[2].c'])
+        m.b[1].activate()
+        m.b[2].c.deactivate()
+        self.assertEqual(active_names(), ['c[1]', 'c[2]', 'b[1].c'])
+        m.b[2].c.activate()
+
+        m.c.add(m.x[3] >= 0)
+        self.assertEqual(active_names(), ['c[1]', 'c[2]', 'c[3]',
+                                          'b[1].c', 'b[2].c'])
+        del m.c[2]
+        self.assertEqual(active_names(), ['c[1]', 'c[3]',
+                                          'b[1].c', 'b[2].c'])
+        m.d = Constraint(expr=m.x[1] <= 5)
+        self.assertEqual(active_names(), ['c[1]', 'c[3]', 'd',
+                                          'b[1].c', 'b[2].c'])
+        m.del_component(m.d)
+        self.assertEqual(active_names(), ['c[1]', 'c[3]',
+                                          'b[1].c', 'b[2].c'])
+        m.reclassify_component_type(m.c, Var)
+        self.assertEqual(active_names(), ['b[1].c', 'b[2].c'])
+
+        # Cached data is not carried over to copies of the model
+        self.assertNotIn('_data_cache', m.clone().__dict__)
+
+        # Immutable Param values are never cached
+        m.p = Param([1,2], initialize=1)
+        self.assertEqual(list(m.component_data_objects(Param)), [1, 1])
+        self.assertNotIn((Param, None), m._data_cache)
+
 
     def test_deepcopy(self):
         m = ConcreteModel()
@@ -1922,6 +1978,8 @@ class TestBlock(unittest.TestCase):
                          OUTPUT.getvalue())
         self.assertIn("'b' contains an uncopyable field 'bad2'",
                       OUTPUT.getvalue())
+        self.assertIn("Block 'b' contains an object that cannot be copied",
+                      OUTPUT.getvalue())
         self.assertNotIn("'__paranoid__'", OUTPUT.getvalue())
         self.assertTrue(hasattr(m.b, 'bad2'))
         self.assertFalse(hasattr(nb, 'bad2'))
@@ -2000,6 +2058,59 @@ class TestBlock(unittest.TestCase):
             sorted(id(x) for x in (n.x, n.y[1], n.b.x, n.b.y[1])),
         )
 
+    def test_clone_component_maps(self):
+        m = ConcreteModel()
+        m.x = Var([1,2])
+        m.b = Block()
+        m.b.y = Var()
+        m.b.c = Constraint(expr=m.x[1] + m.b.y >= 0)
+        m.b.dual = Suffix(direction=Suffix.IMPORT)
+        m.b.dual[m.b.c] = 5
+        m.b.map = ComponentMap([(m.x[1], 1), (m.b.y, 2)])
+        m.b.set = ComponentSet([m.x[2], m.b.y])
+
+        nb = m.b.clone()
+        self.assertEqual(nb.dual[nb.c], 5)
+        self.assertNotIn(m.b.c, nb.dual)
+        self.assertEqual(nb.map[m.x[1]], 1)
+        self.assertEqual(nb.map[nb.y], 2)
+        self.assertNotIn(m.b.y, nb.map)
+        self.assertIn(m.x[2], nb.set)
+        self.assertIn(nb.y, nb.set)
+        self.assertNotIn(m.b.y, nb.set)
+        # the original maps are unchanged
+        self.assertIn(m.b.y, m.b.map)
+        self.assertIn(m.b.c, m.b.dual)
+
+    def test_clone_shared_expressions(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=2)
+        m.p = Param(mutable=True, initialize=3)
+        e = m.p*sin(m.x)
+        m.c1 = Constraint(expr=e + m.x <= 1)
+        m.c2 = Constraint(expr=e >= 0)
+
+        n = m.clone()
+        self.assertIs(n.c1.body.arg(0), n.c2.body)
+        self.assertIsNot(n.c2.body, m.c2.body)
+        self.assertIs(n.c2.body.arg(0), n.p)
+        self.assertIs(n.c2.body.arg(1).arg(0), n.x)
+        n.p = 4
+        self.assertAlmostEqual(value(m.c2.body), 3*sin(2))
+        self.assertAlmostEqual(value(n.c2.body), 4*sin(2))
+
+    def test_clone_deep_expression(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=1)
+        e = m.x
+        for i in range(5000):
+            e = sin(e)
+        m.o = Objective(expr=e)
+
+        n = m.clone()
+        self.assertAlmostEqual(value(n.o), value(m.o))
+        self.assertEqual(list(EXPR.identify_variables(n.o.expr)), [n.x])
+
     def test_pprint(self):
         m = HierarchicalModel().model
         buf = StringIO()
@@ -2261,6 +2372,72 @@ class TestBlock(unittest.TestCase):
                 ValueError, ".*Cannot write model in format"):
             m.write(format="bogus")
 
+    @unittest.skipIf(not fork_available(), "fork() is not available")
+    def test_parallel_construction(self):
+        def build(parallel):
+            m = ConcreteModel()
+            m.T = RangeSet(5)
+            m.x = Var(m.T)
+            m.p = Param(m.T, initialize=lambda m, t: 2*t, mutable=True)
+            def rule(b, s):
+                b.y = Var(m.T, initialize=s)
+                b.c = Constraint(
+                    m.T, rule=lambda b, t: b.y[t] + m.p[t]*m.x[t] >= s)
+                b.sub = Block()
+                b.sub.z = Var(within=Binary)
+                b.o = Objective(expr=b.sub.z + b.y[1])
+                if s == 2:
+                    b.o.deactivate()
+            m.b = Block([1, 2, 3], rule=rule, parallel=parallel)
+            return m
+
+        ms = build(None)
+        mp = build(2)
+        self.assertEqual(
+            [c.name for c in ms.component_objects(descend_into=True)],
+            [c.name for c in mp.component_objects(descend_into=True)])
+        for cs, cp in zip(ms.component_data_objects(Constraint),
+                          mp.component_data_objects(Constraint)):
+            self.assertEqual(str(cs.expr), str(cp.expr))
+        self.assertEqual(mp.b[3].y[4].value, 3)
+        self.assertFalse(mp.b[2].o.active)
+        self.assertTrue(mp.b[3].o.active)
+        # References to components outside the block are preserved
+        _vars = ComponentSet(EXPR.identify_variables(mp.b[1].c[2].body))
+        self.assertIn(mp.x[2], _vars)
+        self.assertIn(mp.b[1].y[2], _vars)
+        _params = ComponentSet(
+            EXPR.identify_mutable_parameters(mp.b[1].c[2].body))
+        self.assertIn(mp.p[2], _params)
+
+    @unittest.skipIf(not fork_available(), "fork() is not available")
+    def test_parallel_construction_attributes(self):
+        def build(parallel):
+            m = ConcreteModel()
+            def rule(b, s):
+                b.x = Var()
+                b.info = {'s': s}
+                b.sub = Block()
+                b.sub.tag = 'tag%s' % (s,)
+            m.b = Block([1, 2, 3], rule=rule, parallel=parallel)
+            return m
+
+        ms = build(None)
+        mp = build(2)
+        for s in (1, 2, 3):
+            self.assertEqual(ms.b[s].info, {'s': s})
+            self.assertEqual(mp.b[s].info, {'s': s})
+            self.assertEqual(mp.b[s].sub.tag, 'tag%s' % (s,))
+
+        def rule(b, s):
+            b.x = Var()
+            b.info = {'x': b.x}
+        m = ConcreteModel()
+        with self.assertRaisesRegexp(
+                ValueError, "The attribute 'info' of block 'b\\[1\\]' "
+                "cannot be sent back"):
+            m.b = Block([1, 2, 3], rule=rule, parallel=2)
+
 
 
 if __name__ == "__main__":
@@ -28,7 +28,7 @@ from pyomo.environ import *
 import pyomo.kernel
 from pyomo.core.expr import expr_common
 from pyomo.core.expr import current as EXPR
-from pyomo.core.expr.expr_pyomo5 import _sizeof_expression
+from pyomo.core.expr.expr_pyomo5 import _sizeof_expression, _intern_float, _float_pool, clear_float_pool
 from pyomo.core.expr.numvalue import native_types, nonpyomo_leaf_types, NumericConstant, as_numeric, is_potentially_variable
 from pyomo.core.base.var import SimpleVar
 from pyomo.core.base.param import _ParamData, SimpleParam
@@ -36,6 +36,12 @@ from pyomo.core.base.label import *
 from pyomo.core.base.template_expr import IndexTemplate
 from pyomo.core.expr.expr_errors import TemplateExpressionError
 
+try:
+    import numpy
+    numpy_available = True
+except:
+    numpy_available = False
+
 
 class TestExpression_EvaluateNumericConstant(unittest.TestCase):
 
@@ -4120,6 +4126,107 @@ class TestSumExpression(unittest.TestCase):
         self.assertEqual( e(), 15 )
         self.assertIs(type(e), EXPR.SumExpression)
 
+    def test_finalized_sum(self):
+        e = quicksum((self.m.a[i] for i in self.m.a), linear=False)
+        self.assertIs(type(e._args_), tuple)
+        self.assertEqual(e.nargs(), 5)
+        # Adding to a finalized sum creates a new sum
+        f = e + self.m.b[1]
+        self.assertIs(type(f), EXPR.SumExpression)
+        self.assertEqual(f.nargs(), 6)
+        self.assertIs(f.arg(5), self.m.b[1])
+        self.assertEqual(e.nargs(), 5)
+        self.assertFalse(e._shared_args)
+        g = e + self.m.b[2]
+        self.assertEqual(g.nargs(), 6)
+        self.assertIs(g.arg(5), self.m.b[2])
+        self.assertIs(f.arg(5), self.m.b[1])
+
+    def test_compact_shared_sum(self):
+        e = self.m.a[1] + self.m.a[2]
+        f = e + self.m.a[3]
+        self.assertIs(e._args_, f._args_)
+        # The arguments of e are shared with f
+        e._compact()
+        self.assertIs(type(e._args_), list)
+        f._compact()
+        self.assertIs(type(f._args_), tuple)
+        self.assertEqual(f.args, (self.m.a[1], self.m.a[2], self.m.a[3]))
+        self.assertEqual(e.nargs(), 2)
+
+    def test_constraint_body(self):
+        m = self.m
+        m.c = Constraint(expr=m.a[1] + m.a[2] + 2*m.a[3] >= 1)
+        self.assertIs(type(m.c.body._args_), tuple)
+        self.assertEqual(str(m.c.body), "a[1] + a[2] + 2*a[3]")
+
+
+class TestExpressionMemory(unittest.TestCase):
+
+    def test_slots(self):
+        # Expression nodes do not have a __dict__
+        for name in dir(EXPR):
+            cls = getattr(EXPR, name)
+            if not isinstance(cls, type) or \
+               not issubclass(cls, EXPR.ExpressionBase):
+                continue
+            for base in cls.__mro__:
+                if base is object:
+                    continue
+                self.assertIn('__slots__', base.__dict__,
+                              "%s (base of %s) does not define __slots__"
+                              % (base.__name__, name))
+
+    def test_interned_constants(self):
+        m = ConcreteModel()
+        m.x = Var([1,2])
+        m.p = Param([1,2], initialize={1: float('2.5'), 2: float('2.5')})
+        c1 = float('1.5')
+        c2 = float('1.5')
+        self.assertIsNot(c1, c2)
+        e1 = c1*m.x[1]
+        e2 = m.x[2]*c2
+        self.assertIs(e1.arg(0), e2.arg(0))
+        e1 = m.p[1]*m.x[1]
+        e2 = m.p[2]*m.x[2]
+        self.assertIs(e1.arg(0), e2.arg(0))
+        e1 = m.x[1] + float('3.5')
+        e2 = m.x[2] + float('3.5')
+        self.assertIs(e1.arg(1), e2.arg(1))
+        # Zero and NaN are not interned, so the sign of zero is preserved
+        self.assertEqual(str(_intern_float(-0.0)), '-0.0')
+        nan = float('nan')
+        self.assertIs(_intern_float(nan), nan)
+        self.assertNotIn(nan, _float_pool)
+
+    def test_clear_float_pool(self):
+        c1 = float('2.75')
+        self.assertIs(_intern_float(c1), c1)
+        self.assertIn(c1, _float_pool)
+        clear_float_pool()
+        self.assertEqual(len(_float_pool), 0)
+        c2 = float('2.75')
+        self.assertIs(_intern_float(c2), c2)
+        self.assertIsNot(_intern_float(c1), c1)
+
+    def test_interned_linear_coefs(self):
+        m = ConcreteModel()
+        m.x = Var([1,2])
+        e = quicksum(float(s)*m.x[i] for i, s in ((1, '1.5'), (2, '1.5')))
+        self.assertIs(type(e), EXPR.LinearExpression)
+        self.assertIs(e.linear_coefs[0], e.linear_coefs[1])
+
+    def test_expr_if_storage(self):
+        m = ConcreteModel()
+        m.x = Var()
+        e = EXPR.Expr_if(IF=m.x <= 1, THEN=m.x, ELSE=2)
+        self.assertIs(e._if, e.arg(0))
+        self.assertIs(e._then, m.x)
+        self.assertEqual(e._else, 2)
+        e = EXPR.Expr_if(IF=1, THEN=m.x, ELSE=2)
+        self.assertIs(type(e._if), NumericConstant)
+        self.assertEqual(e.arg(0), 1)
+
 
 class TestCloneExpression(unittest.TestCase):
 
@@ -5462,6 +5569,86 @@ class TestLinearExpression(unittest.TestCase):
             self.assertIs(e.__class__, EXPR.PowExpression)
 
 
+@unittest.skipIf(not numpy_available, "Numpy is not available")
+class TestArrayLinearExpression(unittest.TestCase):
+
+    def setUp(self):
+        self.m = ConcreteModel()
+        self.m.v = Var(range(4), initialize=lambda m,i: i+1)
+        self.vlist = [self.m.v[i] for i in range(4)]
+
+    def test_construct(self):
+        e = EXPR.array_linear_expression([1, 2, 3], self.vlist, [0, 2, 0], 5)
+        self.assertIs(e.__class__, EXPR.ArrayLinearExpression)
+        self.assertIsInstance(e, EXPR.LinearExpression)
+        self.assertEqual(e.nterms(), 3)
+        self.assertEqual(e.linear_coefs, [1.0, 2.0, 3.0])
+        self.assertEqual([id(v) for v in e.linear_vars],
+                         [id(self.m.v[0]), id(self.m.v[2]), id(self.m.v[0])])
+        self.assertIs(e.var_list, self.vlist)
+        self.assertEqual(e.constant, 5)
+        self.assertEqual(str(e), "5 + v[0] + 2.0*v[2] + 3.0*v[0]")
+
+    def test_default_index(self):
+        e = EXPR.array_linear_expression(numpy.arange(4), self.vlist)
+        self.assertEqual(list(e.index_array), [0, 1, 2, 3])
+        self.assertEqual(value(e), 0*1 + 1*2 + 2*3 + 3*4)
+
+    def test_errors(self):
+        with self.assertRaisesRegexp(ValueError, "must have the same length"):
+            EXPR.array_linear_expression([1, 2], self.vlist, [0])
+        with self.assertRaisesRegexp(IndexError, "not in the list of 4"):
+            EXPR.array_linear_expression([1, 2], self.vlist, [0, 4])
+
+    def test_properties(self):
+        e = EXPR.array_linear_expression([1, 2], self.vlist, [1, 3])
+        self.assertEqual(e.polynomial_degree(), 1)
+        self.assertFalse(e.is_constant())
+        self.assertTrue(e.is_potentially_variable())
+        self.assertFalse(e.is_fixed())
+        self.m.v[1].fix()
+        self.assertFalse(e.is_fixed())
+        self.m.v[3].fix()
+        self.assertTrue(e.is_fixed())
+
+        e = EXPR.array_linear_expression([], self.vlist, [], 2)
+        self.assertEqual(e.polynomial_degree(), 0)
+        self.assertTrue(e.is_constant())
+        self.assertFalse(e.is_potentially_variable())
+
+    def test_aggregate_terms(self):
+        e = EXPR.array_linear_expression(
+            [1, 2, 3, 4], self.vlist, [3, 1, 3, 0])
+        positions, coefs = e.aggregate_terms()
+        self.assertEqual(list(positions), [3, 1, 0])
+        self.assertEqual(list(coefs), [4.0, 2.0, 4.0])
+
+    def test_sum_other(self):
+        e = EXPR.array_linear_expression([1, 2], self.vlist, [0, 1])
+        e = e + self.m.v[2]
+        self.assertIs(e.__class__, EXPR.SumExpression)
+        self.assertEqual(value(e), 1 + 4 + 3)
+        self.assertEqual(e.polynomial_degree(), 1)
+
+    def test_decompose(self):
+        e = EXPR.array_linear_expression([1, 2], self.vlist, [0, 1], 3)
+        flag, terms = EXPR.decompose_term(e)
+        self.assertTrue(flag)
+        self.assertEqual([(c, None if v is None else v.name) for c,v in terms],
+                         [(3, None), (1.0, 'v[0]'), (2.0, 'v[1]')])
+
+        with linear_expression() as f:
+            f += e
+        self.assertEqual(str(f), "3 + v[0] + 2.0*v[1]")
+
+    def test_replace(self):
+        m = self.m
+        m.w = Var()
+        e = EXPR.array_linear_expression([1, 2], self.vlist, [0, 1])
+        f = EXPR.replace_expressions(e, {id(m.v[1]): m.w})
+        self.assertEqual(str(f), "v[0] + 2.0*w")
+
+
 class TestNonlinearExpression(unittest.TestCase):
 
     def test_sum_other(self):
@@ -6820,5 +7007,106 @@ class TestEvaluateExpression(unittest.TestCase):
         self.assertRaises(TemplateExpressionError, EXPR.evaluate_expression, e)
         self.assertRaises(TemplateExpressionError, EXPR.evaluate_expression, e, constant=True)
 
+
+class _CountingVisitor(EXPR.DispatchValueVisitor):
+    # A visitor that only defines the generic ExpressionValueVisitor API
+
+    def visit(self, node, values):
+        return 1 + sum(values)
+
+    def visiting_potential_leaf(self, node):
+        if node.__class__ in native_types or not node.is_expression_type():
+            return True, 1
+        return False, None
+
+
+class TestDispatchValueVisitor(unittest.TestCase):
+
+    def test_generic_handlers(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.p = Param(mutable=True, initialize=2)
+        e = m.p*m.x + sin(m.x) + 3
+        self.assertEqual(_CountingVisitor().dfs_postorder_stack(e), 7)
+        self.assertEqual(_CountingVisitor().dfs_postorder_stack(m.x), 1)
+
+    def test_registered_handlers(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+
+        class _Visitor(_CountingVisitor):
+            pass
+
+        def product(visitor, node, values):
+            return 100 + sum(values)
+        def variable(visitor, node):
+            return 10 if node is m.y else 1
+        _Visitor.register_node_handler(EXPR.ProductExpression, product)
+        _Visitor.register_leaf_handler(m.y.__class__, variable)
+
+        e = (m.x + 1) * m.y
+        self.assertEqual(_Visitor().dfs_postorder_stack(e), 113)
+        # The handlers are registered for the subclass only
+        self.assertEqual(_CountingVisitor().dfs_postorder_stack(e), 5)
+
+    def test_expand_from_leaf_handler(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.e = Expression(expr=m.x + 1)
+
+        class _Visitor(_CountingVisitor):
+            pass
+
+        def named(visitor, node):
+            if node is m.e:
+                return 0
+            return EXPR.DispatchValueVisitor.EXPAND
+        _Visitor.register_leaf_handler(m.e.__class__, named)
+        self.assertEqual(_Visitor().dfs_postorder_stack(2*m.e), 2)
+        m.f = Expression(expr=m.x + 1)
+        self.assertEqual(_Visitor().dfs_postorder_stack(2*m.f), 6)
+
+    def test_reuse_and_reentrance(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+
+        class _Visitor(_CountingVisitor):
+            pass
+
+        visitor = _Visitor()
+        def variable(v, node):
+            # Start another search with the same visitor
+            return v.dfs_postorder_stack(m.x + m.x) if node is m.y else 1
+        _Visitor.register_leaf_handler(m.y.__class__, variable)
+
+        self.assertEqual(visitor.dfs_postorder_stack(m.y*(m.x + 1)), 7)
+        self.assertEqual(visitor.dfs_postorder_stack(m.x*(m.x + 1)), 5)
+
+    def test_deep_expression(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=1)
+        e = m.x
+        for i in range(5000):
+            e = 1 + 2*e
+        self.assertEqual(EXPR.evaluate_expression(e), 2**5001 - 1)
+        self.assertEqual(e.polynomial_degree(), 1)
+        self.assertFalse(e.is_fixed())
+        m.x.fix()
+        self.assertTrue(e.is_fixed())
+        self.assertEqual(e.polynomial_degree(), 0)
+
+    def test_npv_expressions(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=2)
+        m.x = Var()
+        e = m.p**2 * m.x + sin(m.p)
+        self.assertEqual(e.polynomial_degree(), 1)
+        self.assertEqual((m.p**2).polynomial_degree(), 0)
+        self.assertTrue((m.p**2 + m.p).is_fixed())
+        self.assertAlmostEqual(EXPR.evaluate_expression(e.arg(0).arg(0)), 4)
+
+
 if __name__ == "__main__":
     unittest.main()
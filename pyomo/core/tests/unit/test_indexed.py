@@ -15,9 +15,15 @@ import os
 from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
+from six import StringIO
+
 import pyutilib.th as unittest
 
+from pyomo.common.log import LoggingIntercept
 from pyomo.environ import *
+from pyomo.core.base.indexed_component import (normalize_index,
+                                               intern_index,
+                                               set_index_interning)
 
 
 class TestSimpleVar(unittest.TestCase):
@@ -137,5 +143,183 @@ class TestIndexedComponent(unittest.TestCase):
             m.x.__getitem__, {})
 
 
+class TestIndexNormalization(unittest.TestCase):
+
+    def tearDown(self):
+        set_index_interning(False)
+
+    def test_normalize_index(self):
+        self.assertEqual(normalize_index(1), 1)
+        self.assertEqual(normalize_index('a'), 'a')
+        self.assertEqual(normalize_index(None), None)
+        self.assertEqual(normalize_index((5,)), 5)
+        self.assertEqual(normalize_index(()), ())
+        self.assertEqual(normalize_index([1, 2]), (1, 2))
+        self.assertEqual(normalize_index((1, (2, 3))), (1, 2, 3))
+        self.assertEqual(normalize_index(((1,), ('a', (2.5,)))),
+                         (1, 'a', 2.5))
+        idx = (1, 'a', 2.5)
+        self.assertIs(normalize_index(idx), idx)
+
+    def test_nested_getitem(self):
+        m = ConcreteModel()
+        m.x = Var([1,2], ['a','b'], [3])
+        self.assertIs(m.x[(1,'a'),3], m.x[1,'a',3])
+        self.assertRaises(KeyError, m.x.__getitem__, (1,'c',3))
+
+    def test_intern_index(self):
+        idx = (1, 2)
+        self.assertIs(intern_index(idx), idx)
+        set_index_interning()
+        self.assertIs(intern_index(idx), idx)
+        self.assertIs(intern_index(tuple([1, 2])), idx)
+        set_index_interning(False)
+        self.assertIsNot(intern_index(tuple([1, 2])), idx)
+
+    def test_shared_product_indices(self):
+        set_index_interning()
+        m = ConcreteModel()
+        m.I = Set(initialize=[1,2])
+        m.J = Set(initialize=[(3,'a'), (4,'b')], dimen=2)
+        m.x = Var(m.I, m.J)
+        m.y = Param(m.I, m.J, initialize=0, mutable=True)
+        self.assertEqual(sorted(m.x.keys()),
+                         [(1,3,'a'), (1,4,'b'), (2,3,'a'), (2,4,'b')])
+        ykeys = dict((k, k) for k in m.y._data)
+        for k in m.x._data:
+            self.assertIs(ykeys[k], k)
+
+
+class TestLazyConstruction(unittest.TestCase):
+
+    def _model(self):
+        m = ConcreteModel()
+        m.T = RangeSet(1000)
+        m.calls = []
+        def x_bounds(m, t):
+            m.calls.append(('x', t))
+            return (0, t)
+        m.x = Var(m.T, bounds=x_bounds, lazy=True)
+        def e_rule(m, t):
+            m.calls.append(('e', t))
+            return 2*m.x[t]
+        m.e = Expression(m.T, rule=e_rule, lazy=True)
+        def c_rule(m, t):
+            m.calls.append(('c', t))
+            if t == 1:
+                return Constraint.Skip
+            return m.e[t] + m.x[t-1] >= 1
+        m.c = Constraint(m.T, rule=c_rule, lazy=True)
+        return m
+
+    def test_construct(self):
+        m = self._model()
+        self.assertEqual(m.calls, [])
+        self.assertEqual(len(m.x), 0)
+        self.assertEqual(len(m.c), 0)
+        self.assertTrue(m.c.is_lazy())
+        self.assertEqual(list(m.c.keys()), [])
+        # 'in' checks the index set for data that is not constructed
+        self.assertIn(5, m.c)
+        self.assertNotIn(1001, m.c)
+        self.assertEqual(m.calls, [])
+
+    def test_getitem(self):
+        m = self._model()
+        c = m.c[5]
+        self.assertIs(c.body.arg(0), m.e[5])
+        self.assertEqual(sorted(m.calls),
+                         [('c', 5), ('e', 5), ('x', 4), ('x', 5)])
+        self.assertEqual(m.x[4].ub, 4)
+        self.assertIs(m.c[5], c)
+        self.assertEqual(len(m.calls), 4)
+        self.assertEqual(list(m.c.keys()), [5])
+        self.assertEqual(
+            [v.name for v in m.component_data_objects(Var)],
+            ['x[4]', 'x[5]'])
+        self.assertRaises(KeyError, m.c.__getitem__, 1001)
+
+    def test_skip(self):
+        m = self._model()
+        self.assertIn(1, m.c)
+        self.assertRaises(KeyError, m.c.__getitem__, 1)
+        self.assertNotIn(1, m.c)
+        self.assertRaises(KeyError, m.c.__getitem__, 1)
+        # The rule is only evaluated once
+        self.assertEqual(m.calls, [('c', 1)])
+
+    def test_materialize(self):
+        m = self._model()
+        m.c.materialize(range(1, 11))
+        self.assertEqual(len(m.c), 9)
+        self.assertEqual(len(m.e), 9)
+        self.assertEqual(len(m.x), 10)
+        self.assertEqual(list(m.c.keys()), list(range(2, 11)))
+        m.c.materialize([5, 10, 11])
+        self.assertEqual(len(m.c), 10)
+        self.assertEqual(m.calls.count(('c', 5)), 1)
+        self.assertRaises(KeyError, m.c.materialize, [1001])
+        self.assertTrue(m.c.is_lazy())
+
+        m.x.materialize()
+        self.assertEqual(len(m.x), 1000)
+        self.assertFalse(m.x.is_lazy())
+        self.assertEqual(m.x[1000].ub, 1000)
+
+    def test_user_value(self):
+        m = self._model()
+        m.c[5] = m.x[1] <= 2
+        m.c.materialize()
+        self.assertEqual(str(m.c[5].body), "x[1]")
+        self.assertEqual(len(m.c), 999)
+        self.assertNotIn(('c', 5), m.calls)
+
+    def test_not_constructed(self):
+        m = AbstractModel()
+        m.T = RangeSet(3)
+        m.x = Var(m.T, lazy=True)
+        self.assertRaises(ValueError, m.x.materialize)
+        i = m.create_instance()
+        self.assertTrue(i.x.is_lazy())
+        self.assertEqual(len(i.x), 0)
+        i.x.materialize()
+        self.assertEqual(len(i.x), 3)
+
+    def test_write(self):
+        m = self._model()
+        m.o = Objective(expr=m.x[2])
+        m.c.materialize([2, 3])
+        fname = os.path.join(currdir, 'lazy.lp')
+        output = StringIO()
+        try:
+            with LoggingIntercept(output, 'pyomo.core'):
+                m.write(fname, io_options={'symbolic_solver_labels': True})
+            self.assertIn("Writing model 'unknown' with lazily constructed "
+                          "components that are not fully constructed: "
+                          "x, e, c.", output.getvalue())
+            with open(fname) as f:
+                lp = f.read()
+            self.assertIn('c(2)', lp)
+            self.assertNotIn('c(4)', lp)
+
+            m.x.materialize()
+            m.e.materialize()
+            m.c.materialize()
+            output = StringIO()
+            with LoggingIntercept(output, 'pyomo.core'):
+                m.write(fname)
+            self.assertEqual(output.getvalue(), "")
+        finally:
+            if os.path.exists(fname):
+                os.remove(fname)
+
+    def test_scalar(self):
+        m = ConcreteModel()
+        m.x = Var(lazy=True)
+        m.c = Constraint(rule=lambda m: m.x >= 0, lazy=True)
+        self.assertFalse(m.c.is_lazy())
+        self.assertEqual(len(m.c), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
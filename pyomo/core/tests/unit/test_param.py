@@ -30,6 +30,18 @@ from pyomo.core.base.param import _NotValid
 
 from six import iteritems, itervalues, StringIO
 
+try:
+    import numpy
+    has_numpy = True
+except:
+    has_numpy = False
+
+try:
+    import pandas
+    has_pandas = True
+except:
+    has_pandas = False
+
 class ParamTester(object):
 
     def setUp(self, **kwds):
@@ -1485,6 +1497,150 @@ class MiscNonIndexedParamBehaviorTests(unittest.TestCase):
         self.assertEqual(3.0, value(model.CON[None].lower))
 
 
+@unittest.skipIf(not has_numpy, "numpy is not available")
+class TestArrayBackedParam(unittest.TestCase):
+
+    def test_dense_init(self):
+        m = ConcreteModel()
+        m.I = RangeSet(5)
+        m.p = Param(m.I, initialize=numpy.arange(5.0), array_backed=True)
+        self.assertEqual(type(m.p).__name__, 'ArrayIndexedParam')
+        self.assertEqual(len(m.p), 5)
+        self.assertEqual(list(m.p), [1,2,3,4,5])
+        self.assertEqual(m.p[3], 2.0)
+        self.assertEqual(len(m.p._data), 0)
+        self.assertEqual(m.p.extract_values(),
+                         {1:0.0, 2:1.0, 3:2.0, 4:3.0, 5:4.0})
+        self.assertEqual(list(m.p.extract_values(as_array=True)),
+                         [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertRaises(TypeError, m.p.__setitem__, 1, 5)
+        self.assertRaises(KeyError, m.p.__getitem__, 6)
+
+        self.assertRaises(
+            ValueError, m.add_component, 'q',
+            Param(m.I, initialize=numpy.arange(4.0), array_backed=True))
+
+    def test_product_init(self):
+        m = ConcreteModel()
+        m.I = RangeSet(2)
+        m.J = Set(initialize=['a','b','c'], ordered=True)
+        data = numpy.arange(6.0).reshape(2,3)
+        m.p = Param(m.I, m.J, initialize=data, array_backed=True)
+        for i in m.I:
+            for j in m.J:
+                self.assertEqual(m.p[i,j], data[i-1, m.J.ord(j)-1])
+        data[0,0] = 10
+        self.assertEqual(m.p[1,'a'], 0)
+
+    def test_sparse_init(self):
+        m = ConcreteModel()
+        m.I = RangeSet(4)
+        data = numpy.array([1.0, numpy.nan, 3.0, numpy.nan])
+        m.p = Param(m.I, initialize=data, array_backed=True)
+        self.assertEqual(len(m.p), 2)
+        self.assertEqual(list(m.p), [1,3])
+        self.assertEqual(m.p.sparse_keys(), [1,3])
+        self.assertTrue(1 in m.p)
+        self.assertFalse(2 in m.p)
+        self.assertRaises(ValueError, m.p.__getitem__, 2)
+        self.assertEqual(list(m.p.extract_values(as_array=True)), [1.0, 3.0])
+
+        m.q = Param(m.I, initialize=data, default=0, array_backed=True)
+        self.assertEqual(len(m.q), 4)
+        self.assertEqual(m.q[2], 0)
+        self.assertEqual(list(m.q.extract_values(as_array=True)),
+                         [1.0, 0.0, 3.0, 0.0])
+        self.assertEqual(m.q.extract_values_sparse(), {1:1.0, 3:3.0})
+
+    def test_mutable(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.p = Param(m.I, initialize=numpy.ones(3), mutable=True,
+                    array_backed=True)
+        e = m.p[2] * 2
+        self.assertEqual(value(e), 2)
+        m.p[2] = 5
+        self.assertEqual(value(e), 10)
+        self.assertEqual(list(m.p.extract_values(as_array=True)),
+                         [1.0, 5.0, 1.0])
+        m.p.store_values(numpy.array([3.0, 4.0, 5.0]))
+        self.assertEqual(value(e), 8)
+        self.assertIs(m.p[2], m.p[2])
+        self.assertRaises(ValueError, m.p.__setitem__, 1, 'a')
+
+    def test_other_initializers(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3,1,2], ordered=True)
+        m.p = Param(m.I, initialize={1:10, 2:20}, array_backed=True)
+        self.assertEqual(list(m.p), [1,2])
+        self.assertEqual(m.p.extract_values(), {1:10, 2:20})
+        m.q = Param(m.I, initialize=lambda m, i: i*i, array_backed=True)
+        self.assertEqual(list(m.q.extract_values(as_array=True)),
+                         [9.0, 1.0, 4.0])
+
+    def test_validation(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        self.assertRaises(
+            ValueError, m.add_component, 'p',
+            Param(m.I, initialize=numpy.array([1.0, -1.0, 2.0]),
+                  within=NonNegativeReals, array_backed=True))
+        m.J = Set(initialize=[3,1,2])
+        self.assertRaises(
+            ValueError, m.add_component, 'q',
+            Param(m.J, initialize=numpy.ones(3), array_backed=True))
+
+    def test_integer_domain(self):
+        # Values are validated before they are converted to floats
+        m = ConcreteModel()
+        m.I = Set(initialize=['a','b','c'], ordered=True)
+        m.p = Param(m.I, initialize=numpy.array([1, 2, 3]),
+                    within=NonNegativeIntegers, array_backed=True)
+        self.assertEqual(m.p['b'], 2)
+        m.q = Param(m.I, initialize=numpy.array([True, False, True]),
+                    within=Boolean, array_backed=True)
+        self.assertEqual(m.q['b'], 0)
+        self.assertRaises(
+            ValueError, m.add_component, 'r',
+            Param(m.I, initialize=numpy.array([1.5, 2, 3]),
+                  within=NonNegativeIntegers, array_backed=True))
+        m.s = Param(m.I, initialize=numpy.ones(3, dtype=int), mutable=True,
+                    within=NonNegativeIntegers, array_backed=True)
+        m.s.store_values(numpy.array([4, 5, 6]))
+        self.assertEqual(value(m.s['c']), 6)
+        self.assertRaises(ValueError, m.s.store_values,
+                          numpy.array([4, -5, 6]))
+        self.assertEqual(value(m.s['b']), 5)
+
+    def test_store_values_nocheck(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.p = Param(m.I, initialize=numpy.ones(3), mutable=True,
+                    within=NonNegativeReals, array_backed=True)
+        e = m.p[2] * 2
+        self.assertRaises(ValueError, m.p.store_values, {2:-1.0})
+        # Values are not validated when check=False
+        m.p.store_values({2:-1.0}, check=False)
+        self.assertEqual(value(e), -2)
+        self.assertEqual(list(m.p.extract_values(as_array=True)),
+                         [1.0, -1.0, 1.0])
+        self.assertEqual(len(m.p._data), 1)
+        m.p.store_values(-3.0, check=False)
+        self.assertEqual(value(e), -6)
+        self.assertEqual(list(m.p.extract_values(as_array=True)),
+                         [-3.0, -3.0, -3.0])
+
+    @unittest.skipIf(not has_pandas, "pandas is not available")
+    def test_series_init(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=['a','b','c'], ordered=True)
+        m.p = Param(m.I, initialize=pandas.Series([2.0, 1.0], index=['c','a']),
+                    array_backed=True)
+        self.assertEqual(list(m.p), ['a','c'])
+        self.assertEqual(m.p['a'], 1.0)
+        self.assertEqual(m.p['c'], 2.0)
+
+
 # Add test methods for all intrinsic functions
 assignTestsNonIndexedParamTests(MiscNonIndexedParamBehaviorTests,instrinsic_test_list)
 
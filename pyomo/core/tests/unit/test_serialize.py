@@ -0,0 +1,178 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for the binary model file format
+#
+
+from six import StringIO
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.environ import *
+from pyomo.core.base.var import ArrayIndexedVar, IndexedVar, has_numpy
+from pyomo.core.base.serialize import save_model, load_model
+
+
+def _model():
+    m = ConcreteModel(name='test')
+    m.I = RangeSet(5)
+    m.J = Set(initialize=['a', 'b'], ordered=True)
+    m.p = Param(m.I, mutable=True, initialize=lambda m, i: i*1.5)
+    m.q = Param(m.J, initialize={'a': 1, 'b': 2})
+    m.x = Var(m.I, m.J, bounds=(0, 10), initialize=1)
+    m.y = Var(m.I, bounds=(m.p[1], None), within=NonNegativeIntegers)
+    m.z = Var()
+    m.z.fix(3)
+    m.e = Expression(m.I, rule=lambda m, i: m.p[i]*m.y[i]**2)
+    m.c = Constraint(m.I, m.J, rule=lambda m, i, j:
+                     m.x[i, j] + sin(m.y[i]) + m.e[i] <= m.q[j])
+    m.c[2, 'a'].deactivate()
+    m.d = Constraint(expr=m.z == 2*m.x[1, 'a'])
+    m.r = Constraint(expr=inequality(0, m.z + m.y[2], 5))
+    m.cl = ConstraintList()
+    m.cl.add(abs(m.z) >= 1)
+    m.cl.add(quicksum(m.x[i, 'b'] for i in m.I) >= 1)
+    m.o = Objective(expr=summation(m.x) + exp(m.z), sense=maximize)
+    m.b = Block(m.J)
+    m.b['a'].v = VarList()
+    m.b['a'].v.add()
+    m.b['a'].cc = Constraint(expr=m.b['a'].v[1] >= m.x[1, 'a'])
+    m.b['b'].deactivate()
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    m.dual[m.c[1, 'a']] = 5
+    return m
+
+
+def _pprint(m):
+    output = StringIO()
+    m.pprint(ostream=output)
+    return output.getvalue()
+
+
+class TestModelFile(unittest.TestCase):
+
+    def setUp(self):
+        self.fname = TempfileManager.create_tempfile(suffix='.pyomo')
+
+    def tearDown(self):
+        TempfileManager.clear_tempfiles()
+
+    def test_round_trip(self):
+        m = _model()
+        save_model(m, self.fname)
+        for use_mmap in (True, False):
+            n = load_model(self.fname, mmap=use_mmap)
+            self.assertEqual(n.name, 'test')
+            self.assertEqual(_pprint(n), _pprint(m))
+            self.assertFalse(n.c[2, 'a'].active)
+            self.assertFalse(n.b['b'].active)
+            self.assertEqual(n.dual[n.c[1, 'a']], 5)
+            self.assertIs(n.y[1].lb.__class__, float)
+            self.assertIs(n.y[1]._lb, n.p[1])
+            self.assertIs(n.y[1].domain, NonNegativeIntegers)
+            self.assertIs(n.x.index_set(), n.x_index)
+            self.assertEqual(n.x_index.set_tuple, [n.I, n.J])
+            self.assertEqual(n.cl.index_set().name, 'cl_index')
+            self.assertEqual(value(n.o), value(m.o))
+
+    def test_shared_nodes(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=2)
+        m.e = Expression(expr=m.x**2)
+        shared = sin(m.x)
+        m.c1 = Constraint(expr=shared + m.e <= 1)
+        m.c2 = Constraint(expr=2*shared >= 0)
+        save_model(m, self.fname)
+        n = load_model(self.fname)
+        self.assertIs(n.c1.body.arg(0), n.c2.body.arg(1))
+        self.assertIs(n.c1.body.arg(1), n.e)
+        self.assertIs(n.c1.body.arg(0).arg(0), n.x)
+        self.assertEqual(str(n.c1.body), str(m.c1.body))
+
+    @unittest.skipIf(not has_numpy, "NumPy is not available")
+    def test_array_backed(self):
+        m = _model()
+        save_model(m, self.fname)
+        n = load_model(self.fname, array_backed=True)
+        self.assertIs(n.x.__class__, ArrayIndexedVar)
+        self.assertEqual(n.x.get_values(), m.x.get_values())
+        self.assertIs(n.y[3]._lb, n.p[1])
+        # Changes are not written back to the file
+        n.x[1, 'a'].value = 5
+        self.assertEqual(load_model(self.fname).x[1, 'a'].value, 1)
+
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], initialize=4, array_backed=True)
+        save_model(m, self.fname)
+        self.assertIs(load_model(self.fname).x.__class__, ArrayIndexedVar)
+        n = load_model(self.fname, array_backed=False)
+        self.assertIs(n.x.__class__, IndexedVar)
+        self.assertEqual(n.x[2].value, 4)
+
+    def test_lazy(self):
+        m = _model()
+        save_model(m, self.fname)
+        n = load_model(self.fname, lazy=True)
+        self.assertTrue(n.c.is_lazy())
+        # Only the constraints referenced by the suffix and the
+        # inactive constraints are constructed
+        self.assertEqual(list(n.c.keys()), [(1, 'a'), (2, 'a')])
+        self.assertFalse(n.c[2, 'a'].active)
+        self.assertEqual(str(n.c[3, 'b'].body), str(m.c[3, 'b'].body))
+        self.assertIs(n.c[3, 'b'].body.arg(2), n.e[3])
+        self.assertEqual(len(n.c), 3)
+        n.c.materialize()
+        self.assertEqual(_pprint(n), _pprint(m))
+
+    def test_sparse_components(self):
+        m = ConcreteModel()
+        m.I = RangeSet(10)
+        m.x = Var(m.I, dense=False)
+        m.x[3] = 1
+        m.x[7] = 2
+        m.c = Constraint(m.I, rule=lambda m, i:
+                         m.x[i] >= 0 if i in (3, 7) else Constraint.Skip)
+        save_model(m, self.fname)
+        for lazy in (False, True):
+            n = load_model(self.fname, lazy=lazy)
+            self.assertEqual(list(n.x.keys()), [3, 7])
+            self.assertEqual(n.x[7].value, 2)
+            self.assertIs(n.c[7].body, n.x[7])
+            self.assertRaises(KeyError, n.c.__getitem__, 5)
+
+    def test_unsupported(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.s = SOSConstraint(var=m.x, sos=1)
+        self.assertRaisesRegexp(
+            TypeError, "Cannot save component 's': components of type "
+            "SimpleSOSConstraint are not supported",
+            save_model, m, self.fname)
+
+    def test_external_reference(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.b = Block()
+        m.b.c = Constraint(expr=m.x >= 1)
+        self.assertRaisesRegexp(
+            ValueError, "references the variable 'x', which is not part "
+            "of the model", save_model, m.b, self.fname)
+
+    def test_not_a_model_file(self):
+        with open(self.fname, 'w') as OUTPUT:
+            OUTPUT.write('not a model')
+        self.assertRaisesRegexp(
+            ValueError, "is not a Pyomo model file",
+            load_model, self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -671,6 +671,14 @@ class TestRangeSetMisc(unittest.TestCase):
         self.assertEqual(tmp, list(range(1,11,2)))
         self.assertEqual( instance.d.bounds(), (1,9))
 
+    def test_ord(self):
+        a=RangeSet(3,11,2)
+        a.construct()
+        self.assertEqual([a.ord(i) for i in a], [1,2,3,4,5])
+        self.assertEqual(a.next(5), 7)
+        self.assertEqual(a.prevw(3), 11)
+        self.assertRaises(KeyError, a.ord, 4)
+
 class SimpleSetB(SimpleSetA):
 
     def setUp(self):
@@ -2584,6 +2592,62 @@ class TestMisc(PyomoModel):
             tmp.append(item)
         self.assertEqual(len(tmp),9)
 
+    def test_ordered_cross_set(self):
+        self.model.A = RangeSet(3)
+        self.model.B = Set(initialize=['c','a','b'], ordered=True)
+        self.model.C = Set(initialize=[(2,1),(1,2)], dimen=2,
+                           ordered=Set.SortedOrder)
+        self.model.D = self.model.A * self.model.B * self.model.C
+        self.instance = self.model.create_instance()
+        D = self.instance.D
+        self.assertEqual(len(D), 18)
+        self.assertIn((2,'a',1,2), D)
+        self.assertNotIn((2,'d',1,2), D)
+        for i, item in enumerate(D):
+            self.assertEqual(D[i+1], item)
+            self.assertEqual(D.ord(item), i+1)
+        self.assertEqual(D.first(), (1,'c',1,2))
+        self.assertEqual(D[-1], (3,'b',2,1))
+        self.assertEqual(D.next((1,'b',2,1)), (2,'c',1,2))
+        self.assertEqual(D.prev((2,'c',1,2), 2), (1,'b',1,2))
+        self.assertEqual(D.nextw((3,'b',2,1)), (1,'c',1,2))
+        self.assertRaises(IndexError, D.next, (3,'b',2,1))
+        E = self.instance.A * Set(initialize=[1,2])
+        self.assertRaises(ValueError, E.__getitem__, 1)
+
+    def test_sorted_set_updates(self):
+        m = ConcreteModel()
+        m.A = Set(initialize=[5,1,3], ordered=Set.SortedOrder)
+        self.assertEqual(list(m.A), [1,3,5])
+        m.A.add(4)
+        m.A.add(0)
+        self.assertEqual(list(m.A), [0,1,3,4,5])
+        self.assertEqual(m.A.ord(4), 4)
+        self.assertEqual(m.A.next(3), 4)
+        self.assertEqual(m.A.prev(0.0, -1), 1)
+        m.A.remove(3)
+        self.assertEqual(list(m.A), [0,1,4,5])
+        self.assertEqual(m.A.ord(5), 4)
+        self.assertEqual(m.A.last(), 5)
+
+        # A custom sort key, where elements may share the same key
+        m.B = Set(initialize=['ccc','a','bb'], ordered=lambda x: len(x))
+        m.B.add('d')
+        m.B.add('eeee')
+        self.assertEqual(list(m.B), ['a','d','bb','ccc','eeee'])
+        self.assertEqual(m.B.ord('d'), 2)
+        m.B.discard('a')
+        self.assertEqual(m.B.ord('d'), 1)
+        self.assertEqual(m.B[3], 'ccc')
+
+        # Indexed sets
+        m.C = Set([1,2], initialize={1:[3,1], 2:[]}, ordered=Set.SortedOrder)
+        m.C[2].add(2)
+        m.C[1].add(2)
+        self.assertEqual(list(m.C[1]), [1,2,3])
+        self.assertEqual(m.C[1].ord(3), 3)
+        self.assertEqual(list(m.C[2]), [2])
+
 
 class TestSetsInPython3(unittest.TestCase):
     def test_pprint_mixed(self):
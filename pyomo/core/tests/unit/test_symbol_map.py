@@ -2,7 +2,7 @@ import pickle
 
 import pyutilib.th as unittest
 import pyomo.environ
-from pyomo.core.expr.symbol_map import SymbolMap
+from pyomo.core.expr.symbol_map import SymbolMap, IndexSymbolMap
 from pyomo.core.kernel.variable import variable
 
 class TestSymbolMap(unittest.TestCase):
@@ -27,5 +27,69 @@ class TestSymbolMap(unittest.TestCase):
         self.assertIs(s.aliases["v"](), v1)
         self.assertIs(s.aliases["A"](), v1)
 
+class TestIndexSymbolMap(unittest.TestCase):
+
+    def test_labels(self):
+        s = IndexSymbolMap()
+        x = [variable() for i in range(3)]
+        c = variable()
+        s.addObjects('v', x[:2])
+        s.addObjects('c', [c])
+        s.addObjects('v', x[2:])
+        self.assertEqual(s.getSymbol(x[0]), 'v0')
+        self.assertEqual(s.getSymbol(x[2]), 'v2')
+        self.assertEqual(s.getSymbol(c), 'c0')
+        self.assertEqual(s.getIndex(x[1]), ('v', 1))
+        self.assertIs(s.getObject('v1'), x[1])
+        self.assertIs(s.getObject('c0'), c)
+        self.assertIs(s.getObject('v3'), SymbolMap.UnknownSymbol)
+        self.assertIs(s.getObject('v01'), SymbolMap.UnknownSymbol)
+        self.assertIs(s.getObject('x0'), SymbolMap.UnknownSymbol)
+
+    def test_dict_interface(self):
+        s = IndexSymbolMap()
+        x = [variable() for i in range(3)]
+        s.addObjects('v', x)
+        self.assertEqual(len(s.bySymbol), 3)
+        self.assertEqual(len(s.byObject), 3)
+        self.assertIn('v2', s.bySymbol)
+        self.assertNotIn('v3', s.bySymbol)
+        self.assertIs(s.bySymbol['v2'](), x[2])
+        self.assertEqual(sorted(s.bySymbol.keys()), ['v0', 'v1', 'v2'])
+        self.assertEqual(dict((k, v()) for k, v in s.bySymbol.items()),
+                         {'v0': x[0], 'v1': x[1], 'v2': x[2]})
+        self.assertIn(id(x[1]), s.byObject)
+        self.assertEqual(s.byObject[id(x[1])], 'v1')
+        self.assertIsNone(s.byObject.get(id(s)))
+        with self.assertRaises(KeyError):
+            s.bySymbol['v3']
+        with self.assertRaises(KeyError):
+            s.byObject[id(s)]
+
+    def test_alias(self):
+        s = IndexSymbolMap()
+        v = variable()
+        s.addObjects('o', [v])
+        s.alias(s.bySymbol['o0'](), '__default_objective__')
+        self.assertIs(s.getObject('__default_objective__'), v)
+
+    def test_readonly(self):
+        s = IndexSymbolMap()
+        v = variable()
+        with self.assertRaises(TypeError):
+            s.addSymbol(v, 'v0')
+        with self.assertRaises(TypeError):
+            s.createSymbol(v)
+
+    def test_pickle(self):
+        s = IndexSymbolMap()
+        x = [variable() for i in range(2)]
+        s.addObjects('v', x)
+        s.alias(x[0], 'a')
+        x_, s_ = pickle.loads(pickle.dumps((x, s)))
+        self.assertIs(s_.getObject('v1'), x_[1])
+        self.assertIs(s_.getObject('a'), x_[0])
+        self.assertEqual(s_.getSymbol(x_[0]), 'v0')
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,7 @@
 #
 # TestSimpleVar                Class for testing single variables
 # TestArrayVar                Class for testing array of variables
+# TestArrayBackedVar          Class for testing array-backed variables
 #
 
 import os
@@ -21,6 +22,8 @@ currdir = dirname(abspath(__file__))+os.sep
 import pyutilib.th as unittest
 
 from pyomo.core.base import IntegerSet
+from pyomo.core.base.var import (IndexedVar, ArrayIndexedVar,
+                                 _ArrayVarData, load_var_values, has_numpy)
 from pyomo.environ import *
 
 class PyomoModel(unittest.TestCase):
@@ -1337,5 +1340,156 @@ class MiscVarTests(unittest.TestCase):
         model.x = Var(model.C)
 
 
+@unittest.skipIf(not has_numpy, "NumPy is not available")
+class TestArrayBackedVar(unittest.TestCase):
+
+    def _model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(4)
+        m.p = Param(mutable=True, initialize=3)
+        m.x = Var(m.I, array_backed=True, bounds=(0, 10),
+                  initialize=lambda m, i: i)
+        return m
+
+    def test_declaration(self):
+        m = self._model()
+        self.assertIs(type(m.x), ArrayIndexedVar)
+        self.assertIs(type(m.x[1]), _ArrayVarData)
+        self.assertEqual(len(m.x), 4)
+        self.assertEqual(len(m.x._values), 4)
+        m.y = Var(array_backed=True)
+        self.assertIs(type(m.y), SimpleVar)
+        m.z = Var(m.I)
+        self.assertIs(type(m.z), IndexedVar)
+
+    def test_attributes(self):
+        m = self._model()
+        x = m.x[2]
+        self.assertEqual(x.value, 2)
+        self.assertEqual(x.bounds, (0, 10))
+        self.assertFalse(x.fixed)
+        self.assertFalse(x.stale)
+        x.value = None
+        self.assertIsNone(x.value)
+        x.setlb(None)
+        self.assertIsNone(x.lb)
+        x.setub(m.p)
+        self.assertIs(x._ub, m.p)
+        self.assertEqual(x.ub, 3)
+        m.p = 5
+        self.assertEqual(x.ub, 5)
+        x.setub(4)
+        self.assertEqual(x.ub, 4)
+        self.assertEqual(m.x._bound_exprs, {})
+        x.fix(7)
+        self.assertTrue(x.fixed)
+        self.assertEqual(x.value, 7)
+        self.assertFalse(m.x[1].fixed)
+        x.domain = Binary
+        self.assertTrue(x.is_binary())
+        self.assertEqual(x.bounds, (0, 1))
+        self.assertFalse(m.x[1].is_binary())
+        with self.assertRaises(ValueError):
+            x.setlb(m.x[1])
+
+    def test_sparse(self):
+        m = ConcreteModel()
+        m.x = Var(['a', 'b', 'c'], array_backed=True, dense=False,
+                  within=NonNegativeReals)
+        self.assertEqual(len(m.x), 0)
+        m.x['c'] = 3
+        m.x['a'].value = 1
+        self.assertEqual(list(m.x.keys()), ['c', 'a'])
+        self.assertEqual(m.x.get_values(), {'a': 1, 'c': 3})
+        self.assertEqual(m.x['a'].lb, 0)
+        with self.assertRaises(ValueError):
+            m.x['b'] = -1
+        self.assertNotIn('b', m.x)
+        # The storage grows as variables are added
+        m.y = Var(range(100), array_backed=True, dense=False)
+        for i in range(100):
+            m.y[i].value = i
+        self.assertEqual(list(m.y.get_values(as_array=True)),
+                         list(range(100)))
+
+    def test_get_values(self):
+        m = self._model()
+        m.x[2].fix()
+        m.x[3].value = None
+        self.assertEqual(m.x.get_values(),
+                         {1: 1, 2: 2, 3: None, 4: 4})
+        self.assertEqual(m.x.get_values(include_fixed_values=False),
+                         {1: 1, 3: None, 4: 4})
+        vals = m.x.get_values(as_array=True)
+        self.assertEqual(vals.tolist()[:2], [1, 2])
+        self.assertNotEqual(vals[2], vals[2])
+        vals = m.x.get_values(include_fixed_values=False, as_array=True)
+        self.assertNotEqual(vals[1], vals[1])
+        # The returned array is a copy
+        vals[0] = 100
+        self.assertEqual(m.x[1].value, 1)
+
+    def test_set_values(self):
+        m = self._model()
+        m.x.flag_as_stale()
+        self.assertTrue(all(v.stale for v in m.x.values()))
+        m.x.set_values([4, 3, float('nan'), 1])
+        self.assertEqual(m.x.get_values(),
+                         {1: 4, 2: 3, 3: None, 4: 1})
+        self.assertFalse(any(v.stale for v in m.x.values()))
+        m.x.set_values({2: 9})
+        self.assertEqual(m.x[2].value, 9)
+        with self.assertRaises(ValueError):
+            m.x.set_values([1, 2])
+        m.x[1].domain = Binary
+        with self.assertRaises(ValueError):
+            m.x.set_values([4, 3, 2, 1])
+        m.x.set_values([4, 3, 2, 1], valid=True)
+        self.assertEqual(m.x[1].value, 4)
+
+    def test_set_values_generic(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        m.x.set_values([1, float('nan'), 3])
+        self.assertEqual(m.x.get_values(), {1: 1, 2: None, 3: 3})
+        self.assertFalse(m.x[2].stale)
+        self.assertEqual(m.x.get_values(as_array=True).tolist()[::2],
+                         [1, 3])
+
+    def test_fix_unfix(self):
+        m = self._model()
+        m.x.fix()
+        self.assertTrue(all(v.fixed for v in m.x.values()))
+        self.assertEqual(m.x[4].value, 4)
+        m.x.unfix()
+        self.assertFalse(any(v.fixed for v in m.x.values()))
+        m.x.fix(2)
+        self.assertEqual(m.x.get_values(), {1: 2, 2: 2, 3: 2, 4: 2})
+
+    def test_load_var_values(self):
+        m = self._model()
+        m.y = Var([1, 2])
+        m.x.flag_as_stale()
+        m.y[1].stale = True
+        load_var_values([m.x[3], m.y[1], m.x[1]], [6, 7, 8])
+        self.assertEqual(m.x.get_values(), {1: 8, 2: 2, 3: 6, 4: 4})
+        self.assertEqual(m.y[1].value, 7)
+        self.assertEqual([m.x[i].stale for i in m.I],
+                         [False, True, False, True])
+        self.assertFalse(m.y[1].stale)
+
+    def test_expressions(self):
+        m = self._model()
+        m.y = Var(initialize=1)
+        m.c = Constraint(expr=2*m.x[1] + m.x[2] + m.y >= 1)
+        self.assertEqual(value(m.c.body), 5)
+        from pyomo.repn import generate_standard_repn
+        repn = generate_standard_repn(m.c.body)
+        self.assertEqual(repn.linear_coefs, (2, 1, 1))
+        m.x[1].fix()
+        repn = generate_standard_repn(m.c.body)
+        self.assertEqual(repn.constant, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
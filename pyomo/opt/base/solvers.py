@@ -353,6 +353,12 @@ class OptSolver(object):
         # These are ephimeral options that can be set by the user during
         # the call to solve, but will be reset to defaults if not given
         self._load_solutions = True
+        # set during solve() when the results will be loaded directly
+        # into a (Block) model, so readers may skip the label-keyed
+        # solution maps
+        self._bulk_solution_load = False
+        # return a CompactSolverResults object (if supported)
+        self._compact_results = False
         self._select_index = 0
         self._report_timing = False
         self._suffixes = []
@@ -567,6 +573,8 @@ class OptSolver(object):
             initial_time = time.time()
 
             self._presolve(*args, **kwds)
+            self._bulk_solution_load = self._load_solutions and \
+                isinstance(_model, _BlockData)
 
             presolve_completion_time = time.time()
             if self._report_timing:
@@ -643,6 +651,7 @@ class OptSolver(object):
             # Reset the options dict
             #
             self.options = orig_options
+            self._bulk_solution_load = False
 
         return result
 
@@ -657,6 +666,7 @@ class OptSolver(object):
         self._tee                     = kwds.pop("tee", False)
         self._assert_available        = kwds.pop("available", True)
         self._suffixes                = kwds.pop("suffixes", [])
+        self._compact_results         = kwds.pop("compact_results", False)
 
         self.available()
 
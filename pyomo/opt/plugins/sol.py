@@ -38,13 +38,36 @@ class ResultsReader_sol(results.AbstractResultsReader):
         if not name is None:
             self.name = name
 
-    def __call__(self, filename, res=None, soln=None, suffixes=[]):
+    def __call__(self, filename, res=None, soln=None, suffixes=[],
+                 bulk=False):
         """
         Parse a *.sol file
+
+        If bulk is True, then the variable values, constraint duals
+        and suffix values are not stored in the (label-keyed)
+        variable, constraint and objective maps of the solution.
+        Instead, they are stored in the ``_arrays`` attribute of the
+        solution, which maps each of 'variable', 'constraint' and
+        'objective' to a dict of (suffix name) to (values).  The
+        values are a list indexed by the position of the component in
+        the NL file ('Value' and 'Dual') or a dict that maps positions
+        to values (all other suffixes).  This is used when a solution
+        is loaded directly into a model through the symbol map of the
+        NL writer.
         """
+        if hasattr(filename, 'read'):
+            # A file-like object (e.g., the data read from a pipe)
+            try:
+                return self._load(filename, res, soln, suffixes, bulk)
+            except ValueError as e:
+                filename.seek(0)
+                raise ValueError(
+                    "Error reading '<stream>': %s.\n"
+                    "SOL File Output:\n%s"
+                    % (str(e), filename.read()))
         try:
             with open(filename,"r") as f:
-                return self._load(f, res, soln, suffixes)
+                return self._load(f, res, soln, suffixes, bulk)
         except ValueError as e:
             with open(filename,"r") as f:
                 fdata = f.read()
@@ -53,7 +76,7 @@ class ResultsReader_sol(results.AbstractResultsReader):
                 "SOL File Output:\n%s"
                 % (filename, str(e), fdata))
 
-    def _load(self, fin, res, soln, suffixes):
+    def _load(self, fin, res, soln, suffixes, bulk=False):
 
         if res is None:
             res = SolverResults()
@@ -86,18 +109,10 @@ class ResultsReader_sol(results.AbstractResultsReader):
             raise ValueError("no Options line found")
         n = z[nopts + 3] # variables
         m = z[nopts + 1] # constraints
-        x = []
-        y = []
-        i = 0
-        while i < m:
-            line = fin.readline()
-            y.append(float(line))
-            i += 1
-        i = 0
-        while i < n:
-            line = fin.readline()
-            x.append(float(line))
-            i += 1
+        # The duals and primal values are one value per line
+        readline = fin.readline
+        y = list(map(float, (readline() for i in xrange(m))))
+        x = list(map(float, (readline() for i in xrange(n))))
         objno = [0,0]
         line = fin.readline()
         if line:                    # WEH - when is this true?
@@ -167,14 +182,22 @@ class ResultsReader_sol(results.AbstractResultsReader):
             soln.message = msg.strip()
             soln.message = res.solver.message.replace("\n","; ")
             soln_variable = soln.variable
-            i = 0
-            for var_value in x:
-                soln_variable["v"+str(i)] = {"Value" : var_value}
-                i = i + 1
             soln_constraint = soln.constraint
-            if any(re.match(suf,"dual") for suf in suffixes):
-                for i in xrange(0,len(y)):
-                    soln_constraint["c"+str(i)] = {"Dual" : y[i]}
+            load_duals = any(re.match(suf,"dual") for suf in suffixes)
+            if bulk:
+                arrays = soln._arrays = {'variable': {'Value': x},
+                                         'constraint': {},
+                                         'objective': {}}
+                if load_duals:
+                    arrays['constraint']['Dual'] = y
+            else:
+                i = 0
+                for var_value in x:
+                    soln_variable["v"+str(i)] = {"Value" : var_value}
+                    i = i + 1
+                if load_duals:
+                    for i in xrange(0,len(y)):
+                        soln_constraint["c"+str(i)] = {"Dual" : y[i]}
 
             ### Read suffixes ###
             line = fin.readline()
@@ -209,7 +232,17 @@ class ResultsReader_sol(results.AbstractResultsReader):
                     # this information can be obtained from the solver documentation
                     for n in xrange(tabline):
                         fin.readline()
-                    if kind == 0: # Var
+                    if bulk and kind < 3:
+                        if kind == 1:
+                            suffix_name = suffix_name[0].upper() + \
+                                          suffix_name[1:]
+                        tmp = arrays[('variable','constraint','objective')[kind]]
+                        tmp = tmp.setdefault(suffix_name, {})
+                        for cnt in xrange(nvalues):
+                            suf_line = fin.readline().split()
+                            tmp[int(suf_line[0])] = \
+                                convert_function(suf_line[1])
+                    elif kind == 0: # Var
                         for cnt in xrange(nvalues):
                             suf_line = fin.readline().split()
                             key = "v"+suf_line[0]
@@ -15,3 +15,4 @@ from pyomo.opt.results.solver import SolverStatus, TerminationCondition
 from pyomo.opt.results.problem import ProblemSense
 from pyomo.opt.results.solution import SolutionStatus, Solution
 from pyomo.opt.results.results_ import SolverResults
+from pyomo.opt.results.compact import CompactSolverResults, CompactSolution
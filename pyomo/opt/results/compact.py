@@ -0,0 +1,459 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['CompactSolverResults', 'CompactSolution']
+
+from pyomo.opt.results.container import undefined, ScalarData
+from pyomo.opt.results.problem import ProblemInformation
+from pyomo.opt.results.solver import SolverInformation
+from pyomo.opt.results.solution import Solution
+from pyomo.opt.results.results_ import SolverResults
+
+try:
+    unicode
+except NameError:
+    basestring = unicode = str
+
+
+def _convert(name):
+    """Convert an attribute name to a key (see MapContainer._convert)"""
+    if not isinstance(name, basestring):
+        return name
+    tmp = name.replace('_', ' ')
+    return tmp[0].upper() + tmp[1:]
+
+
+class _SlotData(ScalarData):
+    """
+    A ScalarData object whose value is stored in a slot of a compact
+    results section, so that the section and the SolverResults view
+    share the value.
+    """
+
+    def __init__(self, data, section, name):
+        self.__dict__.update(data.__dict__)
+        self.__dict__.pop('value', None)
+        self._section = section
+        self._name = name
+
+    @property
+    def value(self):
+        return getattr(self._section, self._name)
+
+    @value.setter
+    def value(self, val):
+        object.__setattr__(self._section, self._name, val)
+
+    def __reduce_ex__(self, protocol):
+        # Pickle (and copy) this as a ScalarData object.  The view is
+        # linked to the slots again when the results are unpickled.
+        state = dict(self.__dict__)
+        del state['_section']
+        del state['_name']
+        state['value'] = self.value
+        return (ScalarData, (), state)
+
+
+def _declare_fields(cls, names):
+    """
+    Return the (slot name, container key, default value) tuples for
+    the named fields of a results container class.
+    """
+    data = cls()
+    fields = []
+    for name in names:
+        key = _convert(name)
+        if key in data:
+            default = dict.__getitem__(data, key).value
+        else:
+            default = undefined
+        fields.append((name, key, default))
+    return tuple(fields)
+
+
+class _CompactData(object):
+    """
+    Base class for the sections of a CompactSolverResults object.
+
+    The fields of a section are stored in slots.  Any other attribute
+    is looked up in (or stored in) the matching container of the
+    SolverResults view, which is created on first use.
+    """
+
+    __slots__ = ('_results', '_data', '_active')
+
+    # The (slot name, container key, default value) for each field
+    _fields = ()
+    # Map from slot names and container keys to slot names
+    _keys = {}
+    # The slots that hold a dict that is created on first use
+    _lazy = ()
+
+    def __init__(self, results):
+        object.__setattr__(self, '_results', results)
+        object.__setattr__(self, '_data', None)
+        object.__setattr__(self, '_active', False)
+        for name, key, default in self._fields:
+            if name not in self._lazy:
+                object.__setattr__(self, name, default)
+
+    def __getattr__(self, name):
+        # This is only called for names that are not (initialized)
+        # slots, e.g., 'Message' or 'statistics'
+        if name[0] == '_':
+            raise AttributeError(
+                "Unknown attribute `%s' for object with type %s"
+                % (name, type(self)))
+        if name in self._lazy:
+            val = {}
+            object.__setattr__(self, name, val)
+            return val
+        slot = self._keys.get(_convert(name), None)
+        if slot is None:
+            return getattr(self._container(), name)
+        if slot == name:
+            # The slot is not initialized (e.g., while unpickling)
+            raise AttributeError(
+                "Unknown attribute `%s' for object with type %s"
+                % (name, type(self)))
+        return getattr(self, slot)
+
+    def __setattr__(self, name, val):
+        slot = self._keys.get(name, None)
+        if slot is None:
+            if name[0] == '_':
+                object.__setattr__(self, name, val)
+                return
+            slot = self._keys.get(_convert(name), None)
+            if slot is None:
+                setattr(self._container(), name, val)
+                return
+        object.__setattr__(self, slot, val)
+        if not self._active:
+            object.__setattr__(self, '_active', True)
+
+    def __setstate__(self, state):
+        for key, val in state[1].items():
+            object.__setattr__(self, key, val)
+
+    def _container(self):
+        """Return the container of this section in the SolverResults view"""
+        if self._data is None:
+            self._results._materialize()
+        return self._data
+
+    def _link(self, data):
+        """Store the fields of a results container in this section"""
+        for name, key, default in self._fields:
+            if key not in data:
+                data.declare(key)
+            dict.__setitem__(data, key,
+                             _SlotData(dict.__getitem__(data, key),
+                                       self, name))
+        object.__setattr__(self, '_data', data)
+
+    def __len__(self):
+        return len(self._list())
+
+    def __getitem__(self, i):
+        return self._list()[i]
+
+    def __call__(self, i=0):
+        return self._list()(i)
+
+    def __str__(self):
+        return str(self._list())
+
+
+class _CompactProblem(_CompactData):
+
+    __slots__ = ('name',
+                 'lower_bound',
+                 'upper_bound',
+                 'number_of_objectives',
+                 'number_of_constraints',
+                 'number_of_variables',
+                 'number_of_binary_variables',
+                 'number_of_integer_variables',
+                 'number_of_continuous_variables',
+                 'number_of_nonzeros',
+                 'sense')
+
+    _fields = _declare_fields(ProblemInformation, __slots__)
+
+    def _list(self):
+        return self._results._materialize().problem
+
+
+class _CompactSolver(_CompactData):
+
+    __slots__ = ('name',
+                 'status',
+                 'return_code',
+                 'message',
+                 'user_time',
+                 'system_time',
+                 'wallclock_time',
+                 'termination_condition',
+                 'termination_message',
+                 # Declared by the shell solvers and the *.sol reader
+                 'id',
+                 'error_rc',
+                 'time')
+
+    _fields = _declare_fields(SolverInformation, __slots__)
+
+    def _list(self):
+        return self._results._materialize().solver
+
+
+class CompactSolution(_CompactData):
+    """
+    A solution of a CompactSolverResults object.
+
+    The status, gap and message of the solution are stored in slots.
+    The values of the solution may be stored in the label-keyed
+    variable, constraint, objective and problem maps, which are
+    created when they are first used, or in position-indexed arrays
+    (see ResultsReader_sol).
+    """
+
+    __slots__ = ('gap',
+                 'status',
+                 'message',
+                 'status_description',
+                 'problem',
+                 'objective',
+                 'variable',
+                 'constraint',
+                 '_arrays')
+
+    _fields = _declare_fields(Solution, __slots__[:-1])
+    _lazy = ('problem', 'objective', 'variable', 'constraint')
+
+    # Solutions from solvers are keyed by labels (not ComponentUIDs)
+    _cuid = False
+
+    def _link(self, data):
+        _CompactData._link(self, data)
+        arrays = getattr(self, '_arrays', None)
+        if arrays is not None:
+            data._arrays = arrays
+
+    def _list(self):
+        raise TypeError("'%s' object is not a list" % (type(self).__name__,))
+
+
+for _cls in (_CompactProblem, _CompactSolver, CompactSolution):
+    _cls._keys = dict((key, name) for name, key, default in _cls._fields)
+    _cls._keys.update((name, name) for name, key, default in _cls._fields)
+del _cls
+
+
+class _CompactSolutionSet(object):
+    """
+    The list of the solutions of a CompactSolverResults object.  This
+    supports the SolutionSet API, and forwards to the SolutionSet of
+    the SolverResults view once the view is created.
+    """
+
+    __slots__ = ('_results', '_list')
+
+    def __init__(self, results):
+        self._results = results
+        self._list = []
+
+    def _view(self):
+        view = self._results._view
+        if view is not None:
+            return view.solution
+        return None
+
+    def __len__(self):
+        return len(self._list)
+
+    def __getitem__(self, i):
+        return self._list[i]
+
+    def __call__(self, i=1):
+        return self._list[i-1]
+
+    def add(self):
+        soln = CompactSolution(self._results)
+        view = self._view()
+        if view is not None:
+            soln._link(view.add())
+        self._list.append(soln)
+        return soln
+
+    def insert(self, soln):
+        view = self._view()
+        if view is not None:
+            if isinstance(soln, CompactSolution):
+                view.insert(soln._container())
+            else:
+                view.insert(soln)
+        self._list.append(soln)
+
+    def clear(self):
+        view = self._view()
+        if view is not None:
+            view.clear()
+        self._list = []
+
+    def delete(self, i):
+        view = self._view()
+        if view is not None:
+            view.delete(i)
+        del self._list[i]
+
+    def __getattr__(self, name):
+        # Like the ListContainer, other attributes are the attributes
+        # of the first solution
+        if name[0] == '_':
+            raise AttributeError(
+                "Unknown attribute `%s' for object with type %s"
+                % (name, type(self)))
+        if len(self._list) == 0:
+            self.add()
+        return getattr(self._list[0], name)
+
+    def __setattr__(self, name, val):
+        if name[0] == '_':
+            object.__setattr__(self, name, val)
+            return
+        if len(self._list) == 0:
+            self.add()
+        setattr(self._list[0], name, val)
+
+    def __str__(self):
+        return str(self._results._materialize().solution)
+
+
+class CompactSolverResults(object):
+    """
+    A memory-efficient alternative to SolverResults.
+
+    The problem and solver information and the solution status fields
+    are stored in slots, and solution values may be stored in arrays
+    that are loaded directly through the symbol map of the problem
+    writer.  This object supports the commonly used parts of the
+    SolverResults API, e.g.::
+
+        results.solver.termination_condition
+        results.problem.lower_bound
+        results.solution(0).status
+
+    The first time that other parts of the API are used (e.g.,
+    results.write() or results.solver.statistics), a SolverResults
+    object is created as a view of this object.  The view shares the
+    values of the fields stored in slots, and all further operations
+    are forwarded to it.
+    """
+
+    __slots__ = ('_problem', '_solver', '_solution', '_view',
+                 '__dict__', '__weakref__')
+
+    undefined = undefined
+
+    def __init__(self):
+        object.__setattr__(self, '_problem', _CompactProblem(self))
+        object.__setattr__(self, '_solver', _CompactSolver(self))
+        object.__setattr__(self, '_solution', _CompactSolutionSet(self))
+        object.__setattr__(self, '_view', None)
+
+    @property
+    def problem(self):
+        if self._view is None:
+            return self._problem
+        return self._view.problem
+
+    @property
+    def solver(self):
+        if self._view is None:
+            return self._solver
+        return self._view.solver
+
+    @property
+    def solution(self):
+        if self._view is None:
+            return self._solution
+        return self._view.solution
+
+    def _materialize(self):
+        """Create (and return) the SolverResults view of this object"""
+        view = self._view
+        if view is None:
+            view = SolverResults()
+            # Like the SolverResults, the problem and solver sections
+            # are only displayed if they were set
+            self._problem._link(view.problem.add())
+            view.problem._active = self._problem._active
+            self._solver._link(view.solver.add())
+            view.solver._active = self._solver._active
+            for soln in self._solution._list:
+                if isinstance(soln, CompactSolution):
+                    soln._link(view.solution.add())
+                else:
+                    view.solution.insert(soln)
+            object.__setattr__(self, '_view', view)
+        return view
+
+    def __setstate__(self, state):
+        if isinstance(state, tuple):
+            state, slots = state
+        else:
+            slots = {}
+        if state:
+            self.__dict__.update(state)
+        for key, val in slots.items():
+            object.__setattr__(self, key, val)
+        view = self._view
+        if view is not None:
+            # The pickled view is not linked to the slots
+            self._problem._link(view.problem[0])
+            self._solver._link(view.solver[0])
+            for soln, data in zip(self._solution._list, view.solution):
+                if isinstance(soln, CompactSolution):
+                    soln._link(data)
+
+    def __getattr__(self, name):
+        if name[0] == '_':
+            raise AttributeError(
+                "Unknown attribute `%s' for object with type %s"
+                % (name, type(self)))
+        return getattr(self._materialize(), name)
+
+    def __setattr__(self, name, val):
+        if name[0] == '_':
+            object.__setattr__(self, name, val)
+        else:
+            setattr(self._materialize(), name, val)
+
+    def __getitem__(self, name):
+        return self._materialize()[name]
+
+    def __setitem__(self, name, val):
+        self._materialize()[name] = val
+
+    def __contains__(self, name):
+        return name in self._materialize()
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self):
+        return len(self._materialize())
+
+    def __repr__(self):
+        return repr(self._materialize())
+
+    def __str__(self):
+        return str(self._materialize())
@@ -35,6 +35,13 @@ class UndefinedData(object):
     def __str__(self):
         return "<undefined>"
 
+    def __reduce__(self):
+        # Unpickle (and copy) the singletons below, which are
+        # compared by identity
+        if self is ignore:
+            return 'ignore'
+        return 'undefined'
+
 undefined = UndefinedData()
 ignore    = UndefinedData()
 
@@ -10,8 +10,10 @@
 
 __all__ = ['SystemCallSolver']
 
+import errno
 import os
 import sys
+import threading
 import time
 import logging
 
@@ -21,16 +23,87 @@ from pyutilib.misc import Bunch
 from pyutilib.services import registered_executable, TempfileManager
 from pyutilib.subprocess import run
 
+from pyomo.common.probe import probe_cache
 from pyomo.opt.base import *
 from pyomo.opt.base.solvers import *
-from pyomo.opt.results import SolverStatus, SolverResults
+from pyomo.opt.results import (SolverStatus,
+                               SolverResults,
+                               CompactSolverResults)
+
+from six import StringIO, reraise, string_types
 
 logger = logging.getLogger('pyomo.opt')
 
+# The problem formats that can be written to a named pipe, and the
+# suffix of the problem file
+_pipe_suffix = {
+    ProblemFormat.nl: '.pyomo.nl',
+    ProblemFormat.cpxlp: '.pyomo.lp',
+    ProblemFormat.mps: '.pyomo.mps',
+}
+
+
+class _PipeThread(threading.Thread):
+    """
+    A thread that writes or reads one end of a named pipe while the
+    solver executes.
+
+    The thread evaluates :attr:`fcn`, which opens the pipe.  Opening
+    a named pipe blocks until the other end is opened, so
+    :meth:`finish` opens the other end (and closes it) if the solver
+    exited without opening it.
+    """
+
+    def __init__(self, filename, fcn, writer):
+        super(_PipeThread, self).__init__()
+        self.daemon = True
+        self.filename = filename
+        self.fcn = fcn
+        self.writer = writer
+        self.result = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.result = self.fcn()
+        except:
+            self.error = sys.exc_info()
+
+    def finish(self):
+        """Wait for the thread after the solver has exited"""
+        if self.writer:
+            flags = os.O_RDONLY | os.O_NONBLOCK
+        else:
+            flags = os.O_WRONLY | os.O_NONBLOCK
+        while self.is_alive():
+            try:
+                os.close(os.open(self.filename, flags))
+            except OSError:
+                # No reader has opened the pipe (yet)
+                pass
+            self.join(0.01)
+
+    def broken_pipe(self):
+        """True if the thread failed because the reader exited"""
+        return self.error is not None and \
+            isinstance(self.error[1], EnvironmentError) and \
+            self.error[1].errno == errno.EPIPE
+
+
+def _create_pipe(filename):
+    """Replace a (temporary) file with a named pipe"""
+    if os.path.exists(filename):
+        os.remove(filename)
+    os.mkfifo(filename)
+
 
 class SystemCallSolver(OptSolver):
     """ A generic command line solver """
 
+    # True if the solver writes its solution file (in a single pass)
+    # so that it can be read through a named pipe
+    _pipe_soln_file = False
+
     def __init__(self, **kwargs):
         """ Constructor """
 
@@ -46,6 +119,10 @@ class SystemCallSolver(OptSolver):
         # a solver plugin may not report execution time.
         self._last_solve_time = None
         self._define_signal_handlers = True
+        # named pipes used in 'pipe' mode
+        self._pipe = False
+        self._problem_pipe = None
+        self._results_pipe = None
 
         if executable is not None:
             self.set_executable(name=executable, validate=validate)
@@ -138,6 +215,8 @@ class SystemCallSolver(OptSolver):
         """
         Process the logfile for information about the optimization process.
         """
+        if self._compact_results:
+            return CompactSolverResults()
         return SolverResults()
 
     def process_soln_file(self,results):
@@ -190,6 +269,25 @@ class SystemCallSolver(OptSolver):
         """
         raise NotImplementedError
 
+    def version(self):
+        """
+        Returns a 4-tuple describing the solver executable version.
+
+        The version is stored in the probe cache, so the executable is
+        not run again (by any process) until it changes.
+        """
+        if self._version is None:
+            try:
+                exe = self.executable()
+            except NotImplementedError:
+                exe = None
+            ver = probe_cache(exe, '%s.version' % (type(self).__name__,),
+                              self._get_version)
+            if type(ver) is list:
+                ver = tuple(ver)
+            self._version = ver
+        return self._version
+
     def _presolve(self, *args, **kwds):
         """
         Peform presolves.
@@ -198,32 +296,127 @@ class SystemCallSolver(OptSolver):
 
         self._keepfiles = kwds.pop("keepfiles", False)
         self._define_signal_handlers = kwds.pop('use_signal_handling',True)
+        self._pipe = kwds.pop("pipe", False)
+        self._problem_pipe = None
+        self._results_pipe = None
+        self._rc = None
+        if self._pipe and not hasattr(os, 'mkfifo'):
+            logger.warning("Named pipes are not supported on this "
+                           "platform; ignoring the 'pipe' option.")
+            self._pipe = False
+        if self._keepfiles:
+            # Pipes do not leave files behind
+            self._pipe = False
+        if getattr(self, '_warm_start_solve', False):
+            # Warm start files are written with the symbol map, which
+            # is not available until the problem has been written
+            self._pipe = False
 
-        OptSolver._presolve(self, *args, **kwds)
+        try:
+            OptSolver._presolve(self, *args, **kwds)
 
-        #
-        # Verify that the input problems exists
-        #
-        for filename in self._problem_files:
-            if not os.path.exists(filename):
-                msg = 'Solver failed to locate input problem file: %s'
-                raise ValueError(msg % filename)
-        #
-        # Create command line
-        #
-        self._command = self.create_command_line(
-            self.executable(), self._problem_files)
+            #
+            # Verify that the input problems exists
+            #
+            for filename in self._problem_files:
+                if not os.path.exists(filename):
+                    msg = 'Solver failed to locate input problem file: %s'
+                    raise ValueError(msg % filename)
+            #
+            # Create command line
+            #
+            self._command = self.create_command_line(
+                self.executable(), self._problem_files)
 
-        self._log_file=self._command.log_file
+            self._log_file=self._command.log_file
+            #
+            # The pre-cleanup is probably unncessary, but also not harmful.
+            #
+            if (self._log_file is not None) and \
+               os.path.exists(self._log_file):
+                os.remove(self._log_file)
+            if (self._soln_file is not None) and \
+               os.path.exists(self._soln_file):
+                os.remove(self._soln_file)
+            #
+            # Read the solution file through a named pipe
+            #
+            if self._pipe and self._pipe_soln_file and \
+               (self._soln_file is not None) and \
+               (self._soln_file == self._results_file):
+                _create_pipe(self._soln_file)
+                def _read(filename=self._soln_file):
+                    with open(filename, 'r') as f:
+                        return f.read()
+                self._results_pipe = _PipeThread(self._soln_file, _read, False)
+                self._results_pipe.start()
+        except:
+            # Do not leave a pipe thread waiting for the solver
+            self._finish_pipes(raise_error=False)
+            raise
+
+    def _convert_problem(self,
+                         args,
+                         problem_format,
+                         valid_problem_formats,
+                         **kwds):
         #
-        # The pre-cleanup is probably unncessary, but also not harmful.
+        # In pipe mode, the problem is written to a named pipe by a
+        # background thread, so the solver can start reading the
+        # problem while it is being written.  The symbol map is
+        # collected after the solver exits.
         #
-        if (self._log_file is not None) and \
-           os.path.exists(self._log_file):
-            os.remove(self._log_file)
-        if (self._soln_file is not None) and \
-           os.path.exists(self._soln_file):
-            os.remove(self._soln_file)
+        if not self._pipe or \
+           (self._problem is not None) or \
+           (len(args) != 1) or \
+           isinstance(args[0], string_types) or \
+           (problem_format not in _pipe_suffix) or \
+           (problem_format not in valid_problem_formats):
+            return OptSolver._convert_problem(self,
+                                              args,
+                                              problem_format,
+                                              valid_problem_formats,
+                                              **kwds)
+        filename = TempfileManager.create_tempfile(
+            suffix=_pipe_suffix[problem_format])
+        _create_pipe(filename)
+        kwds['_problem_filename'] = filename
+        def _write():
+            return OptSolver._convert_problem(self,
+                                              args,
+                                              problem_format,
+                                              valid_problem_formats,
+                                              **kwds)
+        self._problem_pipe = _PipeThread(filename, _write, True)
+        self._problem_pipe.start()
+        return (filename,), problem_format, None
+
+    def _finish_pipes(self, raise_error=True):
+        """Wait for the named pipe threads after the solver exits"""
+        error = None
+        problem_pipe = self._problem_pipe
+        if problem_pipe is not None:
+            self._problem_pipe = None
+            problem_pipe.finish()
+            if problem_pipe.error is None:
+                self._smap_id = problem_pipe.result[2]
+            elif not (self._rc and problem_pipe.broken_pipe()):
+                # A broken pipe means the solver exited without
+                # reading the whole problem, which is reported through
+                # the solver return code
+                error = problem_pipe.error
+        results_pipe = self._results_pipe
+        if results_pipe is not None:
+            results_pipe.finish()
+            # The solution has been read, so the pipe is not needed
+            if os.path.exists(results_pipe.filename):
+                os.remove(results_pipe.filename)
+            if results_pipe.error is not None:
+                self._results_pipe = None
+                if error is None:
+                    error = results_pipe.error
+        if error is not None and raise_error:
+            reraise(*error)
 
     def _apply_solver(self):
         if registered_executable('timer'):
@@ -245,7 +438,13 @@ class SystemCallSolver(OptSolver):
                 print("Solver problem files: %s" % str(self._problem_files))
 
         sys.stdout.flush()
-        self._rc, self._log = self._execute_command(self._command)
+        try:
+            self._rc, self._log = self._execute_command(self._command)
+        except:
+            self._rc = None
+            self._finish_pipes(raise_error=False)
+            raise
+        self._finish_pipes()
         sys.stdout.flush()
         return Bunch(rc=self._rc, log=self._log)
 
@@ -332,6 +531,10 @@ class SystemCallSolver(OptSolver):
         log_file_completion_time = time.time()
         if self._report_timing is True:
             print("      %6.2f seconds required to read logfile " % (log_file_completion_time - start_time))
+        results_file = self._results_file
+        if self._results_pipe is not None:
+            results_file = StringIO(self._results_pipe.result or "")
+            self._results_pipe = None
         if self._results_reader is None:
             self.process_soln_file(results)
             soln_file_completion_time = time.time()
@@ -343,15 +546,23 @@ class SystemCallSolver(OptSolver):
             # information, but perhaps also in a results file.
             # For now, if there is a single solution, then we assume that
             # the results file is going to add more data to it.
+            kwds = {}
+            if self._bulk_solution_load and \
+               self._results_format == ResultsFormat.sol:
+                # The solution is loaded directly through the symbol
+                # map, so the reader can skip the label-keyed maps
+                kwds['bulk'] = True
             if len(results.solution) == 1:
-                results = self._results_reader(self._results_file,
+                results = self._results_reader(results_file,
                                                res=results,
                                                soln=results.solution(0),
-                                               suffixes=self._suffixes)
+                                               suffixes=self._suffixes,
+                                               **kwds)
             else:
-                results = self._results_reader(self._results_file,
+                results = self._results_reader(results_file,
                                                res=results,
-                                               suffixes=self._suffixes)
+                                               suffixes=self._suffixes,
+                                               **kwds)
             results_reader_completion_time = time.time()
             if self._report_timing is True:
                 print("      %6.2f seconds required to read solution file" % (results_reader_completion_time - log_file_completion_time))
@@ -0,0 +1,127 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for pyomo.opt.results.compact
+#
+
+import copy
+import pickle
+import os
+from os.path import abspath, dirname
+currdir = dirname(abspath(__file__))+os.sep
+
+import pyutilib.th as unittest
+
+import pyomo.opt
+from pyomo.opt import (SolverResults,
+                       CompactSolverResults,
+                       TerminationCondition,
+                       SolutionStatus,
+                       SolverStatus,
+                       undefined)
+
+
+def _fill(results):
+    results.solver.message = "a message"
+    results.solver.status = SolverStatus.warning
+    results.solver.termination_condition = TerminationCondition.optimal
+    results.solver.id = 3
+    results.problem.number_of_variables = 2
+    soln = results.solution.add()
+    results.solution.status = SolutionStatus.optimal
+    soln.variable['x'] = {'Value': 1.5}
+    soln.constraint['c'] = {'Dual': 2}
+    return results
+
+
+class Test(unittest.TestCase):
+
+    def test_slots(self):
+        results = CompactSolverResults()
+        self.assertEqual(results.solver.status, SolverStatus.ok)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.unknown)
+        self.assertIs(results.solver.message, undefined)
+        self.assertEqual(results.problem.upper_bound, float('inf'))
+        results.solver.Message = "msg"
+        self.assertEqual(results.solver.message, "msg")
+        self.assertEqual(len(results.solution), 0)
+        soln = results.solution.add()
+        self.assertEqual(soln.status, SolutionStatus.unknown)
+        self.assertEqual(soln.variable, {})
+        self.assertIs(results.solution(0), soln)
+        self.assertIsNone(results._view)
+        with self.assertRaises(AttributeError):
+            soln._unknown
+
+    def test_view(self):
+        a = _fill(SolverResults())
+        b = _fill(CompactSolverResults())
+        self.assertIsNone(b._view)
+        self.assertEqual(str(a), str(b))
+        self.assertIsNotNone(b._view)
+        self.assertIs(type(b.solver), type(a.solver))
+        # The view shares the fields stored in slots
+        b.solver.status = SolverStatus.ok
+        self.assertEqual(b._solver.status, SolverStatus.ok)
+        b._solver.termination_condition = TerminationCondition.infeasible
+        self.assertEqual(b.solver(0)['Termination condition'],
+                         TerminationCondition.infeasible)
+        b.solution(0).status = SolutionStatus.infeasible
+        self.assertEqual(b._solution(0).status, SolutionStatus.infeasible)
+
+    def test_view_on_demand(self):
+        results = _fill(CompactSolverResults())
+        results.solver.statistics.black_box.number_of_iterations = 5
+        self.assertIsNotNone(results._view)
+        self.assertEqual(
+            results.solver.statistics.black_box.number_of_iterations, 5)
+        self.assertEqual(results.solver.message, "a message")
+        soln = results.solution.add()
+        self.assertEqual(len(results.solution), 2)
+        self.assertIs(results.solution(0), soln)
+
+    def test_pickle(self):
+        a = _fill(SolverResults())
+        b = _fill(CompactSolverResults())
+        c = pickle.loads(pickle.dumps(b))
+        self.assertIsNone(c._view)
+        self.assertEqual(str(a), str(c))
+        c = copy.deepcopy(b)
+        self.assertEqual(str(a), str(c))
+        # Once the view is created, it is pickled with the results
+        b.solver.statistics.black_box.number_of_iterations = 5
+        c = pickle.loads(pickle.dumps(b))
+        self.assertEqual(str(b), str(c))
+        c.solver.status = SolverStatus.error
+        self.assertEqual(c._solver.status, SolverStatus.error)
+        self.assertEqual(b.solver.status, SolverStatus.warning)
+
+    def test_sol_reader(self):
+        import pyomo.environ
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            a = reader(currdir+"test4_sol.sol", suffixes=["dual"])
+            b = reader(currdir+"test4_sol.sol", res=CompactSolverResults(),
+                       suffixes=["dual"])
+            self.assertIsNone(b._view)
+            self.assertEqual(b.solver.termination_condition,
+                             TerminationCondition.optimal)
+            self.assertEqual(str(a), str(b))
+            b = reader(currdir+"test4_sol.sol", res=CompactSolverResults(),
+                       suffixes=["dual"], bulk=True)
+            self.assertIsNone(b._view)
+            self.assertEqual(b.solution(0).variable, {})
+            x = a.solution(0).variable
+            self.assertEqual(b.solution(0)._arrays['variable']['Value'],
+                             [x['v%s' % i]['Value'] for i in range(len(x))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -135,5 +135,88 @@ class Test(unittest.TestCase):
             self.assertEqual(m.iis[m.v1], 1)
             self.assertEqual(m.iis[m.c0], 4)
 
+    def test_iis_bulk(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            if reader is None:
+                raise IOError("Reader 'sol' is not registered")
+            result = reader(currdir+"iis_no_variable_values.sol",
+                            suffixes=["iis"], bulk=True)
+            soln = result.solution(0)
+            self.assertEqual(len(soln.variable), 0)
+            self.assertEqual(len(soln.constraint), 0)
+            self.assertEqual(soln._arrays['variable']['iis'], {0: 1, 1: 1})
+            self.assertEqual(soln._arrays['constraint']['Iis'], {0: 4})
+
+    def _write_sol(self, filename, duals, values):
+        with open(filename, 'w') as f:
+            f.write("Test Solver: optimal\n\nOptions\n3\n1\n1\n0\n")
+            f.write("%s\n%s\n%s\n%s\n" % (len(duals), len(duals),
+                                            len(values), len(values)))
+            for val in duals + values:
+                f.write("%r\n" % (val,))
+            f.write("objno 0 0\n")
+
+    def test_bulk_load(self):
+        from pyomo.environ import (ConcreteModel, Var, Constraint,
+                                   Objective, Suffix)
+        for compact in (False, True):
+            m = ConcreteModel()
+            m.x = Var([1, 2, 3])
+            m.x[2].fix(5)
+            m.c = Constraint(expr=m.x[1] + m.x[3] >= 1)
+            m.d = Constraint(expr=m.x[1] - m.x[3] <= 4)
+            m.o = Objective(expr=m.x[1] + 2*m.x[3] + m.x[2])
+            m.dual = Suffix(direction=Suffix.IMPORT)
+            _, smap_id = m.write(
+                currdir+"test_sol.nl",
+                io_options={'compact_symbol_map': compact})
+            os.remove(currdir+"test_sol.nl")
+            smap = m.solutions.symbol_map[smap_id]
+            v = [smap.bySymbol['v%d' % i]() for i in range(2)]
+            c = [smap.bySymbol['c%d' % i]() for i in range(2)]
+            self._write_sol(currdir+"test_sol.txt", [0.5, -1.5], [2.0, 3.0])
+            with pyomo.opt.ReaderFactory("sol") as reader:
+                results = reader(currdir+"test_sol.txt",
+                                 suffixes=["dual"], bulk=True)
+            results._smap_id = smap_id
+            m.solutions.load_from(results)
+            self.assertEqual(v[0].value, 2.0)
+            self.assertEqual(v[1].value, 3.0)
+            self.assertFalse(v[0].stale)
+            self.assertEqual(m.x[2].value, 5)
+            self.assertEqual(m.dual[c[0]], 0.5)
+            self.assertEqual(m.dual[c[1]], -1.5)
+            self.assertEqual(len(m.solutions.symbol_map), 0)
+
+    def test_bulk_load_store_to(self):
+        from pyomo.environ import (ConcreteModel, Var, Constraint,
+                                   Objective, Suffix)
+        from pyomo.opt import SolverResults
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+        m.d = Constraint(expr=m.x[1] - m.x[2] <= 4)
+        m.o = Objective(expr=m.x[1] + 2*m.x[2])
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        _, smap_id = m.write(currdir+"test_sol.nl")
+        os.remove(currdir+"test_sol.nl")
+        smap = m.solutions.symbol_map[smap_id]
+        c = [smap.bySymbol['c%d' % i]().name for i in range(2)]
+        self._write_sol(currdir+"test_sol.txt", [0.5, -1.5], [2.0, 3.0])
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            results = reader(currdir+"test_sol.txt",
+                             suffixes=["dual"], bulk=True)
+        os.remove(currdir+"test_sol.txt")
+        results._smap_id = smap_id
+        m.solutions.load_from(results)
+        # The values read in bulk are stored back by store_to()
+        results = SolverResults()
+        m.solutions.store_to(results)
+        soln = results.solution(0)
+        self.assertEqual(soln.constraint[c[0]], {'Dual': 0.5})
+        self.assertEqual(soln.constraint[c[1]], {'Dual': -1.5})
+        self.assertEqual(sorted(soln.variable), ['x[1]', 'x[2]'])
+        self.assertEqual(soln.objective['o']['Value'], 8.0)
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,13 +12,18 @@
 #
 
 import os
+import stat
+import sys
+import threading
 
 import pyutilib.th as unittest
 from pyutilib.common import ApplicationError
+from pyutilib.services import TempfileManager
 
 from pyomo.opt.base import UnknownSolver
 from pyomo.opt.base.solvers import SolverFactory
 from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.shellcmd import _PipeThread
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 exedirname = "exe_dir"
@@ -47,6 +52,26 @@ _test_names = ["cplex", "ipopt", "bonmin", "cbc", "glpk", "gurobi", "junk___"]
 
 is_windows = os.name == 'nt'
 
+# An ASL "solver" that reports whether the problem was read from a
+# named pipe, and returns a solution with x[i] = i+1 and dual[j] = j/2
+fake_asl = """#!%s
+import os, stat, sys
+nl = sys.argv[1]
+fifo = stat.S_ISFIFO(os.stat(nl).st_mode)
+with open(nl) as INPUT:
+    INPUT.readline()
+    n, m = [int(i) for i in INPUT.readline().split()[:2]]
+    INPUT.read()
+with open(nl[:-3] + '.sol', 'w') as OUTPUT:
+    OUTPUT.write('fake pipe=%%s\\n\\nOptions\\n3\\n1\\n1\\n0\\n' %% (fifo,))
+    OUTPUT.write('%%d\\n%%d\\n%%d\\n%%d\\n' %% (m, m, n, n))
+    for i in range(m):
+        OUTPUT.write('%%r\\n' %% (0.5*i,))
+    for i in range(n):
+        OUTPUT.write('%%r\\n' %% (1.0+i,))
+    OUTPUT.write('objno 0 0\\n')
+"""
+
 
 class TestSystemCallSolver(unittest.TestCase):
 
@@ -284,5 +309,105 @@ class TestSystemCallSolver(unittest.TestCase):
                 self.assertEqual(opt._user_executable, isexe_abspath)
                 self.assertEqual(opt.executable(), isexe_abspath)
 
+
+@unittest.skipIf(not hasattr(os, 'mkfifo'), "Named pipes are not supported")
+class TestPipeMode(unittest.TestCase):
+
+    def setUp(self):
+        import pyomo.environ
+        TempfileManager.push()
+        self.exe = TempfileManager.create_tempfile(suffix='.fake_asl')
+        with open(self.exe, 'w') as OUTPUT:
+            OUTPUT.write(fake_asl % (sys.executable,))
+        os.chmod(self.exe, os.stat(self.exe).st_mode | stat.S_IXUSR)
+
+    def tearDown(self):
+        TempfileManager.pop(remove=True)
+
+    def _model(self):
+        from pyomo.environ import (ConcreteModel, Var, Constraint,
+                                   Objective, Suffix)
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], bounds=(0, None))
+        m.c = Constraint([1, 2], rule=lambda m, i: m.x[i] >= i)
+        m.o = Objective(expr=sum(m.x.values()))
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        return m
+
+    def _solve(self, opt_attrs={}, **kwds):
+        m = self._model()
+        with SolverFactory('asl', solver=self.exe) as opt:
+            opt.set_executable(self.exe)
+            for key, val in opt_attrs.items():
+                setattr(opt, key, val)
+            try:
+                results = opt.solve(m, **kwds)
+            finally:
+                self.files = list(opt._problem_files) + \
+                    [opt._soln_file, opt._log_file]
+            self.assertIsNone(opt._problem_pipe)
+            self.assertIsNone(opt._results_pipe)
+        self.assertEqual(sorted(v.value for v in m.x.values()),
+                         [1.0, 2.0, 3.0])
+        self.assertEqual(sorted(m.dual.values()), [0.0, 0.5])
+        return results
+
+    def test_pipe(self):
+        results = self._solve(pipe=True)
+        self.assertEqual(results.solver.message, "fake pipe=True")
+
+    def test_no_pipe(self):
+        results = self._solve()
+        self.assertEqual(results.solver.message, "fake pipe=False")
+
+    def test_compact_results(self):
+        from pyomo.opt import CompactSolverResults
+        results = self._solve(pipe=True, compact_results=True)
+        self.assertIs(type(results), CompactSolverResults)
+        self.assertIsNone(results._view)
+        self.assertEqual(results.solver.message, "fake pipe=True")
+
+    def test_pipe_keepfiles(self):
+        # Files that are kept are written to disk
+        results = self._solve(pipe=True, keepfiles=True)
+        self.assertEqual(results.solver.message, "fake pipe=False")
+        for fname in self.files:
+            self.assertTrue(os.path.isfile(fname))
+            os.remove(fname)
+
+    def test_pipe_warmstart(self):
+        # Warm start files need the symbol map before the solver starts
+        results = self._solve(opt_attrs={'_warm_start_solve': True},
+                              pipe=True)
+        self.assertEqual(results.solver.message, "fake pipe=False")
+
+    def test_pipe_presolve_error(self):
+        # The writer thread is stopped if the presolve fails after it
+        # was started
+        def _error(*args, **kwds):
+            raise RuntimeError("command line error")
+        with self.assertRaisesRegexp(RuntimeError, "command line error"):
+            self._solve(opt_attrs={'create_command_line': _error},
+                        pipe=True)
+        self.assertFalse(any(isinstance(t, _PipeThread)
+                             for t in threading.enumerate()))
+        TempfileManager.pop(remove=True)
+        for fname in self.files:
+            if fname is not None:
+                self.assertFalse(os.path.exists(fname))
+
+    def test_pipe_solver_error(self):
+        # The solver exits without opening the named pipe
+        with open(self.exe, 'w') as OUTPUT:
+            OUTPUT.write("#!%s\nimport sys\nsys.exit(2)\n"
+                         % (sys.executable,))
+        with self.assertRaises(ApplicationError):
+            self._solve(pipe=True)
+        # The solver does not clean up after an error
+        TempfileManager.pop(remove=True)
+        for fname in self.files:
+            self.assertFalse(os.path.exists(fname))
+
+
 if __name__ == "__main__":
     unittest.main()
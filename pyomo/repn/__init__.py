@@ -10,3 +10,4 @@
 
 from pyomo.repn.standard_repn import *
 from pyomo.repn.standard_aux import *
+from pyomo.repn.compiled_repn import *
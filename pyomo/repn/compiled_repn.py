@@ -0,0 +1,333 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from __future__ import division
+
+__all__ = ['StandardRepnCache']
+
+from six import itervalues
+
+from pyomo.core.expr import current as EXPR
+from pyomo.core.expr.numvalue import (native_numeric_types,
+                                      nonpyomo_leaf_types,
+                                      value)
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.repn.standard_repn import StandardRepn, generate_standard_repn
+
+
+class _NamedExpressionVisitor(EXPR.SimpleExpressionVisitor):
+
+    def __init__(self):
+        self.seen = set()
+        self.named = []
+        self.structural = False
+
+    def visit(self, node):
+        if node.__class__ in nonpyomo_leaf_types:
+            return
+        if node.__class__ is EXPR.PowExpression:
+            # The repn of x**p depends on the value of the exponent
+            if node.arg(1).__class__ not in native_numeric_types:
+                self.structural = True
+        elif node.__class__ is EXPR.Expr_ifExpression:
+            # The repn of an Expr_if depends on the value of the condition
+            if node._if.__class__ not in native_numeric_types:
+                self.structural = True
+        elif node.is_named_expression_type() and id(node) not in self.seen:
+            self.seen.add(id(node))
+            self.named.append((node, node.expr))
+
+
+class _CompiledRepn(object):
+    """
+    The cached standard representation of a single expression.
+
+    The symbolic repn is generated with ``compute_values=False``, so
+    its structure does not depend on the values of mutable parameters
+    or fixed variables.  Each coefficient that is not a native number
+    is a "slot" whose numeric value is recomputed when one of the
+    parameters or fixed variables it depends on changes.
+
+    The exception are expressions with an exponent or an Expr_if
+    condition that is not a number (e.g., ``x**p``): the terms in
+    their repn depend on the value of the exponent or condition.  The
+    repn of these expressions is generated from the current values,
+    and it is recompiled when the value of a mutable parameter or
+    fixed variable in the expression changes.
+    """
+
+    __slots__ = ('valid',         # False once this entry is discarded
+                 'expr',          # The expression that was compiled
+                 'named',         # (named expression, expr) pairs
+                 'vars',          # Variables that appear in the repn
+                 'fixed',         # The fixed status of those variables
+                 'symbolic',      # The repn with symbolic coefficients
+                 'constant',      # The value of the constant term
+                 'linear_coefs',  # Values of the linear coefficients
+                 'quadratic_coefs', # Values of the quadratic coefficients
+                 'structural',    # True if the terms depend on values
+                 'watched',       # (obj, value) pairs for structural repns
+                 'repn')          # The numeric repn (None if stale)
+
+    def __init__(self, expr, quadratic):
+        self.valid = True
+        self.expr = expr
+
+        visitor = _NamedExpressionVisitor()
+        if expr.__class__ not in nonpyomo_leaf_types and \
+           expr.is_expression_type():
+            visitor.xbfs(expr)
+        self.named = tuple(visitor.named)
+        self.structural = visitor.structural
+
+        if self.structural:
+            watched = [(p, p.value)
+                       for p in EXPR.identify_mutable_parameters(expr)]
+            watched.extend((v, v.value)
+                           for v in EXPR.identify_variables(expr)
+                           if v.fixed)
+            self.watched = tuple(watched)
+        else:
+            self.watched = ()
+        self.symbolic = generate_standard_repn(
+            expr, compute_values=self.structural, quadratic=quadratic)
+        self.constant = None
+        self.linear_coefs = [None]*len(self.symbolic.linear_coefs)
+        self.quadratic_coefs = [None]*len(self.symbolic.quadratic_coefs)
+        self.repn = None
+
+    def slots(self):
+        """
+        Yields the ``(kind, index, coef)`` tuples for every
+        coefficient in the symbolic repn.
+        """
+        symbolic = self.symbolic
+        yield 'constant', None, symbolic.constant
+        for i, c in enumerate(symbolic.linear_coefs):
+            yield 'linear', i, c
+        for i, c in enumerate(symbolic.quadratic_coefs):
+            yield 'quadratic', i, c
+
+    def update(self, kind, index, coef):
+        """
+        Recompute the numeric value of a single coefficient.
+        """
+        if coef.__class__ in native_numeric_types:
+            val = coef
+        else:
+            val = value(coef)
+        if kind == 'linear':
+            self.linear_coefs[index] = val
+        elif kind == 'quadratic':
+            self.quadratic_coefs[index] = val
+        else:
+            self.constant = val
+        self.repn = None
+
+    def is_current(self, expr):
+        """
+        Returns :const:`True` if the cached repn still describes the
+        expression.
+        """
+        if expr is not self.expr:
+            return False
+        for e, arg in self.named:
+            if e.expr is not arg:
+                return False
+        for v, fixed in zip(self.vars, self.fixed):
+            if v.fixed != fixed:
+                return False
+        for obj, val in self.watched:
+            if obj.value != val:
+                return False
+        return True
+
+    def generate_repn(self):
+        """
+        Create the numeric repn from the current coefficient values.
+        """
+        symbolic = self.symbolic
+        repn = StandardRepn()
+        repn.constant = self.constant
+        v = []
+        c = []
+        for var, coef in zip(symbolic.linear_vars, self.linear_coefs):
+            if coef != 0:
+                v.append(var)
+                c.append(coef)
+        repn.linear_vars = tuple(v)
+        repn.linear_coefs = tuple(c)
+        v = []
+        c = []
+        for vars_, coef in zip(symbolic.quadratic_vars, self.quadratic_coefs):
+            if coef != 0:
+                v.append(vars_)
+                c.append(coef)
+        repn.quadratic_vars = tuple(v)
+        repn.quadratic_coefs = tuple(c)
+        repn.nonlinear_expr = symbolic.nonlinear_expr
+        repn.nonlinear_vars = symbolic.nonlinear_vars
+        self.repn = repn
+        return repn
+
+
+class StandardRepnCache(object):
+    """
+    A cache of standard representations for constraints and objectives.
+
+    The first time that the repn of a component is requested, its
+    expression is compiled into a symbolic repn in which mutable
+    parameters (and fixed variables) are left as coefficient
+    expressions.  The numeric repn is then generated from the values
+    of those coefficients.  The cache maintains an index from each
+    mutable parameter and fixed variable to the coefficients that
+    depend on it, so :func:`refresh` only re-evaluates the
+    coefficients that are affected by a change.
+
+    A cached repn is recompiled automatically if the expression of
+    the component (or of a named expression that it references) is
+    replaced, or if a variable in the expression is fixed or unfixed.
+    Expressions whose terms depend on the value of an exponent or an
+    Expr_if condition (e.g., ``x**p``) are also recompiled when the
+    value of a mutable parameter or fixed variable in them changes.
+
+    Args:
+        quadratic (bool): If :const:`True`, then quadratic terms are
+            collected in the repn.  Defaults to :const:`True`.
+
+    Example:
+        >>> cache = StandardRepnCache()
+        >>> repn = cache.get(model.c)
+        >>> model.p = 5
+        >>> cache.refresh()
+        >>> repn = cache.get(model.c)
+    """
+
+    def __init__(self, quadratic=True):
+        self.quadratic = quadratic
+        self._compiled = ComponentMap()
+        # id(obj) -> [obj, value, [(compiled, kind, index, coef), ...]]
+        self._dependents = {}
+
+    def __len__(self):
+        return len(self._compiled)
+
+    def __contains__(self, obj):
+        return obj in self._compiled
+
+    def get(self, obj):
+        """
+        Return the standard representation of a constraint or objective.
+
+        Args:
+            obj: A constraint or objective data object.
+
+        Returns:
+            A :class:`StandardRepn` object with numeric coefficients.
+        """
+        expr = self._get_expr(obj)
+        compiled = self._compiled.get(obj, None)
+        if compiled is None or not compiled.is_current(expr):
+            compiled = self._compile(obj, expr)
+        if compiled.repn is None:
+            return compiled.generate_repn()
+        return compiled.repn
+
+    def invalidate(self, obj=None):
+        """
+        Discard the cached repn of a component.
+
+        Args:
+            obj: A constraint or objective data object.  If this is
+                :const:`None`, then the whole cache is cleared.
+        """
+        if obj is None:
+            for compiled in itervalues(self._compiled):
+                compiled.valid = False
+            self._compiled = ComponentMap()
+            self._dependents = {}
+        elif obj in self._compiled:
+            self._compiled[obj].valid = False
+            del self._compiled[obj]
+
+    def refresh(self):
+        """
+        Update the coefficients that depend on mutable parameters or
+        fixed variables whose values have changed since the last call.
+
+        Returns:
+            The number of coefficients that were recomputed.
+        """
+        stale = {}
+        for key, dep in list(self._dependents.items()):
+            obj, old, users = dep
+            val = obj.value
+            if val == old and val.__class__ is old.__class__:
+                continue
+            dep[1] = val
+            live = []
+            for user in users:
+                if user[0].valid:
+                    live.append(user)
+                    stale[id(user[0]), user[1], user[2]] = user
+            if live:
+                dep[2] = live
+            else:
+                del self._dependents[key]
+        for compiled, kind, index, coef in itervalues(stale):
+            compiled.update(kind, index, coef)
+        return len(stale)
+
+    def _get_expr(self, obj):
+        try:
+            return obj.body
+        except AttributeError:
+            return obj.expr
+
+    def _compile(self, obj, expr):
+        old = self._compiled.get(obj, None)
+        if old is not None:
+            old.valid = False
+        compiled = _CompiledRepn(expr, self.quadratic)
+        symbolic = compiled.symbolic
+        vars_ = {}
+        for v in symbolic.linear_vars:
+            vars_[id(v)] = v
+        for v1, v2 in symbolic.quadratic_vars:
+            vars_[id(v1)] = v1
+            vars_[id(v2)] = v2
+        if symbolic.nonlinear_expr is not None:
+            for v in EXPR.identify_variables(symbolic.nonlinear_expr):
+                vars_[id(v)] = v
+        if compiled.structural:
+            # Fixed variables are not in a repn generated from values
+            for v in EXPR.identify_variables(expr):
+                vars_[id(v)] = v
+        for kind, index, coef in compiled.slots():
+            compiled.update(kind, index, coef)
+            if coef.__class__ in native_numeric_types:
+                continue
+            user = (compiled, kind, index, coef)
+            for p in EXPR.identify_mutable_parameters(coef):
+                self._add_dependent(p, user)
+            for v in EXPR.identify_variables(coef):
+                vars_[id(v)] = v
+                self._add_dependent(v, user)
+        compiled.vars = tuple(itervalues(vars_))
+        compiled.fixed = tuple(v.fixed for v in compiled.vars)
+        self._compiled[obj] = compiled
+        return compiled
+
+    def _add_dependent(self, obj, user):
+        dep = self._dependents.get(id(obj), None)
+        if dep is None:
+            self._dependents[id(obj)] = [obj, obj.value, [user]]
+        else:
+            dep[2].append(user)
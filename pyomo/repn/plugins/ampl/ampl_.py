@@ -33,9 +33,10 @@ from pyomo.opt.base import *
 from pyomo.core.expr import current as EXPR
 from pyomo.core.expr.numvalue import (NumericConstant,
                                       native_numeric_types,
+                                      nonpyomo_leaf_types,
                                       value)
 from pyomo.core.base import *
-from pyomo.core.base import SymbolMap, Block
+from pyomo.core.base import SymbolMap, IndexSymbolMap, Block
 from pyomo.core.base.var import Var
 from pyomo.core.base import _ExpressionData, Expression, SortComponents
 from pyomo.core.base import var
@@ -139,6 +140,95 @@ def _build_op_template():
 
 
 
+def _collect_common_subexpressions(roots):
+    """
+    Identify the subexpressions that are shared by the nonlinear
+    expressions of a model.
+
+    Subexpressions are identified by their identity, so this detects
+    named expressions (and subtrees) that appear in more than one
+    place in the expression DAG.  The expressions are walked without
+    descending into a node more than once.
+
+    Args:
+        roots: A list of ``(usage, expr)`` tuples, where ``usage`` is 1
+            for constraints and 2 for objectives.
+
+    Returns:
+        A tuple ``(shared, counts)``, where ``shared`` is the list of
+        shared subexpressions in AMPL defined variable order and
+        ``counts`` is the number of subexpressions used by both
+        constraints and objectives, only by constraints, and only by
+        objectives.
+    """
+    def _subexpressions(node):
+        if node.is_named_expression_type():
+            args = (node.expr,)
+        else:
+            args = node.args
+        ans = []
+        for arg in args:
+            if arg.__class__ in nonpyomo_leaf_types or \
+               not arg.is_expression_type() or \
+               not arg.is_potentially_variable() or \
+               not arg.nargs():
+                continue
+            if arg.__class__ is EXPR.ExternalFunctionExpression and \
+               arg.is_fixed():
+                # Fixed external functions are written as constants
+                continue
+            ans.append(arg)
+        return ans
+
+    refs = {}
+    usage = {}
+    children = {}
+    postorder = []
+    for root_usage, root in roots:
+        if root is None or root.__class__ in nonpyomo_leaf_types or \
+           not root.is_expression_type() or \
+           not root.is_potentially_variable() or not root.nargs():
+            continue
+        if id(root) in refs:
+            refs[id(root)] += 1
+            usage[id(root)] |= root_usage
+            continue
+        refs[id(root)] = 1
+        usage[id(root)] = root_usage
+        children[id(root)] = _subexpressions(root)
+        stack = [(root, iter(children[id(root)]))]
+        while stack:
+            node, args = stack[-1]
+            for arg in args:
+                if id(arg) in refs:
+                    refs[id(arg)] += 1
+                    continue
+                refs[id(arg)] = 1
+                usage[id(arg)] = 0
+                children[id(arg)] = _subexpressions(arg)
+                stack.append((arg, iter(children[id(arg)])))
+                break
+            else:
+                stack.pop()
+                postorder.append(node)
+
+    # Every node appears after its subexpressions in the postorder, so
+    # the usage is propagated from the roots in the reverse order.
+    for node in reversed(postorder):
+        node_usage = usage[id(node)]
+        for arg in children[id(node)]:
+            usage[id(arg)] |= node_usage
+
+    shared = {3: [], 1: [], 2: []}
+    for node in postorder:
+        if refs[id(node)] > 1:
+            shared[usage[id(node)]].append(node)
+    # Subexpressions are used wherever the expressions that contain
+    # them are used, so this order defines every subexpression before
+    # the defined variables that reference it.
+    return (shared[3] + shared[1] + shared[2],
+            (len(shared[3]), len(shared[1]), len(shared[2])))
+
 def _get_bound(exp):
     if exp is None:
         return None
@@ -272,6 +362,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
         self._ampl_obj_id = {}
         self._OUTPUT = None
         self._varID_map = None
+        self._defined_vars = None
 
     def __call__(self,
                  model,
@@ -327,6 +418,18 @@ class ProblemWriter_nl(AbstractProblemWriter):
         include_all_variable_bounds = \
             io_options.pop("include_all_variable_bounds", False)
 
+        # If True, the returned symbol map stores the objects in
+        # lists indexed by their NL row/column ids and only
+        # generates the "v%d", "c%d", and "o%d" labels on demand.
+        compact_symbol_map = io_options.pop("compact_symbol_map", False)
+
+        # If True, named expressions and subexpressions that are
+        # shared by more than one nonlinear expression are written
+        # once as AMPL defined variables (V segments) and referenced
+        # from the constraints and objectives.
+        export_defined_variables = \
+            io_options.pop("export_defined_variables", False)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_nl passed unrecognized io_options:\n\t" +
@@ -375,7 +478,9 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     show_section_timing=show_section_timing,
                     skip_trivial_constraints=skip_trivial_constraints,
                     file_determinism=file_determinism,
-                    include_all_variable_bounds=include_all_variable_bounds)
+                    include_all_variable_bounds=include_all_variable_bounds,
+                    compact_symbol_map=compact_symbol_map,
+                    export_defined_variables=export_defined_variables)
 
         self._symbolic_solver_labels = False
         self._output_fixed_variable_bounds = False
@@ -384,6 +489,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
         self._OUTPUT = None
         self._varID_map = None
         self._op_string = None
+        self._defined_vars = None
         return filename, symbol_map
 
     def _print_quad_term(self, v1, v2):
@@ -476,9 +582,17 @@ class ProblemWriter_nl(AbstractProblemWriter):
 
         elif exp.is_expression_type():
             #
+            # Reference subexpressions that were written as
+            # defined variables
+            #
+            if self._defined_vars is not None and \
+               id(exp) in self._defined_vars and \
+               exp is not self._defining:
+                OUTPUT.write(self._defined_vars[id(exp)])
+            #
             # Identify NPV expressions
             #
-            if not exp.is_potentially_variable():
+            elif not exp.is_potentially_variable():
                 OUTPUT.write(self._op_string[NumericConstant] % (value(exp)))
             #
             # We are assuming that _Constant_* expression objects
@@ -665,7 +779,9 @@ class ProblemWriter_nl(AbstractProblemWriter):
                         show_section_timing=False,
                         skip_trivial_constraints=False,
                         file_determinism=1,
-                        include_all_variable_bounds=False):
+                        include_all_variable_bounds=False,
+                        compact_symbol_map=False,
+                        export_defined_variables=False):
 
         output_fixed_variable_bounds = self._output_fixed_variable_bounds
         symbolic_solver_labels = self._symbolic_solver_labels
@@ -688,7 +804,10 @@ class ProblemWriter_nl(AbstractProblemWriter):
         subsection_timer = StopWatch()
 
         # create the symbol_map
-        symbol_map = SymbolMap()
+        if compact_symbol_map:
+            symbol_map = IndexSymbolMap()
+        else:
+            symbol_map = SymbolMap()
 
         name_labeler = self._name_labeler
         # These will get updated when symbolic_solver_labels
@@ -810,6 +929,12 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # Count number of objectives and build the repns
         #
+        # The repns share the cached repn of named expressions
+        if export_defined_variables:
+            named_expression_cache = {}
+        else:
+            named_expression_cache = None
+
         n_objs = 0
         n_nonlinear_objs = 0
         ObjVars = set()
@@ -835,8 +960,10 @@ class ProblemWriter_nl(AbstractProblemWriter):
                         max_rowname_len = len(objname)
 
                 if gen_obj_repn:
-                    repn = generate_standard_repn(active_objective.expr,
-                                                  quadratic=False)
+                    repn = generate_standard_repn(
+                        active_objective.expr,
+                        quadratic=False,
+                        named_expression_cache=named_expression_cache)
                     block_repn[active_objective] = repn
                     linear_vars = repn.linear_vars
                     nonlinear_vars = repn.nonlinear_vars
@@ -880,7 +1007,10 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 obj_ID = trivial_labeler(active_objective)
                 Objectives_dict[obj_ID] = (active_objective, wrapped_repn)
                 self_ampl_obj_id[obj_ID] = n_objs
-                symbol_map.addSymbols([(active_objective, "o%d"%n_objs)])
+                if compact_symbol_map:
+                    symbol_map.addObjects('o', (active_objective,))
+                else:
+                    symbol_map.addSymbols([(active_objective, "o%d"%n_objs)])
 
                 n_objs += 1
                 if repn.is_nonlinear():
@@ -953,8 +1083,10 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     nonlinear_vars = repn.nonlinear_vars
                 else:
                     if gen_con_repn:
-                        repn = generate_standard_repn(constraint_data.body,
-                                                      quadratic=False)
+                        repn = generate_standard_repn(
+                            constraint_data.body,
+                            quadratic=False,
+                            named_expression_cache=named_expression_cache)
                         block_repn[constraint_data] = repn
                         linear_vars = repn.linear_vars
                         nonlinear_vars = repn.nonlinear_vars
@@ -1095,9 +1227,14 @@ class ProblemWriter_nl(AbstractProblemWriter):
             (con_ID,row_id) for row_id,con_ID in \
             enumerate(itertools.chain(nonlin_con_order_list,lin_con_order_list)))
         # populate the symbol_map
-        symbol_map.addSymbols(
-            [(Constraints_dict[con_ID][0],"c%d"%row_id) for row_id,con_ID in \
-             enumerate(itertools.chain(nonlin_con_order_list,lin_con_order_list))])
+        if compact_symbol_map:
+            symbol_map.addObjects(
+                'c', [Constraints_dict[con_ID][0] for con_ID in \
+                      itertools.chain(nonlin_con_order_list,lin_con_order_list)])
+        else:
+            symbol_map.addSymbols(
+                [(Constraints_dict[con_ID][0],"c%d"%row_id) for row_id,con_ID in \
+                 enumerate(itertools.chain(nonlin_con_order_list,lin_con_order_list))])
 
         if show_section_timing:
             subsection_timer.report("Generate constraint representations")
@@ -1198,13 +1335,42 @@ class ProblemWriter_nl(AbstractProblemWriter):
         self_ampl_var_id.update((var_ID,column_id)
                                 for column_id,var_ID in enumerate(full_var_list))
         # populate the symbol_map
-        symbol_map.addSymbols([(Vars_dict[var_ID],"v%d"%column_id)
-                               for column_id,var_ID in enumerate(full_var_list)])
+        if compact_symbol_map:
+            symbol_map.addObjects('v', [Vars_dict[var_ID]
+                                        for var_ID in full_var_list])
+        else:
+            symbol_map.addSymbols([(Vars_dict[var_ID],"v%d"%column_id)
+                                   for column_id,var_ID in enumerate(full_var_list)])
 
         if show_section_timing:
             subsection_timer.report("Partition variable types")
             subsection_timer.reset()
 
+        #
+        # Identify the defined variables
+        #
+        defined_vars = []
+        n_common_exprs = (0, 0, 0)
+        if export_defined_variables:
+            roots = [(1, Constraints_dict[con_ID][1].repn.nonlinear_expr)
+                     for con_ID in nonlin_con_order_list]
+            roots.extend((2, wrapped_repn.repn.nonlinear_expr)
+                         for obj, wrapped_repn in itervalues(Objectives_dict))
+            defined_vars, n_common_exprs = \
+                _collect_common_subexpressions(roots)
+            self._defined_vars = {}
+            self._defining = None
+            for i, exp in enumerate(defined_vars, len(full_var_list)):
+                if symbolic_solver_labels and exp.is_named_expression_type():
+                    self._defined_vars[id(exp)] = \
+                        "v%d\t#%s\n" % (i, name_labeler(exp))
+                else:
+                    self._defined_vars[id(exp)] = "v%d\n" % (i)
+
+            if show_section_timing:
+                subsection_timer.report("Identify defined variables")
+                subsection_timer.reset()
+
 #        end_time = time.clock()
 #        print (end_time - start_time)
 
@@ -1301,7 +1467,8 @@ class ProblemWriter_nl(AbstractProblemWriter):
         #
         # LINE 10
         #
-        OUTPUT.write(" 0 0 0 0 0\t# common exprs: b,c,o,c1,o1\n")
+        OUTPUT.write(" %d %d %d 0 0\t# common exprs: b,c,o,c1,o1\n"
+                     % n_common_exprs)
 
 #        end_time = time.clock()
 #        print (end_time - start_time)
@@ -1500,6 +1667,18 @@ class ProblemWriter_nl(AbstractProblemWriter):
 
         del modelSOS
 
+        #
+        # "V" lines
+        #
+        for i, exp in enumerate(defined_vars, len(full_var_list)):
+            OUTPUT.write("V%d 0 0" % (i))
+            if symbolic_solver_labels and exp.is_named_expression_type():
+                OUTPUT.write("\t#%s" % (name_labeler(exp)))
+            OUTPUT.write("\n")
+            self._defining = exp
+            self._print_nonlinear_terms_NL(exp)
+        self._defining = None
+
         #
         # "C" lines
         #
@@ -70,7 +70,8 @@ class ToBaronVisitor(EXPR.ExpressionValueVisitor):
             else:
                 tmp.append(val)
 
-        if node.__class__ is EXPR.LinearExpression:
+        if node.__class__ in (EXPR.LinearExpression,
+                              EXPR.ArrayLinearExpression):
             for v in node.linear_vars:
                 self.variables.add(id(v))
 
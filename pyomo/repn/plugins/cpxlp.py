@@ -17,9 +17,10 @@ import math
 import operator
 
 from six import iterkeys, iteritems, StringIO
-from six.moves import xrange
+from six.moves import xrange, zip
 
 from pyutilib.misc import PauseGC
+from pyomo.common.parallel import parallel_map
 from pyomo.opt import ProblemFormat
 from pyomo.opt.base import AbstractProblemWriter, WriterFactory
 from pyomo.core.base import \
@@ -129,6 +130,17 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         force_objective_constant = \
             io_options.pop("force_objective_constant", False)
 
+        # A StandardRepnCache that is used to generate (and reuse)
+        # the standard representation of objectives and constraints
+        # across repeated writes of the same model.
+        repn_cache = io_options.pop("repn_cache", None)
+
+        # If greater than one, the constraint rows are generated in
+        # chunks of "chunk_size" rows by this many worker processes.
+        # The file is identical to the one written serially.
+        processes = io_options.pop("processes", None)
+        chunk_size = io_options.pop("chunk_size", 10000)
+
         if len(io_options):
             raise ValueError(
                 "ProblemWriter_cpxlp passed unrecognized io_options:\n\t" +
@@ -172,7 +184,10 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     column_order=column_order,
                     skip_trivial_constraints=skip_trivial_constraints,
                     force_objective_constant=force_objective_constant,
-                    include_all_variable_bounds=include_all_variable_bounds)
+                    include_all_variable_bounds=include_all_variable_bounds,
+                    repn_cache=repn_cache,
+                    processes=processes,
+                    chunk_size=chunk_size)
 
         self._referenced_variable_ids.clear()
 
@@ -388,7 +403,10 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                         column_order=None,
                         skip_trivial_constraints=False,
                         force_objective_constant=False,
-                        include_all_variable_bounds=False):
+                        include_all_variable_bounds=False,
+                        repn_cache=None,
+                        processes=None,
+                        chunk_size=10000):
 
         eq_string_template = self.eq_string_template
         leq_string_template = self.leq_string_template
@@ -398,6 +416,8 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
 
         symbol_map = SymbolMap()
         variable_symbol_map = SymbolMap()
+        if repn_cache is not None:
+            repn_cache.refresh()
         # NOTE: we use createSymbol instead of getSymbol because we
         #       know whether or not the symbol exists, and don't want
         #       to the overhead of error/duplicate checking.
@@ -511,7 +531,9 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                 else:
                     output.append("max \n")
 
-                if gen_obj_repn:
+                if repn_cache is not None:
+                    repn = repn_cache.get(objective_data)
+                elif gen_obj_repn:
                     repn = generate_standard_repn(objective_data.expr)
                     block_repn[objective_data] = repn
                 else:
@@ -590,31 +612,84 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                         assert not constraint_data.equality
                         continue # non-binding, so skip
 
-                    if constraint_data._linear_canonical_form:
-                        repn = constraint_data.canonical_form()
-                    elif gen_con_repn:
-                        repn = generate_standard_repn(constraint_data.body)
-                        block_repn[constraint_data] = repn
-                    else:
-                        repn = block_repn[constraint_data]
+                    yield constraint_data, gen_con_repn, block_repn
 
-                    yield constraint_data, repn
+        def get_repn(constraint_data, gen_con_repn, block_repn):
+            if constraint_data._linear_canonical_form:
+                repn = constraint_data.canonical_form()
+            elif repn_cache is not None:
+                repn = repn_cache.get(constraint_data)
+            elif gen_con_repn:
+                repn = generate_standard_repn(constraint_data.body)
+                block_repn[constraint_data] = repn
+            else:
+                repn = block_repn[constraint_data]
+            return repn
+
+        def format_row(constraint_data, repn):
+            #
+            # Returns the polynomial degree, the constant offset and
+            # the string for the body of the constraint.  The body
+            # is not generated for constraints that will be skipped
+            # (or rejected) by the caller.
+            #
+            degree = repn.polynomial_degree()
+            if (degree == 0 and skip_trivial_constraints) or \
+               (degree == 2 and not supports_quadratic_constraint) or \
+               degree is None:
+                return degree, None, None
+            body = []
+            offset = print_expr_canonical(repn,
+                                          body,
+                                          object_symbol_dictionary,
+                                          variable_symbol_dictionary,
+                                          False,
+                                          column_order)
+            return degree, offset, "".join(body)
 
         if row_order is not None:
-            sorted_constraint_list = list(constraint_generator())
-            sorted_constraint_list.sort(key=lambda x: row_order[x[0]])
-            def yield_all_constraints():
-                for data, repn in sorted_constraint_list:
-                    yield data, repn
+            constraint_list = list(constraint_generator())
+            constraint_list.sort(key=lambda x: row_order[x[0]])
         else:
-            yield_all_constraints = constraint_generator
+            constraint_list = constraint_generator()
+
+        if processes is not None and processes > 1:
+            #
+            # Generate the rows in chunks using a pool of worker
+            # processes.  The chunks are returned (and written) in
+            # order, so the file is identical to the serial output.
+            #
+            if row_order is None:
+                constraint_list = list(constraint_list)
+            variable_by_id = dict((id(vardata), vardata)
+                                  for vardata in variable_list)
+
+            def format_chunk(chunk):
+                self._referenced_variable_ids.clear()
+                rows = []
+                for data in constraint_list[chunk[0]:chunk[1]]:
+                    rows.append(format_row(data[0], get_repn(*data)))
+                return rows, list(self._referenced_variable_ids)
+
+            def all_rows():
+                referenced_variable_ids = self._referenced_variable_ids
+                chunks = [(i, i+chunk_size) for i in
+                          xrange(0, len(constraint_list), chunk_size)]
+                results = parallel_map(format_chunk, chunks, processes)
+                for (start, end), (rows, ids) in zip(chunks, results):
+                    for id_ in ids:
+                        referenced_variable_ids[id_] = variable_by_id[id_]
+                    for data, row in zip(constraint_list[start:end], rows):
+                        yield (data[0],) + row
+        else:
+            def all_rows():
+                for data in constraint_list:
+                    yield (data[0],) + format_row(data[0], get_repn(*data))
 
         # FIXME: This is a hack to get nested blocks working...
-        for constraint_data, repn in yield_all_constraints():
+        for constraint_data, degree, offset, body in all_rows():
             have_nontrivial = True
 
-            degree = repn.polynomial_degree()
-
             #
             # Write constraint
             #
@@ -648,12 +723,7 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                 alias_symbol_func(symbol_map, constraint_data, label)
                 output.append(label)
                 output.append(':\n')
-                offset = print_expr_canonical(repn,
-                                              output,
-                                              object_symbol_dictionary,
-                                              variable_symbol_dictionary,
-                                              False,
-                                              column_order)
+                output.append(body)
                 bound = constraint_data.lower
                 bound = _get_bound(bound) - offset
                 output.append(eq_string_template
@@ -668,12 +738,7 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     alias_symbol_func(symbol_map, constraint_data, label)
                     output.append(label)
                     output.append(':\n')
-                    offset = print_expr_canonical(repn,
-                                                  output,
-                                                  object_symbol_dictionary,
-                                                  variable_symbol_dictionary,
-                                                  False,
-                                                  column_order)
+                    output.append(body)
                     bound = constraint_data.lower
                     bound = _get_bound(bound) - offset
                     output.append(geq_string_template
@@ -689,12 +754,7 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                     alias_symbol_func(symbol_map, constraint_data, label)
                     output.append(label)
                     output.append(':\n')
-                    offset = print_expr_canonical(repn,
-                                                  output,
-                                                  object_symbol_dictionary,
-                                                  variable_symbol_dictionary,
-                                                  False,
-                                                  column_order)
+                    output.append(body)
                     bound = constraint_data.upper
                     bound = _get_bound(bound) - offset
                     output.append(leq_string_template
@@ -12,11 +12,14 @@
 # Problem Writer for (Free) MPS Format Files
 #
 
+import gzip
 import logging
 import math
 import operator
+from array import array
+from itertools import repeat
 
-from six import iteritems, iterkeys, StringIO
+from six import iteritems, iterkeys, StringIO, PY3
 from six.moves import xrange
 
 from pyutilib.misc import PauseGC
@@ -30,6 +33,12 @@ from pyomo.core.base import \
      ComponentMap, is_fixed)
 from pyomo.repn import generate_standard_repn
 
+try:
+    import numpy
+    has_numpy = True
+except:                                         #pragma:nocover
+    has_numpy = False
+
 logger = logging.getLogger('pyomo.core')
 
 def _no_negative_zero(val):
@@ -45,6 +54,90 @@ def _get_bound(exp):
         return value(exp)
     raise ValueError("non-fixed bound or weight: " + str(exp))
 
+def _open_output(filename):
+    """Open the output file, compressing it if the name ends in '.gz'."""
+    if filename.endswith('.gz'):
+        return gzip.open(filename, 'wt' if PY3 else 'wb')
+    return open(filename, "w")
+
+
+class _ColumnMajorMatrix(object):
+    """A sparse matrix that is assembled by row and read by column.
+
+    Rows are added in order, and entries are always added to the most
+    recently added row.  The nonzeros are stored in flat coordinate
+    arrays, which :meth:`to_csc` sorts into compressed sparse column
+    form.  Entries within a column keep the order of their rows.
+    """
+
+    __slots__ = ('ncols', 'row_labels', '_rows', '_cols', '_values')
+
+    def __init__(self, ncols):
+        self.ncols = ncols
+        self.row_labels = []
+        self._rows = array('l')
+        self._cols = array('l')
+        self._values = array('d')
+
+    def __len__(self):
+        """The number of nonzeros"""
+        return len(self._values)
+
+    def add_row(self, label):
+        self.row_labels.append(label)
+
+    def add_entries(self, cols, values):
+        self._rows.extend(repeat(len(self.row_labels)-1, len(cols)))
+        self._cols.extend(cols)
+        self._values.extend(values)
+
+    def add_entry(self, col, value):
+        self._rows.append(len(self.row_labels)-1)
+        self._cols.append(col)
+        self._values.append(value)
+
+    def to_csc(self):
+        """Return the (colptr, rowind, values) arrays for the matrix.
+
+        This releases the coordinate arrays, so no further entries may
+        be added.
+        """
+        rows, cols, values = self._rows, self._cols, self._values
+        self._rows = self._cols = self._values = None
+        nnz = len(values)
+        if has_numpy and nnz:
+            index_type = numpy.dtype(cols.typecode)
+            np_cols = numpy.frombuffer(cols, dtype=index_type)
+            # A stable sort keeps the row order within each column
+            order = numpy.argsort(np_cols, kind='mergesort')
+            colptr = numpy.zeros(self.ncols+1, dtype=index_type)
+            numpy.cumsum(numpy.bincount(np_cols, minlength=self.ncols),
+                         out=colptr[1:])
+            del np_cols, cols
+            rowind = numpy.frombuffer(rows, dtype=index_type)[order]
+            del rows
+            csc_values = numpy.frombuffer(values, dtype=numpy.float64)[order]
+            del values, order
+            return (array('l', colptr.tobytes()),
+                    array('l', rowind.tobytes()),
+                    array('d', csc_values.tobytes()))
+        # Counting sort by column
+        colptr = array('l', repeat(0, self.ncols+1))
+        for c in cols:
+            colptr[c+1] += 1
+        for c in xrange(self.ncols):
+            colptr[c+1] += colptr[c]
+        next_pos = array('l', colptr)
+        rowind = array('l', repeat(0, nnz))
+        csc_values = array('d', repeat(0, nnz))
+        for k in xrange(nnz):
+            c = cols[k]
+            pos = next_pos[c]
+            next_pos[c] = pos + 1
+            rowind[pos] = rows[k]
+            csc_values[pos] = values[k]
+        return colptr, rowind, csc_values
+
 
 @WriterFactory.register('mps', 'Generate the corresponding MPS file')
 class ProblemWriter_mps(AbstractProblemWriter):
@@ -157,7 +250,7 @@ class ProblemWriter_mps(AbstractProblemWriter):
         # are non-circular, everything will be collected
         # immediately anyway.
         with PauseGC() as pgc:
-            with open(output_filename, "w") as output_file:
+            with _open_output(output_filename) as output_file:
                 symbol_map = self._print_model_MPS(
                     model,
                     output_file,
@@ -184,13 +277,17 @@ class ProblemWriter_mps(AbstractProblemWriter):
             quadratic_data,
             variable_to_column):
 
+        column_data.add_row(row_label)
+
         #
         # Linear
         #
         if len(repn.linear_coefs) > 0:
-            for vardata, coef in zip(repn.linear_vars, repn.linear_coefs):
+            for vardata in repn.linear_vars:
                 self._referenced_variable_ids[id(vardata)] = vardata
-                column_data[variable_to_column[vardata]].append((row_label, coef))
+            column_data.add_entries(
+                [variable_to_column[vardata] for vardata in repn.linear_vars],
+                repn.linear_coefs)
 
         #
         # Quadratic
@@ -321,7 +418,9 @@ class ProblemWriter_mps(AbstractProblemWriter):
         variable_to_column = ComponentMap(
             (vardata, i) for i, vardata in enumerate(variable_list))
         # add one position for ONE_VAR_CONSTANT
-        column_data = [[] for i in xrange(len(variable_list)+1)]
+        one_var_constant = len(variable_list)
+        column_data = _ColumnMajorMatrix(len(variable_list)+1)
+        has_one_var_constant = False
         quadobj_data = []
         quadmatrix_data = []
         # constraint rhs
@@ -408,7 +507,8 @@ class ProblemWriter_mps(AbstractProblemWriter):
                     variable_to_column)
                 if force_objective_constant or (constant != 0.0):
                     # ONE_VAR_CONSTANT
-                    column_data[-1].append((objective_label, constant))
+                    column_data.add_entry(one_var_constant, constant)
+                    has_one_var_constant = True
 
         if numObj == 0:
             raise ValueError(
@@ -531,28 +631,33 @@ class ProblemWriter_mps(AbstractProblemWriter):
                 else:
                     assert constraint_data.has_lb()
 
-        if len(column_data[-1]) > 0:
+        if has_one_var_constant:
             # ONE_VAR_CONSTANT = 1
             output_file.write(" E  c_e_ONE_VAR_CONSTANT\n")
-            column_data[-1].append(("c_e_ONE_VAR_CONSTANT",1))
+            column_data.add_row("c_e_ONE_VAR_CONSTANT")
+            column_data.add_entry(one_var_constant, 1)
             rhs_data.append(("c_e_ONE_VAR_CONSTANT",1))
 
         #
         # COLUMNS section
         #
+        # The coefficients were collected by row; sort them into
+        # column-major order in a single pass.
+        row_labels = column_data.row_labels
+        colptr, rowind, coefs = column_data.to_csc()
+        del column_data
         column_template = "     %s %s %"+self._precision_string+"\n"
         output_file.write("COLUMNS\n")
-        cnt = 0
-        for vardata in variable_list:
-            col_entries = column_data[variable_to_column[vardata]]
-            cnt += 1
-            if len(col_entries) > 0:
+        for col, vardata in enumerate(variable_list):
+            start = colptr[col]
+            end = colptr[col+1]
+            if end > start:
                 var_label = variable_symbol_dictionary[id(vardata)]
-                for i, (row_label, coef) in enumerate(col_entries):
+                for i in xrange(start, end):
                     output_file.write(column_template
                                       % (var_label,
-                                         row_label,
-                                         _no_negative_zero(coef)))
+                                         row_labels[rowind[i]],
+                                         _no_negative_zero(coefs[i])))
             elif include_all_variable_bounds:
                 # the column is empty, so add a (0 * var)
                 # term to the objective
@@ -567,15 +672,15 @@ class ProblemWriter_mps(AbstractProblemWriter):
                                      objective_label,
                                      0))
 
-        assert cnt == len(column_data)-1
-        if len(column_data[-1]) > 0:
-            col_entries = column_data[-1]
+        if has_one_var_constant:
             var_label = "ONE_VAR_CONSTANT"
-            for i, (row_label, coef) in enumerate(col_entries):
+            for i in xrange(colptr[one_var_constant],
+                            colptr[one_var_constant+1]):
                 output_file.write(column_template
                                   % (var_label,
-                                     row_label,
-                                     _no_negative_zero(coef)))
+                                     row_labels[rowind[i]],
+                                     _no_negative_zero(coefs[i])))
+        del colptr, rowind, coefs
 
         #
         # RHS section
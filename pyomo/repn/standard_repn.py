@@ -252,7 +252,7 @@ to a solver and then be deleted.
 
 """
 #@profile
-def generate_standard_repn(expr, idMap=None, compute_values=True, verbose=False, quadratic=True, repn=None):
+def generate_standard_repn(expr, idMap=None, compute_values=True, verbose=False, quadratic=True, repn=None, named_expression_cache=None):
     #
     # Use a custom Results object
     #
@@ -262,6 +262,16 @@ def generate_standard_repn(expr, idMap=None, compute_values=True, verbose=False,
     else:
         Results = ResultsWithoutQuadratics
     #
+    # Memoize the repn of named expressions.  The cache is a
+    # dictionary that the caller may share across calls (e.g., while
+    # writing a model), so a named expression that is referenced by
+    # many constraints is only collected once.  The cached values are
+    # not updated, so the cache is only valid while the values of the
+    # parameters and fixed variables do not change.
+    #
+    global _named_expression_cache
+    _named_expression_cache = named_expression_cache
+    #
     # Use a custom isclose function
     #
     global isclose
@@ -358,6 +368,16 @@ def generate_standard_repn(expr, idMap=None, compute_values=True, verbose=False,
                 repn.linear_coefs = tuple(linear_coefs[key] for key in keys)
             repn.constant = C_
             return repn
+        #
+        # The expression is linear and stored in arrays
+        #
+        elif expr.__class__ is EXPR.ArrayLinearExpression:
+            ans = _collect_array_linear(expr, 1, idMap, compute_values, verbose, quadratic)
+            repn.constant = ans.constant
+            keys = list(ans.linear.keys())
+            repn.linear_vars = tuple(idMap[key] for key in keys)
+            repn.linear_coefs = tuple(ans.linear[key] for key in keys)
+            return repn
 
         #
         # Unknown expression object
@@ -428,6 +448,7 @@ class ResultsWithoutQuadratics(object):
         return "Const:\t%s\nLinear:\t%s\nNonlinear:\t%s" % (str(self.constant), str(self.linear), str(self.nonl))
 
 Results = ResultsWithQuadratics
+_named_expression_cache = None
 
 
 #@profile
@@ -833,8 +854,57 @@ def _collect_identity(exp, multiplier, idMap, compute_values, verbose, quadratic
             return Results(constant=multiplier*value(exp._args_[0]))
         else:
             return Results(constant=multiplier*exp._args_[0])
+    if _named_expression_cache is not None:
+        return _collect_cached_identity(exp, multiplier, idMap, compute_values, verbose, quadratic)
     return _collect_standard_repn(exp.expr, multiplier, idMap, compute_values, verbose, quadratic)
 
+def _collect_cached_identity(exp, multiplier, idMap, compute_values, verbose, quadratic):
+    #
+    # The cache stores the variables instead of the idMap keys, since
+    # the idMap may be different in each call to generate_standard_repn.
+    # The cached nonlinear expression is shared by every repn that
+    # references the named expression.
+    #
+    cache_key = (id(exp), compute_values, quadratic)
+    entry = _named_expression_cache.get(cache_key, None)
+    if entry is None or entry[0] is not exp or entry[1] is not exp.expr:
+        res = _collect_standard_repn(exp.expr, 1, idMap, compute_values, verbose, quadratic)
+        linear = tuple((idMap[key], coef) for key, coef in six.iteritems(res.linear))
+        if quadratic:
+            quad = tuple(((idMap[key[0]], idMap[key[1]]), coef)
+                         for key, coef in six.iteritems(res.quadratic))
+        else:
+            quad = ()
+        entry = (exp, exp.expr, res.constant, linear, quad, res.nonl)
+        _named_expression_cache[cache_key] = entry
+    _, _, constant, linear, quad, nonl = entry
+
+    varkeys = idMap[None]
+    def _key(v):
+        id_ = id(v)
+        if id_ in varkeys:
+            return varkeys[id_]
+        key = len(idMap) - 1
+        varkeys[id_] = key
+        idMap[key] = v
+        return key
+
+    ans = Results()
+    scale = not (multiplier.__class__ in native_numeric_types and multiplier == 1)
+    ans.constant = multiplier*constant if scale else constant
+    for v, coef in linear:
+        ans.linear[_key(v)] = multiplier*coef if scale else coef
+    for (v1, v2), coef in quad:
+        k1 = _key(v1)
+        k2 = _key(v2)
+        ndx = (k1, k2) if k1 <= k2 else (k2, k1)
+        ans.quadratic[ndx] = multiplier*coef if scale else coef
+    if scale and not (nonl.__class__ in native_numeric_types and nonl == 0):
+        ans.nonl = multiplier*nonl
+    else:
+        ans.nonl = nonl
+    return ans
+
 def _collect_linear(exp, multiplier, idMap, compute_values, verbose, quadratic):
     ans = Results()
     if compute_values:
@@ -868,6 +938,44 @@ def _collect_linear(exp, multiplier, idMap, compute_values, verbose, quadratic):
                     ans.linear[key] = multiplier*c
     return ans
 
+def _collect_array_linear(exp, multiplier, idMap, compute_values, verbose, quadratic):
+    #
+    # Terms that reference the same variable are combined with
+    # NumPy, so the Python loop below is over distinct variables
+    # instead of terms.
+    #
+    ans = Results()
+    if compute_values:
+        ans.constant = multiplier*value(exp.constant)
+    else:
+        ans.constant = multiplier*exp.constant
+
+    positions, coefs = exp.aggregate_terms()
+    if multiplier.__class__ in native_numeric_types:
+        coefs = coefs * multiplier
+        multiplier = 1
+    var_list = exp.var_list
+    for i, c in zip(positions.tolist(), coefs.tolist()):
+        v = var_list[i]
+        if v.fixed:
+            if compute_values:
+                ans.constant += multiplier*c*v.value
+            else:
+                ans.constant += multiplier*c*v
+        else:
+            id_ = id(v)
+            if id_ in idMap[None]:
+                key = idMap[None][id_]
+            else:
+                key = len(idMap) - 1
+                idMap[None][id_] = key
+                idMap[key] = v
+            if key in ans.linear:
+                ans.linear[key] += multiplier*c
+            else:
+                ans.linear[key] = multiplier*c
+    return ans
+
 def _collect_comparison(exp, multiplier, idMap, compute_values, verbose, quadratic):
     return Results(nonl=multiplier*exp)
 
@@ -888,6 +996,7 @@ _repn_collectors = {
     EXPR.AbsExpression                          : _collect_nonl,
     EXPR.NegationExpression                     : _collect_negation,
     EXPR.LinearExpression                       : _collect_linear,
+    EXPR.ArrayLinearExpression                  : _collect_array_linear,
     EXPR.InequalityExpression                   : _collect_comparison,
     EXPR.RangedExpression                       : _collect_comparison,
     EXPR.EqualityExpression                     : _collect_comparison,
@@ -1278,6 +1387,7 @@ _linear_repn_collectors = {
     #EXPR.AbsExpression                          : _linear_collect_nonl,
     EXPR.NegationExpression                     : _linear_collect_negation,
     EXPR.LinearExpression                       : _linear_collect_linear,
+    EXPR.ArrayLinearExpression                  : _linear_collect_linear,
     #EXPR.InequalityExpression                   : _linear_collect_comparison,
     #EXPR.RangedExpression                       : _linear_collect_comparison,
     #EXPR.EqualityExpression                     : _linear_collect_comparison,
@@ -14,11 +14,14 @@
 import os
 import random
 
+from six import iteritems
+
 import pyutilib.th as unittest
 
 from pyomo.common.getGSL import find_GSL
 from pyomo.environ import *
 import pyomo.opt
+from pyomo.core.expr.symbol_map import IndexSymbolMap
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 
@@ -188,6 +191,73 @@ class TestNLWriter(unittest.TestCase):
             delete=True)
         self._cleanup(test_fname)
 
+    def test_defined_variables(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=1)
+        m.y = Var(initialize=2)
+        m.e = Expression(expr=m.x**2*exp(m.y) + 3*m.x)
+        h = sin(m.x*m.y)
+        m.c1 = Constraint(expr=m.e + m.y <= 10)
+        m.c2 = Constraint(expr=2*m.e - h >= 1)
+        m.c3 = Constraint(expr=h + cos(m.e) == 0)
+        m.o = Objective(expr=m.e + h)
+
+        baseline_fname, test_fname = self._get_fnames()
+        self._cleanup(test_fname)
+        m.write(test_fname, format='nl',
+                io_options={'export_defined_variables': True})
+        self.assertFileEqualsBaseline(
+            test_fname,
+            baseline_fname,
+            delete=True)
+        self._cleanup(test_fname)
+
+    def test_compact_symbol_map(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], bounds=(0,None))
+        m.c1 = Constraint(expr=m.x[1]**2 + m.x[2] >= 1)
+        m.c2 = Constraint(expr=m.x[2] + m.x[3] <= 4)
+        m.o = Objective(expr=m.x[1] + m.x[3])
+        m.junk = Suffix(direction=Suffix.EXPORT, datatype=Suffix.INT)
+        m.junk[m.x[3]] = 2
+        m.junk[m.c2] = 3
+        m.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
+        m.dual[m.c1] = 1.5
+
+        baseline_fname, test_fname = self._get_fnames()
+        self._cleanup(baseline_fname)
+        self._cleanup(test_fname)
+        _, baseline_id = m.write(baseline_fname, format='nl')
+        _, test_id = m.write(test_fname, format='nl',
+                             io_options={'compact_symbol_map':True})
+        self.assertFileEqualsBaseline(test_fname, baseline_fname,
+                                      delete=False)
+        self._cleanup(baseline_fname)
+        self._cleanup(test_fname)
+
+        baseline_smap = m.solutions.symbol_map[baseline_id]
+        test_smap = m.solutions.symbol_map[test_id]
+        self.assertIs(type(test_smap), IndexSymbolMap)
+        self.assertEqual(sorted(test_smap.bySymbol.keys()),
+                         sorted(baseline_smap.bySymbol.keys()))
+        for symbol, obj in iteritems(baseline_smap.bySymbol):
+            self.assertIs(test_smap.getObject(symbol), obj())
+            self.assertEqual(test_smap.getSymbol(obj()), symbol)
+        self.assertIs(test_smap.getObject('__default_objective__'), m.o)
+
+        # Loading a solution uses the same symbols
+        results = pyomo.opt.SolverResults()
+        results._smap_id = test_id
+        soln = results.solution.add()
+        soln.variable['v0'] = {'Value': 1.0}
+        soln.variable['v2'] = {'Value': 3.0}
+        soln.constraint['c1'] = {'Dual': 0.5}
+        var = test_smap.getObject('v0')
+        m.solutions.load_from(results)
+        self.assertEqual(var.value, 1.0)
+        self.assertEqual(test_smap.getObject('v2').value, 3.0)
+        self.assertEqual(m.dual[test_smap.getObject('c1')], 0.5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -18,6 +18,14 @@ import pyutilib.th as unittest
 
 from pyomo.environ import *
 import pyomo.opt
+from pyomo.common.parallel import fork_available
+from pyomo.core.expr import current as EXPR
+
+try:
+    import numpy
+    numpy_available = True
+except:
+    numpy_available = False
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 
@@ -66,6 +74,33 @@ class TestCPXLPOrdering(unittest.TestCase):
                 expr += term
         return expr
 
+    @unittest.skipIf(not numpy_available, "Numpy is not available")
+    def test_array_linear_expression(self):
+        def _build(array):
+            model = ConcreteModel()
+            model.x = Var(range(4))
+            xlist = list(model.x.values())
+            rows = [([1, 2.5], [0, 3]), ([-1, 1, 4], [2, 1, 2])]
+            model.c = ConstraintList()
+            for coefs, idx in rows:
+                if array:
+                    body = EXPR.array_linear_expression(coefs, xlist, idx)
+                else:
+                    body = quicksum(c*xlist[i] for c,i in zip(coefs, idx))
+                model.c.add(body >= 1)
+            model.obj = Objective(expr=sum(xlist))
+            return model
+
+        baseline_fname, test_fname = self._get_fnames()
+        self._cleanup(baseline_fname)
+        self._cleanup(test_fname)
+        _build(False).write(baseline_fname, format="lp")
+        _build(True).write(test_fname, format="lp")
+        try:
+            self.assertFileEqualsBaseline(test_fname, baseline_fname)
+        finally:
+            self._cleanup(baseline_fname)
+
     def test_no_column_ordering_quadratic(self):
         model = ConcreteModel()
         model.a = Var()
@@ -236,6 +271,50 @@ class TestCPXLP_writer(unittest.TestCase):
         self._cleanup(test_fname)
 
 
+    @unittest.skipIf(not fork_available(), "Cannot fork worker processes")
+    def test_parallel_chunks(self):
+        model = ConcreteModel()
+        model.x = Var(range(20), bounds=(0, 1))
+        model.c = Constraint(
+            range(50),
+            rule=lambda m, i: (-1, sum((j+1)*m.x[(i+j) % 20]
+                                        for j in range(4)), i))
+        model.d = Constraint(expr=model.x[0] + model.x[1] == 1)
+        model.q = Constraint(expr=model.x[3]*model.x[4] <= 4)
+        model.t = Constraint(expr=model.x[5] - model.x[5] <= 1)
+        model.obj = Objective(expr=sum(model.x.values()))
+
+        baseline_fname, test_fname = self._get_fnames()
+        self._cleanup(baseline_fname)
+        self._cleanup(test_fname)
+        try:
+            for options in ({}, {'symbolic_solver_labels': True},
+                            {'skip_trivial_constraints': True}):
+                model.write(baseline_fname, format='lp', io_options=options)
+                options = dict(options, processes=2, chunk_size=7)
+                model.write(test_fname, format='lp', io_options=options)
+                self.assertFileEqualsBaseline(test_fname, baseline_fname,
+                                              delete=False)
+        finally:
+            self._cleanup(baseline_fname)
+            self._cleanup(test_fname)
+
+    @unittest.skipIf(not fork_available(), "Cannot fork worker processes")
+    def test_parallel_chunks_nonlinear(self):
+        model = ConcreteModel()
+        model.x = Var(range(3))
+        model.c = Constraint(range(3), rule=lambda m, i: m.x[i] <= i)
+        model.n = Constraint(expr=exp(model.x[0]) <= 4)
+        model.obj = Objective(expr=model.x[0])
+
+        baseline_fname, test_fname = self._get_fnames()
+        try:
+            with self.assertRaisesRegexp(ValueError, "Constraint 'n' has"):
+                model.write(test_fname, format='lp',
+                            io_options={'processes': 2, 'chunk_size': 1})
+        finally:
+            self._cleanup(test_fname)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,7 @@
 # Test the canonical expressions
 #
 
+import gzip
 import os
 import random
 
@@ -18,6 +19,7 @@ import pyutilib.th as unittest
 
 from pyomo.environ import *
 import pyomo.opt
+import pyomo.repn.plugins.mps as mps
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 
@@ -169,5 +171,53 @@ class TestMPSOrdering(unittest.TestCase):
         row_order[model.con4[2]] = -1
         self._check_baseline(model, row_order=row_order)
 
+    def test_gzip_output(self):
+        model = ConcreteModel()
+        model.a = Var()
+        model.b = Var(within=Integers)
+        model.obj = Objective(expr=model.a + 2*model.b + 3)
+        model.con = Constraint(expr=(0, model.a - model.b, 1))
+        fname = os.path.join(thisdir, "gzip_output.mps")
+        try:
+            model.write(fname, format="mps")
+            model.write(fname+".gz", format="mps")
+            with open(fname) as f:
+                baseline = f.read()
+            with gzip.open(fname+".gz", "rb") as f:
+                self.assertEqual(f.read().decode(), baseline)
+        finally:
+            self._cleanup(fname)
+            self._cleanup(fname+".gz")
+
+
+class TestColumnMajorMatrix(unittest.TestCase):
+
+    def _check_matrix(self):
+        data = mps._ColumnMajorMatrix(4)
+        data.add_row('r0')
+        data.add_entries([2, 0], [1.5, -2])
+        data.add_row('r1')
+        data.add_row('r2')
+        data.add_entries([0, 3, 2], [3, 4, 5])
+        data.add_entry(1, 6)
+        self.assertEqual(len(data), 6)
+        self.assertEqual(data.row_labels, ['r0', 'r1', 'r2'])
+        colptr, rowind, values = data.to_csc()
+        self.assertEqual(list(colptr), [0, 2, 3, 5, 6])
+        self.assertEqual(list(rowind), [0, 2, 2, 0, 2, 2])
+        self.assertEqual(list(values), [-2, 3, 6, 1.5, 5, 4])
+
+    def test_to_csc(self):
+        tmp = mps.has_numpy
+        try:
+            mps.has_numpy = False
+            self._check_matrix()
+        finally:
+            mps.has_numpy = tmp
+
+    @unittest.skipIf(not mps.has_numpy, "NumPy is not available")
+    def test_to_csc_numpy(self):
+        self._check_matrix()
+
 if __name__ == "__main__":
     unittest.main()
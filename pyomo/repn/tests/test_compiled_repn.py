@@ -0,0 +1,231 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Test the cached standard representation
+#
+
+import os
+
+import pyutilib.th as unittest
+
+from pyomo.environ import *
+from pyomo.repn import StandardRepnCache, generate_standard_repn
+
+thisdir = os.path.dirname(os.path.abspath(__file__))
+
+
+def _model():
+    m = ConcreteModel()
+    m.I = RangeSet(3)
+    m.x = Var(m.I, initialize=1)
+    m.p = Param(m.I, mutable=True, initialize={1:1, 2:2, 3:3})
+    m.q = Param(mutable=True, initialize=10)
+    m.c1 = Constraint(expr=sum(m.p[i]*m.x[i] for i in m.I) + m.q >= 0)
+    m.c2 = Constraint(expr=m.q*m.x[1]*m.x[2] + m.x[3] <= 5)
+    m.c3 = Constraint(expr=m.x[1] + m.x[2] == 1)
+    m.o = Objective(expr=m.p[1]*m.x[1]**2 + m.x[3])
+    return m
+
+
+def _repn_dict(repn):
+    ans = {}
+    for v, c in zip(repn.linear_vars, repn.linear_coefs):
+        ans[v.name] = c
+    for (v1, v2), c in zip(repn.quadratic_vars, repn.quadratic_coefs):
+        ans[tuple(sorted((v1.name, v2.name)))] = c
+    ans[None] = repn.constant
+    ans['nonlinear'] = repn.nonlinear_expr is not None
+    return ans
+
+
+class TestStandardRepnCache(unittest.TestCase):
+
+    def assertRepnEqual(self, cache, obj):
+        try:
+            expr = obj.body
+        except AttributeError:
+            expr = obj.expr
+        self.assertEqual(_repn_dict(cache.get(obj)),
+                         _repn_dict(generate_standard_repn(expr)))
+
+    def test_matches_generate_standard_repn(self):
+        m = _model()
+        cache = StandardRepnCache()
+        for obj in (m.c1, m.c2, m.c3, m.o):
+            self.assertRepnEqual(cache, obj)
+        self.assertEqual(len(cache), 4)
+        self.assertIn(m.c1, cache)
+
+    def test_reuse(self):
+        m = _model()
+        cache = StandardRepnCache()
+        repn = cache.get(m.c1)
+        self.assertIs(cache.get(m.c1), repn)
+        self.assertEqual(cache.refresh(), 0)
+        self.assertIs(cache.get(m.c1), repn)
+
+    def test_param_change(self):
+        m = _model()
+        cache = StandardRepnCache()
+        for obj in (m.c1, m.c2, m.c3, m.o):
+            cache.get(obj)
+        c3 = cache.get(m.c3)
+        m.p[2] = 7
+        # Only the x[2] coefficient in c1 depends on p[2]
+        self.assertEqual(cache.refresh(), 1)
+        self.assertIs(cache.get(m.c3), c3)
+        self.assertEqual(_repn_dict(cache.get(m.c1))['x[2]'], 7)
+        m.q = 4
+        # The constant of c1 and the quadratic coefficient of c2
+        self.assertEqual(cache.refresh(), 2)
+        for obj in (m.c1, m.c2, m.c3, m.o):
+            self.assertRepnEqual(cache, obj)
+
+    def test_zero_coefficient(self):
+        m = _model()
+        cache = StandardRepnCache()
+        self.assertEqual(len(cache.get(m.c1).linear_vars), 3)
+        m.p[1] = 0
+        cache.refresh()
+        self.assertEqual(len(cache.get(m.c1).linear_vars), 2)
+        m.p[1] = 5
+        cache.refresh()
+        self.assertEqual(_repn_dict(cache.get(m.c1))['x[1]'], 5)
+
+    def test_fixed_variable(self):
+        m = _model()
+        cache = StandardRepnCache()
+        repn = cache.get(m.c3)
+        m.x[1].fix(4)
+        self.assertIsNot(cache.get(m.c3), repn)
+        self.assertRepnEqual(cache, m.c3)
+        self.assertEqual(cache.get(m.c3).constant, 4)
+        # Changing the value of a fixed variable is a coefficient update
+        m.x[1].value = 6
+        self.assertEqual(cache.refresh(), 1)
+        self.assertEqual(cache.get(m.c3).constant, 6)
+        m.x[1].unfix()
+        self.assertRepnEqual(cache, m.c3)
+        self.assertEqual(len(cache.get(m.c3).linear_vars), 2)
+
+    def test_fixed_quadratic(self):
+        m = _model()
+        cache = StandardRepnCache()
+        cache.get(m.c2)
+        m.x[1].fix(2)
+        self.assertRepnEqual(cache, m.c2)
+        m.x[1].value = 3
+        cache.refresh()
+        self.assertRepnEqual(cache, m.c2)
+
+    def test_expression_change(self):
+        m = _model()
+        cache = StandardRepnCache()
+        cache.get(m.c3)
+        m.c3.set_value(m.x[1] - 2*m.x[3] == 1)
+        self.assertRepnEqual(cache, m.c3)
+        self.assertEqual(_repn_dict(cache.get(m.c3))['x[3]'], -2)
+
+    def test_named_expression_change(self):
+        m = _model()
+        m.e = Expression(expr=m.p[3]*m.x[3])
+        m.c4 = Constraint(expr=m.e + m.x[1] <= 1)
+        cache = StandardRepnCache()
+        self.assertEqual(_repn_dict(cache.get(m.c4))['x[3]'], 3)
+        m.e.expr = 5*m.x[2]
+        self.assertRepnEqual(cache, m.c4)
+        self.assertNotIn('x[3]', _repn_dict(cache.get(m.c4)))
+
+    def test_leaf_expression(self):
+        m = _model()
+        m.c4 = Constraint(expr=m.x[1] >= 0)
+        m.c5 = Constraint(expr=m.q <= 5)
+        cache = StandardRepnCache()
+        self.assertRepnEqual(cache, m.c4)
+        self.assertRepnEqual(cache, m.c5)
+        m.q = 3
+        cache.refresh()
+        self.assertEqual(cache.get(m.c5).constant, 3)
+
+    def test_param_exponent(self):
+        m = _model()
+        m.n = Param(mutable=True, initialize=0)
+        m.c4 = Constraint(expr=m.x[1]**m.n + m.p[2]*m.x[2] <= 5)
+        cache = StandardRepnCache()
+        for n in (0, 1, 2, 0):
+            m.n = n
+            cache.refresh()
+            self.assertRepnEqual(cache, m.c4)
+        self.assertEqual(cache.get(m.c4).constant, 1)
+        m.n = 2
+        self.assertEqual(len(cache.get(m.c4).quadratic_vars), 1)
+        m.p[2] = 4
+        self.assertEqual(_repn_dict(cache.get(m.c4))['x[2]'], 4)
+
+    def test_fixed_exponent(self):
+        m = _model()
+        m.y = Var()
+        m.y.fix(1)
+        m.c4 = Constraint(expr=m.x[1]**m.y <= 5)
+        cache = StandardRepnCache()
+        for val in (1, 2, 0):
+            m.y.value = val
+            self.assertRepnEqual(cache, m.c4)
+        m.y.unfix()
+        self.assertRepnEqual(cache, m.c4)
+        self.assertIsNotNone(cache.get(m.c4).nonlinear_expr)
+
+    def test_expr_if(self):
+        m = _model()
+        m.flag = Param(mutable=True, initialize=1)
+        m.c4 = Constraint(
+            expr=Expr_if(IF=m.flag, THEN=m.x[1], ELSE=m.x[2]**2) <= 5)
+        cache = StandardRepnCache()
+        self.assertRepnEqual(cache, m.c4)
+        self.assertEqual(cache.get(m.c4).linear_vars, (m.x[1],))
+        m.flag = 0
+        self.assertRepnEqual(cache, m.c4)
+        self.assertEqual(len(cache.get(m.c4).quadratic_vars), 1)
+
+    def test_invalidate(self):
+        m = _model()
+        cache = StandardRepnCache()
+        cache.get(m.c1)
+        cache.get(m.c2)
+        cache.invalidate(m.c1)
+        self.assertNotIn(m.c1, cache)
+        self.assertIn(m.c2, cache)
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+
+    def test_lp_writer(self):
+        m = _model()
+        m.del_component(m.c2)
+        m.del_component(m.o)
+        m.o = Objective(expr=m.p[1]*m.x[1] + m.x[3])
+        cache = StandardRepnCache()
+        baseline_fname = os.path.join(thisdir, "compiled_repn.lp.baseline")
+        test_fname = os.path.join(thisdir, "compiled_repn.lp.out")
+        try:
+            for val in (1, 5):
+                m.p[1] = val
+                m.write(baseline_fname, format="lp")
+                m.write(test_fname, format="lp",
+                        io_options={'repn_cache': cache})
+                self.assertFileEqualsBaseline(test_fname, baseline_fname,
+                                              delete=False)
+        finally:
+            for fname in (baseline_fname, test_fname):
+                if os.path.exists(fname):
+                    os.remove(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
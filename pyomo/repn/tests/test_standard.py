@@ -29,6 +29,12 @@ from pyomo.core.base.numvalue import native_numeric_types, as_numeric
 from six import iteritems
 from six.moves import range
 
+try:
+    import numpy
+    numpy_available = True
+except:
+    numpy_available = False
+
 class frozendict(dict):
     __slots__ = ('_hash',)
     def __hash__(self):
@@ -4091,5 +4097,96 @@ class Test(unittest.TestCase):
         e = Foo()
         self.assertRaises(AttributeError, generate_standard_repn, e)
 
+@unittest.skipIf(not numpy_available, "Numpy is not available")
+class TestArrayLinearExpression(unittest.TestCase):
+
+    def setUp(self):
+        self.m = ConcreteModel()
+        self.m.A = RangeSet(5)
+        self.m.v = Var(self.m.A, initialize=2)
+        self.vlist = list(self.m.v.values())
+
+    def test_linear(self):
+        e = EXPR.array_linear_expression(
+            [1, -2, 3, 4], self.vlist, [0, 1, 4, 1], 5)
+        rep = generate_standard_repn(e)
+        self.assertEqual(str(rep.to_expression()), "5 + v[1] + 2.0*v[2] + 3.0*v[5]")
+        self.assertTrue(all(type(c) is float for c in rep.linear_coefs))
+        rep = generate_standard_repn(e, compute_values=False)
+        self.assertEqual(str(rep.to_expression()), "5 + v[1] + 2.0*v[2] + 3.0*v[5]")
+
+    def test_fixed(self):
+        e = EXPR.array_linear_expression(
+            [1, -2, 3, 4], self.vlist, [0, 1, 4, 1], 5)
+        self.m.v[2].fix(3)
+        rep = generate_standard_repn(e)
+        self.assertEqual(str(rep.to_expression()), "11.0 + v[1] + 3.0*v[5]")
+        rep = generate_standard_repn(e, compute_values=False)
+        self.assertEqual(str(rep.to_expression()), "5 + 2.0*v[2] + v[1] + 3.0*v[5]")
+
+    def test_matches_linear_expression(self):
+        coefs = [0.5, 1, -1, 2.5, 3]
+        idx = [4, 2, 0, 3, 2]
+        e = EXPR.array_linear_expression(coefs, self.vlist, idx)
+        f = quicksum(c*self.vlist[i] for c,i in zip(coefs, idx))
+        self.assertEqual(repn_to_dict(generate_standard_repn(e)),
+                         repn_to_dict(generate_standard_repn(f)))
+
+    def test_nested(self):
+        m = self.m
+        e = EXPR.array_linear_expression([1, 2], self.vlist, [0, 1], 1)
+        rep = generate_standard_repn(3*e + m.v[1]*m.v[2])
+        self.assertEqual(str(rep.to_expression()), "3 + 3.0*v[1] + 6.0*v[2] + v[1]*v[2]")
+        rep = generate_standard_repn(m.v[1] + e, quadratic=False)
+        self.assertEqual(str(rep.to_expression()), "1 + 2.0*v[1] + 2.0*v[2]")
+
+
+
+class TestNamedExpressionCache(unittest.TestCase):
+
+    def setUp(self):
+        m = self.m = ConcreteModel()
+        m.x = Var(initialize=1)
+        m.y = Var(initialize=2)
+        m.p = Param(mutable=True, initialize=3)
+        m.e = Expression(expr=m.p*m.x + m.x*m.y + exp(m.y) + sin(m.x) + 4)
+
+    def test_matches_uncached(self):
+        m = self.m
+        for expr in (m.e, 2*m.e + m.y, m.x*m.e, m.e - m.e):
+            for quadratic in (True, False):
+                cache = {}
+                for i in range(2):
+                    self.assertEqual(
+                        repn_to_dict(generate_standard_repn(
+                            expr, quadratic=quadratic,
+                            named_expression_cache=cache)),
+                        repn_to_dict(generate_standard_repn(
+                            expr, quadratic=quadratic)))
+
+    def test_shared_nonlinear_expr(self):
+        m = self.m
+        cache = {}
+        rep1 = generate_standard_repn(m.e + m.x, named_expression_cache=cache)
+        rep2 = generate_standard_repn(m.y + m.e, named_expression_cache=cache)
+        self.assertIs(rep1.nonlinear_expr, rep2.nonlinear_expr)
+        self.assertEqual(len(cache), 1)
+        rep3 = generate_standard_repn(3*m.e, named_expression_cache=cache)
+        self.assertIs(rep3.nonlinear_expr.arg(1), rep1.nonlinear_expr)
+        self.assertEqual(str(rep3.to_expression()),
+                         "12 + 9*x + 3*x*y + 3*(exp(y) + sin(x))")
+        # Without the cache, each repn has its own nonlinear expression
+        rep4 = generate_standard_repn(m.e + m.x)
+        self.assertIsNot(rep4.nonlinear_expr, rep1.nonlinear_expr)
+
+    def test_replaced_expression(self):
+        m = self.m
+        cache = {}
+        generate_standard_repn(m.e + m.x, named_expression_cache=cache)
+        m.e.expr = 5*m.y
+        rep = generate_standard_repn(m.e + m.x, named_expression_cache=cache)
+        self.assertEqual(repn_to_dict(rep), {id(m.x): 1, id(m.y): 5})
+
+
 if __name__ == "__main__":
     unittest.main()
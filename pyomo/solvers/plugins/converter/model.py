@@ -49,6 +49,8 @@ class PyomoMIPConverter(object):
         import pyomo.scripting.convert
 
         capabilities = kwds.pop("capabilities", None)
+        # The problem file name (e.g., a named pipe) chosen by the solver
+        _problem_filename = kwds.pop("_problem_filename", None)
 
         # all non-consumed keywords are assumed to be options
         # that should be passed to the writer.
@@ -69,8 +71,10 @@ class PyomoMIPConverter(object):
             instance = args[2]
 
         if args[1] == ProblemFormat.cpxlp:
-            problem_filename = pyutilib.services.TempfileManager.\
-                               create_tempfile(suffix = '.pyomo.lp')
+            problem_filename = _problem_filename
+            if problem_filename is None:
+                problem_filename = pyutilib.services.TempfileManager.\
+                                   create_tempfile(suffix = '.pyomo.lp')
             if instance is not None:
                 if isinstance(instance, IBlock):
                     symbol_map_id = instance.write(
@@ -160,9 +164,11 @@ class PyomoMIPConverter(object):
                 return (problem_filename,),symbol_map
 
         elif args[1] in [ProblemFormat.mps, ProblemFormat.nl]:
+            problem_filename = _problem_filename
             if args[1] == ProblemFormat.nl:
-                problem_filename = pyutilib.services.TempfileManager.\
-                                   create_tempfile(suffix = '.pyomo.nl')
+                if problem_filename is None:
+                    problem_filename = pyutilib.services.TempfileManager.\
+                                       create_tempfile(suffix = '.pyomo.nl')
                 if io_options.get("symbolic_solver_labels", False):
                     pyutilib.services.TempfileManager.add_tempfile(
                         problem_filename[:-3]+".row",
@@ -172,8 +178,9 @@ class PyomoMIPConverter(object):
                         exists=False)
             else:
                 assert args[1] == ProblemFormat.mps
-                problem_filename = pyutilib.services.TempfileManager.\
-                                   create_tempfile(suffix = '.pyomo.mps')
+                if problem_filename is None:
+                    problem_filename = pyutilib.services.TempfileManager.\
+                                       create_tempfile(suffix = '.pyomo.mps')
             if instance is not None:
                 if isinstance(instance, IBlock):
                     symbol_map_id = instance.write(
@@ -10,3 +10,4 @@
 
 import pyomo.solvers.plugins.smanager.pyro
 import pyomo.solvers.plugins.smanager.phpyro
+import pyomo.solvers.plugins.smanager.pool
@@ -0,0 +1,384 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+
+__all__ = []
+
+import multiprocessing
+import sys
+import time
+import traceback
+try:
+    import cPickle as pickle
+except:
+    import pickle
+
+try:
+    from collections import OrderedDict
+except ImportError:                         #pragma:nocover
+    from ordereddict import OrderedDict
+
+try:
+    from multiprocessing.connection import wait as _wait
+except ImportError:                         #pragma:nocover
+    def _wait(connections):
+        while True:
+            ready = [c for c in connections if c.poll(0.01)]
+            if ready:
+                return ready
+
+import pyomo.opt
+from pyomo.common.parallel import fork_available
+from pyomo.opt.parallel.manager import (ActionManagerError,
+                                        ActionStatus,
+                                        ActionHandle)
+from pyomo.opt.parallel.async_solver import (AsynchronousSolverManager,
+                                             SolverManagerFactory)
+from pyomo.core.base import Block, Var, Constraint, Objective
+from pyomo.core.expr.symbol_map import SymbolMap, IndexSymbolMap
+
+from six import iteritems, itervalues, string_types
+
+
+def _model_components(model):
+    """
+    Return the lists of variables, active constraints and active
+    objectives of a model.  A worker process and the manager build
+    these lists from the same model state, so the position of a
+    component in a list identifies it in both processes.
+    """
+    return {
+        'v': list(model.component_data_objects(Var)),
+        'c': list(model.component_data_objects(Constraint, active=True)),
+        'o': list(model.component_data_objects(Objective, active=True)),
+    }
+
+
+def _compact_results(results, components):
+    """
+    Replace the label-keyed maps of the solutions in a results object
+    with position-keyed arrays (see ResultsReader_sol) that refer to
+    the component lists of the model.
+    """
+    smap = results.__dict__.get('_smap', None)
+    results._smap = None
+    if smap is None:
+        if len(results.solution):
+            raise ActionManagerError(
+                "The solver did not return a symbol map for the solutions")
+        return
+    for soln in results.solution:
+        arrays = {}
+        for name, prefix in (('variable', 'v'),
+                             ('constraint', 'c'),
+                             ('objective', 'o')):
+            position = dict((id(obj), i)
+                            for i, obj in enumerate(components[prefix]))
+            data = arrays[name] = {}
+            entries = getattr(soln, name)
+            for symb, entry in iteritems(entries):
+                obj = smap.bySymbol.get(symb, None)
+                if obj is None:
+                    obj = smap.aliases.get(symb, None)
+                    if obj is None:
+                        continue
+                i = position.get(id(obj()), None)
+                if i is None:
+                    continue
+                for key, val in iteritems(entry):
+                    data.setdefault(key, {})[i] = val
+            entries.clear()
+        soln._arrays = arrays
+
+
+def _symbol_table(results, components):
+    """
+    Replace the symbol map of a results object with a table of the
+    symbols (and aliases) of the components, by the position of each
+    component in the component lists of the model.  The manager uses
+    this table to rebuild the symbol map, so the solutions keep their
+    label-keyed maps.
+    """
+    smap = results.__dict__.get('_smap', None)
+    results._smap = None
+    if smap is None:
+        return None
+    symbols = {}
+    position = {}
+    for prefix, objs in iteritems(components):
+        symbols[prefix] = [smap.byObject.get(id(obj), None) for obj in objs]
+        position.update((id(obj), (prefix, i)) for i, obj in enumerate(objs))
+    aliases = []
+    for name, obj in iteritems(smap.aliases):
+        i = position.get(id(obj()), None)
+        if i is not None:
+            aliases.append((name, i))
+    return symbols, aliases
+
+
+def _restore_symbol_map(table, components):
+    """
+    Create a symbol map for the components of the model from the table
+    returned by _symbol_table().
+    """
+    symbols, aliases = table
+    smap = SymbolMap()
+    for prefix, objs in iteritems(components):
+        smap.addSymbols((obj, symb)
+                        for obj, symb in zip(objs, symbols[prefix])
+                        if symb is not None)
+    for name, (prefix, i) in aliases:
+        smap.alias(components[prefix][i], name)
+    return smap
+
+
+def _worker(conn, opt, args, kwds, components):
+    """
+    Solve a model in a worker process and send the results to the
+    manager.  The results are compact (see _compact_results) if the
+    manager loads the solutions into the model.
+    """
+    try:
+        time_start = time.time()
+        load_solutions = kwds.get('load_solutions', True)
+        kwds['load_solutions'] = False
+        if isinstance(opt, string_types):
+            with pyomo.opt.SolverFactory(opt) as _opt:
+                results = _opt.solve(*args, **kwds)
+                default_variable_value = _opt._default_variable_value
+        else:
+            results = opt.solve(*args, **kwds)
+            default_variable_value = opt._default_variable_value
+        results.pyomo_solve_time = time.time()-time_start
+        if load_solutions:
+            _compact_results(results, components)
+            symbols = None
+        else:
+            symbols = _symbol_table(results, components)
+        data = pickle.dumps(
+            (True, (results, default_variable_value, symbols)),
+            pickle.HIGHEST_PROTOCOL)
+    except:
+        data = pickle.dumps(
+            (False, "".join(traceback.format_exception(*sys.exc_info()))),
+            pickle.HIGHEST_PROTOCOL)
+    conn.send_bytes(data)
+    conn.close()
+
+
+class _Job(object):
+
+    __slots__ = ('ah', 'opt', 'solver', 'args', 'kwds', 'model',
+                 'components', 'process', 'conn')
+
+    def __init__(self, ah, opt, solver, args, kwds):
+        self.ah = ah
+        self.opt = opt
+        self.solver = solver
+        self.args = args
+        self.kwds = kwds
+        self.model = args[0]
+        self.components = None
+        self.process = None
+        self.conn = None
+
+
+@SolverManagerFactory.register("pool", doc="Execute solvers concurrently in local worker processes")
+class SolverManager_Pool(AsynchronousSolverManager):
+    """
+    A solver manager that executes queued solves concurrently in
+    worker processes on the local machine.
+
+    Each solve is run in a process that is forked from the manager
+    process when the solve is started, so the model is not pickled.
+    The worker writes the problem file, runs the solver and sends back
+    the results, where the solutions are stored by the position of
+    each component in the model rather than by label.  The solutions
+    are loaded into the model (unless load_solutions=False) when the
+    manager collects the results.  A model must not be changed
+    between queuing a solve and collecting its results.
+
+    Args:
+        processes (int): The maximum number of concurrent solves.
+            The default is the number of CPUs.
+        solver_limits (dict): The maximum number of concurrent solves
+            for each solver name (e.g., the number of licenses).
+
+    If worker processes cannot be forked on this platform, then the
+    solves are executed when they are queued.
+    """
+
+    def __init__(self, **kwds):
+        self._processes = kwds.pop('processes', None)
+        if self._processes is None:
+            self._processes = multiprocessing.cpu_count()
+        self._solver_limits = dict(kwds.pop('solver_limits', None) or {})
+        AsynchronousSolverManager.__init__(self, **kwds)
+
+    def clear(self):
+        """
+        Clear manager state
+        """
+        super(SolverManager_Pool, self).clear()
+        self.results = OrderedDict()
+        self._pending = []
+        self._running = {}
+        self._done = OrderedDict()
+
+    def _perform_queue(self, ah, *args, **kwds):
+        """
+        Perform the queue operation.  This method returns the ActionHandle,
+        and the ActionHandle status indicates whether the queue was successful.
+        """
+        opt = kwds.pop('solver', kwds.pop('opt', None))
+        if opt is None:
+            raise ActionManagerError(
+                "No solver passed to %s, use keyword option 'solver'"
+                % (type(self).__name__) )
+        if len(args) == 0 or not isinstance(args[0], Block):
+            raise ActionManagerError(
+                "The %s only solves Pyomo (Block) models"
+                % (type(self).__name__) )
+        if isinstance(opt, string_types):
+            solver = opt
+        else:
+            solver = opt.name
+        self._pending.append(_Job(ah, opt, solver, args, kwds))
+        self._start_jobs()
+        return ah
+
+    def _perform_wait_any(self):
+        """
+        Perform the wait_any operation.  This method returns an
+        ActionHandle with the results of waiting.  If None is returned
+        then the ActionManager assumes that it can call this method again.
+        Note that an ActionHandle can be returned with a dummy value,
+        to indicate an error.
+        """
+        if len(self._done) == 0 and len(self._running) == 0:
+            self._start_jobs()
+        if len(self._done) == 0:
+            if len(self._running) == 0:
+                if self._pending:
+                    return ActionHandle(
+                        error=True,
+                        explanation=("The queued evaluations in the 'pool' "
+                                     "solver manager cannot be started "
+                                     "with the solver limits %s"
+                                     % (self._solver_limits,)))
+                return ActionHandle(error=True,
+                                    explanation=("No queued evaluations "
+                                                 "available in the 'pool' "
+                                                 "solver manager"))
+            try:
+                for conn in _wait(list(self._running)):
+                    self._finish_job(self._running.pop(conn))
+            finally:
+                # Start the pending solves, even if a worker failed
+                self._start_jobs()
+        ah_id = next(iter(self._done))
+        del self._done[ah_id]
+        return self.event_handle[ah_id]
+
+    def _start_jobs(self):
+        """Start pending solves, subject to the concurrency limits"""
+        if not fork_available():
+            while self._pending:
+                job = self._pending.pop(0)
+                self._solve_serially(job)
+            return
+        if hasattr(multiprocessing, 'get_context'):
+            ctx = multiprocessing.get_context('fork')
+        else:                               #pragma:nocover
+            ctx = multiprocessing
+        running = {}
+        for job in itervalues(self._running):
+            running[job.solver] = running.get(job.solver, 0) + 1
+        i = 0
+        while i < len(self._pending) and \
+              len(self._running) < max(1, self._processes):
+            job = self._pending[i]
+            limit = self._solver_limits.get(job.solver, None)
+            if limit is not None and running.get(job.solver, 0) >= limit:
+                i += 1
+                continue
+            del self._pending[i]
+            running[job.solver] = running.get(job.solver, 0) + 1
+            job.components = _model_components(job.model)
+            job.conn, child_conn = ctx.Pipe(duplex=False)
+            job.process = ctx.Process(
+                target=_worker,
+                args=(child_conn, job.opt, job.args, job.kwds,
+                      job.components))
+            job.process.start()
+            child_conn.close()
+            self._running[job.conn] = job
+
+    def _finish_job(self, job):
+        """Collect the results of a worker process"""
+        try:
+            data = job.conn.recv_bytes()
+        except EOFError:
+            data = None
+        job.conn.close()
+        job.process.join()
+        ah = job.ah
+        if data is None:
+            ok, results = False, ("The worker process exited with code %s"
+                                  % (job.process.exitcode,))
+        else:
+            ok, results = pickle.loads(data)
+        if not ok:
+            ah.status = ActionStatus.error
+            self.event_handle[ah.id].update(ah)
+            self.queued_action_counter -= 1
+            raise ActionManagerError(
+                "Solve for action %s failed in the worker process:\n%s"
+                % (ah.id, results))
+        self._load_results(job, *results)
+
+    def _load_results(self, job, results, default_variable_value, symbols):
+        """Load the solutions into the model and record the results"""
+        model = job.model
+        if symbols is not None:
+            # The solutions are returned with their label-keyed maps
+            results._smap = _restore_symbol_map(symbols, job.components)
+        else:
+            smap = IndexSymbolMap()
+            for prefix, objs in iteritems(job.components):
+                smap.addObjects(prefix, objs)
+            results._smap = smap
+        if job.kwds.get('load_solutions', True):
+            model.solutions.load_from(
+                results,
+                select=job.kwds.get('select', 0),
+                default_variable_value=default_variable_value)
+            results._smap_id = None
+            results.solution.clear()
+        ah = job.ah
+        ah.status = ActionStatus.done
+        self.event_handle[ah.id].update(ah)
+        self.results[ah.id] = results
+        self._done[ah.id] = True
+
+    def _solve_serially(self, job):
+        """Solve a model in this process"""
+        time_start = time.time()
+        if isinstance(job.opt, string_types):
+            with pyomo.opt.SolverFactory(job.opt) as _opt:
+                results = _opt.solve(*job.args, **job.kwds)
+        else:
+            results = job.opt.solve(*job.args, **job.kwds)
+        results.pyomo_solve_time = time.time()-time_start
+        ah = job.ah
+        ah.status = ActionStatus.done
+        self.event_handle[ah.id].update(ah)
+        self.results[ah.id] = results
+        self._done[ah.id] = True
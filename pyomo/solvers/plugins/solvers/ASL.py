@@ -33,6 +33,9 @@ class ASL(SystemCallSolver):
     """A generic optimizer that uses the AMPL Solver Library to interface with applications.
     """
 
+    # ASL solvers write the *.sol file in a single pass
+    _pipe_soln_file = True
+
 
     def __init__(self, **kwds):
         #
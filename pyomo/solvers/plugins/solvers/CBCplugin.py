@@ -21,6 +21,7 @@ import pyutilib.misc
 import pyutilib.common
 import pyutilib.subprocess
 
+from pyomo.common.probe import probe_cache
 from pyomo.opt.base import *
 from pyomo.opt.base.solvers import _extract_version
 from pyomo.opt.results import *
@@ -48,11 +49,25 @@ def configure_cbc():
     if pyomo.common.registered_executable("cbc") is None:
         return
     cbc_exec = pyomo.common.registered_executable("cbc").get_path()
-    results = pyutilib.subprocess.run( [cbc_exec,"-stop"], timelimit=1 )
-    _cbc_version = _extract_version(results[1])
-    results = pyutilib.subprocess.run(
-        [cbc_exec,"dummy","-AMPL","-stop"], timelimit=1 )
-    _cbc_compiled_with_asl = not ('No match for AMPL' in results[1])
+    def _probe_version():
+        results = pyutilib.subprocess.run( [cbc_exec,"-stop"], timelimit=1 )
+        return _extract_version(results[1])
+    def _probe_asl():
+        results = pyutilib.subprocess.run(
+            [cbc_exec,"dummy","-AMPL","-stop"], timelimit=1 )
+        if results[0] < 0:
+            # The probe was killed at the time limit, so its output
+            # cannot be trusted and the result is not cached
+            return None
+        return not ('No match for AMPL' in results[1])
+    _cbc_version = probe_cache(cbc_exec, 'cbc.version', _probe_version)
+    if _cbc_version is not None:
+        _cbc_version = tuple(_cbc_version)
+    _cbc_compiled_with_asl = probe_cache(cbc_exec, 'cbc.asl', _probe_asl)
+    if _cbc_compiled_with_asl is None:
+        # The probe timed out: assume that CBC supports ASL (for this
+        # process), so the probe is not run again
+        _cbc_compiled_with_asl = True
     if _cbc_version is not None:
         _cbc_old_version = _cbc_version < (2,7,0,0)
 
@@ -18,6 +18,7 @@ from pyutilib.misc import Bunch, Options
 from pyutilib.services import register_executable, registered_executable
 from pyutilib.services import TempfileManager
 
+from pyomo.common.probe import probe_cache
 from pyomo.opt import *
 from pyomo.opt.base.solvers import _extract_version
 from pyomo.opt.solver import SystemCallSolver
@@ -34,10 +35,15 @@ def configure_glpk():
     _glpk_version = _extract_version("")
     if registered_executable("glpsol") is None:
         return
-    errcode, results = pyutilib.subprocess.run(
-        [registered_executable('glpsol').get_path(), "--version"], timelimit=2)
-    if errcode == 0:
-        _glpk_version = _extract_version(results)
+    glpsol = registered_executable('glpsol').get_path()
+    def _probe():
+        errcode, results = pyutilib.subprocess.run(
+            [glpsol, "--version"], timelimit=2)
+        if errcode == 0:
+            return _extract_version(results)
+    version = probe_cache(glpsol, 'glpsol.version', _probe)
+    if version is not None:
+        _glpk_version = tuple(version)
 
 # Not sure how better to get these constants, but pulled from GLPK
 # documentation and source code (include/glpk.h)
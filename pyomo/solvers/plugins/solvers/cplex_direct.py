@@ -26,6 +26,7 @@ from pyomo.opt.results.results_ import SolverResults
 from pyomo.opt.results.solution import Solution, SolutionStatus
 from pyomo.opt.results.solver import TerminationCondition, SolverStatus
 from pyomo.opt.base import SolverFactory
+from pyomo.core.base.var import load_var_values
 import time
 
 
@@ -360,6 +361,49 @@ class CPLEXDirect(DirectSolver):
         self._pyomo_con_to_solver_con_map[con] = conname
         self._solver_con_to_pyomo_con_map[conname] = con
 
+    def _add_constraints(self, cons):
+        rows, other = self._compile_linear_constraints(cons)
+
+        ndx_map = self._pyomo_var_to_ndx_map
+        lin_expr = []
+        senses = []
+        rhs = []
+        range_values = []
+        for i in range(len(rows)):
+            variables, coefficients = rows.row(i)
+            lin_expr.append([[ndx_map[v] for v in variables], coefficients])
+            lb = rows.lower[i]
+            ub = rows.upper[i]
+            if rows.equality[i]:
+                senses.append('E')
+                rhs.append(lb)
+                range_values.append(0.0)
+            elif lb is not None and ub is not None:
+                senses.append('R')
+                rhs.append(ub)
+                range_values.append(lb - ub)
+            elif lb is not None:
+                senses.append('G')
+                rhs.append(lb)
+                range_values.append(0.0)
+            else:
+                senses.append('L')
+                rhs.append(ub)
+                range_values.append(0.0)
+
+        # All linear rows are added with a single call
+        if len(rows) > 0:
+            self._solver_model.linear_constraints.add(
+                lin_expr=lin_expr,
+                senses=''.join(senses),
+                rhs=rhs,
+                range_values=range_values,
+                names=rows.names)
+        self._register_linear_rows(rows, rows.names)
+
+        for con in other:
+            self._add_constraint(con)
+
     def _add_sos_constraint(self, con):
         if not con.active:
             return None
@@ -699,10 +743,10 @@ class CPLEXDirect(DirectSolver):
         cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
         vals = self._solver_model.solution.get_values(cplex_vars_to_load)
 
-        for i, pyomo_var in enumerate(vars_to_load):
-            if ref_vars[pyomo_var] > 0:
-                pyomo_var.stale = False
-                pyomo_var.value = vals[i]
+        loaded = [ref_vars[var] > 0 for var in vars_to_load]
+        load_var_values(
+            [var for var, flag in zip(vars_to_load, loaded) if flag],
+            [val for val, flag in zip(vals, loaded) if flag])
 
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
@@ -18,9 +18,63 @@ import pyomo.common
 import pyomo.opt.base.solvers
 from pyomo.core.kernel.component_map import ComponentMap
 from pyomo.core.kernel.component_set import ComponentSet
+from pyomo.core.expr.numvalue import is_fixed, value
 from pyomo.opt.base.formats import ResultsFormat
+from pyomo.repn import generate_standard_repn
 from pyutilib.misc import Options
 
+
+class LinearRows(object):
+    """
+    Linear constraints that are compiled to compressed sparse row
+    (CSR) form so that they can be sent to a solver in bulk.
+
+    The variables and coefficients of row ``i`` are stored in
+    ``variables[starts[i]:starts[i+1]]`` and
+    ``coefficients[starts[i]:starts[i+1]]``.
+
+    Attributes:
+        constraints (list): The constraint of each row.
+        names (list): The solver name of each row.
+        starts (list): The offsets of the rows (``len(constraints)+1``
+            entries).
+        variables (list): The Pyomo variable of each nonzero.
+        coefficients (list): The coefficient of each nonzero.
+        lower (list): The lower bound of each row less the constant
+            of its body, or :const:`None`.
+        upper (list): The upper bound of each row less the constant
+            of its body, or :const:`None`.
+        equality (list): True for rows that are equality constraints.
+    """
+
+    __slots__ = ('constraints',
+                 'names',
+                 'starts',
+                 'variables',
+                 'coefficients',
+                 'lower',
+                 'upper',
+                 'equality')
+
+    def __init__(self):
+        self.constraints = []
+        self.names = []
+        self.starts = [0]
+        self.variables = []
+        self.coefficients = []
+        self.lower = []
+        self.upper = []
+        self.equality = []
+
+    def __len__(self):
+        return len(self.constraints)
+
+    def row(self, i):
+        """Returns the (variables, coefficients) of a row."""
+        start, end = self.starts[i], self.starts[i+1]
+        return self.variables[start:end], self.coefficients[start:end]
+
+
 class DirectOrPersistentSolver(OptSolver):
     """
     This is a base class for both direct and persistent solvers. Direct solver interfaces do not use any file io.
@@ -205,6 +259,8 @@ class DirectOrPersistentSolver(OptSolver):
                 sort=True):
             self._add_var(var)
 
+        cons = []
+        sos_cons = []
         for sub_block in block.block_data_objects(descend_into=True,
                                                   active=True):
             for con in sub_block.component_data_objects(
@@ -216,14 +272,13 @@ class DirectOrPersistentSolver(OptSolver):
                    (not con.has_ub()):
                     assert not con.equality
                     continue  # non-binding, so skip
-                self._add_constraint(con)
+                cons.append(con)
 
-            for con in sub_block.component_data_objects(
+            sos_cons.extend(sub_block.component_data_objects(
                     ctype=pyomo.core.base.sos.SOSConstraint,
                     descend_into=False,
                     active=True,
-                    sort=True):
-                self._add_sos_constraint(con)
+                    sort=True))
 
             obj_counter = 0
             for obj in sub_block.component_data_objects(
@@ -236,6 +291,94 @@ class DirectOrPersistentSolver(OptSolver):
                                      "support multiple objectives.")
                 self._set_objective(obj)
 
+        self._add_constraints(cons)
+        for con in sos_cons:
+            self._add_sos_constraint(con)
+
+    def _add_constraints(self, cons):
+        """
+        Add a list of constraints to the solver model.  Subclasses can
+        override this method to send the constraints to the solver in
+        bulk (see _compile_linear_constraints).
+        """
+        for con in cons:
+            self._add_constraint(con)
+
+    def _compile_linear_constraints(self, cons):
+        """
+        Compile the linear constraints in a list to CSR form.
+
+        Solver names are assigned to all constraints in the order of
+        the list, so the names do not depend on which constraints
+        could be compiled.  Inactive and skipped trivial constraints
+        are dropped.
+
+        Returns
+        -------
+        rows: LinearRows
+            The linear constraints.
+        other: list
+            The constraints that are not linear. These should be added
+            with _add_constraint.
+        """
+        rows = LinearRows()
+        other = []
+        for con in cons:
+            if not con.active:
+                continue
+            if con._linear_canonical_form:
+                repn = con.canonical_form()
+            else:
+                repn = generate_standard_repn(con.body, quadratic=False)
+            if repn.nonlinear_expr is not None or \
+               len(repn.quadratic_vars) > 0:
+                self._symbol_map.getSymbol(con, self._labeler)
+                other.append(con)
+                continue
+            if len(repn.linear_vars) == 0 and \
+               self._skip_trivial_constraints:
+                continue
+
+            if con.has_lb():
+                if not is_fixed(con.lower):
+                    raise ValueError("Lower bound of constraint {0} "
+                                     "is not constant.".format(con))
+                rows.lower.append(value(con.lower) - repn.constant)
+            else:
+                rows.lower.append(None)
+            if con.has_ub():
+                if not is_fixed(con.upper):
+                    raise ValueError("Upper bound of constraint {0} "
+                                     "is not constant.".format(con))
+                rows.upper.append(value(con.upper) - repn.constant)
+            else:
+                rows.upper.append(None)
+            rows.equality.append(con.equality)
+
+            rows.constraints.append(con)
+            rows.names.append(self._symbol_map.getSymbol(con, self._labeler))
+            rows.variables.extend(repn.linear_vars)
+            rows.coefficients.extend(repn.linear_coefs)
+            rows.starts.append(len(rows.variables))
+        return rows, other
+
+    def _register_linear_rows(self, rows, solver_cons):
+        """
+        Update the maps between Pyomo and solver constraints after the
+        rows in a LinearRows object were added to the solver.
+        """
+        referenced_variables = self._referenced_variables
+        for i, con in enumerate(rows.constraints):
+            referenced_vars = ComponentSet(rows.row(i)[0])
+            for var in referenced_vars:
+                referenced_variables[var] += 1
+            if rows.lower[i] is not None and rows.upper[i] is not None \
+               and not rows.equality[i]:
+                self._range_constraints.add(con)
+            self._vars_referenced_by_con[con] = referenced_vars
+            self._pyomo_con_to_solver_con_map[con] = solver_cons[i]
+            self._solver_con_to_pyomo_con_map[solver_cons[i]] = con
+
     """ This method should be implemented by subclasses."""
     def _set_objective(self, obj):
         raise NotImplementedError("This method should be implemented "
@@ -27,8 +27,21 @@ from pyomo.opt.results.solution import Solution, SolutionStatus
 from pyomo.opt.results.solver import TerminationCondition, SolverStatus
 from pyomo.opt.base import SolverFactory
 from pyomo.core.base.suffix import Suffix
+from pyomo.core.base.var import load_var_values
 import pyomo.core.base.var
 
+try:
+    import numpy
+    has_numpy = True
+except:     #pragma:nocover
+    has_numpy = False
+
+try:
+    import scipy.sparse
+    has_scipy = True
+except:     #pragma:nocover
+    has_scipy = False
+
 
 logger = logging.getLogger('pyomo.solvers')
 
@@ -325,6 +338,82 @@ class GurobiDirect(DirectSolver):
         self._pyomo_con_to_solver_con_map[con] = gurobipy_con
         self._solver_con_to_pyomo_con_map[gurobipy_con] = con
 
+    def _add_constraints(self, cons):
+        rows, other = self._compile_linear_constraints(cons)
+
+        GRB = self._gurobipy.GRB
+        var_map = self._pyomo_var_to_solver_var_map
+        solver_cons = [None]*len(rows)
+        batch = []
+        senses = []
+        rhs = []
+        for i in range(len(rows)):
+            lb = rows.lower[i]
+            ub = rows.upper[i]
+            if rows.equality[i]:
+                senses.append(GRB.EQUAL)
+                rhs.append(lb)
+            elif lb is not None and ub is not None:
+                # Range rows cannot be added with a single sense
+                variables, coefficients = rows.row(i)
+                solver_cons[i] = self._solver_model.addRange(
+                    self._gurobipy.LinExpr(coefficients,
+                                           [var_map[v] for v in variables]),
+                    lb, ub, name=rows.names[i])
+                continue
+            elif lb is not None:
+                senses.append(GRB.GREATER_EQUAL)
+                rhs.append(lb)
+            else:
+                senses.append(GRB.LESS_EQUAL)
+                rhs.append(ub)
+            batch.append(i)
+
+        if len(batch) > 0 and has_numpy and has_scipy and \
+           hasattr(self._solver_model, 'addMConstr'):
+            # Add all of the remaining rows with the matrix API
+            columns = {}
+            x = []
+            indptr = [0]
+            indices = []
+            data = []
+            for i in batch:
+                variables, coefficients = rows.row(i)
+                for v in variables:
+                    col = columns.get(id(v), None)
+                    if col is None:
+                        col = columns[id(v)] = len(x)
+                        x.append(var_map[v])
+                    indices.append(col)
+                data.extend(coefficients)
+                indptr.append(len(indices))
+            A = scipy.sparse.csr_matrix(
+                (numpy.array(data, dtype=float),
+                 numpy.array(indices, dtype=numpy.int64),
+                 numpy.array(indptr, dtype=numpy.int64)),
+                shape=(len(batch), len(x)))
+            self._solver_model.update()
+            mconstr = self._solver_model.addMConstr(
+                A, x, numpy.array(senses), numpy.array(rhs, dtype=float))
+            batch_cons = mconstr.tolist()
+            self._solver_model.setAttr(
+                'ConstrName', batch_cons, [rows.names[i] for i in batch])
+            for i, gurobipy_con in zip(batch, batch_cons):
+                solver_cons[i] = gurobipy_con
+        else:
+            for i, sense, b in zip(batch, senses, rhs):
+                variables, coefficients = rows.row(i)
+                solver_cons[i] = self._solver_model.addConstr(
+                    lhs=self._gurobipy.LinExpr(coefficients,
+                                               [var_map[v] for v in variables]),
+                    sense=sense,
+                    rhs=b,
+                    name=rows.names[i])
+        self._register_linear_rows(rows, solver_cons)
+
+        for con in other:
+            self._add_constraint(con)
+
     def _add_sos_constraint(self, con):
         if not con.active:
             return None
@@ -701,10 +790,10 @@ class GurobiDirect(DirectSolver):
         gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
         vals = self._solver_model.getAttr("X", gurobi_vars_to_load)
 
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                var.stale = False
-                var.value = val
+        loaded = [ref_vars[var] > 0 for var in vars_to_load]
+        load_var_values(
+            [var for var, flag in zip(vars_to_load, loaded) if flag],
+            [val for val, flag in zip(vals, loaded) if flag])
 
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
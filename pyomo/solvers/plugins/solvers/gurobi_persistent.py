@@ -93,6 +93,13 @@ class GurobiPersistent(PersistentSolver, GurobiDirect):
     def _warm_start(self):
         GurobiDirect._warm_start(self)
 
+    def update(self):
+        changes = PersistentSolver.update(self)
+        self._solver_model.update()
+        return changes
+
+    update.__doc__ = PersistentSolver.update.__doc__
+
     def update_var(self, var):
         """Update a single variable in the solver's model.
 
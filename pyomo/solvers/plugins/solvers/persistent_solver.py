@@ -22,18 +22,268 @@ import logging
 from pyomo.core.base.constraint import Constraint
 from pyomo.core.base.var import Var
 from pyomo.core.base.sos import SOSConstraint
+from pyomo.core.expr import current as EXPR
+from pyomo.core.expr.numvalue import value, nonpyomo_leaf_types
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.core.kernel.component_set import ComponentSet
 
 
 logger = logging.getLogger('pyomo.solvers')
 
 
+class _DependencyVisitor(EXPR.SimpleExpressionVisitor):
+    """
+    Collects the values that the solver representation of an
+    expression depends on: named expressions, mutable parameters, and
+    fixed variables (which are folded into the coefficients).
+    """
+
+    def __init__(self):
+        self.seen = set()
+        self.named = []
+        self.params = []
+        self.fixed = []
+
+    def walk(self, expr):
+        if expr.__class__ in nonpyomo_leaf_types:
+            return
+        if expr.is_expression_type():
+            self.xbfs(expr)
+        else:
+            self.visit(expr)
+
+    def visit(self, node):
+        if node.__class__ in nonpyomo_leaf_types or id(node) in self.seen:
+            return
+        self.seen.add(id(node))
+        if node.is_expression_type():
+            if node.is_named_expression_type():
+                self.named.append((node, node.expr))
+            elif node.nargs() == 0:
+                # Linear expressions store their terms outside of args
+                for v in getattr(node, 'linear_vars', ()):
+                    self.visit(v)
+                for c in getattr(node, 'linear_coefs', ()):
+                    self.walk(c)
+                self.walk(getattr(node, 'constant', None))
+        elif node.is_variable_type():
+            if node.fixed:
+                self.fixed.append((node, node.value))
+        elif node.is_fixed() and not node.is_constant():
+            self.params.append((node, node.value))
+
+
+def _expression_state(expr):
+    visitor = _DependencyVisitor()
+    visitor.walk(expr)
+    return (expr, tuple(visitor.named), tuple(visitor.params),
+            tuple(visitor.fixed))
+
+
+def _expression_is_current(expr, state):
+    if expr is not state[0]:
+        return False
+    for e, arg in state[1]:
+        if e.expr is not arg:
+            return False
+    for p, val in state[2]:
+        if p.value != val:
+            return False
+    for v, val in state[3]:
+        if not v.fixed or v.value != val:
+            return False
+    return True
+
+
+class ModelChanges(object):
+    """
+    The differences between a model and the state that was last
+    recorded by a :class:`ModelChangeTracker`.
+
+    Attributes:
+        added_vars (list): Variables that are new to the model.
+        removed_vars (list): Variables that are no longer active.
+        modified_vars (list): Variables whose bounds, domain, or
+            fixed status (or fixed value) changed.
+        added_constraints (list): Constraints that are new (or were
+            activated).
+        removed_constraints (list): Constraints that were deleted or
+            deactivated.
+        modified_constraints (list): Constraints whose expression,
+            bounds, mutable parameters or folded fixed variables
+            changed.
+        added_sos_constraints (list): New SOS constraints.
+        removed_sos_constraints (list): Deleted or deactivated SOS
+            constraints.
+        objective: The active objective if it changed, or
+            :const:`None`.
+    """
+
+    __slots__ = ('added_vars',
+                 'removed_vars',
+                 'modified_vars',
+                 'added_constraints',
+                 'removed_constraints',
+                 'modified_constraints',
+                 'added_sos_constraints',
+                 'removed_sos_constraints',
+                 'objective')
+
+    def __init__(self):
+        self.added_vars = []
+        self.removed_vars = []
+        self.modified_vars = []
+        self.added_constraints = []
+        self.removed_constraints = []
+        self.modified_constraints = []
+        self.added_sos_constraints = []
+        self.removed_sos_constraints = []
+        self.objective = None
+
+    def __len__(self):
+        return sum(len(getattr(self, name)) for name in self.__slots__
+                   if name != 'objective') + (self.objective is not None)
+
+
+class ModelChangeTracker(object):
+    """
+    Tracks the changes to a model between solves of a persistent
+    solver.
+
+    Pyomo components do not emit notifications when they are modified,
+    so the tracker records the state of every variable, constraint,
+    SOS constraint and objective that was sent to the solver and
+    derives the change events by comparing that record to the model.
+    A constraint (or objective) is modified if its expression or
+    bounds are replaced, if a named expression that it references is
+    changed, or if the value of a mutable parameter or fixed variable
+    that was folded into its coefficients changes.
+    """
+
+    def __init__(self):
+        self._vars = ComponentMap()
+        self._cons = ComponentMap()
+        self._sos = ComponentSet()
+        self._objective = None
+        self._objective_state = None
+
+    @staticmethod
+    def _var_state(var):
+        return (var.lb, var.ub, var.domain, var.fixed,
+                var.value if var.fixed else None)
+
+    @staticmethod
+    def _con_is_current(con, state):
+        if (value(con.lower) if con.has_lb() else None) != state[1]:
+            return False
+        if (value(con.upper) if con.has_ub() else None) != state[2]:
+            return False
+        return _expression_is_current(con.body, state[0])
+
+    @staticmethod
+    def _con_state(con):
+        return (_expression_state(con.body),
+                value(con.lower) if con.has_lb() else None,
+                value(con.upper) if con.has_ub() else None)
+
+    def changes(self, model):
+        """
+        Compare the model to the recorded state.
+
+        Args:
+            model: The block that was passed to the solver.
+
+        Returns:
+            A :class:`ModelChanges` object.
+        """
+        changes = ModelChanges()
+
+        seen = ComponentSet()
+        for var in model.component_data_objects(
+                ctype=Var, descend_into=True, active=True, sort=True):
+            seen.add(var)
+            if var not in self._vars:
+                changes.added_vars.append(var)
+            elif self._vars[var] != self._var_state(var):
+                changes.modified_vars.append(var)
+        changes.removed_vars.extend(
+            var for var in self._vars if var not in seen)
+
+        seen = ComponentSet()
+        seen_sos = ComponentSet()
+        objectives = []
+        for block in model.block_data_objects(descend_into=True,
+                                              active=True):
+            for con in block.component_data_objects(
+                    ctype=Constraint, descend_into=False,
+                    active=True, sort=True):
+                if (not con.has_lb()) and (not con.has_ub()):
+                    continue
+                seen.add(con)
+                if con not in self._cons:
+                    changes.added_constraints.append(con)
+                elif not self._con_is_current(con, self._cons[con]):
+                    changes.modified_constraints.append(con)
+            for con in block.component_data_objects(
+                    ctype=SOSConstraint, descend_into=False,
+                    active=True, sort=True):
+                seen_sos.add(con)
+                if con not in self._sos:
+                    changes.added_sos_constraints.append(con)
+            objectives.extend(block.component_data_objects(
+                ctype=Objective, descend_into=False, active=True))
+        changes.removed_constraints.extend(
+            con for con in self._cons if con not in seen)
+        changes.removed_sos_constraints.extend(
+            con for con in self._sos if con not in seen_sos)
+
+        if len(objectives) > 1:
+            raise ValueError("Solver interface does not "
+                             "support multiple objectives.")
+        if objectives:
+            obj = objectives[0]
+            if obj is not self._objective or \
+               obj.sense != self._objective_state[0] or \
+               not _expression_is_current(obj.expr,
+                                          self._objective_state[1]):
+                changes.objective = obj
+        return changes
+
+    def record(self, changes):
+        """
+        Record the state of the components in a :class:`ModelChanges`
+        object after the changes were sent to the solver.
+        """
+        for var in changes.removed_vars:
+            del self._vars[var]
+        for var in changes.added_vars:
+            self._vars[var] = self._var_state(var)
+        for var in changes.modified_vars:
+            self._vars[var] = self._var_state(var)
+        for con in changes.removed_constraints:
+            del self._cons[con]
+        for con in changes.added_constraints:
+            self._cons[con] = self._con_state(con)
+        for con in changes.modified_constraints:
+            self._cons[con] = self._con_state(con)
+        for con in changes.removed_sos_constraints:
+            self._sos.remove(con)
+        for con in changes.added_sos_constraints:
+            self._sos.add(con)
+        if changes.objective is not None:
+            self._objective = changes.objective
+            self._objective_state = (changes.objective.sense,
+                                     _expression_state(changes.objective.expr))
+
+
 class PersistentSolver(DirectOrPersistentSolver):
     """
     A base class for persistent solvers. Direct solver interfaces do not use any file io.
     Rather, they interface directly with the python bindings for the specific solver. Persistent solver interfaces
     are similar except that they "remember" their model. Thus, persistent solver interfaces allow incremental changes
     to the solver model (e.g., the gurobi python model or the cplex python model). Note that users are responsible
-    for notifying the persistent solver interfaces when changes are made to the corresponding pyomo model.
+    for notifying the persistent solver interfaces when changes are made to the corresponding pyomo model, unless
+    the instance was set with auto_update=True (see set_instance).
 
     Keyword Arguments
     -----------------
@@ -50,6 +300,9 @@ class PersistentSolver(DirectOrPersistentSolver):
     def __init__(self, **kwds):
         DirectOrPersistentSolver.__init__(self, **kwds)
 
+        self._change_tracker = None
+        """A ModelChangeTracker if changes to the model are applied automatically, otherwise None."""
+
     def _presolve(self, **kwds):
         DirectOrPersistentSolver._presolve(self, **kwds)
 
@@ -76,8 +329,67 @@ class PersistentSolver(DirectOrPersistentSolver):
             If False then an error will be raised if a fixed variable is used in one of the solver constraints.
             This is useful for catching bugs. Ordinarily a fixed variable should appear as a constant value in the
             solver constraints. If True, then the error will not be raised.
+        auto_update: bool
+            If True, changes to the model (added, removed, activated or deactivated components, modified
+            constraint expressions, fixed or unfixed variables, variable bounds and mutable parameter values)
+            are detected and applied to the solver's model when solve is called (see update).
         """
-        return self._set_instance(model, kwds)
+        auto_update = kwds.pop('auto_update', False)
+        self._change_tracker = None
+        ans = self._set_instance(model, kwds)
+        if auto_update:
+            self._change_tracker = ModelChangeTracker()
+            self._change_tracker.record(self._change_tracker.changes(model))
+        return ans
+
+    def update(self):
+        """
+        Apply the changes that were made to the model since the last solve to the solver's model. Only the
+        modified components are updated: constraints whose expression, bounds, mutable parameters or folded
+        fixed variables changed are removed and added again, and variables whose bounds, domain or fixed status
+        changed are updated with update_var.
+
+        This requires that the instance was set with auto_update=True, and it is called automatically by solve.
+
+        Returns
+        -------
+        changes: ModelChanges
+            The changes that were applied.
+        """
+        if self._pyomo_model is None:
+            raise RuntimeError('You must call set_instance before calling update.')
+        if self._change_tracker is None:
+            raise RuntimeError('Automatic updates are not enabled. Use set_instance(model, auto_update=True).')
+        changes = self._change_tracker.changes(self._pyomo_model)
+        con_map = self._pyomo_con_to_solver_con_map
+        for con in changes.removed_constraints:
+            if con in con_map:
+                self.remove_constraint(con)
+        for con in changes.modified_constraints:
+            if con in con_map:
+                self.remove_constraint(con)
+        for con in changes.removed_sos_constraints:
+            if con in con_map:
+                self.remove_sos_constraint(con)
+        for var in changes.added_vars:
+            if var not in self._pyomo_var_to_solver_var_map:
+                self._add_var(var)
+        for var in changes.modified_vars:
+            self.update_var(var)
+        self._add_constraints(
+            [con for con in changes.added_constraints if con not in con_map]
+            + changes.modified_constraints)
+        for con in changes.added_sos_constraints:
+            if con not in con_map:
+                self._add_sos_constraint(con)
+        if changes.objective is not None:
+            self._set_objective(changes.objective)
+        for var in changes.removed_vars:
+            if var in self._pyomo_var_to_solver_var_map and \
+               self._referenced_variables[var] == 0:
+                self.remove_var(var)
+        self._change_tracker.record(changes)
+        return changes
 
     def add_block(self, block):
         """Add a single Pyomo Block to the solver's model.
@@ -346,6 +658,9 @@ class PersistentSolver(DirectOrPersistentSolver):
 
         self.available(exception_flag=True)
 
+        if self._change_tracker is not None:
+            self.update()
+
         # Collect suffix names to try and import from solution.
         if isinstance(self._pyomo_model, _BlockData):
             model_suffixes = list(name for (name, comp) in active_import_suffix_generator(self._pyomo_model))
@@ -0,0 +1,82 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+
+from pyomo.environ import *
+from pyomo.solvers.plugins.solvers.direct_or_persistent_solver import \
+    DirectOrPersistentSolver
+
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var([1,2,3])
+    m.y = Var()
+    m.p = Param(mutable=True, initialize=2)
+    m.c1 = Constraint(expr=m.x[1] + m.p*m.x[2] + 1 >= 3)
+    m.c2 = Constraint(expr=m.x[1]*m.x[2] <= 1)
+    m.c3 = Constraint(expr=m.x[3] - m.y == 4)
+    m.c4 = Constraint(expr=(0, m.y + 5, 10))
+    m.c5 = Constraint(expr=m.p <= 3)
+    return m
+
+
+class TestLinearRows(unittest.TestCase):
+
+    def _solver(self, m, **kwds):
+        opt = DirectOrPersistentSolver(type='test')
+        DirectOrPersistentSolver._set_instance(opt, m, kwds)
+        opt._range_constraints = set()
+        for v in m.component_data_objects(Var):
+            opt._referenced_variables[v] = 0
+        return opt
+
+    def test_compile(self):
+        m = _model()
+        opt = self._solver(m)
+        cons = list(m.component_data_objects(Constraint))
+        rows, other = opt._compile_linear_constraints(cons)
+        self.assertEqual(rows.constraints, [m.c1, m.c3, m.c4, m.c5])
+        self.assertEqual(other, [m.c2])
+        # Names are assigned in the order of the constraints
+        self.assertEqual(rows.names, ['x1', 'x3', 'x4', 'x5'])
+        self.assertEqual(opt._symbol_map.getSymbol(m.c2), 'x2')
+        self.assertEqual(rows.starts, [0, 2, 4, 5, 5])
+        self.assertEqual(rows.row(0), ([m.x[1], m.x[2]], [1, 2]))
+        self.assertEqual(rows.row(1), ([m.x[3], m.y], [1, -1]))
+        self.assertEqual(rows.row(3), ([], []))
+        self.assertEqual(rows.lower, [2, 4, -5, None])
+        self.assertEqual(rows.upper, [None, 4, 5, 1])
+        self.assertEqual(rows.equality, [False, True, False, False])
+
+    def test_skip_trivial(self):
+        m = _model()
+        opt = self._solver(m, skip_trivial_constraints=True)
+        m.c1.deactivate()
+        cons = list(m.component_data_objects(Constraint))
+        rows, other = opt._compile_linear_constraints(cons)
+        self.assertEqual(rows.constraints, [m.c3, m.c4])
+
+    def test_register(self):
+        m = _model()
+        opt = self._solver(m)
+        cons = list(m.component_data_objects(Constraint))
+        rows, other = opt._compile_linear_constraints(cons)
+        opt._register_linear_rows(rows, rows.names)
+        self.assertIs(opt._solver_con_to_pyomo_con_map['x4'], m.c4)
+        self.assertEqual(opt._pyomo_con_to_solver_con_map[m.c3], 'x3')
+        self.assertEqual(opt._range_constraints, set([m.c4]))
+        self.assertEqual(opt._referenced_variables[m.y], 2)
+        self.assertEqual(opt._referenced_variables[m.x[2]], 1)
+        self.assertEqual(len(opt._vars_referenced_by_con[m.c5]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
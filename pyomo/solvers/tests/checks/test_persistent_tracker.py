@@ -0,0 +1,252 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+
+from pyomo.environ import *
+from pyomo.core.expr import current as EXPR
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.core.kernel.component_set import ComponentSet
+from pyomo.solvers.plugins.solvers.persistent_solver import \
+    PersistentSolver, ModelChangeTracker
+
+
+def _model():
+    m = ConcreteModel()
+    m.I = RangeSet(3)
+    m.x = Var(m.I, bounds=(0, 10))
+    m.p = Param(m.I, mutable=True, initialize={1:1, 2:2, 3:3})
+    m.c1 = Constraint(expr=sum(m.p[i]*m.x[i] for i in m.I) >= 1)
+    m.c2 = Constraint(expr=m.x[1] + m.x[2] <= 5)
+    m.c3 = Constraint(expr=m.x[3] >= 0)
+    m.o = Objective(expr=m.x[1] + m.x[2] + m.x[3])
+    return m
+
+
+class _RecordingSolver(PersistentSolver):
+    """A persistent solver that records the calls to the solver model."""
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'recording'
+        PersistentSolver.__init__(self, **kwds)
+        self._python_api_exists = True
+        self.calls = []
+
+    def _set_instance(self, model, kwds={}):
+        PersistentSolver._set_instance(self, model, kwds)
+        self._pyomo_con_to_solver_con_map = ComponentMap()
+        self._solver_con_to_pyomo_con_map = ComponentMap()
+        self._solver_var_to_pyomo_var_map = ComponentMap()
+        self._add_block(model)
+
+    def _add_var(self, var):
+        self.calls.append(('add_var', var))
+        self._pyomo_var_to_solver_var_map[var] = var
+        self._solver_var_to_pyomo_var_map[var] = var
+        self._referenced_variables[var] = 0
+        self._symbol_map.getSymbol(var, self._labeler)
+
+    def _add_constraint(self, con):
+        self.calls.append(('add_constraint', con))
+        referenced = ComponentSet(
+            EXPR.identify_variables(con.body, include_fixed=False))
+        for var in referenced:
+            self._referenced_variables[var] += 1
+        self._vars_referenced_by_con[con] = referenced
+        self._pyomo_con_to_solver_con_map[con] = con
+        self._solver_con_to_pyomo_con_map[con] = con
+        self._symbol_map.getSymbol(con, self._labeler)
+
+    def _add_sos_constraint(self, con):
+        self.calls.append(('add_sos_constraint', con))
+        self._vars_referenced_by_con[con] = ComponentSet()
+        self._pyomo_con_to_solver_con_map[con] = con
+        self._solver_con_to_pyomo_con_map[con] = con
+        self._symbol_map.getSymbol(con, self._labeler)
+
+    def _set_objective(self, obj):
+        self.calls.append(('set_objective', obj))
+        self._objective = obj
+
+    def _remove_constraint(self, solver_con):
+        self.calls.append(('remove_constraint', solver_con))
+
+    def _remove_sos_constraint(self, solver_con):
+        self.calls.append(('remove_sos_constraint', solver_con))
+
+    def _remove_var(self, solver_var):
+        self.calls.append(('remove_var', solver_var))
+
+    def update_var(self, var):
+        self.calls.append(('update_var', var))
+
+    def reset(self):
+        calls = self.calls
+        self.calls = []
+        return calls
+
+
+class TestModelChangeTracker(unittest.TestCase):
+
+    def _tracker(self, m):
+        tracker = ModelChangeTracker()
+        changes = tracker.changes(m)
+        self.assertEqual(len(changes.added_vars), 3)
+        self.assertEqual(
+            len(changes.added_constraints),
+            len(list(m.component_data_objects(Constraint))))
+        self.assertIs(changes.objective, m.o)
+        tracker.record(changes)
+        self.assertEqual(len(tracker.changes(m)), 0)
+        return tracker
+
+    def test_param_change(self):
+        m = _model()
+        tracker = self._tracker(m)
+        m.p[2] = 5
+        changes = tracker.changes(m)
+        self.assertEqual(changes.modified_constraints, [m.c1])
+        self.assertEqual(len(changes), 1)
+        tracker.record(changes)
+        self.assertEqual(len(tracker.changes(m)), 0)
+
+    def test_var_changes(self):
+        m = _model()
+        tracker = self._tracker(m)
+        m.x[1].setub(4)
+        m.x[2].fix(1)
+        m.x[3].domain = Binary
+        changes = tracker.changes(m)
+        self.assertEqual(changes.modified_vars, [m.x[1], m.x[2], m.x[3]])
+        self.assertEqual(len(changes), 3)
+        tracker.record(changes)
+        # Changing the value of a fixed variable changes its bounds
+        m.x[2].value = 2
+        self.assertEqual(tracker.changes(m).modified_vars, [m.x[2]])
+
+    def test_folded_fixed_variable(self):
+        m = _model()
+        m.x[3].fix(1)
+        tracker = self._tracker(m)
+        m.x[3].value = 2
+        changes = tracker.changes(m)
+        self.assertEqual(changes.modified_vars, [m.x[3]])
+        self.assertEqual(changes.modified_constraints, [m.c1, m.c3])
+        self.assertIs(changes.objective, m.o)
+        tracker.record(changes)
+        m.x[3].unfix()
+        changes = tracker.changes(m)
+        self.assertEqual(changes.modified_constraints, [m.c1, m.c3])
+
+    def test_add_remove(self):
+        m = _model()
+        tracker = self._tracker(m)
+        m.y = Var()
+        m.c4 = Constraint(expr=m.y + m.x[1] == 2)
+        m.c2.deactivate()
+        m.del_component(m.c3)
+        changes = tracker.changes(m)
+        self.assertEqual(changes.added_vars, [m.y])
+        self.assertEqual(changes.added_constraints, [m.c4])
+        self.assertEqual(
+            sorted(c.name for c in changes.removed_constraints),
+            ['c2', 'c3'])
+        tracker.record(changes)
+        m.b = Block()
+        m.b.c = Constraint(expr=m.y <= 1)
+        self.assertEqual(tracker.changes(m).added_constraints, [m.b.c])
+        m.b.deactivate()
+        self.assertEqual(len(tracker.changes(m)), 0)
+
+    def test_expression_change(self):
+        m = _model()
+        m.e = Expression(expr=m.x[1])
+        m.c4 = Constraint(expr=m.e <= 3)
+        tracker = self._tracker(m)
+        m.c2.set_value(m.x[1] - m.x[2] <= 5)
+        m.e.expr = m.x[2]
+        m.o.sense = maximize
+        changes = tracker.changes(m)
+        self.assertEqual(changes.modified_constraints, [m.c2, m.c4])
+        self.assertIs(changes.objective, m.o)
+        tracker.record(changes)
+        m.p[1] = 4
+        m.c2.set_value(m.x[1] - m.x[2] <= 6)
+        self.assertEqual(tracker.changes(m).modified_constraints,
+                         [m.c1, m.c2])
+
+    def test_objective_change(self):
+        m = _model()
+        tracker = self._tracker(m)
+        m.o.deactivate()
+        m.o2 = Objective(expr=m.p[1]*m.x[1])
+        changes = tracker.changes(m)
+        self.assertIs(changes.objective, m.o2)
+        tracker.record(changes)
+        m.p[1] = 3
+        self.assertIs(tracker.changes(m).objective, m.o2)
+
+
+class TestPersistentUpdate(unittest.TestCase):
+
+    def test_update_requires_auto_update(self):
+        m = _model()
+        opt = _RecordingSolver()
+        opt.set_instance(m)
+        with self.assertRaises(RuntimeError):
+            opt.update()
+
+    def test_update(self):
+        m = _model()
+        opt = _RecordingSolver()
+        opt.set_instance(m, auto_update=True)
+        self.assertEqual(len(opt.reset()), 7)
+        self.assertEqual(len(opt.update()), 0)
+        self.assertEqual(opt.reset(), [])
+
+        m.p[1] = 5
+        m.x[2].setlb(1)
+        opt.update()
+        self.assertEqual(opt.reset(), [('remove_constraint', m.c1),
+                                       ('update_var', m.x[2]),
+                                       ('add_constraint', m.c1)])
+
+        m.y = Var()
+        m.c4 = Constraint(expr=m.y >= m.x[1])
+        c2 = m.c2
+        m.del_component(c2)
+        opt.update()
+        self.assertEqual(opt.reset(), [('remove_constraint', c2),
+                                       ('add_var', m.y),
+                                       ('add_constraint', m.c4)])
+
+        y, c4 = m.y, m.c4
+        m.del_component(c4)
+        m.del_component(y)
+        opt.update()
+        self.assertEqual(opt.reset(), [('remove_constraint', c4),
+                                       ('remove_var', y)])
+        self.assertEqual(len(opt.update()), 0)
+
+    def test_manual_changes(self):
+        m = _model()
+        opt = _RecordingSolver()
+        opt.set_instance(m, auto_update=True)
+        opt.reset()
+        m.c4 = Constraint(expr=m.x[1] >= 1)
+        opt.add_constraint(m.c4)
+        opt.reset()
+        # The constraint was already added by the user
+        opt.update()
+        self.assertEqual(opt.reset(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
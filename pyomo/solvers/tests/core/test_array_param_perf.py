@@ -0,0 +1,73 @@
+#
+# Track the time needed to construct indexed parameters from NumPy
+# arrays, to look up their values, and to extract all of their values
+#
+# A dictionary-backed parameter is initialized from the equivalent
+# dictionary for comparison.
+#
+
+import pyutilib.th as unittest
+
+from pyomo.core import ConcreteModel, RangeSet, Param
+from pyomo.solvers.tests.performance import PerformanceBase
+
+try:
+    import numpy
+    has_numpy = True
+except:
+    has_numpy = False
+
+
+class ArrayParamPerformanceBase(PerformanceBase):
+
+    def _param_test(self, array_backed):
+        m = ConcreteModel()
+        m.I = RangeSet(self.size)
+        data = numpy.arange(float(self.size))
+        if not array_backed:
+            data = dict(zip(m.I, data.tolist()))
+        def construct():
+            m.p = Param(m.I, initialize=data, array_backed=array_backed)
+        _, seconds = self._time(construct)
+        self.recordTestData('construction time', seconds)
+        def lookup():
+            p = m.p
+            return sum(p[i] for i in m.I)
+        ans, seconds = self._time(lookup)
+        self.recordTestData('lookup time', seconds)
+        self.assertEqual(ans, self.size*(self.size-1)/2.)
+        ans, seconds = self._time(
+            lambda: m.p.extract_values(as_array=True))
+        self.recordTestData('extract time', seconds)
+        self.assertEqual(len(ans), self.size)
+
+    def test_dict_param(self):
+        self._param_test(False)
+
+    def test_array_param(self):
+        self._param_test(True)
+
+
+@unittest.category('performance')
+@unittest.skipIf(not has_numpy, "numpy is not available")
+class TestArrayParamPerformance_1000(ArrayParamPerformanceBase,
+                                     unittest.TestCase):
+    size = 1000
+
+
+@unittest.category('performance')
+@unittest.skipIf(not has_numpy, "numpy is not available")
+class TestArrayParamPerformance_10000(ArrayParamPerformanceBase,
+                                      unittest.TestCase):
+    size = 10000
+
+
+@unittest.category('performance')
+@unittest.skipIf(not has_numpy, "numpy is not available")
+class TestArrayParamPerformance_100000(ArrayParamPerformanceBase,
+                                       unittest.TestCase):
+    size = 100000
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+#
+# Track the time needed to clone models of increasing size
+#
+
+import copy
+
+import pyutilib.th as unittest
+
+from pyomo.solvers.tests.performance import (PerformanceBase,
+                                             create_model)
+
+
+class ClonePerformanceBase(PerformanceBase):
+
+    @classmethod
+    def setUpClass(self):
+        self.model = create_model(self.size, dual=True)
+
+    @classmethod
+    def tearDownClass(self):
+        self.model = None
+
+    def test_clone(self):
+        instance, seconds = self._time(self.model.clone)
+        self.recordTestData('clone time', seconds)
+        self.recordTestData('clone time per constraint',
+                            seconds / (2*self.size))
+        self.assertIs(instance.c[1].body.arg(0).arg(1).arg(0),
+                      instance.x[1])
+        self.assertIsNot(instance.x[1], self.model.x[1])
+
+    def test_clone_subblock(self):
+        instance, seconds = self._time(self.model.b.clone)
+        self.recordTestData('subblock clone time', seconds)
+        # references to components outside the block are not copied
+        self.assertIs(instance.c[1].body.arg(1).arg(1), self.model.x[1])
+
+    def test_deepcopy(self):
+        # The cost of copying the model through the pickle protocol, for
+        # comparison with the structural copy used by clone()
+        memo = {'__block_scope__': {id(self.model): True, id(None): False},
+                '__paranoid__': False}
+        try:
+            instance, seconds = self._time(
+                lambda: copy.deepcopy(self.model, memo))
+        except TypeError:
+            self.skipTest("deepcopy of models is not supported "
+                          "by this version of Python")
+        self.recordTestData('deepcopy time', seconds)
+
+
+@unittest.category('performance')
+class TestClonePerformance_1000(ClonePerformanceBase, unittest.TestCase):
+    size = 1000
+
+
+@unittest.category('performance')
+class TestClonePerformance_10000(ClonePerformanceBase, unittest.TestCase):
+    size = 10000
+
+
+@unittest.category('performance')
+class TestClonePerformance_100000(ClonePerformanceBase, unittest.TestCase):
+    size = 100000
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for the 'pool' solver manager
+#
+
+import os
+
+import pyutilib.th as unittest
+
+from pyomo.environ import (ConcreteModel, Var, Constraint, Objective,
+                           Suffix, SolverManagerFactory, value)
+from pyomo.common.parallel import fork_available
+from pyomo.core.base.label import NumericLabeler
+from pyomo.core.expr.symbol_map import SymbolMap
+from pyomo.opt import SolverResults, SolverStatus
+from pyomo.opt.parallel.manager import ActionManagerError
+
+
+class _FakeSolver(object):
+    """
+    A "solver" that sets each variable to its lower bound and the dual
+    of each constraint to its upper bound, and records the process
+    that solved the model.
+    """
+
+    name = 'fake'
+    _default_variable_value = None
+
+    def solve(self, model, **kwds):
+        if kwds.get('fail', False):
+            raise RuntimeError("Forced failure")
+        results = SolverResults()
+        results.solver.status = SolverStatus.ok
+        results.problem.name = str(os.getpid())
+        soln = results.solution.add()
+        smap = SymbolMap()
+        labeler = NumericLabeler('x')
+        for v in model.component_data_objects(Var):
+            if not v.fixed:
+                soln.variable[smap.getSymbol(v, labeler)] = \
+                    {'Value': v.lb}
+        for c in model.component_data_objects(Constraint, active=True):
+            soln.constraint[smap.getSymbol(c, labeler)] = \
+                {'Dual': value(c.upper)}
+        assert not kwds.get('load_solutions', True)
+        results._smap = smap
+        return results
+
+
+def _model(i):
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3], bounds=(i, None))
+    m.x[2].fix(-1)
+    m.c = Constraint([1, 2], rule=lambda m, j: m.x[j] <= 10*i + j)
+    m.c[2].deactivate()
+    m.d = Constraint(expr=m.x[3] <= 100*i)
+    m.o = Objective(expr=sum(m.x.values()))
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    return m
+
+
+@unittest.skipIf(not fork_available(), "fork() is not available")
+class TestPoolSolverManager(unittest.TestCase):
+
+    def _check(self, m, i):
+        self.assertEqual(m.x[1].value, i)
+        self.assertEqual(m.x[2].value, -1)
+        self.assertEqual(m.x[3].value, i)
+        self.assertFalse(m.x[1].stale)
+        self.assertEqual(m.dual[m.c[1]], 10*i + 1)
+        self.assertNotIn(m.c[2], m.dual)
+        self.assertEqual(m.dual[m.d], 100*i)
+
+    def test_queue_wait_all(self):
+        mngr = SolverManagerFactory('pool', processes=2)
+        models = [_model(i) for i in range(1, 6)]
+        ahs = [mngr.queue(m, opt=_FakeSolver()) for m in models]
+        mngr.wait_all(ahs)
+        pids = set()
+        for i, (m, ah) in enumerate(zip(models, ahs)):
+            results = mngr.get_results(ah)
+            self.assertEqual(len(results.solution), 0)
+            self.assertNotEqual(results.problem.name, str(os.getpid()))
+            pids.add(results.problem.name)
+            self._check(m, i+1)
+        self.assertEqual(len(pids), 5)
+
+    def test_wait_any(self):
+        mngr = SolverManagerFactory('pool', processes=2,
+                                    solver_limits={'fake': 1})
+        models = dict((mngr.queue(_model(i), opt=_FakeSolver()), i)
+                      for i in range(1, 4))
+        # Only one solve runs at a time
+        self.assertEqual(len(mngr._running), 1)
+        self.assertEqual(len(mngr._pending), 2)
+        seen = set()
+        for _ in range(3):
+            ah = mngr.wait_any()
+            self.assertIn(ah, models)
+            seen.add(ah)
+            self.assertIsNotNone(mngr.get_results(ah))
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(mngr.num_queued(), 0)
+        self.assertEqual(mngr.wait_any().id, -1)
+
+    def test_solve_without_loading(self):
+        mngr = SolverManagerFactory('pool')
+        m = _model(2)
+        results = mngr.solve(m, opt=_FakeSolver(), load_solutions=False)
+        self.assertIsNone(m.x[1].value)
+        # The solutions keep their label-keyed maps
+        soln = results.solution(0)
+        self.assertEqual(soln.variable['x1'], {'Value': 2})
+        self.assertEqual(soln.variable['x2'], {'Value': 2})
+        self.assertEqual(soln.constraint['x3'], {'Dual': 21})
+        self.assertEqual(soln.constraint['x4'], {'Dual': 200})
+        m.solutions.load_from(results)
+        self._check(m, 2)
+
+    def test_errors(self):
+        mngr = SolverManagerFactory('pool')
+        with self.assertRaisesRegexp(ActionManagerError, "No solver passed"):
+            mngr.queue(_model(1))
+        with self.assertRaisesRegexp(ActionManagerError, "only solves"):
+            mngr.queue(opt=_FakeSolver())
+        mngr.queue(_model(1), opt=_FakeSolver(), fail=True)
+        with self.assertRaisesRegexp(ActionManagerError, "Forced failure"):
+            mngr.wait_all()
+
+    def test_error_with_pending(self):
+        # Pending solves are started after a worker fails
+        mngr = SolverManagerFactory('pool', processes=1)
+        mngr.queue(_model(1), opt=_FakeSolver(), fail=True)
+        m = _model(2)
+        ah = mngr.queue(m, opt=_FakeSolver())
+        self.assertEqual(len(mngr._pending), 1)
+        with self.assertRaisesRegexp(ActionManagerError, "Forced failure"):
+            mngr.wait_any()
+        self.assertEqual(mngr.wait_any(), ah)
+        self._check(m, 2)
+
+    def test_zero_solver_limit(self):
+        mngr = SolverManagerFactory('pool', solver_limits={'fake': 0})
+        mngr.queue(_model(1), opt=_FakeSolver())
+        ah = mngr.wait_any()
+        self.assertEqual(ah.id, -1)
+        self.assertIn("cannot be started", ah.explanation)
+        self.assertEqual(len(mngr._pending), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -162,6 +162,21 @@ class Test(unittest.TestCase):
                                        tolerance=1e-7)
         #self.sisser_instance.load_solutions(results)
 
+    def test_ipopt_solve_duals_store_to(self):
+        # The duals loaded into the model are stored back into the results
+        m = ConcreteModel()
+        m.x = Var(initialize=2.0)
+        m.c = Constraint(expr=m.x >= 1)
+        m.o = Objective(expr=m.x**2)
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        results = self.ipopt.solve(m)
+        self.assertAlmostEqual(m.x.value, 1.0, places=5)
+        self.assertAlmostEqual(m.dual[m.c], 2.0, places=5)
+        m.solutions.store_to(results)
+        soln = results.solution(0)
+        self.assertAlmostEqual(soln.variable['x']['Value'], 1.0, places=5)
+        self.assertAlmostEqual(soln.constraint['c']['Dual'], 2.0, places=5)
+
     def test_ipopt_solve_from_instance_OF_options(self):
 
         with self.assertRaises(ValueError):
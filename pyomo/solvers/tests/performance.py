@@ -0,0 +1,49 @@
+#
+# Utilities shared by the performance tests in pyomo.solvers.tests.core
+#
+
+import gc
+import time
+
+from pyomo.core import (ConcreteModel, Block, RangeSet, Param, Var,
+                        Constraint, Objective, Suffix, sin)
+
+
+def create_model(n, dual=False):
+    """
+    Create a model with n nonlinear constraints on the top-level block
+    and n linear constraints on a sub-block that refer to variables
+    outside of the sub-block.  If dual is True, the model has an import
+    Suffix for duals.
+    """
+    model = ConcreteModel()
+    model.I = RangeSet(n)
+    model.x = Var(model.I, bounds=(0, 10), initialize=1)
+    model.p = Param(model.I, mutable=True, initialize=2)
+    model.c = Constraint(model.I, rule=lambda m, i:
+                         m.p[i]*m.x[i]**2 + sin(m.x[i]) <= 10)
+    model.b = Block()
+    model.b.y = Var(model.I)
+    model.b.c = Constraint(model.I, rule=lambda b, i:
+                           b.y[i] - b.model().x[i] >= 0)
+    model.o = Objective(expr=sum(model.x[i] for i in model.I))
+    if dual:
+        model.dual = Suffix(direction=Suffix.IMPORT)
+    return model
+
+
+class PerformanceBase(object):
+    """
+    A mixin for performance test cases that are repeated for problems
+    of increasing size.  Each test case class sets the 'size'
+    attribute.
+    """
+
+    size = None
+
+    def _time(self, f):
+        """Return the result of f() and the seconds it took"""
+        gc.collect()
+        start = time.time()
+        ans = f()
+        return ans, time.time() - start
@@ -0,0 +1,135 @@
+"""This module contains functions to report the memory used by the
+expression trees of a Pyomo model."""
+import logging
+import sys
+
+from pyomo.core import Constraint, Expression, Objective
+from pyomo.core.base.block import _BlockData
+from pyomo.core.expr.numvalue import native_numeric_types, native_types
+from pyutilib.misc import Container
+
+
+default_logger = logging.getLogger('pyomo.util.memory_report')
+default_logger.setLevel(logging.INFO)
+
+
+class ExpressionMemoryReport(Container):
+    """Stores the memory used by expression trees.
+
+    Memory is reported in bytes, as measured by :func:`sys.getsizeof`.
+    Each node, argument container and numeric constant is counted once,
+    even if it is shared by several expressions.
+
+    The ``classes`` dictionary maps the name of each expression class
+    to the number of nodes (``count``) and the bytes used by those
+    nodes and their argument containers (``bytes``).  The ``constants``
+    entry reports the number of references to numeric constants, the
+    number of distinct constant objects and the bytes used by them.
+
+    """
+    pass
+
+
+def build_expression_memory_report(obj):
+    """Build an expression memory report object.
+
+    Args:
+        obj: A block, or an expression.  For blocks, the constraint
+            bodies and the expressions of all objectives and named
+            expressions are reported.
+    """
+    report = ExpressionMemoryReport()
+    classes = {}
+    seen = set()
+    constants = {}
+    n_constant_refs = 0
+
+    if isinstance(obj, _BlockData):
+        roots = [con.body for con in obj.component_data_objects(Constraint)]
+        roots.extend(data.expr for data in
+                     obj.component_data_objects((Objective, Expression)))
+    else:
+        roots = [obj]
+
+    stack = []
+    for root in roots:
+        if root.__class__ in native_numeric_types:
+            n_constant_refs += 1
+            constants[id(root)] = root
+            continue
+        stack.append(root)
+        while stack:
+            node = stack.pop()
+            if node is None or node.__class__ in native_types or \
+               id(node) in seen:
+                continue
+            seen.add(id(node))
+            if not node.is_expression_type():
+                continue
+            if node.is_named_expression_type():
+                # Named expressions are components, so only the
+                # expression that they contain is reported
+                stack.append(node.expr)
+                continue
+            info = classes.get(node.__class__.__name__, None)
+            if info is None:
+                info = classes[node.__class__.__name__] = \
+                       Container(count=0, bytes=0)
+            info.count += 1
+            info.bytes += sys.getsizeof(node)
+            for data in _node_containers(node):
+                if id(data) not in seen:
+                    seen.add(id(data))
+                    info.bytes += sys.getsizeof(data)
+            for arg in _node_children(node):
+                if arg.__class__ in native_numeric_types:
+                    n_constant_refs += 1
+                    constants[id(arg)] = arg
+                else:
+                    stack.append(arg)
+
+    report.classes = classes
+    report.nodes = sum(info.count for info in classes.values())
+    report.constants = Container()
+    report.constants.references = n_constant_refs
+    report.constants.distinct = len(constants)
+    report.constants.bytes = sum(
+        sys.getsizeof(c) for c in constants.values())
+    report.bytes = sum(info.bytes for info in classes.values()) + \
+                   report.constants.bytes
+    return report
+
+
+def log_expression_memory_report(obj, logger=default_logger):
+    """Generate a report logging the memory used by expressions."""
+    report = build_expression_memory_report(obj)
+    lines = ["%-32s %12s %14s" % ("Expression class", "Nodes", "Bytes")]
+    for name, info in sorted(report.classes.items(),
+                             key=lambda x: -x[1].bytes):
+        lines.append("%-32s %12d %14d" % (name, info.count, info.bytes))
+    lines.append("%-32s %12d %14d" % (
+        "(numeric constants)", report.constants.distinct,
+        report.constants.bytes))
+    lines.append("%-32s %12d %14d" % ("Total", report.nodes, report.bytes))
+    logger.info("\n".join(lines))
+
+
+def _node_containers(node):
+    """Yield the argument containers stored by an expression node."""
+    for cls in node.__class__.__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            data = getattr(node, name, None)
+            if data.__class__ in (list, tuple) and data:
+                yield data
+            elif hasattr(data, 'nbytes'):
+                # NumPy arrays
+                yield data
+
+
+def _node_children(node):
+    """Return the child nodes (and coefficients) of an expression node."""
+    linear_coefs = getattr(node, 'linear_coefs', None)
+    if linear_coefs is None:
+        return node.args
+    # Linear expressions store their coefficients outside of args
+    return [node.constant] + list(linear_coefs)
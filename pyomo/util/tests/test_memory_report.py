@@ -0,0 +1,104 @@
+"""Tests for the expression memory report utility."""
+import logging
+import sys
+
+from six import StringIO
+
+import pyutilib.th as unittest
+from pyomo.common.log import LoggingIntercept
+from pyomo.core import (Block, ConcreteModel, Constraint, Expression,
+                        Objective, Param, RangeSet, Var, quicksum, sin)
+from pyomo.util.memory_report import (build_expression_memory_report,
+                                      log_expression_memory_report)
+
+
+class TestExpressionMemoryReport(unittest.TestCase):
+    """Tests for expression memory report utility."""
+
+    def test_empty_model(self):
+        """Test with an empty model."""
+        m = ConcreteModel()
+        report = build_expression_memory_report(m)
+        self.assertEqual(report.nodes, 0)
+        self.assertEqual(report.bytes, 0)
+        self.assertEqual(report.classes, {})
+        self.assertEqual(report.constants.references, 0)
+
+    def test_shared_nodes(self):
+        """Shared nodes and constants are counted once."""
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        e = sin(m.x)
+        m.c1 = Constraint(expr=e + m.y <= 1)
+        m.c2 = Constraint(expr=2*e >= 0)
+        report = build_expression_memory_report(m)
+        self.assertEqual(report.classes['UnaryFunctionExpression'].count, 1)
+        self.assertEqual(report.classes['SumExpression'].count, 1)
+        self.assertEqual(report.classes['ProductExpression'].count, 1)
+        self.assertEqual(report.nodes, 3)
+        self.assertEqual(report.constants.references, 1)
+        self.assertEqual(report.constants.distinct, 1)
+        self.assertEqual(report.bytes,
+                         sum(info.bytes for info in report.classes.values())
+                         + sys.getsizeof(2))
+
+    def test_block_data(self):
+        """Test with a block of an indexed block."""
+        m = ConcreteModel()
+        m.b = Block([1, 2])
+        m.b[1].x = Var()
+        m.b[1].c = Constraint(expr=sin(m.b[1].x) <= 1)
+        m.b[2].x = Var()
+        m.b[2].c = Constraint(expr=2*m.b[2].x**2 <= 1)
+        report = build_expression_memory_report(m.b[1])
+        self.assertEqual(report.nodes, 1)
+        self.assertEqual(report.classes['UnaryFunctionExpression'].count, 1)
+        report = build_expression_memory_report(m)
+        self.assertEqual(report.nodes, 3)
+
+    def test_interned_constants(self):
+        """Equal immutable parameter values are stored once."""
+        m = ConcreteModel()
+        m.I = RangeSet(10)
+        m.x = Var(m.I)
+        m.p = Param(m.I, initialize=lambda m, i: float(i % 2) + 0.5)
+        m.c = Constraint(m.I, rule=lambda m, i: m.p[i]*m.x[i]**2 <= 1)
+        report = build_expression_memory_report(m)
+        self.assertEqual(report.classes['ProductExpression'].count, 10)
+        self.assertEqual(report.classes['PowExpression'].count, 10)
+        self.assertEqual(report.constants.references, 20)
+        # 0.5, 1.5 and the exponent 2
+        self.assertEqual(report.constants.distinct, 3)
+
+    def test_named_expressions(self):
+        """Named expressions are reported through their expression."""
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.e = Expression(expr=m.x[1]*m.x[2])
+        m.o = Objective(expr=m.e + quicksum(m.x[i] for i in m.x))
+        report = build_expression_memory_report(m)
+        self.assertEqual(report.classes['ProductExpression'].count, 1)
+        self.assertNotIn('SimpleExpression', report.classes)
+        self.assertEqual(report.nodes,
+                         build_expression_memory_report(m.o.expr).nodes)
+
+    def test_log_expression_memory(self):
+        """Test logging functionality."""
+        m = ConcreteModel()
+        m.x = Var()
+        m.c = Constraint(expr=sin(m.x) <= 1)
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.util.memory_report',
+                              logging.INFO):
+            log_expression_memory_report(m)
+        lines = output.getvalue().strip().splitlines()
+        self.assertEqual(lines[0].split(),
+                         ['Expression', 'class', 'Nodes', 'Bytes'])
+        self.assertEqual(lines[1].split()[:2],
+                         ['UnaryFunctionExpression', '1'])
+        self.assertEqual(lines[-1].split()[:2], ['Total', '1'])
+
+
+if __name__ == '__main__':
+    unittest.main()